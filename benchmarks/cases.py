@@ -0,0 +1,195 @@
+"""Registry of parsing hot path benchmark cases.
+
+Each case prepares its workload outside the timed region and times only the
+per-call work of the function under test.
+"""
+
+from typing import Any, Callable
+
+from electric_text.clients.functions.is_complete_number import is_complete_number
+from electric_text.clients.functions.parse_partial_response import (
+    parse_partial_response,
+)
+from electric_text.prompting.functions.output_conversion.client_response_to_system_output import (
+    client_response_to_system_output,
+)
+from electric_text.prompting.functions.output_conversion.system_output_to_dict import (
+    system_output_to_dict,
+)
+from electric_text.providers.data.stream_history import StreamHistory
+from electric_text.providers.model_providers.anthropic.functions.process_stream_response import (
+    process_stream_response as process_anthropic_stream_response,
+)
+from electric_text.providers.model_providers.ollama.functions.process_stream_response import (
+    process_stream_response as process_ollama_stream_response,
+)
+from electric_text.providers.model_providers.openai.functions.process_nested_schemas import (
+    process_nested_schemas,
+)
+from electric_text.providers.model_providers.openai.functions.process_stream_response import (
+    process_stream_response as process_openai_stream_response,
+)
+from electric_text.providers.model_providers.openai.functions.set_text_format import (
+    set_text_format,
+)
+
+from benchmarks.data.benchmark_case import BenchmarkCase
+from benchmarks.data.benchmark_input import BenchmarkInput
+from benchmarks.functions.generate_anthropic_stream_lines import (
+    generate_anthropic_stream_lines,
+)
+from benchmarks.functions.generate_data_system_output import (
+    generate_data_system_output,
+)
+from benchmarks.functions.generate_nested_schema import generate_nested_schema
+from benchmarks.functions.generate_number_string import generate_number_string
+from benchmarks.functions.generate_ollama_stream_lines import (
+    generate_ollama_stream_lines,
+)
+from benchmarks.functions.generate_openai_stream_lines import (
+    generate_openai_stream_lines,
+)
+from benchmarks.functions.generate_partial_json import generate_partial_json
+from benchmarks.functions.generate_structured_client_response import (
+    generate_structured_client_response,
+)
+from benchmarks.functions.generate_text_client_response import (
+    generate_text_client_response,
+)
+
+STREAM_SIZES = (10, 100, 1000)
+FIELD_SIZES = (4, 16, 64, 256)
+
+
+def prepare_partial_json(field_count: int) -> BenchmarkInput:
+    partial = generate_partial_json(field_count)
+    return BenchmarkInput(
+        run=lambda: parse_partial_response(partial), length=len(partial)
+    )
+
+
+def prepare_number(digit_count: int) -> BenchmarkInput:
+    number = generate_number_string(digit_count)
+    return BenchmarkInput(run=lambda: is_complete_number(number), length=len(number))
+
+
+def prepare_stream(
+    lines: list[str], process: Callable[[str, StreamHistory], StreamHistory]
+) -> BenchmarkInput:
+    def run() -> StreamHistory:
+        history = StreamHistory()
+        for line in lines:
+            history = process(line, history)
+        return history
+
+    return BenchmarkInput(run=run, length=sum(len(line) + 1 for line in lines))
+
+
+def prepare_nested_schemas(property_count: int) -> BenchmarkInput:
+    # process_nested_schemas mutates in place, so the schema is processed once
+    # up front and each timed call measures the steady-state traversal.
+    schema = generate_nested_schema(property_count)
+    unsupported_keywords = ["examples", "$comment", "default"]
+    process_nested_schemas(schema, unsupported_keywords)
+    return BenchmarkInput(
+        run=lambda: process_nested_schemas(schema, unsupported_keywords),
+        length=len(str(schema)),
+    )
+
+
+def prepare_text_format(property_count: int) -> BenchmarkInput:
+    schema = generate_nested_schema(property_count)
+    return BenchmarkInput(run=lambda: set_text_format(schema), length=len(str(schema)))
+
+
+def prepare_text_output(text_length: int) -> BenchmarkInput:
+    response = generate_text_client_response(text_length)
+    return BenchmarkInput(
+        run=lambda: client_response_to_system_output(response), length=text_length
+    )
+
+
+def prepare_data_output(field_count: int) -> BenchmarkInput:
+    response = generate_structured_client_response(field_count)
+    return BenchmarkInput(
+        run=lambda: client_response_to_system_output(response),
+        length=len(response.text_content),
+    )
+
+
+def prepare_output_dict(field_count: int) -> BenchmarkInput:
+    output = generate_data_system_output(field_count)
+    data: dict[str, Any] = output.data.data if output.data else {}
+    return BenchmarkInput(
+        run=lambda: system_output_to_dict(output), length=len(str(data))
+    )
+
+
+CASES: list[BenchmarkCase] = [
+    BenchmarkCase(
+        name="parse_partial_response",
+        description="Repair and parse a truncated JSON object (called on every streamed chunk).",
+        sizes=FIELD_SIZES,
+        prepare=prepare_partial_json,
+    ),
+    BenchmarkCase(
+        name="is_complete_number",
+        description="Check whether a trailing number literal is complete.",
+        sizes=(4, 16, 64, 256),
+        prepare=prepare_number,
+    ),
+    BenchmarkCase(
+        name="anthropic.process_stream_response",
+        description="Fold a full Anthropic SSE stream of N text deltas into a StreamHistory.",
+        sizes=STREAM_SIZES,
+        prepare=lambda size: prepare_stream(
+            generate_anthropic_stream_lines(size), process_anthropic_stream_response
+        ),
+    ),
+    BenchmarkCase(
+        name="openai.process_stream_response",
+        description="Fold a full OpenAI Responses SSE stream of N text deltas into a StreamHistory.",
+        sizes=STREAM_SIZES,
+        prepare=lambda size: prepare_stream(
+            generate_openai_stream_lines(size), process_openai_stream_response
+        ),
+    ),
+    BenchmarkCase(
+        name="ollama.process_stream_response",
+        description="Fold a full Ollama NDJSON stream of N content chunks into a StreamHistory.",
+        sizes=STREAM_SIZES,
+        prepare=lambda size: prepare_stream(
+            generate_ollama_stream_lines(size), process_ollama_stream_response
+        ),
+    ),
+    BenchmarkCase(
+        name="process_nested_schemas",
+        description="Traverse an already-processed schema with N top-level properties.",
+        sizes=FIELD_SIZES,
+        prepare=prepare_nested_schemas,
+    ),
+    BenchmarkCase(
+        name="set_text_format",
+        description="Copy and post-process a schema with N top-level properties for OpenAI.",
+        sizes=FIELD_SIZES,
+        prepare=prepare_text_format,
+    ),
+    BenchmarkCase(
+        name="client_response_to_system_output.text",
+        description="Convert an unstructured response of N characters.",
+        sizes=(100, 1000, 10000, 100000),
+        prepare=prepare_text_output,
+    ),
+    BenchmarkCase(
+        name="client_response_to_system_output.data",
+        description="Convert a validated structured response with N fields.",
+        sizes=FIELD_SIZES,
+        prepare=prepare_data_output,
+    ),
+    BenchmarkCase(
+        name="system_output_to_dict",
+        description="Serialize a DATA SystemOutput with N fields to a dictionary.",
+        sizes=FIELD_SIZES,
+        prepare=prepare_output_dict,
+    ),
+]
@@ -0,0 +1,9 @@
+from benchmarks.data.benchmark_case import BenchmarkCase
+from benchmarks.data.benchmark_input import BenchmarkInput
+from benchmarks.data.benchmark_result import BenchmarkResult
+
+__all__ = [
+    "BenchmarkCase",
+    "BenchmarkInput",
+    "BenchmarkResult",
+]
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from benchmarks.data.benchmark_input import BenchmarkInput
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A named micro-benchmark over generated inputs of increasing size.
+
+    Attributes:
+        name: Stable identifier used as the key in baseline files
+        description: What is being measured
+        sizes: Input sizes to run (meaning depends on the case, e.g. delta count)
+        prepare: Builds the workload for a given size, outside the timed region
+    """
+
+    name: str
+    description: str
+    sizes: tuple[int, ...]
+    prepare: Callable[[int], BenchmarkInput]
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class BenchmarkInput:
+    """A prepared, zero-argument workload and the response length it covers.
+
+    Attributes:
+        run: Callable executing one iteration of the workload
+        length: Length in characters of the response being processed
+    """
+
+    run: Callable[[], Any]
+    length: int
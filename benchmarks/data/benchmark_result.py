@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timing of one benchmark case at one input size.
+
+    Attributes:
+        case: Name of the benchmark case
+        size: Input size the case was prepared with
+        length: Response length in characters
+        median_us: Median time per call in microseconds
+        min_us: Fastest time per call in microseconds
+        loops: Calls per timed repeat
+        repeats: Number of timed repeats
+    """
+
+    case: str
+    size: int
+    length: int
+    median_us: float
+    min_us: float
+    loops: int
+    repeats: int
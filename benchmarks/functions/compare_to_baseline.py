@@ -0,0 +1,32 @@
+from benchmarks.data.benchmark_result import BenchmarkResult
+
+
+def compare_to_baseline(
+    results: list[BenchmarkResult],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Find results that are slower than the baseline by more than `tolerance`.
+
+    Results without a matching baseline entry are ignored.
+
+    Args:
+        results: Fresh benchmark results
+        baseline: Median microseconds keyed by case name, then by size
+        tolerance: Allowed slowdown ratio (0.5 allows 50% slower)
+
+    Returns:
+        Human-readable descriptions of each regression
+    """
+    regressions: list[str] = []
+    for result in results:
+        expected = baseline.get(result.case, {}).get(str(result.size))
+        if expected is None:
+            continue
+        if result.median_us > expected * (1 + tolerance):
+            regressions.append(
+                f"{result.case}[{result.size}]: {result.median_us:.2f}us "
+                f"vs baseline {expected:.2f}us"
+            )
+
+    return regressions
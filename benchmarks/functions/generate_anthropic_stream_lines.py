@@ -0,0 +1,57 @@
+import json
+
+
+def generate_anthropic_stream_lines(delta_count: int) -> list[str]:
+    """Generate the SSE lines of an Anthropic Messages stream with `delta_count` text deltas.
+
+    Args:
+        delta_count: Number of content_block_delta events
+
+    Returns:
+        Raw lines as yielded by httpx's aiter_lines()
+    """
+    events: list[tuple[str, dict[str, object]]] = [
+        (
+            "message_start",
+            {
+                "type": "message_start",
+                "message": {
+                    "id": "msg_bench",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": "claude-3-7-sonnet-20250219",
+                    "content": [],
+                    "usage": {"input_tokens": 100, "output_tokens": 1},
+                },
+            },
+        ),
+        (
+            "content_block_start",
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+        ),
+    ]
+
+    for index in range(delta_count):
+        events.append(
+            (
+                "content_block_delta",
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": f" token{index}"},
+                },
+            )
+        )
+
+    events.append(("content_block_stop", {"type": "content_block_stop", "index": 0}))
+    events.append(("message_stop", {"type": "message_stop"}))
+
+    lines: list[str] = []
+    for event_name, data in events:
+        lines.extend([f"event: {event_name}", f"data: {json.dumps(data)}", ""])
+
+    return lines
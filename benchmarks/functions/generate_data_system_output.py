@@ -0,0 +1,22 @@
+from electric_text.prompting.data.data_output import DataOutput
+from electric_text.prompting.data.system_output import SystemOutput
+from electric_text.prompting.data.system_output_type import SystemOutputType
+
+
+def generate_data_system_output(field_count: int) -> SystemOutput:
+    """Generate a DATA SystemOutput whose payload has `field_count` entries.
+
+    Args:
+        field_count: Number of keys in the structured data payload
+
+    Returns:
+        SystemOutput of type DATA
+    """
+    data: dict[str, object] = {
+        f"field_{index}": [f"line {index}", index] for index in range(field_count)
+    }
+
+    return SystemOutput(
+        response_type=SystemOutputType.DATA,
+        data=DataOutput(data=data, is_valid=True, schema_name="BenchmarkOutput"),
+    )
@@ -0,0 +1,60 @@
+from typing import Any
+
+
+def generate_nested_schema(property_count: int) -> dict[str, Any]:
+    """Generate a Pydantic-style JSON schema with `property_count` top-level properties.
+
+    Properties cycle through scalars, arrays of nested objects, optional
+    (anyOf) fields and $ref'd definitions, so every branch of the OpenAI
+    schema post-processing is exercised.
+
+    Args:
+        property_count: Number of top-level properties
+
+    Returns:
+        A JSON schema dictionary
+    """
+    properties: dict[str, Any] = {}
+    for index in range(property_count):
+        name = f"field_{index}"
+        match index % 4:
+            case 0:
+                properties[name] = {
+                    "type": "string",
+                    "description": f"Field {index}",
+                    "examples": ["example"],
+                }
+            case 1:
+                properties[name] = {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "label": {"type": "string"},
+                            "score": {"type": "number", "default": 0},
+                        },
+                    },
+                }
+            case 2:
+                properties[name] = {
+                    "anyOf": [{"type": "integer"}, {"type": "null"}],
+                    "default": None,
+                }
+            case _:
+                properties[name] = {"$ref": "#/$defs/Nested"}
+
+    return {
+        "title": "BenchmarkSchema",
+        "type": "object",
+        "properties": properties,
+        "required": list(properties.keys())[: property_count // 2],
+        "$defs": {
+            "Nested": {
+                "type": "object",
+                "properties": {
+                    "inner": {"type": "string", "$comment": "nested"},
+                    "values": {"type": "array", "items": {"type": "integer"}},
+                },
+            }
+        },
+    }
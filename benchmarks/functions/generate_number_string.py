@@ -0,0 +1,12 @@
+def generate_number_string(digit_count: int) -> str:
+    """Generate a decimal number string with roughly `digit_count` digits.
+
+    Args:
+        digit_count: Total number of digits (at least 2)
+
+    Returns:
+        A number string such as "12345.6789"
+    """
+    digits = "".join(str(index % 10) for index in range(1, max(digit_count, 2) + 1))
+    split = len(digits) // 2
+    return f"{digits[:split]}.{digits[split:]}"
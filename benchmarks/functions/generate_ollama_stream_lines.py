@@ -0,0 +1,32 @@
+import json
+
+
+def generate_ollama_stream_lines(delta_count: int) -> list[str]:
+    """Generate the NDJSON lines of an Ollama chat stream with `delta_count` content chunks.
+
+    Args:
+        delta_count: Number of non-final content chunks
+
+    Returns:
+        Raw lines as yielded by httpx's aiter_lines()
+    """
+    lines: list[str] = []
+    for index in range(delta_count):
+        chunk = {
+            "model": "llama3.1:8b",
+            "created_at": "2025-01-10T12:12:00.000000Z",
+            "message": {"role": "assistant", "content": f" token{index}"},
+            "done": False,
+        }
+        lines.append(json.dumps(chunk))
+
+    final = {
+        "model": "llama3.1:8b",
+        "created_at": "2025-01-10T12:12:01.000000Z",
+        "message": {"role": "assistant", "content": ""},
+        "done_reason": "stop",
+        "done": True,
+    }
+    lines.append(json.dumps(final))
+
+    return lines
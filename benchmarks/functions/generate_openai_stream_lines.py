@@ -0,0 +1,47 @@
+import json
+
+
+def generate_openai_stream_lines(delta_count: int) -> list[str]:
+    """Generate the SSE lines of an OpenAI Responses stream with `delta_count` text deltas.
+
+    Args:
+        delta_count: Number of response.output_text.delta events
+
+    Returns:
+        Raw lines as yielded by httpx's aiter_lines()
+    """
+    item_id = "msg_bench"
+    events: list[dict[str, object]] = [
+        {"type": "response.created", "response": {"id": "resp_bench", "output": []}},
+        {
+            "type": "response.output_item.added",
+            "output_index": 0,
+            "item": {"id": item_id, "type": "message", "content": []},
+        },
+        {
+            "type": "response.content_part.added",
+            "item_id": item_id,
+            "output_index": 0,
+            "content_index": 0,
+            "part": {"type": "output_text", "annotations": [], "text": ""},
+        },
+    ]
+
+    for index in range(delta_count):
+        events.append(
+            {
+                "type": "response.output_text.delta",
+                "item_id": item_id,
+                "output_index": 0,
+                "content_index": 0,
+                "delta": f" token{index}",
+            }
+        )
+
+    events.append({"type": "response.done", "response": {"id": "resp_bench"}})
+
+    lines: list[str] = []
+    for data in events:
+        lines.extend([f"event: {data['type']}", f"data: {json.dumps(data)}", ""])
+
+    return lines
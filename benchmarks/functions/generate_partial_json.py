@@ -0,0 +1,29 @@
+import json
+
+
+def generate_partial_json(field_count: int) -> str:
+    """Generate a truncated JSON object, as seen mid-way through a structured stream.
+
+    Field values cycle through strings, numbers, arrays and nested objects.
+    The object ends inside an unterminated string value.
+
+    Args:
+        field_count: Number of complete fields before the truncated one
+
+    Returns:
+        A partial JSON object string
+    """
+    fields: list[str] = []
+    for index in range(field_count):
+        match index % 4:
+            case 0:
+                value = json.dumps(f"value {index} " * 3)
+            case 1:
+                value = str(index * 7.5)
+            case 2:
+                value = json.dumps([index, index + 1, f"item {index}"])
+            case _:
+                value = json.dumps({"nested": index, "flag": index % 2 == 0})
+        fields.append(f'"field_{index}": {value}')
+
+    return "{" + ", ".join(fields + ['"tail": "unfinished'])
@@ -0,0 +1,43 @@
+import json
+from typing import Any
+
+from pydantic import create_model
+
+from electric_text.clients.data.client_response import ClientResponse
+from electric_text.providers.data.content_block import (
+    ContentBlock,
+    ContentBlockType,
+    TextData,
+)
+from electric_text.providers.data.stream_history import StreamHistory
+
+
+def generate_structured_client_response(field_count: int) -> ClientResponse[Any]:
+    """Generate a validated structured ClientResponse with `field_count` string fields.
+
+    Args:
+        field_count: Number of fields on the generated validation model
+
+    Returns:
+        ClientResponse with parsed content and a validated model instance
+    """
+    fields: dict[str, Any] = {
+        f"field_{index}": (str, ...) for index in range(field_count)
+    }
+    model_class = create_model("BenchmarkOutput", **fields)
+
+    parsed_content = {name: f"value for {name}" for name in fields}
+    history = StreamHistory(
+        content_blocks=[
+            ContentBlock(
+                type=ContentBlockType.TEXT,
+                data=TextData(json.dumps(parsed_content)),
+            )
+        ]
+    )
+
+    return ClientResponse[Any](
+        stream_history=history,
+        parsed_content=parsed_content,
+        validated_output=model_class(**parsed_content),
+    )
@@ -0,0 +1,26 @@
+from typing import Any
+
+from electric_text.clients.data.client_response import ClientResponse
+from electric_text.providers.data.content_block import (
+    ContentBlock,
+    ContentBlockType,
+    TextData,
+)
+from electric_text.providers.data.stream_history import StreamHistory
+
+
+def generate_text_client_response(text_length: int) -> ClientResponse[Any]:
+    """Generate an unstructured ClientResponse holding `text_length` characters of text.
+
+    Args:
+        text_length: Length of the text content
+
+    Returns:
+        ClientResponse with a single text content block
+    """
+    text = ("lorem ipsum " * (text_length // 12 + 1))[:text_length]
+    history = StreamHistory(
+        content_blocks=[ContentBlock(type=ContentBlockType.TEXT, data=TextData(text))]
+    )
+
+    return ClientResponse[Any](stream_history=history)
@@ -0,0 +1,30 @@
+import statistics
+import timeit
+from typing import Any, Callable
+
+
+def measure_callable(
+    run: Callable[[], Any], repeats: int = 5, min_time: float = 0.05
+) -> tuple[float, float, int]:
+    """Time a zero-argument callable.
+
+    The loop count is chosen with timeit's autorange so that each repeat lasts
+    at least `min_time` seconds, which keeps fast functions out of timer noise.
+
+    Args:
+        run: The callable to time
+        repeats: Number of timed repeats
+        min_time: Minimum duration of one repeat in seconds
+
+    Returns:
+        Tuple of (median seconds per call, min seconds per call, loops per repeat)
+    """
+    timer = timeit.Timer(run)
+
+    loops = 1
+    while timer.timeit(loops) < min_time:
+        loops *= 2
+
+    per_call = [total / loops for total in timer.repeat(repeat=repeats, number=loops)]
+
+    return statistics.median(per_call), min(per_call), loops
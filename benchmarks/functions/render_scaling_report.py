@@ -0,0 +1,58 @@
+from textwrap import dedent
+
+from benchmarks.data.benchmark_result import BenchmarkResult
+
+
+def render_scaling_report(
+    results: list[BenchmarkResult], descriptions: dict[str, str], bar_width: int = 40
+) -> str:
+    """Render benchmark results as a markdown report of time versus response length.
+
+    Each case gets a table and a text bar chart, so the checked-in report can
+    be diffed and read without any plotting dependency.
+
+    Args:
+        results: Results from one or more benchmark cases
+        descriptions: Case descriptions keyed by case name
+        bar_width: Width in characters of the longest bar
+
+    Returns:
+        Markdown document
+    """
+    sections = [
+        dedent("""\
+            # Parsing hot path scaling
+
+            Median time per call versus response length (characters).
+            Regenerate with `python -m benchmarks.run --write-baseline`.
+            """)
+    ]
+
+    case_names = list(dict.fromkeys(result.case for result in results))
+    for case_name in case_names:
+        case_results = [result for result in results if result.case == case_name]
+        slowest = max(result.median_us for result in case_results) or 1.0
+
+        rows = "\n".join(
+            f"| {result.size} | {result.length} | {result.median_us:.2f} "
+            f"| {result.median_us * 1000 / max(result.length, 1):.2f} |"
+            for result in case_results
+        )
+        label_width = max(len(str(result.length)) for result in case_results)
+        bars = "\n".join(
+            f"{str(result.length).rjust(label_width)} | "
+            f"{'#' * max(1, round(result.median_us / slowest * bar_width))} "
+            f"{result.median_us:.2f}us"
+            for result in case_results
+        )
+
+        sections.append(
+            f"## {case_name}\n\n"
+            f"{descriptions.get(case_name, '')}\n\n"
+            "| size | length | median (us) | ns/char |\n"
+            "| ---: | ---: | ---: | ---: |\n"
+            f"{rows}\n\n"
+            f"```\n{bars}\n```\n"
+        )
+
+    return "\n".join(sections)
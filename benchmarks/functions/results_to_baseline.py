@@ -0,0 +1,19 @@
+from benchmarks.data.benchmark_result import BenchmarkResult
+
+
+def results_to_baseline(results: list[BenchmarkResult]) -> dict[str, dict[str, float]]:
+    """Convert results to the baseline file structure.
+
+    Args:
+        results: Benchmark results
+
+    Returns:
+        Median microseconds keyed by case name, then by size
+    """
+    baseline: dict[str, dict[str, float]] = {}
+    for result in results:
+        baseline.setdefault(result.case, {})[str(result.size)] = round(
+            result.median_us, 3
+        )
+
+    return baseline
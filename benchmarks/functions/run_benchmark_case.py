@@ -0,0 +1,39 @@
+from benchmarks.data.benchmark_case import BenchmarkCase
+from benchmarks.data.benchmark_result import BenchmarkResult
+from benchmarks.functions.measure_callable import measure_callable
+
+
+def run_benchmark_case(
+    case: BenchmarkCase,
+    sizes: tuple[int, ...] | None = None,
+    repeats: int = 5,
+    min_time: float = 0.05,
+) -> list[BenchmarkResult]:
+    """Run a benchmark case at each of its input sizes.
+
+    Args:
+        case: The benchmark case to run
+        sizes: Optional override of the case's sizes
+        repeats: Number of timed repeats per size
+        min_time: Minimum duration of one repeat in seconds
+
+    Returns:
+        One BenchmarkResult per size, in size order
+    """
+    results: list[BenchmarkResult] = []
+    for size in sizes or case.sizes:
+        prepared = case.prepare(size)
+        median, fastest, loops = measure_callable(prepared.run, repeats, min_time)
+        results.append(
+            BenchmarkResult(
+                case=case.name,
+                size=size,
+                length=prepared.length,
+                median_us=median * 1e6,
+                min_us=fastest * 1e6,
+                loops=loops,
+                repeats=repeats,
+            )
+        )
+
+    return results
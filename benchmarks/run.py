@@ -0,0 +1,79 @@
+"""Run the parsing hot path micro-benchmarks.
+
+Usage:
+    python -m benchmarks.run                   # run and print the report
+    python -m benchmarks.run --write-baseline  # refresh benchmarks/results/
+    python -m benchmarks.run --check           # fail on regressions vs baseline
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.cases import CASES
+from benchmarks.data.benchmark_result import BenchmarkResult
+from benchmarks.functions.compare_to_baseline import compare_to_baseline
+from benchmarks.functions.render_scaling_report import render_scaling_report
+from benchmarks.functions.results_to_baseline import results_to_baseline
+from benchmarks.functions.run_benchmark_case import run_benchmark_case
+
+RESULTS_DIR = Path(__file__).parent / "results"
+BASELINE_PATH = RESULTS_DIR / "baseline.json"
+REPORT_PATH = RESULTS_DIR / "scaling.md"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Parsing hot path benchmarks")
+    parser.add_argument("--case", action="append", help="Only run the named case(s)")
+    parser.add_argument(
+        "--quick", action="store_true", help="Fewer, shorter repeats (smoke test)"
+    )
+    parser.add_argument(
+        "--write-baseline",
+        action="store_true",
+        help="Write baseline.json and scaling.md to benchmarks/results/",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Exit non-zero on regressions"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed slowdown ratio for --check (default: 0.5)",
+    )
+    args = parser.parse_args(argv)
+
+    repeats, min_time = (3, 0.01) if args.quick else (7, 0.1)
+    cases = [case for case in CASES if not args.case or case.name in args.case]
+
+    results: list[BenchmarkResult] = []
+    for case in cases:
+        print(f"running {case.name}...", file=sys.stderr)
+        results.extend(run_benchmark_case(case, repeats=repeats, min_time=min_time))
+
+    report = render_scaling_report(
+        results, {case.name: case.description for case in cases}
+    )
+    print(report)
+
+    if args.write_baseline:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(
+            json.dumps(results_to_baseline(results), indent=2) + "\n"
+        )
+        REPORT_PATH.write_text(report)
+
+    if args.check:
+        baseline = json.loads(BASELINE_PATH.read_text())
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
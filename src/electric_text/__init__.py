@@ -1,14 +1,29 @@
-from importlib.metadata import version, PackageNotFoundError
-
-try:
-    __version__ = version("electric_text")
-except PackageNotFoundError:
-    __version__ = "unknown"
-
-# Export the main interface
-from electric_text.prompting import generate
+from typing import Any
 
 __all__ = [
     "generate",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Load the public interface on first use.
+
+    Importing any electric_text submodule runs this package's __init__, so
+    eager imports here would load the whole package graph (pydantic included)
+    for every CLI invocation and subcommand.
+    """
+    if name == "generate":
+        from electric_text.prompting.functions.generate import generate
+
+        return generate
+
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            return version("electric_text")
+        except PackageNotFoundError:
+            return "unknown"
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
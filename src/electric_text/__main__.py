@@ -1,23 +1,52 @@
 import asyncio
+import importlib
+import os
 import sys
 
-from electric_text.cli.functions.main import main
-from electric_text.cli.commands.config import config_command
+from electric_text.daemon import (
+    DaemonRequest,
+    forward_to_daemon,
+    get_daemon_fingerprint,
+    get_daemon_socket_path,
+    should_forward_to_daemon,
+)
 
+# Subcommands are imported only when selected, so each command loads only
+# the modules it needs
 COMMANDS = {
-    "config": config_command,
+    "batch": "electric_text.cli.commands.batch:batch_command",
+    "bench": "electric_text.cli.commands.bench:bench_command",
+    "config": "electric_text.cli.commands.config:config_command",
+    "serve-local": "electric_text.cli.commands.serve_local:serve_local_command",
 }
 
 if __name__ == "__main__":
     # Check if a subcommand is specified
     if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
         # Run the subcommand
-        command_name = sys.argv[1]
-        command_func = COMMANDS[command_name]
+        module_name, function_name = COMMANDS[sys.argv[1]].split(":")
+        command_func = getattr(importlib.import_module(module_name), function_name)
         # Remove the command name from args
         exit_code = command_func(sys.argv[2:])
         sys.exit(exit_code)
     else:
+        # Hand the request to a running serve-local daemon, if there is one
+        # for this directory and environment
+        if should_forward_to_daemon(sys.argv[1:], os.environ):
+            exit_code = forward_to_daemon(
+                DaemonRequest(
+                    args=sys.argv[1:],
+                    fingerprint=get_daemon_fingerprint(os.getcwd(), os.environ),
+                ),
+                get_daemon_socket_path(os.environ),
+                sys.stdout,
+                sys.stderr,
+            )
+            if exit_code is not None:
+                sys.exit(exit_code)
+
+        from electric_text.cli.functions.main import main
+
         # Run the default command (process text)
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
@@ -0,0 +1,19 @@
+from electric_text.batch.data.batch_record import BatchRecord
+from electric_text.batch.data.batch_settings import BatchSettings
+from electric_text.batch.data.batch_summary import BatchSummary
+from electric_text.batch.functions.keep_completed_results import (
+    keep_completed_results,
+)
+from electric_text.batch.functions.load_batch_journal import load_batch_journal
+from electric_text.batch.functions.read_batch_records import read_batch_records
+from electric_text.batch.functions.run_batch import run_batch
+
+__all__ = [
+    "BatchRecord",
+    "BatchSettings",
+    "BatchSummary",
+    "keep_completed_results",
+    "load_batch_journal",
+    "read_batch_records",
+    "run_batch",
+]
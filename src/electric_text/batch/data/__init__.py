@@ -0,0 +1,5 @@
+from electric_text.batch.data.batch_record import BatchRecord
+from electric_text.batch.data.batch_settings import BatchSettings
+from electric_text.batch.data.batch_summary import BatchSummary
+
+__all__ = ["BatchRecord", "BatchSettings", "BatchSummary"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BatchRecord:
+    """One input of a batch run.
+
+    Args:
+        id: Identifier echoed in the record's output and journal entry
+        text_input: Text to process
+        model: Model override ('provider:model' or a shorthand)
+        prompt_name: Prompt name override
+        max_tokens: Max tokens override
+    """
+
+    id: str
+    text_input: str
+    model: str | None = None
+    prompt_name: str | None = None
+    max_tokens: int | None = None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BatchSettings:
+    """How a batch run schedules its records.
+
+    Args:
+        concurrency: Maximum number of records in flight
+    """
+
+    concurrency: int = 4
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    """What a batch run did with its records.
+
+    Args:
+        succeeded: Records that produced an output
+        failed: Records that produced an error (not journaled, so a resumed
+            run retries them)
+        skipped: Records already in the journal
+    """
+
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
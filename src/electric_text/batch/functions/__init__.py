@@ -0,0 +1,15 @@
+from electric_text.batch.functions.keep_completed_results import (
+    keep_completed_results,
+)
+from electric_text.batch.functions.load_batch_journal import load_batch_journal
+from electric_text.batch.functions.parse_batch_line import parse_batch_line
+from electric_text.batch.functions.read_batch_records import read_batch_records
+from electric_text.batch.functions.run_batch import run_batch
+
+__all__ = [
+    "keep_completed_results",
+    "load_batch_journal",
+    "parse_batch_line",
+    "read_batch_records",
+    "run_batch",
+]
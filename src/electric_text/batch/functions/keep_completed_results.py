@@ -0,0 +1,34 @@
+import json
+import os
+
+
+def keep_completed_results(path: str, completed_ids: set[str]) -> None:
+    """Drop the result lines of records a resumed batch will run again.
+
+    Only successful records are journaled, so a resumed run retries the
+    ones that failed. Their earlier error lines are removed first, leaving
+    one line per id once the run is done. A line cut short by an
+    interrupted write is removed too.
+
+    Args:
+        path: Output path (a missing file means nothing to keep)
+        completed_ids: Ids the journal records as completed
+    """
+    if not os.path.exists(path):
+        return
+
+    kept = []
+    with open(path, encoding="utf-8") as output:
+        for line in output:
+            try:
+                is_completed = str(json.loads(line)["id"]) in completed_ids
+            except (ValueError, KeyError, TypeError):
+                continue
+            if is_completed:
+                kept.append(line if line.endswith("\n") else line + "\n")
+
+    # Replace the file whole, so an interruption cannot lose kept results
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as output:
+        output.writelines(kept)
+    os.replace(temporary, path)
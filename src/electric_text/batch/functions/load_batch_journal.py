@@ -0,0 +1,28 @@
+import json
+import os
+
+
+def load_batch_journal(path: str) -> set[str]:
+    """Read the ids a previous run of a batch completed.
+
+    A line cut short by an interrupted write is ignored, so that record is
+    simply run again.
+
+    Args:
+        path: Journal path (a missing file means nothing completed yet)
+
+    Returns:
+        The completed ids
+    """
+    if not os.path.exists(path):
+        return set()
+
+    completed = set()
+    with open(path, encoding="utf-8") as journal:
+        for line in journal:
+            try:
+                completed.add(str(json.loads(line)["id"]))
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    return completed
@@ -0,0 +1,44 @@
+import json
+
+from electric_text.batch.data.batch_record import BatchRecord
+
+FIELDS = ("id", "text", "model", "prompt_name", "max_tokens")
+
+
+def parse_batch_line(line: str, line_number: int) -> BatchRecord:
+    """Parse one line of batch input.
+
+    A line starting with "{" is a JSON object with a required "text" and
+    optional "id", "model", "prompt_name", and "max_tokens"; any other line
+    is the text itself. Records without an id use their line number.
+
+    Args:
+        line: The line, without its newline
+        line_number: 1-based line number in the input
+
+    Returns:
+        The parsed record
+
+    Raises:
+        ValueError: If a JSON line is malformed or has unknown or missing fields
+    """
+    if not line.lstrip().startswith("{"):
+        return BatchRecord(id=str(line_number), text_input=line)
+
+    fields = json.loads(line)
+    unknown = sorted(set(fields) - set(FIELDS))
+    if unknown:
+        raise ValueError(f"Line {line_number}: unknown fields {', '.join(unknown)}")
+    if not isinstance(fields.get("text"), str):
+        raise ValueError(f"Line {line_number}: 'text' must be a string")
+    max_tokens = fields.get("max_tokens")
+    if max_tokens is not None and not isinstance(max_tokens, int):
+        raise ValueError(f"Line {line_number}: 'max_tokens' must be an integer")
+
+    return BatchRecord(
+        id=str(fields.get("id", line_number)),
+        text_input=fields["text"],
+        model=fields.get("model"),
+        prompt_name=fields.get("prompt_name"),
+        max_tokens=max_tokens,
+    )
@@ -0,0 +1,31 @@
+from typing import Iterable, Iterator
+
+from electric_text.batch.data.batch_record import BatchRecord
+from electric_text.batch.functions.parse_batch_line import parse_batch_line
+
+
+def read_batch_records(lines: Iterable[str]) -> Iterator[BatchRecord]:
+    """Parse batch input lazily, so records from stdin start as they arrive.
+
+    Blank lines are skipped but still counted for line-number ids.
+
+    Args:
+        lines: Lines of JSONL or plain text
+
+    Yields:
+        One record per non-blank line
+
+    Raises:
+        ValueError: If a line is malformed or repeats an earlier id
+    """
+    seen: set[str] = set()
+    for line_number, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+
+        record = parse_batch_line(line, line_number)
+        if record.id in seen:
+            raise ValueError(f"Line {line_number}: duplicate id {record.id!r}")
+        seen.add(record.id)
+        yield record
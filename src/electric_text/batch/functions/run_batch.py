@@ -0,0 +1,85 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Iterable, TextIO
+
+from electric_text.batch.data.batch_record import BatchRecord
+from electric_text.batch.data.batch_settings import BatchSettings
+from electric_text.batch.data.batch_summary import BatchSummary
+
+
+async def run_batch(
+    records: Iterable[BatchRecord],
+    run_record: Callable[[BatchRecord], Awaitable[dict[str, Any]]],
+    output: TextIO,
+    settings: BatchSettings,
+    journal: TextIO | None = None,
+    completed_ids: set[str] | None = None,
+) -> BatchSummary:
+    """Run records concurrently, writing each result as soon as it finishes.
+
+    Every record produces one JSON line on output, tagged with its id:
+    {"id": ..., "output": ...} on success or {"id": ..., "error": ...} on
+    failure. Successful ids are then appended to the journal, so a resumed
+    run can skip them. Records are read in a worker thread, and only as
+    concurrency slots free up, so input that streams in slowly (such as
+    stdin) neither stalls records in flight nor has to be complete first.
+
+    A malformed input line raises once the records already started have
+    finished.
+
+    Args:
+        records: Records to run
+        run_record: Produces the output for one record
+        output: Where to write result lines
+        settings: Batch settings
+        journal: Where to record completed ids
+        completed_ids: Ids to skip because an earlier run completed them
+
+    Returns:
+        BatchSummary
+
+    Raises:
+        ValueError: If the input has a malformed line or a repeated id
+    """
+    completed_ids = completed_ids or set()
+    slots = asyncio.Semaphore(settings.concurrency)
+    counts = {"succeeded": 0, "failed": 0, "skipped": 0}
+
+    async def run(record: BatchRecord) -> None:
+        try:
+            result = {"id": record.id, "output": await run_record(record)}
+        except Exception as e:
+            result = {"id": record.id, "error": f"{type(e).__name__}: {e}"}
+        finally:
+            slots.release()
+
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+        if "error" in result:
+            counts["failed"] += 1
+            return
+
+        counts["succeeded"] += 1
+        if journal is not None:
+            journal.write(json.dumps({"id": record.id}) + "\n")
+            journal.flush()
+
+    in_flight: set[asyncio.Task[None]] = set()
+    pending = iter(records)
+    try:
+        while (record := await asyncio.to_thread(next, pending, None)) is not None:
+            if record.id in completed_ids:
+                counts["skipped"] += 1
+                continue
+
+            await slots.acquire()
+            task = asyncio.create_task(run(record))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+    except Exception:
+        # Records already started still finish and are journaled
+        await asyncio.gather(*in_flight)
+        raise
+
+    await asyncio.gather(*in_flight)
+    return BatchSummary(**counts)
@@ -0,0 +1,196 @@
+import argparse
+import asyncio
+import sys
+from contextlib import ExitStack
+from functools import partial
+from typing import List, Optional, TextIO
+
+from electric_text.batch import (
+    BatchSettings,
+    BatchSummary,
+    keep_completed_results,
+    load_batch_journal,
+    read_batch_records,
+    run_batch,
+)
+from electric_text.cli.functions.run_batch_record import run_batch_record
+from electric_text.prompting.data.system_input import SystemInput
+from electric_text.prompting.functions.get_client_pool import get_client_pool
+from electric_text.prompting.functions.get_default_model import get_default_model
+from electric_text.prompting.functions.load_user_config import load_user_config
+
+
+async def run_batch_with_pool(
+    lines: TextIO,
+    defaults: SystemInput,
+    output: TextIO,
+    settings: BatchSettings,
+    journal: TextIO | None,
+    completed_ids: set[str],
+) -> BatchSummary:
+    """Run a batch with pooled provider connections, closing them afterwards."""
+    pool = get_client_pool()
+    pool.enable()
+    try:
+        return await run_batch(
+            read_batch_records(lines),
+            partial(run_batch_record, defaults=defaults),
+            output,
+            settings,
+            journal=journal,
+            completed_ids=completed_ids,
+        )
+    finally:
+        await pool.aclose()
+
+
+def batch_command(args: Optional[List[str]] = None) -> int:
+    """Run the batch command.
+
+    Args:
+        args: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code (0 if every record succeeded, 1 otherwise, 2 for bad input)
+    """
+    parser = argparse.ArgumentParser(
+        prog="electric_text batch",
+        description="Process JSONL or plain-text records concurrently",
+    )
+
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="JSONL or one-text-per-line file ('-' or omitted reads stdin)",
+    )
+
+    parser.add_argument(
+        "--model",
+        "-m",
+        type=str,
+        help="Default model: 'provider:model' or a shorthand (default: configured default model)",
+    )
+
+    parser.add_argument(
+        "--prompt-name",
+        "-p",
+        type=str,
+        help="Default prompt name",
+    )
+
+    parser.add_argument(
+        "--max-tokens",
+        "-mt",
+        type=int,
+        help="Default maximum number of tokens to generate",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        "-j",
+        type=int,
+        default=4,
+        help="Maximum number of records in flight (default: 4)",
+    )
+
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        help="Write result lines to this file instead of stdout",
+    )
+
+    parser.add_argument(
+        "--journal",
+        type=str,
+        help="Record completed ids here and skip ids already recorded",
+    )
+
+    parser.add_argument(
+        "--tool-boxes",
+        "-tb",
+        type=str,
+        help="Tool boxes to use for every record (comma-separated)",
+    )
+
+    parser.add_argument(
+        "--api-key",
+        "-k",
+        type=str,
+        help="API key for providers that require authentication",
+    )
+
+    parser.add_argument(
+        "--config",
+        "-c",
+        type=str,
+        help="Path to configuration file",
+    )
+
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.config:
+        load_user_config(parsed_args.config)
+
+    defaults = SystemInput(
+        text_input="",
+        provider_name="",
+        model_name=parsed_args.model or get_default_model(),
+        api_key=parsed_args.api_key,
+        max_tokens=parsed_args.max_tokens,
+        prompt_name=parsed_args.prompt_name,
+        tool_boxes=parsed_args.tool_boxes,
+    )
+    completed_ids = (
+        load_batch_journal(parsed_args.journal) if parsed_args.journal else set()
+    )
+    if parsed_args.output and completed_ids:
+        # Failed records run again, so their earlier lines must go
+        keep_completed_results(parsed_args.output, completed_ids)
+
+    with ExitStack() as stack:
+        lines = (
+            sys.stdin
+            if parsed_args.input == "-"
+            else stack.enter_context(open(parsed_args.input, encoding="utf-8"))
+        )
+        # A resumed run adds to the results it already wrote
+        output = (
+            stack.enter_context(
+                open(
+                    parsed_args.output, "a" if completed_ids else "w", encoding="utf-8"
+                )
+            )
+            if parsed_args.output
+            else sys.stdout
+        )
+        journal = (
+            stack.enter_context(open(parsed_args.journal, "a", encoding="utf-8"))
+            if parsed_args.journal
+            else None
+        )
+
+        try:
+            summary = asyncio.run(
+                run_batch_with_pool(
+                    lines,
+                    defaults,
+                    output,
+                    BatchSettings(concurrency=parsed_args.concurrency),
+                    journal,
+                    completed_ids,
+                )
+            )
+        except ValueError as e:
+            # Records finished before the bad line are journaled, so the
+            # batch can be resumed once the input is fixed
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+
+    print(
+        f"{summary.succeeded} succeeded, {summary.failed} failed, "
+        f"{summary.skipped} skipped",
+        file=sys.stderr,
+    )
+    return 1 if summary.failed else 0
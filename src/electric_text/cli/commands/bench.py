@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import json
+import sys
+from typing import List, Optional
+
+from electric_text.load_testing import (
+    LoadTestSettings,
+    format_load_test_report,
+    load_test_report_to_dict,
+    run_load_test,
+)
+from electric_text.prompting.functions.create_load_test_target import (
+    create_load_test_target,
+)
+from electric_text.prompting.functions.get_default_model import get_default_model
+from electric_text.prompting.functions.load_user_config import load_user_config
+
+
+def bench_command(args: Optional[List[str]] = None) -> int:
+    """Run the load-testing command.
+
+    Args:
+        args: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code (0 if every request succeeded, 1 otherwise, 2 for an
+        invalid model)
+    """
+    parser = argparse.ArgumentParser(
+        prog="electric_text bench",
+        description="Load-test a provider and report throughput and latency percentiles",
+    )
+
+    parser.add_argument(
+        "--model",
+        "-m",
+        type=str,
+        help="Model to test: 'provider:model' or a shorthand (default: configured default model)",
+    )
+
+    parser.add_argument(
+        "--requests",
+        "-n",
+        type=int,
+        default=100,
+        help="Total number of requests (default: 100)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        "-j",
+        type=int,
+        default=10,
+        help="Maximum number of requests in flight (default: 10)",
+    )
+
+    parser.add_argument(
+        "--rate",
+        "-r",
+        type=float,
+        help="Target requests per second (default: as fast as concurrency allows)",
+    )
+
+    parser.add_argument(
+        "--mode",
+        choices=["stream", "completion"],
+        default="stream",
+        help="Stream responses (measures TTFT) or await completions (default: stream)",
+    )
+
+    parser.add_argument(
+        "--prompt",
+        "-p",
+        type=str,
+        default="Say hello.",
+        help="Prompt text sent with every request",
+    )
+
+    parser.add_argument(
+        "--max-tokens",
+        "-mt",
+        type=int,
+        help="Maximum number of tokens to generate",
+    )
+
+    parser.add_argument(
+        "--api-key",
+        "-k",
+        type=str,
+        help="API key for providers that require authentication",
+    )
+
+    parser.add_argument(
+        "--format",
+        "-f",
+        choices=["table", "json"],
+        default="table",
+        help="Report format (default: table)",
+    )
+
+    parser.add_argument(
+        "--config",
+        "-c",
+        type=str,
+        help="Path to configuration file",
+    )
+
+    parsed_args = parser.parse_args(args)
+
+    if parsed_args.config:
+        load_user_config(parsed_args.config)
+
+    try:
+        client, request = create_load_test_target(
+            model_string=parsed_args.model or get_default_model(),
+            text_input=parsed_args.prompt,
+            api_key=parsed_args.api_key,
+            max_tokens=parsed_args.max_tokens,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    settings = LoadTestSettings(
+        total_requests=parsed_args.requests,
+        concurrency=parsed_args.concurrency,
+        rate=parsed_args.rate,
+        stream=parsed_args.mode == "stream",
+    )
+
+    report = asyncio.run(run_load_test(client, request, settings))
+
+    if parsed_args.format == "json":
+        print(json.dumps(load_test_report_to_dict(report), indent=2))
+    else:
+        print(format_load_test_report(report))
+
+    return 1 if report.failed else 0
@@ -0,0 +1,42 @@
+import argparse
+import asyncio
+import os
+from typing import List, Optional
+
+from electric_text.cli.functions.run_daemon import run_daemon
+from electric_text.daemon import get_daemon_fingerprint, get_daemon_socket_path
+
+
+def serve_local_command(args: Optional[List[str]] = None) -> int:
+    """Run the serve-local command.
+
+    Keeps the client stack loaded and provider connections open in a
+    background process; later `electric_text` invocations from the same
+    directory and environment are forwarded to it over a Unix socket.
+
+    Args:
+        args: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code (0 for success, non-zero for error)
+    """
+    parser = argparse.ArgumentParser(
+        prog="electric_text serve-local",
+        description="Serve CLI requests from a warm local daemon",
+    )
+
+    parser.add_argument(
+        "--socket",
+        "-s",
+        type=str,
+        default=get_daemon_socket_path(os.environ),
+        help="Unix socket path (default: $ELECTRIC_TEXT_DAEMON_SOCKET or a private per-user path)",
+    )
+
+    parsed_args = parser.parse_args(args)
+    fingerprint = get_daemon_fingerprint(os.getcwd(), os.environ)
+
+    try:
+        return asyncio.run(run_daemon(parsed_args.socket, fingerprint))
+    except KeyboardInterrupt:
+        return 0
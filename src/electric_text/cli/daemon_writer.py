@@ -0,0 +1,38 @@
+import asyncio
+import io
+
+from electric_text.daemon import encode_daemon_message
+
+
+class DaemonWriter(io.StringIO):
+    """A text stream that sends what is written to a daemon client.
+
+    Output is sent a line at a time as {"stdout": ...} or {"stderr": ...}
+    messages, so `print(..., file=writer)` streams results to the forwarding
+    CLI as they are produced. Partial lines are held until a newline or
+    flush(). Subclassing StringIO provides the rest of the TextIO interface
+    that print() and argparse expect.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, stream_name: str) -> None:
+        super().__init__()
+        self.writer = writer
+        self.stream_name = stream_name
+        self.pending = ""
+
+    def write(self, text: str) -> int:
+        self.pending += text
+        complete, newline, partial = self.pending.rpartition("\n")
+        if newline:
+            self.send(complete + newline)
+            self.pending = partial
+        return len(text)
+
+    def flush(self) -> None:
+        if self.pending:
+            self.send(self.pending)
+            self.pending = ""
+
+    def send(self, text: str) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(encode_daemon_message({self.stream_name: text}))
@@ -0,0 +1,29 @@
+import argparse
+
+from electric_text.prompting.data.output_format import OutputFormat
+
+
+def add_output_format_argument(
+    parser: argparse.ArgumentParser,
+) -> argparse.ArgumentParser:
+    """Add the --output-format option to an argument parser.
+
+    Args:
+        parser: The parser to extend
+
+    Returns:
+        The same parser, for chaining
+    """
+    parser.add_argument(
+        "--output-format",
+        "-of",
+        choices=[output_format.value for output_format in OutputFormat],
+        default=OutputFormat.FULL.value,
+        help=(
+            "NDJSON output: 'full' prints the whole output for every update, "
+            "'delta' prints only appended text, tool argument fragments and "
+            "completed fields, then a summary (default: full)"
+        ),
+    )
+
+    return parser
@@ -0,0 +1,35 @@
+import argparse
+
+from electric_text.profiling import ProfileMode
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Add the profiling options to an argument parser.
+
+    Args:
+        parser: The parser to extend
+
+    Returns:
+        The same parser, for chaining
+    """
+    parser.add_argument(
+        "--profile",
+        type=str,
+        metavar="PATH",
+        help="Profile the request and write a .pstats (or collapsed-stack) file to PATH",
+    )
+
+    parser.add_argument(
+        "--profile-mode",
+        choices=[mode.value for mode in ProfileMode],
+        default=ProfileMode.CPROFILE.value,
+        help="Profiler to use with --profile (default: cprofile)",
+    )
+
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Also trace memory allocations with tracemalloc when profiling",
+    )
+
+    return parser
@@ -0,0 +1,57 @@
+import asyncio
+import json
+import traceback
+
+from electric_text.cli.daemon_writer import DaemonWriter
+from electric_text.cli.functions.process_text import process_text
+from electric_text.daemon import DaemonRequest, encode_daemon_message
+
+
+async def handle_daemon_request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, fingerprint: str
+) -> None:
+    """Run one forwarded CLI invocation and stream its output back.
+
+    Requests from a different working directory or ELECTRIC_TEXT_*
+    environment are answered with a mismatch, and the caller runs them
+    itself instead. An invocation that raises has its traceback sent to
+    the caller's stderr and exits with 1, as it would have run locally.
+
+    Args:
+        reader: The connection's reader
+        writer: The connection's writer
+        fingerprint: The daemon's own fingerprint
+    """
+    try:
+        request = DaemonRequest(**json.loads(await reader.readline()))
+    except (TypeError, ValueError):
+        writer.close()
+        return
+
+    if request.fingerprint != fingerprint:
+        writer.write(encode_daemon_message({"mismatch": "fingerprint"}))
+        writer.close()
+        return
+
+    stdout = DaemonWriter(writer, "stdout")
+    stderr = DaemonWriter(writer, "stderr")
+    try:
+        exit_code = await process_text(request.args, stdout=stdout, stderr=stderr)
+    except SystemExit as exit_request:
+        # --help and argparse usage errors exit from parse_args
+        exit_code = exit_request.code if isinstance(exit_request.code, int) else 0
+    except Exception:
+        # Bad configs and missing prompt directories raise before any output
+        traceback.print_exc(file=stderr)
+        exit_code = 1
+
+    stdout.flush()
+    stderr.flush()
+    if not writer.is_closing():
+        writer.write(encode_daemon_message({"exit_code": exit_code}))
+
+    try:
+        await writer.drain()
+    except ConnectionError:
+        pass
+    writer.close()
@@ -1,81 +1,31 @@
-import json
-import logging
-import traceback
+import sys
 from typing import List, Optional
 
-from electric_text.prompting import generate
-from electric_text.logging import configure_logging, get_logger
-from electric_text.cli.functions.parse_args import parse_args
-from electric_text.prompting.functions.load_user_config import load_user_config
-from electric_text.prompting.functions.resolve_system_input import resolve_system_input
-from electric_text.prompting.functions.output_conversion.system_output_to_dict import (
-    system_output_to_dict,
-)
+from electric_text.cli.functions.parse_profile_settings import parse_profile_settings
+from electric_text.cli.functions.process_text import process_text
+from electric_text.profiling import format_profile_summary, profiling
 
 
 async def main(args: Optional[List[str]] = None) -> int:
     """Main entry point for the CLI.
 
+    With --profile, the whole request runs under the profiler and a per-phase
+    summary is printed to stderr.
+
     Args:
         args: Command-line arguments (defaults to sys.argv[1:])
 
     Returns:
         Exit code
     """
-    # Parse arguments and get raw input + config path
-    raw_input, config_path = parse_args(args)
-
-    # Load user config if specified
-    if config_path:
-        load_user_config(config_path)
-
-    # Resolve configuration-dependent values
-    system_input = resolve_system_input(raw_input)
-
-    log_level = getattr(logging, system_input.log_level)
-    configure_logging(level=log_level)
-    logger = get_logger(__name__)
-
-    try:
-        logger.debug(f"Processing with system input: {system_input}")
-
-        if system_input.stream:
-            stream_result = await generate(
-                text_input=system_input.text_input,
-                provider_name=system_input.provider_name,
-                model_name=system_input.model_name,
-                log_level=system_input.log_level,
-                api_key=system_input.api_key,
-                max_tokens=system_input.max_tokens,
-                prompt_name=system_input.prompt_name,
-                stream=True,
-                tool_boxes=system_input.tool_boxes,
-            )
-
-            async for output in stream_result:
-                output_dict = system_output_to_dict(output)
-                print(json.dumps(output_dict))
+    profile_settings = parse_profile_settings(args)
+    if profile_settings is None:
+        return await process_text(args)
 
-        else:
-            result = await generate(
-                text_input=system_input.text_input,
-                provider_name=system_input.provider_name,
-                model_name=system_input.model_name,
-                log_level=system_input.log_level,
-                api_key=system_input.api_key,
-                max_tokens=system_input.max_tokens,
-                prompt_name=system_input.prompt_name,
-                stream=False,
-                tool_boxes=system_input.tool_boxes,
-            )
+    with profiling(profile_settings) as session:
+        exit_code = await process_text(args)
 
-            output_dict = system_output_to_dict(result)
-            print(json.dumps(output_dict))
+    if session.report is not None:
+        print(format_profile_summary(session.report), file=sys.stderr)
 
-        return 0
-    except Exception as e:
-        print(f"Error: {e}")
-        print(f"Type: {type(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        logger.error(f"Error during execution: {e}")
-        return 1
+    return exit_code
@@ -1,8 +1,11 @@
 import argparse
 from typing import List, Optional
 
+from electric_text.cli.functions.add_output_format_argument import (
+    add_output_format_argument,
+)
+from electric_text.cli.functions.add_profile_arguments import add_profile_arguments
 from electric_text.prompting.data.system_input import SystemInput
-from electric_text.prompting.functions.get_model_choices import get_model_choices
 from electric_text.prompting.functions.get_default_model import get_default_model
 from electric_text.prompting.functions.get_default_log_level import (
     get_default_log_level,
@@ -21,9 +24,12 @@ def parse_args(args: Optional[List[str]] = None) -> tuple[SystemInput, Optional[
     Returns:
         Tuple of (SystemInput with raw parsed arguments, config_path if specified)
     """
+    # Without abbreviations, every spelling of the profile options starts with
+    # --profile, which is how should_forward_to_daemon keeps them in-process
     parser = argparse.ArgumentParser(
         prog="electric_text",
         description="This text is electric!",
+        allow_abbrev=False,
     )
 
     parser.add_argument(
@@ -32,16 +38,14 @@ def parse_args(args: Optional[List[str]] = None) -> tuple[SystemInput, Optional[
         help="Text to be processed",
     )
 
-    # Get model choices and default from prompting layer
-    choices = get_model_choices()
+    # The model string is validated when it is resolved in the prompting layer
     default_model = get_default_model()
 
     parser.add_argument(
         "--model",
         "-m",
-        choices=choices,
         default=default_model,
-        help=f"Model to use for processing (default: {default_model})",
+        help=f"Model to use: 'provider:model' or a shorthand (default: {default_model})",
     )
 
     # Get default log level from prompting layer
@@ -85,6 +89,8 @@ def parse_args(args: Optional[List[str]] = None) -> tuple[SystemInput, Optional[
         help="Stream the response",
     )
 
+    add_output_format_argument(parser)
+
     parser.add_argument(
         "--tool-boxes",
         "-tb",
@@ -99,6 +105,9 @@ def parse_args(args: Optional[List[str]] = None) -> tuple[SystemInput, Optional[
         help="Path to configuration file",
     )
 
+    # Profiling options are read by parse_profile_settings before this runs
+    add_profile_arguments(parser)
+
     parsed_args = parser.parse_args(args)
 
     # Return raw SystemInput - configuration resolution happens in prompting layer
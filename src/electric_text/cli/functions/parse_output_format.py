@@ -0,0 +1,26 @@
+import argparse
+from typing import List, Optional
+
+from electric_text.cli.functions.add_output_format_argument import (
+    add_output_format_argument,
+)
+from electric_text.prompting.data.output_format import OutputFormat
+
+
+def parse_output_format(args: Optional[List[str]] = None) -> OutputFormat:
+    """Parse only the --output-format option, ignoring all other arguments.
+
+    The option is validated with the rest by parse_args; this reads it
+    without adding a field to SystemInput, which describes the request
+    rather than how the CLI prints it.
+
+    Args:
+        args: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        The selected output format
+    """
+    parser = add_output_format_argument(argparse.ArgumentParser(add_help=False))
+    parsed_args, _ = parser.parse_known_args(args)
+
+    return OutputFormat(parsed_args.output_format)
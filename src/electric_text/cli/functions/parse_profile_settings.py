@@ -0,0 +1,33 @@
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+from electric_text.cli.functions.add_profile_arguments import add_profile_arguments
+from electric_text.profiling import ProfileMode, ProfileSettings
+
+
+def parse_profile_settings(args: Optional[List[str]] = None) -> ProfileSettings | None:
+    """Parse only the profiling options, ignoring all other arguments.
+
+    This runs before the full argument parsing so that argument parsing and
+    configuration loading are included in the profile.
+
+    Args:
+        args: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        ProfileSettings if --profile was given, None otherwise
+    """
+    parser = add_profile_arguments(
+        argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    )
+    parsed_args, _ = parser.parse_known_args(args)
+
+    if parsed_args.profile is None:
+        return None
+
+    return ProfileSettings(
+        output_path=Path(parsed_args.profile),
+        mode=ProfileMode(parsed_args.profile_mode),
+        memory=parsed_args.profile_memory,
+    )
@@ -0,0 +1,109 @@
+import json
+import logging
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import AsyncIterator, List, Optional, TextIO
+
+from electric_text.logging import configure_logging, get_logger
+from electric_text.profiling import ProfilePhase, record_phase
+from electric_text.cli.functions.parse_args import parse_args
+from electric_text.cli.functions.parse_output_format import parse_output_format
+from electric_text.prompting.data.system_output import SystemOutput
+from electric_text.prompting.functions.load_user_config import load_user_config
+from electric_text.prompting.functions.resolve_system_input import resolve_system_input
+
+
+async def process_text(
+    args: Optional[List[str]] = None,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int:
+    """Process text input from the command line and print the results.
+
+    Args:
+        args: Command-line arguments (defaults to sys.argv[1:])
+        stdout: Where to print results (defaults to sys.stdout)
+        stderr: Where to print errors (defaults to sys.stderr)
+
+    Returns:
+        Exit code
+    """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    with record_phase(ProfilePhase.CONFIG):
+        # Parse arguments and get raw input + config path; argparse prints
+        # --help and usage errors to sys.stdout/sys.stderr
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            raw_input, config_path = parse_args(args)
+
+        # Load user config if specified
+        if config_path:
+            load_user_config(config_path)
+
+        # Resolve configuration-dependent values
+        try:
+            system_input = resolve_system_input(raw_input)
+        except ValueError as e:
+            print(f"Error: {e}", file=stderr)
+            return 2
+
+        log_level = getattr(logging, system_input.log_level)
+        configure_logging(level=log_level)
+
+    logger = get_logger(__name__)
+
+    # Imported after argument parsing so --help and usage errors skip the
+    # client stack (pydantic, tools, prompt loading)
+    from electric_text.prompting.functions.generate import generate
+    from electric_text.prompting.functions.output_conversion.format_output_records import (
+        format_output_records,
+    )
+    from electric_text.prompting.functions.output_conversion.single_output import (
+        single_output,
+    )
+
+    output_format = parse_output_format(args)
+
+    try:
+        logger.debug(f"Processing with system input: {system_input}")
+
+        outputs: AsyncIterator[SystemOutput]
+        if system_input.stream:
+            outputs = await generate(
+                text_input=system_input.text_input,
+                provider_name=system_input.provider_name,
+                model_name=system_input.model_name,
+                log_level=system_input.log_level,
+                api_key=system_input.api_key,
+                max_tokens=system_input.max_tokens,
+                prompt_name=system_input.prompt_name,
+                stream=True,
+                tool_boxes=system_input.tool_boxes,
+            )
+        else:
+            result = await generate(
+                text_input=system_input.text_input,
+                provider_name=system_input.provider_name,
+                model_name=system_input.model_name,
+                log_level=system_input.log_level,
+                api_key=system_input.api_key,
+                max_tokens=system_input.max_tokens,
+                prompt_name=system_input.prompt_name,
+                stream=False,
+                tool_boxes=system_input.tool_boxes,
+            )
+            outputs = single_output(result)
+
+        async for record in format_output_records(outputs, output_format):
+            with record_phase(ProfilePhase.SERIALIZE):
+                print(json.dumps(record), file=stdout, flush=True)
+
+        return 0
+    except Exception as e:
+        print(f"Error: {e}", file=stdout)
+        print(f"Type: {type(e)}", file=stdout)
+        print(f"Traceback: {traceback.format_exc()}", file=stdout)
+        logger.error(f"Error during execution: {e}")
+        return 1
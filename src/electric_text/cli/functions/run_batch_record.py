@@ -0,0 +1,50 @@
+from dataclasses import replace
+from typing import Any
+
+from electric_text.batch import BatchRecord
+from electric_text.prompting.data.system_input import SystemInput
+from electric_text.prompting.functions.generate import generate
+from electric_text.prompting.functions.output_conversion.system_output_to_dict import (
+    system_output_to_dict,
+)
+from electric_text.prompting.functions.resolve_system_input import resolve_system_input
+
+
+async def run_batch_record(
+    record: BatchRecord, defaults: SystemInput
+) -> dict[str, Any]:
+    """Generate the output for one batch record.
+
+    Args:
+        record: The record, whose overrides replace the defaults
+        defaults: Raw SystemInput built from the command-line options
+
+    Returns:
+        The output as a JSON-serializable dict
+
+    Raises:
+        ValueError: If the record's model cannot be resolved
+    """
+    system_input = resolve_system_input(
+        replace(
+            defaults,
+            text_input=record.text_input,
+            model_name=record.model or defaults.model_name,
+            prompt_name=record.prompt_name or defaults.prompt_name,
+            max_tokens=record.max_tokens or defaults.max_tokens,
+        )
+    )
+
+    result = await generate(
+        text_input=system_input.text_input,
+        provider_name=system_input.provider_name,
+        model_name=system_input.model_name,
+        log_level=system_input.log_level,
+        api_key=system_input.api_key,
+        max_tokens=system_input.max_tokens,
+        prompt_name=system_input.prompt_name,
+        stream=False,
+        tool_boxes=system_input.tool_boxes,
+    )
+
+    return system_output_to_dict(result)
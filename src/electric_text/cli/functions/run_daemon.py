@@ -0,0 +1,47 @@
+import asyncio
+import os
+import signal
+import sys
+from typing import TextIO
+
+from electric_text.cli.functions.start_daemon_server import start_daemon_server
+from electric_text.prompting.functions.get_client_pool import get_client_pool
+
+
+async def run_daemon(
+    socket_path: str, fingerprint: str, stderr: TextIO | None = None
+) -> int:
+    """Serve forwarded CLI invocations until cancelled or sent SIGTERM.
+
+    Args:
+        socket_path: The Unix socket path to listen on
+        fingerprint: Fingerprint of the daemon's directory and environment
+        stderr: Where to print status messages (defaults to sys.stderr)
+
+    Returns:
+        Exit code
+    """
+    stderr = stderr or sys.stderr
+
+    try:
+        server = await start_daemon_server(socket_path, fingerprint)
+    except (OSError, RuntimeError) as e:
+        print(f"Error: {e}", file=stderr)
+        return 1
+
+    task = asyncio.current_task()
+    if task is not None:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+
+    print(f"Serving electric_text on {socket_path}", file=stderr, flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await get_client_pool().aclose()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+    return 0
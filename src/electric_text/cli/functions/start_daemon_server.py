@@ -0,0 +1,60 @@
+import asyncio
+import importlib
+import os
+import socket
+from functools import partial
+
+from electric_text.cli.functions.handle_daemon_request import handle_daemon_request
+from electric_text.daemon import is_daemon_listening
+from electric_text.prompting.functions.get_client_pool import get_client_pool
+
+# Imported up front so the first forwarded request doesn't pay for them
+WARM_MODULES = (
+    "electric_text.prompting.functions.generate",
+    "electric_text.prompting.functions.output_conversion.system_output_to_dict",
+)
+
+
+async def start_daemon_server(socket_path: str, fingerprint: str) -> asyncio.Server:
+    """Start serving forwarded CLI invocations on a Unix socket.
+
+    Enables the process-wide client pool, so requests share warm provider
+    connections, and replaces a socket file left behind by a daemon that
+    is no longer running. A missing socket directory is created with mode
+    0700, and the socket is created with mode 0600, so other users can
+    neither connect nor see forwarded arguments.
+
+    Args:
+        socket_path: The Unix socket path to listen on
+        fingerprint: Fingerprint of the daemon's directory and environment
+
+    Returns:
+        The listening server
+
+    Raises:
+        RuntimeError: If another daemon is already listening on the socket, or
+            the socket directory belongs to another user
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if os.stat(directory).st_uid != os.getuid():
+        raise RuntimeError(f"{directory} belongs to another user")
+    if is_daemon_listening(socket_path):
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    for module_name in WARM_MODULES:
+        importlib.import_module(module_name)
+    get_client_pool().enable()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        listener.bind(socket_path)
+    finally:
+        os.umask(umask)
+
+    return await asyncio.start_unix_server(
+        partial(handle_daemon_request, fingerprint=fingerprint), sock=listener
+    )
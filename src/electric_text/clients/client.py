@@ -1,7 +1,9 @@
 import importlib
-from typing import AsyncGenerator
+from contextlib import aclosing
+from typing import Any, AsyncGenerator
 from electric_text.clients.data.validation_model import ValidationModel
 from electric_text.providers import ModelProvider
+from electric_text.profiling import ProfilePhase, record_phase
 from electric_text.clients.data.client_request import ClientRequest
 from electric_text.providers.data.stream_history import StreamHistory
 from electric_text.providers.data.provider_request import ProviderRequest
@@ -13,6 +15,10 @@ from electric_text.clients.functions.history_to_client_response import (
 from electric_text.clients.functions.convert_to_provider_request import (
     convert_to_provider_request,
 )
+from electric_text.clients.request_coalescer import RequestCoalescer
+from electric_text.providers.functions.hash_provider_request import (
+    hash_provider_request,
+)
 
 
 class Client:
@@ -25,8 +31,13 @@ class Client:
         config: dict[str, str] = {},
         http_logging_enabled: bool = False,
         http_log_dir: str = "./http_logs",
+        http_log_options: dict[str, Any] | None = None,
+        keep_alive: bool = False,
+        coalesce: bool = False,
     ) -> None:
         self.provider_name = provider_name
+        # Identical requests in flight share one upstream call when coalescing
+        self.coalescer = RequestCoalescer() if coalesce else None
         provider_module = f"electric_text.providers.model_providers.{provider_name}"
         module = importlib.import_module(provider_module)
         provider_class = getattr(module, f"{provider_name.title()}Provider")
@@ -36,9 +47,39 @@ class Client:
             **config,
             "http_logging_enabled": http_logging_enabled,
             "http_log_dir": http_log_dir,
+            "http_log_options": http_log_options,
+            "keep_alive": keep_alive,
         }
         self.provider = provider_class(**provider_config)
 
+    async def aclose(self) -> None:
+        """Close connections kept open by a keep_alive client."""
+        await self.provider.aclose()
+
+    def stream_histories(
+        self, provider_request: ProviderRequest
+    ) -> AsyncGenerator[StreamHistory, None]:
+        """Open the provider's stream, or join an identical one in flight."""
+        if self.coalescer is None:
+            return self.provider.generate_stream(provider_request)
+
+        return self.coalescer.stream(
+            hash_provider_request(provider_request),
+            lambda: self.provider.generate_stream(provider_request),
+        )
+
+    async def generate_history(
+        self, provider_request: ProviderRequest
+    ) -> StreamHistory:
+        """Get the provider's completion, or share an identical one in flight."""
+        if self.coalescer is None:
+            return await self.provider.generate_completion(provider_request)
+
+        return await self.coalescer.complete(
+            hash_provider_request(provider_request),
+            lambda: self.provider.generate_completion(provider_request),
+        )
+
     async def stream_raw[OutputSchema: ValidationModel](
         self, request: ClientRequest[OutputSchema]
     ) -> AsyncGenerator[ClientResponse[OutputSchema], None]:
@@ -51,11 +92,13 @@ class Client:
         Returns:
             AsyncGenerator[ClientResponse[None], None]: A generator of ClientResponse objects
         """
-        provider_request: ProviderRequest = convert_to_provider_request(request)
+        with record_phase(ProfilePhase.REQUEST_BUILD):
+            provider_request: ProviderRequest = convert_to_provider_request(request)
 
-        # Call provider with request
-        async for history in self.provider.generate_stream(provider_request):
-            yield ClientResponse[OutputSchema](stream_history=history)
+        # Call provider with request, closing its HTTP stream as soon as we stop
+        async with aclosing(self.stream_histories(provider_request)) as histories:
+            async for history in histories:
+                yield ClientResponse[OutputSchema](stream_history=history)
 
     async def generate_raw[OutputSchema: ValidationModel](
         self,
@@ -70,12 +113,11 @@ class Client:
         Returns:
             ClientResponse[None]: Contains the raw content
         """
-        provider_request: ProviderRequest = convert_to_provider_request(request)
+        with record_phase(ProfilePhase.REQUEST_BUILD):
+            provider_request: ProviderRequest = convert_to_provider_request(request)
 
         # Call provider with request
-        history: StreamHistory = await self.provider.generate_completion(
-            provider_request
-        )
+        history: StreamHistory = await self.generate_history(provider_request)
 
         return ClientResponse[OutputSchema](stream_history=history)
 
@@ -92,18 +134,21 @@ class Client:
         Returns:
             AsyncGenerator[ClientResponse[Any], None]: A generator of ClientResponse objects
         """
-        provider_request: ProviderRequest = convert_to_provider_request(request)
+        with record_phase(ProfilePhase.REQUEST_BUILD):
+            provider_request: ProviderRequest = convert_to_provider_request(request)
 
         # Ensure output_schema is set
         assert request.output_schema is not DefaultOutputSchema, "missing output_schema"
 
-        # Call provider with request
-        async for history in self.provider.generate_stream(provider_request):
-            response: ClientResponse[OutputSchema] = await history_to_client_response(
-                history, request.output_schema
-            )
+        # Call provider with request, closing its HTTP stream as soon as we stop
+        async with aclosing(self.stream_histories(provider_request)) as histories:
+            async for history in histories:
+                with record_phase(ProfilePhase.PARSE_VALIDATE):
+                    response = await history_to_client_response(
+                        history, request.output_schema
+                    )
 
-            yield response
+                yield response
 
     async def generate_structured[OutputSchema: ValidationModel](
         self,
@@ -118,15 +163,17 @@ class Client:
         Returns:
             ClientResponse[Any]: Contains the raw content, parsed content, and model instance if valid
         """
-        provider_request: ProviderRequest = convert_to_provider_request(request)
+        with record_phase(ProfilePhase.REQUEST_BUILD):
+            provider_request: ProviderRequest = convert_to_provider_request(request)
 
         # Ensure output_schema is set
         assert request.output_schema is not None, "missing output_schema"
 
         # Call provider with request
-        history = await self.provider.generate_completion(provider_request)
+        history = await self.generate_history(provider_request)
 
-        return await history_to_client_response(history, request.output_schema)
+        with record_phase(ProfilePhase.PARSE_VALIDATE):
+            return await history_to_client_response(history, request.output_schema)
 
     async def generate[OutputSchema: ValidationModel](
         self,
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List, Dict, Optional, Type
+from typing import Any, Dict, Optional, Type, Sequence
 from electric_text.clients.data.prompt import Prompt
 from electric_text.clients.data.validation_model import ValidationModel
 
@@ -14,5 +14,5 @@ class ClientRequest[OutputSchema: ValidationModel]:
     model_name: str
     prompt: Prompt
     output_schema: Type[OutputSchema]
-    tools: Optional[List[Dict[str, Any]]] = None
+    tools: Optional[Sequence[Dict[str, Any]]] = None
     max_tokens: Optional[int] = None
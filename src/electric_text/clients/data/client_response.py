@@ -44,6 +44,16 @@ class ClientResponse[OutputSchema: ValidationModel]:
                     return (tool_data.name, tool_data.input)
         return None
 
+    @property
+    def first_tool_call_json(self) -> str | None:
+        """Get the raw JSON arguments of the first tool call, as streamed so far."""
+        for block in self.stream_history.content_blocks:
+            if block.type == ContentBlockType.TOOL_CALL:
+                tool_data = block.data
+                if isinstance(tool_data, ToolCallData):
+                    return tool_data.input_json_string
+        return None
+
     @property
     def text_content(self) -> str:
         """Get text content from response."""
@@ -0,0 +1,20 @@
+import hashlib
+
+
+def get_validation_module_name(model_path: str, mtime_ns: int, size: int) -> str:
+    """Name the module a validation model file is imported as.
+
+    Each file, and each version of a file (told apart by modification time
+    and size, as the import cache does), gets its own entry in sys.modules,
+    so loading one prompt's model never replaces another's.
+
+    Args:
+        model_path: Path to the Python file containing the validation model
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        str: A module name unique to the file and its version
+    """
+    digest = hashlib.sha1(model_path.encode()).hexdigest()[:16]
+    return f"electric_text_validation_model_{digest}_{mtime_ns}_{size}"
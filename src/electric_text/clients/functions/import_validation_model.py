@@ -0,0 +1,75 @@
+import sys
+import importlib.util
+from functools import lru_cache
+from pydantic import BaseModel
+from electric_text.clients.data.model_load_result import ModelLoadResult
+from electric_text.clients.functions.get_validation_module_name import (
+    get_validation_module_name,
+)
+
+
+# Module name of the latest version imported from each file
+LOADED_MODULES: dict[str, str] = {}
+
+
+@lru_cache(maxsize=256)
+def import_validation_model(
+    model_path: str, mtime_ns: int, size: int
+) -> ModelLoadResult:
+    """
+    Import a validation model class from one version of a Python file.
+
+    Results are cached per (path, mtime_ns, size), so the module code runs
+    once per version of the file and callers share the same class object.
+    Once a version imports, the file's previous version is removed from
+    sys.modules, so edited files do not pile up modules.
+
+    Args:
+        model_path: Path to the Python file containing the validation model.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        ModelLoadResult: Result of loading the model class, with error information if applicable.
+    """
+    module_name = get_validation_module_name(model_path, mtime_ns, size)
+
+    try:
+        # Import the module dynamically
+        spec = importlib.util.spec_from_file_location(module_name, model_path)
+        if spec is None or spec.loader is None:
+            return ModelLoadResult(
+                error="IMPORT_ERROR",
+                error_message=f"Could not load module from {model_path}",
+            )
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+        previous = LOADED_MODULES.get(model_path)
+        if previous is not None and previous != module_name:
+            sys.modules.pop(previous, None)
+        LOADED_MODULES[model_path] = module_name
+
+        # Find the first class that extends BaseModel
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (
+                isinstance(attr, type)
+                and issubclass(attr, BaseModel)
+                and attr.__name__ != "BaseModel"
+                and attr.__module__ == module_name
+            ):
+                return ModelLoadResult(model_class=attr)
+
+        return ModelLoadResult(
+            error="NO_MODEL", error_message=f"No validation model found in {model_path}"
+        )
+
+    except Exception as e:
+        sys.modules.pop(module_name, None)
+        return ModelLoadResult(
+            error="OTHER",
+            error_message=f"Error loading validation model from {model_path}: {str(e)}",
+        )
@@ -1,13 +1,21 @@
-import sys
-import importlib.util
-from pydantic import BaseModel
+import os
+import threading
 from electric_text.clients.data.model_load_result import ModelLoadResult
+from electric_text.clients.functions.import_validation_model import (
+    import_validation_model,
+)
+
+# Serializes imports so concurrent first loads of a file run its code once
+LOAD_LOCK = threading.Lock()
 
 
 def load_validation_model(model_path: str) -> ModelLoadResult:
     """
     Load a validation model class from a Python file.
 
+    The file is imported once per version (modification time and size);
+    later calls return the same class object until the file changes.
+
     Args:
         model_path: Path to the Python file containing the validation model.
 
@@ -15,35 +23,12 @@ def load_validation_model(model_path: str) -> ModelLoadResult:
         ModelLoadResult: Result of loading the model class, with error information if applicable.
     """
     try:
-        # Import the module dynamically
-        spec = importlib.util.spec_from_file_location("schema_module", model_path)
-        if spec is None or spec.loader is None:
-            return ModelLoadResult(
-                error="IMPORT_ERROR",
-                error_message=f"Could not load module from {model_path}",
-            )
-
-        module = importlib.util.module_from_spec(spec)
-        sys.modules["schema_module"] = module
-        spec.loader.exec_module(module)
-
-        # Find the first class that extends BaseModel
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if (
-                isinstance(attr, type)
-                and issubclass(attr, BaseModel)
-                and attr.__name__ != "BaseModel"
-                and attr.__module__ == "schema_module"
-            ):
-                return ModelLoadResult(model_class=attr)
-
-        return ModelLoadResult(
-            error="NO_MODEL", error_message=f"No validation model found in {model_path}"
-        )
-
-    except Exception as e:
+        stat = os.stat(model_path)
+    except OSError as e:
         return ModelLoadResult(
             error="OTHER",
             error_message=f"Error loading validation model from {model_path}: {str(e)}",
         )
+
+    with LOAD_LOCK:
+        return import_validation_model(model_path, stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,137 @@
+import asyncio
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Callable, Coroutine
+
+from electric_text.clients.stream_flight import StreamFlight
+from electric_text.providers.data.stream_history import StreamHistory
+
+
+class RequestCoalescer:
+    """Shares one upstream call between identical requests in flight.
+
+    Requests are keyed by the caller, typically by hash_provider_request.
+    A completion requested while an identical one is running awaits that
+    one's result. A stream requested while an identical one is running
+    joins it: a late joiner first gets the history so far, then every
+    later update. Each caller gets its own copy of every history, so one
+    that changes what it was given cannot affect the others. The upstream
+    call is cancelled, or its stream closed, once every caller has stopped
+    waiting or reading. Nothing is cached: once a call finishes, the next
+    identical request makes a new one.
+    """
+
+    def __init__(self) -> None:
+        self.completions: dict[str, asyncio.Task[StreamHistory]] = {}
+        self.waiters: dict[asyncio.Task[StreamHistory], int] = {}
+        self.streams: dict[str, StreamFlight] = {}
+        self.coalesced = 0
+
+    async def complete(
+        self, key: str, call: Callable[[], Coroutine[Any, Any, StreamHistory]]
+    ) -> StreamHistory:
+        """Get a completion, sharing the call with identical ones in flight.
+
+        Args:
+            key: Identifies identical requests
+            call: Makes the upstream call
+
+        Returns:
+            The completion's StreamHistory
+        """
+        task = self.completions.get(key)
+        if task is None:
+            task = asyncio.create_task(call())
+            self.completions[key] = task
+            task.add_done_callback(lambda done: self.forget_completion(key, done))
+        else:
+            self.coalesced += 1
+
+        self.waiters[task] = self.waiters.get(task, 0) + 1
+        try:
+            # One caller giving up must not cancel the call for the others
+            history = await asyncio.shield(task)
+        finally:
+            self.waiters[task] -= 1
+            if self.waiters[task] == 0:
+                del self.waiters[task]
+                if not task.done():
+                    # Nobody is waiting: stop paying for the call
+                    if self.completions.get(key) is task:
+                        del self.completions[key]
+                    task.cancel()
+
+        return history.copy()
+
+    def forget_completion(self, key: str, task: asyncio.Task[StreamHistory]) -> None:
+        """Stop sharing a finished completion."""
+        if self.completions.get(key) is task:
+            del self.completions[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved here in case every caller gave up
+
+    async def stream(
+        self, key: str, open_stream: Callable[[], AsyncGenerator[StreamHistory, None]]
+    ) -> AsyncGenerator[StreamHistory, None]:
+        """Stream histories, sharing the upstream stream with identical ones in flight.
+
+        Args:
+            key: Identifies identical requests
+            open_stream: Opens the upstream stream
+
+        Yields:
+            StreamHistory: The history so far, then after each update
+        """
+        flight = self.streams.get(key)
+        if flight is None:
+            flight = StreamFlight()
+            self.streams[key] = flight
+            flight.pump = asyncio.create_task(self.pump(key, flight, open_stream))
+        else:
+            self.coalesced += 1
+
+        flight.subscribers += 1
+        try:
+            seen = 0
+            while True:
+                changed = flight.changed
+                if flight.updates > seen and flight.history is not None:
+                    seen = flight.updates
+                    yield flight.history.copy()
+                    continue
+                if flight.is_done:
+                    if flight.error is not None:
+                        raise flight.error
+                    return
+                await changed.wait()
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and flight.pump is not None:
+                # Nobody is reading: close the upstream stream before returning
+                self.forget_stream(key, flight)
+                flight.pump.cancel()
+                await asyncio.wait([flight.pump])
+
+    async def pump(
+        self,
+        key: str,
+        flight: StreamFlight,
+        open_stream: Callable[[], AsyncGenerator[StreamHistory, None]],
+    ) -> None:
+        """Read the upstream stream into a flight until it ends."""
+        try:
+            async with aclosing(open_stream()) as histories:
+                async for history in histories:
+                    flight.history = history
+                    flight.updates += 1
+                    flight.notify()
+        except Exception as e:
+            flight.error = e
+        finally:
+            flight.is_done = True
+            self.forget_stream(key, flight)
+            flight.notify()
+
+    def forget_stream(self, key: str, flight: StreamFlight) -> None:
+        """Stop offering a flight to new identical requests."""
+        if self.streams.get(key) is flight:
+            del self.streams[key]
@@ -0,0 +1,26 @@
+import asyncio
+
+from electric_text.providers.data.stream_history import StreamHistory
+
+
+class StreamFlight:
+    """One upstream stream shared by every caller that asked for it.
+
+    history is the provider's latest StreamHistory, which holds everything
+    streamed so far; updates counts how often it changed. changed is
+    replaced on every change, so waiters take the event, check, then wait.
+    """
+
+    def __init__(self) -> None:
+        self.history: StreamHistory | None = None
+        self.updates = 0
+        self.is_done = False
+        self.error: BaseException | None = None
+        self.subscribers = 0
+        self.pump: asyncio.Task[None] | None = None
+        self.changed = asyncio.Event()
+
+    def notify(self) -> None:
+        """Wake every subscriber waiting on changed."""
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
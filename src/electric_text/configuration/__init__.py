@@ -1,16 +1,21 @@
 from electric_text.configuration.data.config import Config
-from electric_text.configuration.functions.load_config import load_config, DEFAULT_LOCATIONS
+from electric_text.configuration.data.config_snapshot import ConfigSnapshot
+from electric_text.configuration.functions.load_config import load_config
+from electric_text.configuration.functions.get_config_candidates import DEFAULT_LOCATIONS
 from electric_text.configuration.functions.get_config_value import get_config_value
 from electric_text.configuration.functions.get_cached_config import get_cached_config
+from electric_text.configuration.functions.get_config_service import get_config_service
 from electric_text.configuration.functions.print_config import print_config
 from electric_text.configuration.functions.validate_configuration import validate_configuration
 
 __all__ = [
     "Config", 
+    "ConfigSnapshot",
     "load_config", 
     "get_config_value", 
     "get_cached_config", 
+    "get_config_service",
     "print_config", 
     "validate_configuration",
     "DEFAULT_LOCATIONS",
-] 
\ No newline at end of file
+]
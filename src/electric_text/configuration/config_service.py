@@ -0,0 +1,62 @@
+import os
+import threading
+import time
+from typing import Optional
+
+from electric_text.configuration.data.config_snapshot import ConfigSnapshot
+from electric_text.configuration.functions.build_config_snapshot import (
+    build_config_snapshot,
+)
+from electric_text.configuration.functions.is_config_snapshot_current import (
+    is_config_snapshot_current,
+)
+
+
+class ConfigService:
+    """Holds the current configuration snapshot and reloads it when it changes.
+
+    Reads return the current snapshot without locking. At most once every
+    check_interval_s seconds a read also re-stats the config files and
+    compares the ELECTRIC_TEXT_* environment; if anything changed, a new
+    snapshot is built under a lock and swapped in with a single assignment.
+    Asking for a different config path reloads immediately.
+    """
+
+    def __init__(self, check_interval_s: float = 1.0) -> None:
+        self.check_interval_s = check_interval_s
+        self.snapshot: ConfigSnapshot | None = None
+        self.next_check_at = 0.0
+        self.lock = threading.Lock()
+
+    def get_snapshot(self, config_path: Optional[str] = None) -> ConfigSnapshot:
+        """Get the snapshot for a config path, reloading it if its inputs changed.
+
+        Raises:
+            FileNotFoundError: If an explicit or environment config path is missing
+            ValueError: If the config file is not a YAML mapping
+        """
+        snapshot = self.snapshot
+        if (
+            snapshot is not None
+            and snapshot.config_path == config_path
+            and snapshot.env_config_path == os.environ.get("ELECTRIC_TEXT_CONFIG")
+            and time.monotonic() < self.next_check_at
+        ):
+            return snapshot
+
+        with self.lock:
+            snapshot = self.snapshot
+            if (
+                snapshot is None
+                or snapshot.config_path != config_path
+                or not is_config_snapshot_current(snapshot)
+            ):
+                snapshot = build_config_snapshot(config_path)
+                self.snapshot = snapshot
+
+            self.next_check_at = time.monotonic() + self.check_interval_s
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the current snapshot so the next read reloads it."""
+        self.snapshot = None
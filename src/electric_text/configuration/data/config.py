@@ -2,7 +2,7 @@ from typing import Dict, List, Any
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Configuration for the electric_text system.
 
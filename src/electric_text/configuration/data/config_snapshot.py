@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from electric_text.configuration.data.config import Config
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """An immutable view of the configuration and the inputs it was loaded from.
+
+    Attributes:
+        config: The loaded configuration
+        config_path: The explicit config path it was loaded for, if any
+        env_config_path: The value of ELECTRIC_TEXT_CONFIG when it was loaded
+        stamps: (mtime_ns, size) of every candidate config file (None if missing)
+        environment: The ELECTRIC_TEXT_* environment variables when it was loaded
+        shorthand_models: Model shorthands from the config and environment,
+            mapped to (provider, model)
+    """
+
+    config: Config
+    config_path: Optional[str] = None
+    env_config_path: Optional[str] = None
+    stamps: dict[str, tuple[int, int] | None] = field(default_factory=dict)
+    environment: tuple[tuple[str, str], ...] = ()
+    shorthand_models: dict[str, tuple[str, str]] = field(default_factory=dict)
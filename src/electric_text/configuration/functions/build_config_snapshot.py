@@ -0,0 +1,42 @@
+import os
+from typing import Optional
+
+from electric_text.configuration.data.config_snapshot import ConfigSnapshot
+from electric_text.configuration.functions.get_config_candidates import (
+    get_config_candidates,
+)
+from electric_text.configuration.functions.get_environment_fingerprint import (
+    get_environment_fingerprint,
+)
+from electric_text.configuration.functions.get_file_stamp import get_file_stamp
+from electric_text.configuration.functions.load_config import load_config
+from electric_text.shorthand.functions.build_user_shorthand_models import (
+    build_user_shorthand_models,
+)
+
+
+def build_config_snapshot(config_path: Optional[str] = None) -> ConfigSnapshot:
+    """Load the configuration along with what is needed to tell when it changes.
+
+    Shorthands depend only on the config and the ELECTRIC_TEXT_* environment,
+    so their lookup is built here, once per snapshot.
+
+    Args:
+        config_path: Optional explicit path to the config file
+
+    Returns:
+        ConfigSnapshot with the loaded configuration
+    """
+    environment = get_environment_fingerprint()
+    candidates = get_config_candidates(config_path)
+    stamps = {str(path): get_file_stamp(str(path)) for path in candidates}
+    config = load_config(config_path)
+
+    return ConfigSnapshot(
+        config=config,
+        config_path=config_path,
+        env_config_path=os.environ.get("ELECTRIC_TEXT_CONFIG"),
+        stamps=stamps,
+        environment=environment,
+        shorthand_models=build_user_shorthand_models(config.shorthands),
+    )
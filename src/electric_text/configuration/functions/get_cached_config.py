@@ -1,13 +1,16 @@
 from typing import Optional
-from functools import lru_cache
 
 from electric_text.configuration.data.config import Config
-from electric_text.configuration.functions.load_config import load_config
+from electric_text.configuration.functions.get_config_service import (
+    get_config_service,
+)
 
 
-@lru_cache(maxsize=1)
 def get_cached_config(config_path: Optional[str] = None) -> Config:
-    """Get the configuration with caching applied.
+    """Get the current configuration snapshot.
+
+    The configuration is cached by the configuration service and reloaded
+    when the config file or the ELECTRIC_TEXT_* environment changes.
 
     Args:
         config_path: Optional path to the configuration file
@@ -15,4 +18,4 @@ def get_cached_config(config_path: Optional[str] = None) -> Config:
     Returns:
         Cached Config instance
     """
-    return load_config(config_path)
\ No newline at end of file
+    return get_config_service().get_snapshot(config_path).config
@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+from typing import Optional
+
+# Default locations to check for config file
+DEFAULT_LOCATIONS = [
+    "./config.yaml",
+    "~/.electric_text/config.yaml",
+    "/etc/electric_text/config.yaml",
+]
+
+
+def get_config_candidates(
+    config_path: Optional[str] = None, search_locations: list[str] | None = None
+) -> list[Path]:
+    """List the paths a configuration may be loaded from, in order of precedence.
+
+    1. Explicitly provided path
+    2. Path from ELECTRIC_TEXT_CONFIG environment variable
+    3. Default locations (or custom search_locations if provided)
+
+    Args:
+        config_path: Optional explicit path to the config file
+        search_locations: Optional list of locations to search for config files
+
+    Returns:
+        The candidate paths; the first one that exists is loaded
+
+    Raises:
+        FileNotFoundError: If an explicit or environment path does not exist
+    """
+    # Check for config path in environment variable
+    env_config_path = os.environ.get("ELECTRIC_TEXT_CONFIG")
+
+    if config_path:
+        # Explicit path provided - must exist
+        path = Path(config_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Config file not found: {config_path}")
+        return [path]
+
+    if env_config_path:
+        # Environment variable set - must exist
+        path = Path(env_config_path)
+        if not path.exists():
+            raise FileNotFoundError(
+                f"Config file not found (from ELECTRIC_TEXT_CONFIG): {env_config_path}"
+            )
+        return [path]
+
+    # No explicit path - try default locations or custom search locations
+    locations = search_locations if search_locations is not None else DEFAULT_LOCATIONS
+    return [Path(p).expanduser() for p in locations]
@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+from electric_text.configuration.config_service import ConfigService
+
+
+@lru_cache(maxsize=1)
+def get_config_service() -> ConfigService:
+    """Get the process-wide configuration service.
+
+    Returns:
+        The shared ConfigService instance
+    """
+    return ConfigService()
@@ -0,0 +1,16 @@
+import os
+
+
+def get_environment_fingerprint() -> tuple[tuple[str, str], ...]:
+    """Collect the ELECTRIC_TEXT_* environment variables that shape the configuration.
+
+    Returns:
+        Sorted (name, value) pairs
+    """
+    return tuple(
+        sorted(
+            (name, value)
+            for name, value in os.environ.items()
+            if name.startswith("ELECTRIC_TEXT_")
+        )
+    )
@@ -0,0 +1,17 @@
+import os
+
+
+def get_file_stamp(path: str) -> tuple[int, int] | None:
+    """Get the (mtime_ns, size) of a file or directory, or None if it is missing.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        The stamp, which changes whenever the file is rewritten
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,20 @@
+from electric_text.configuration.data.config_snapshot import ConfigSnapshot
+from electric_text.configuration.functions.get_environment_fingerprint import (
+    get_environment_fingerprint,
+)
+from electric_text.configuration.functions.get_file_stamp import get_file_stamp
+
+
+def is_config_snapshot_current(snapshot: ConfigSnapshot) -> bool:
+    """Check that no config file or ELECTRIC_TEXT_* variable changed since loading.
+
+    Args:
+        snapshot: The snapshot to check
+
+    Returns:
+        True if the snapshot still reflects its inputs
+    """
+    if get_environment_fingerprint() != snapshot.environment:
+        return False
+
+    return all(get_file_stamp(path) == stamp for path, stamp in snapshot.stamps.items())
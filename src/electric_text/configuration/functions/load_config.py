@@ -1,17 +1,10 @@
-import os
-import yaml
-from pathlib import Path
 from typing import Dict, Any, Optional
 
 
 from electric_text.configuration.data.config import Config
-
-# Default locations to check for config file
-DEFAULT_LOCATIONS = [
-    "./config.yaml",
-    "~/.electric_text/config.yaml",
-    "/etc/electric_text/config.yaml",
-]
+from electric_text.configuration.functions.get_config_candidates import (
+    get_config_candidates,
+)
 
 
 def load_config(
@@ -34,35 +27,15 @@ def load_config(
     Returns:
         Config instance with loaded configuration
     """
-    # Check for config path in environment variable
-    env_config_path = os.environ.get("ELECTRIC_TEXT_CONFIG")
-
-    # Determine paths to check in order of priority
-    if config_path:
-        # Explicit path provided - must exist
-        path = Path(config_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-        paths = [path]
-    elif env_config_path:
-        # Environment variable set - must exist
-        path = Path(env_config_path)
-        if not path.exists():
-            raise FileNotFoundError(
-                f"Config file not found (from ELECTRIC_TEXT_CONFIG): {env_config_path}"
-            )
-        paths = [path]
-    else:
-        # No explicit path - try default locations or custom search locations
-        locations = (
-            search_locations if search_locations is not None else DEFAULT_LOCATIONS
-        )
-        paths = [Path(p).expanduser() for p in locations]
+    paths = get_config_candidates(config_path, search_locations)
 
     # Find first existing config file
     config_dict: Dict[str, Any] = {}
     for path in paths:
         if path.exists():
+            # Imported here so runs without a config file never load yaml
+            import yaml
+
             with open(path, "r") as f:
                 loaded_config = yaml.safe_load(f)
                 if loaded_config is not None:
@@ -22,4 +22,50 @@ def validate_http_logging_section(http_logging_config: Dict[str, Any]) -> List[s
     if log_dir is not None and not isinstance(log_dir, str):
         issues.append("http_logging.log_dir must be a string")
 
+    # Validate background writer fields
+    for key in ["queue_size", "segment_max_bytes", "batch_size"]:
+        value = http_logging_config.get(key)
+        if value is not None and (
+            not isinstance(value, int) or isinstance(value, bool) or value < 1
+        ):
+            issues.append(f"http_logging.{key} must be a positive integer")
+
+    block_timeout = http_logging_config.get("block_timeout")
+    if block_timeout is not None and (
+        not isinstance(block_timeout, (int, float)) or isinstance(block_timeout, bool)
+    ):
+        issues.append("http_logging.block_timeout must be a number")
+
+    overflow = http_logging_config.get("overflow")
+    if overflow is not None and overflow not in ["drop", "block"]:
+        issues.append("http_logging.overflow must be 'drop' or 'block'")
+
+    for key in ["compress", "errors_only"]:
+        value = http_logging_config.get(key)
+        if value is not None and not isinstance(value, bool):
+            issues.append(f"http_logging.{key} must be a boolean")
+
+    buffer_size = http_logging_config.get("buffer_size")
+    if buffer_size is not None and (
+        not isinstance(buffer_size, int)
+        or isinstance(buffer_size, bool)
+        or buffer_size < 0
+    ):
+        issues.append("http_logging.buffer_size must be a non-negative integer")
+
+    sample_rate = http_logging_config.get("sample_rate")
+    if sample_rate is not None and (
+        not isinstance(sample_rate, (int, float))
+        or isinstance(sample_rate, bool)
+        or not 0 <= sample_rate <= 1
+    ):
+        issues.append("http_logging.sample_rate must be a number between 0 and 1")
+
+    slow_threshold_ms = http_logging_config.get("slow_threshold_ms")
+    if slow_threshold_ms is not None and (
+        not isinstance(slow_threshold_ms, (int, float))
+        or isinstance(slow_threshold_ms, bool)
+    ):
+        issues.append("http_logging.slow_threshold_ms must be a number")
+
     return issues
@@ -0,0 +1,5 @@
+from electric_text.daemon.data.daemon_request import DaemonRequest
+
+__all__ = [
+    "DaemonRequest",
+]
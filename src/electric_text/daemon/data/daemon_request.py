@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class DaemonRequest:
+    """A CLI invocation forwarded to the serve-local daemon.
+
+    Attributes:
+        args: The command-line arguments, without the program name
+        fingerprint: Fingerprint of the caller's working directory and
+            ELECTRIC_TEXT_* environment; the daemon only runs requests whose
+            fingerprint matches its own
+    """
+
+    args: list[str] = field(default_factory=list)
+    fingerprint: str = ""
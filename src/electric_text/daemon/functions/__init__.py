@@ -0,0 +1,23 @@
+from electric_text.daemon.functions.encode_daemon_message import (
+    encode_daemon_message,
+)
+from electric_text.daemon.functions.forward_to_daemon import forward_to_daemon
+from electric_text.daemon.functions.get_daemon_fingerprint import (
+    get_daemon_fingerprint,
+)
+from electric_text.daemon.functions.get_daemon_socket_path import (
+    get_daemon_socket_path,
+)
+from electric_text.daemon.functions.is_daemon_listening import is_daemon_listening
+from electric_text.daemon.functions.should_forward_to_daemon import (
+    should_forward_to_daemon,
+)
+
+__all__ = [
+    "encode_daemon_message",
+    "forward_to_daemon",
+    "get_daemon_fingerprint",
+    "get_daemon_socket_path",
+    "is_daemon_listening",
+    "should_forward_to_daemon",
+]
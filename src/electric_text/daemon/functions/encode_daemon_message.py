@@ -0,0 +1,14 @@
+import json
+from typing import Any
+
+
+def encode_daemon_message(message: dict[str, Any]) -> bytes:
+    """Encode one message of the daemon protocol as a JSON line.
+
+    Args:
+        message: The message
+
+    Returns:
+        UTF-8 JSON followed by a newline
+    """
+    return (json.dumps(message) + "\n").encode()
@@ -0,0 +1,71 @@
+import json
+import os
+import socket
+from dataclasses import asdict
+from typing import TextIO
+
+from electric_text.daemon.data.daemon_request import DaemonRequest
+from electric_text.daemon.functions.encode_daemon_message import (
+    encode_daemon_message,
+)
+
+
+def forward_to_daemon(
+    request: DaemonRequest, socket_path: str, stdout: TextIO, stderr: TextIO
+) -> int | None:
+    """Run a CLI invocation on the serve-local daemon, if one is listening.
+
+    Output is copied to stdout and stderr as it arrives, so streamed results
+    appear as they are produced. The arguments may include an API key, so
+    they are only sent to a socket owned by the current user.
+
+    Args:
+        request: The forwarded invocation
+        socket_path: The daemon's Unix socket
+        stdout: Where to write the daemon's standard output
+        stderr: Where to write the daemon's standard error
+
+    Returns:
+        The exit code, or None if the run should happen in-process instead
+        (no daemon, a socket owned by another user, or a daemon with a
+        different directory or environment)
+    """
+    try:
+        owner = os.stat(socket_path).st_uid
+    except OSError:
+        return None
+    if owner != os.getuid():
+        stderr.write(
+            f"Warning: not forwarding to {socket_path}, which belongs to another user\n"
+        )
+        return None
+
+    try:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(socket_path)
+    except OSError:
+        return None
+
+    started = False
+    with connection, connection.makefile("rb") as replies:
+        try:
+            connection.sendall(encode_daemon_message(asdict(request)))
+            for line in replies:
+                message = json.loads(line)
+                if "mismatch" in message:
+                    return None
+                if "exit_code" in message:
+                    return int(message["exit_code"])
+
+                started = True
+                stream = stdout if "stdout" in message else stderr
+                stream.write(message.get("stdout", message.get("stderr", "")))
+                stream.flush()
+        except (OSError, ValueError):
+            pass
+
+    if not started:
+        return None
+
+    stderr.write("Error: lost connection to the electric_text daemon\n")
+    return 1
@@ -0,0 +1,30 @@
+import hashlib
+import json
+from collections.abc import Mapping
+
+# Variables that only control forwarding, so they may differ between the
+# daemon and its callers
+IGNORED_VARIABLES = ("ELECTRIC_TEXT_DAEMON_SOCKET", "ELECTRIC_TEXT_NO_DAEMON")
+
+
+def get_daemon_fingerprint(cwd: str, environ: Mapping[str, str]) -> str:
+    """Fingerprint what a CLI run depends on besides its arguments.
+
+    Relative config, prompt and log paths depend on the working directory,
+    and configuration, shorthands and API keys come from ELECTRIC_TEXT_*
+    variables. Only the digest is sent, never the values.
+
+    Args:
+        cwd: The working directory
+        environ: Environment variables
+
+    Returns:
+        A hex digest
+    """
+    variables = sorted(
+        (name, value)
+        for name, value in environ.items()
+        if name.startswith("ELECTRIC_TEXT_") and name not in IGNORED_VARIABLES
+    )
+    encoded = json.dumps([cwd, variables]).encode()
+    return hashlib.sha256(encoded).hexdigest()
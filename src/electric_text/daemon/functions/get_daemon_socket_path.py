@@ -0,0 +1,30 @@
+import os
+import tempfile
+from collections.abc import Mapping
+
+
+def get_daemon_socket_path(environ: Mapping[str, str]) -> str:
+    """Get the Unix socket path the serve-local daemon listens on.
+
+    The default is in a directory only the current user can enter:
+    $XDG_RUNTIME_DIR when it is set, otherwise a per-user directory in the
+    temp directory, which the daemon creates with mode 0700.
+
+    Args:
+        environ: Environment variables (ELECTRIC_TEXT_DAEMON_SOCKET overrides
+            the default)
+
+    Returns:
+        The socket path
+    """
+    configured = environ.get("ELECTRIC_TEXT_DAEMON_SOCKET")
+    if configured:
+        return configured
+
+    runtime_dir = environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "electric_text.sock")
+
+    return os.path.join(
+        tempfile.gettempdir(), f"electric_text-{os.getuid()}", "daemon.sock"
+    )
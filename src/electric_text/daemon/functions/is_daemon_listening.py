@@ -0,0 +1,19 @@
+import socket
+
+
+def is_daemon_listening(socket_path: str) -> bool:
+    """Check whether something accepts connections on a daemon socket.
+
+    Args:
+        socket_path: The Unix socket path
+
+    Returns:
+        True if a connection succeeds
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except OSError:
+            return False
+
+    return True
@@ -0,0 +1,23 @@
+import os
+from collections.abc import Mapping
+
+
+def should_forward_to_daemon(args: list[str], environ: Mapping[str, str]) -> bool:
+    """Decide whether a CLI run may be forwarded to the serve-local daemon.
+
+    Profiled runs stay in-process so the profile describes this process (the
+    CLI accepts no abbreviated options, so they all start with --profile), and
+    ELECTRIC_TEXT_NO_DAEMON=1 disables forwarding altogether. The daemon
+    listens on a Unix socket, so Windows always runs in-process.
+
+    Args:
+        args: The command-line arguments, without the program name
+        environ: Environment variables
+
+    Returns:
+        True if the run may be forwarded
+    """
+    if os.name == "nt" or environ.get("ELECTRIC_TEXT_NO_DAEMON", "") not in ("", "0"):
+        return False
+
+    return not any(arg.startswith("--profile") for arg in args)
@@ -0,0 +1,19 @@
+from electric_text.load_testing.data.latency_summary import LatencySummary
+from electric_text.load_testing.data.load_test_report import LoadTestReport
+from electric_text.load_testing.data.load_test_settings import LoadTestSettings
+from electric_text.load_testing.functions.format_load_test_report import (
+    format_load_test_report,
+)
+from electric_text.load_testing.functions.load_test_report_to_dict import (
+    load_test_report_to_dict,
+)
+from electric_text.load_testing.functions.run_load_test import run_load_test
+
+__all__ = [
+    "format_load_test_report",
+    "LatencySummary",
+    "load_test_report_to_dict",
+    "LoadTestReport",
+    "LoadTestSettings",
+    "run_load_test",
+]
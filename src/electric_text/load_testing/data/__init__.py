@@ -0,0 +1,6 @@
+from electric_text.load_testing.data.latency_summary import LatencySummary
+from electric_text.load_testing.data.load_test_report import LoadTestReport
+from electric_text.load_testing.data.load_test_settings import LoadTestSettings
+from electric_text.load_testing.data.request_sample import RequestSample
+
+__all__ = ["LatencySummary", "LoadTestReport", "LoadTestSettings", "RequestSample"]
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+from electric_text.load_testing.data.latency_summary import LatencySummary
+from electric_text.load_testing.data.load_test_settings import LoadTestSettings
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    """Results of a load test.
+
+    Args:
+        settings: The settings the test ran with
+        target: Provider and model that were tested ("provider:model")
+        succeeded: Requests without errors
+        failed: Requests with at least one error
+        duration_s: Wall-clock duration of the whole test
+        throughput_rps: Completed requests per second
+        ttft: TTFT distribution of successful streamed requests
+        latency: Total latency distribution of successful requests
+        errors: Number of requests per error kind
+        cpu_s: Client-side CPU time used during the test
+        peak_rss_mb: Peak resident memory of the process (None if unavailable)
+    """
+
+    settings: LoadTestSettings
+    target: str
+    succeeded: int
+    failed: int
+    duration_s: float
+    throughput_rps: float
+    ttft: LatencySummary | None
+    latency: LatencySummary | None
+    errors: dict[str, int]
+    cpu_s: float
+    peak_rss_mb: float | None
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LoadTestSettings:
+    """How a load test drives requests.
+
+    Args:
+        total_requests: Number of requests to send
+        concurrency: Maximum number of requests in flight
+        rate: Target request starts per second (None starts requests as soon
+            as a concurrency slot is free)
+        stream: Stream responses (measures TTFT) instead of awaiting completions
+    """
+
+    total_requests: int = 100
+    concurrency: int = 10
+    rate: float | None = None
+    stream: bool = True
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RequestSample:
+    """Measurements of one request.
+
+    Args:
+        ttft_ms: Time to the first content chunk (None without streaming or content)
+        latency_ms: Time until the response was complete
+        errors: Error kinds seen (error chunk types, or "exception:<name>")
+    """
+
+    ttft_ms: float | None
+    latency_ms: float
+    errors: tuple[str, ...] = ()
@@ -0,0 +1,19 @@
+from electric_text.load_testing.functions.build_load_test_report import (
+    build_load_test_report,
+)
+from electric_text.load_testing.functions.format_load_test_report import (
+    format_load_test_report,
+)
+from electric_text.load_testing.functions.load_test_report_to_dict import (
+    load_test_report_to_dict,
+)
+from electric_text.load_testing.functions.measure_request import measure_request
+from electric_text.load_testing.functions.run_load_test import run_load_test
+
+__all__ = [
+    "build_load_test_report",
+    "format_load_test_report",
+    "load_test_report_to_dict",
+    "measure_request",
+    "run_load_test",
+]
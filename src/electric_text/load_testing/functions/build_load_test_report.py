@@ -0,0 +1,50 @@
+from electric_text.load_testing.data.load_test_report import LoadTestReport
+from electric_text.load_testing.data.load_test_settings import LoadTestSettings
+from electric_text.load_testing.data.request_sample import RequestSample
+from electric_text.load_testing.functions.count_errors import count_errors
+from electric_text.load_testing.functions.summarize_latencies import (
+    summarize_latencies,
+)
+
+
+def build_load_test_report(
+    settings: LoadTestSettings,
+    target: str,
+    samples: list[RequestSample],
+    duration_s: float,
+    cpu_s: float,
+    peak_rss_mb: float | None,
+) -> LoadTestReport:
+    """Aggregate request samples into a report.
+
+    Latency distributions only include successful requests, so fast failures
+    do not flatter the percentiles.
+
+    Args:
+        settings: The settings the test ran with
+        target: Provider and model that were tested
+        samples: One sample per request
+        duration_s: Wall-clock duration of the test
+        cpu_s: CPU time used during the test
+        peak_rss_mb: Peak resident memory
+
+    Returns:
+        LoadTestReport
+    """
+    succeeded = [sample for sample in samples if not sample.errors]
+
+    return LoadTestReport(
+        settings=settings,
+        target=target,
+        succeeded=len(succeeded),
+        failed=len(samples) - len(succeeded),
+        duration_s=duration_s,
+        throughput_rps=len(samples) / duration_s if duration_s > 0 else 0.0,
+        ttft=summarize_latencies(
+            [sample.ttft_ms for sample in succeeded if sample.ttft_ms is not None]
+        ),
+        latency=summarize_latencies([sample.latency_ms for sample in succeeded]),
+        errors=count_errors(samples),
+        cpu_s=cpu_s,
+        peak_rss_mb=peak_rss_mb,
+    )
@@ -0,0 +1,18 @@
+from electric_text.load_testing.data.request_sample import RequestSample
+
+
+def count_errors(samples: list[RequestSample]) -> dict[str, int]:
+    """Count requests per error kind.
+
+    Args:
+        samples: Request samples
+
+    Returns:
+        Number of requests that saw each error kind, most frequent first
+    """
+    counts: dict[str, int] = {}
+    for sample in samples:
+        for error in sample.errors:
+            counts[error] = counts.get(error, 0) + 1
+
+    return dict(sorted(counts.items(), key=lambda item: -item[1]))
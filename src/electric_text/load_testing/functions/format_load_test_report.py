@@ -0,0 +1,48 @@
+from textwrap import dedent
+
+from electric_text.load_testing.data.latency_summary import LatencySummary
+from electric_text.load_testing.data.load_test_report import LoadTestReport
+from electric_text.load_testing.functions.get_cpu_percent import get_cpu_percent
+
+
+def format_load_test_report(report: LoadTestReport) -> str:
+    """Format a load test report as a plain-text table.
+
+    Args:
+        report: The report
+
+    Returns:
+        Multi-line summary
+    """
+    mode = "stream" if report.settings.stream else "completion"
+    pacing = (
+        f"{report.settings.rate:g} req/s" if report.settings.rate else "closed loop"
+    )
+    memory = f"{report.peak_rss_mb:.1f} MB" if report.peak_rss_mb is not None else "n/a"
+
+    def row(label: str, summary: LatencySummary | None) -> str:
+        if summary is None:
+            return f"{label:<14}{'-':>10}"
+        values = [summary.p50, summary.p90, summary.p95, summary.p99, summary.max]
+        return f"{label:<14}" + "".join(f"{value:>10.1f}" for value in values)
+
+    summary = dedent(f"""\
+        Target        {report.target} ({mode}, concurrency {report.settings.concurrency}, {pacing})
+        Requests      {report.succeeded + report.failed} ({report.succeeded} ok, {report.failed} failed) in {report.duration_s:.2f}s
+        Throughput    {report.throughput_rps:.1f} req/s
+        Client CPU    {report.cpu_s:.2f}s ({get_cpu_percent(report):.0f}% of one core)
+        Peak RSS      {memory}
+        """)
+
+    header = f"{'(ms)':<14}" + "".join(
+        f"{label:>10}" for label in ["p50", "p90", "p95", "p99", "max"]
+    )
+    table = "\n".join(
+        [header, row("TTFT", report.ttft), row("Latency", report.latency)]
+    )
+
+    errors = "".join(
+        f"\n  {kind:<24}{count:>6}" for kind, count in report.errors.items()
+    )
+
+    return summary + "\n" + table + ("\n\nErrors" + errors if errors else "")
@@ -0,0 +1,13 @@
+from electric_text.load_testing.data.load_test_report import LoadTestReport
+
+
+def get_cpu_percent(report: LoadTestReport) -> float:
+    """CPU time as a percentage of one core over the test duration.
+
+    Args:
+        report: The report
+
+    Returns:
+        Percentage (above 100 when more than one core was busy)
+    """
+    return report.cpu_s / report.duration_s * 100 if report.duration_s > 0 else 0.0
@@ -0,0 +1,18 @@
+# Stream chunk type values that mark a failed response
+ERROR_CHUNK_TYPES = {"http_error", "parse_error"}
+
+
+def get_error_kinds(chunk_types: list[str]) -> tuple[str, ...]:
+    """List the distinct error chunk types of a response, in order of appearance.
+
+    Args:
+        chunk_types: Type values of all chunks of the response (e.g. "text_delta")
+
+    Returns:
+        Error chunk type values (e.g. "http_error")
+    """
+    return tuple(
+        dict.fromkeys(
+            chunk_type for chunk_type in chunk_types if chunk_type in ERROR_CHUNK_TYPES
+        )
+    )
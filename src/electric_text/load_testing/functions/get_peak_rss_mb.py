@@ -0,0 +1,17 @@
+import sys
+
+
+def get_peak_rss_mb() -> float | None:
+    """Peak resident memory of this process in megabytes.
+
+    Returns:
+        Peak RSS, or None where the resource module is unavailable (Windows)
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
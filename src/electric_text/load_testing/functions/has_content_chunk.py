@@ -0,0 +1,20 @@
+# Stream chunk type values that carry generated content
+CONTENT_CHUNK_TYPES = {
+    "text_delta",
+    "tool_start",
+    "tool_delta",
+    "full_text",
+    "full_tool_call",
+}
+
+
+def has_content_chunk(chunk_types: list[str]) -> bool:
+    """Whether any of the chunks carries generated content.
+
+    Args:
+        chunk_types: Type values of the chunks to check (e.g. "text_delta")
+
+    Returns:
+        True if a text or tool call chunk is present
+    """
+    return any(chunk_type in CONTENT_CHUNK_TYPES for chunk_type in chunk_types)
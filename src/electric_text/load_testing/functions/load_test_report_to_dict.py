@@ -0,0 +1,17 @@
+from dataclasses import asdict
+from typing import Any
+
+from electric_text.load_testing.data.load_test_report import LoadTestReport
+from electric_text.load_testing.functions.get_cpu_percent import get_cpu_percent
+
+
+def load_test_report_to_dict(report: LoadTestReport) -> dict[str, Any]:
+    """Convert a load test report to a JSON-serializable dictionary.
+
+    Args:
+        report: The report
+
+    Returns:
+        Dictionary with settings, results, latency distributions and errors
+    """
+    return {**asdict(report), "cpu_percent": get_cpu_percent(report)}
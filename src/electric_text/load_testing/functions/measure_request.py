@@ -0,0 +1,55 @@
+from time import perf_counter
+
+from electric_text.clients import Client
+from electric_text.clients.data.client_request import ClientRequest
+from electric_text.clients.data.validation_model import ValidationModel
+from electric_text.load_testing.data.request_sample import RequestSample
+from electric_text.load_testing.functions.get_error_kinds import get_error_kinds
+from electric_text.load_testing.functions.has_content_chunk import has_content_chunk
+
+
+async def measure_request[OutputSchema: ValidationModel](
+    client: Client,
+    request: ClientRequest[OutputSchema],
+    stream: bool,
+    started_at: float,
+) -> RequestSample:
+    """Send one request and measure it.
+
+    Args:
+        client: Client to send the request with
+        request: The request
+        stream: Stream the response (measures TTFT)
+        started_at: perf_counter() time that latencies are measured from; the
+            scheduled start in rate mode, so queueing delay counts as latency
+
+    Returns:
+        RequestSample (exceptions are recorded as errors, never raised)
+    """
+    ttft_ms: float | None = None
+    # Chunk type values seen so far; each update only adds the new chunks
+    chunk_types: list[str] = []
+
+    try:
+        if stream:
+            async for response in client.stream_raw(request):
+                new_chunks = response.stream_history.chunks[len(chunk_types) :]
+                new_types = [chunk.type.value for chunk in new_chunks]
+                if ttft_ms is None and has_content_chunk(new_types):
+                    ttft_ms = (perf_counter() - started_at) * 1000
+                chunk_types.extend(new_types)
+        else:
+            response = await client.generate_raw(request)
+            chunk_types = [chunk.type.value for chunk in response.stream_history.chunks]
+    except Exception as e:
+        return RequestSample(
+            ttft_ms=ttft_ms,
+            latency_ms=(perf_counter() - started_at) * 1000,
+            errors=(f"exception:{type(e).__name__}",),
+        )
+
+    return RequestSample(
+        ttft_ms=ttft_ms,
+        latency_ms=(perf_counter() - started_at) * 1000,
+        errors=get_error_kinds(chunk_types),
+    )
@@ -0,0 +1,17 @@
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Percentile with linear interpolation between closest ranks.
+
+    Args:
+        sorted_values: Non-empty values in ascending order
+        fraction: Percentile as a fraction (0.99 for p99)
+
+    Returns:
+        The interpolated value
+    """
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        position - lower
+    )
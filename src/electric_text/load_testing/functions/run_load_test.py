@@ -0,0 +1,60 @@
+import asyncio
+from time import perf_counter, process_time
+
+from electric_text.clients import Client
+from electric_text.clients.data.client_request import ClientRequest
+from electric_text.clients.data.validation_model import ValidationModel
+from electric_text.load_testing.data.load_test_report import LoadTestReport
+from electric_text.load_testing.data.load_test_settings import LoadTestSettings
+from electric_text.load_testing.data.request_sample import RequestSample
+from electric_text.load_testing.functions.build_load_test_report import (
+    build_load_test_report,
+)
+from electric_text.load_testing.functions.get_peak_rss_mb import get_peak_rss_mb
+from electric_text.load_testing.functions.measure_request import measure_request
+
+
+async def run_load_test[OutputSchema: ValidationModel](
+    client: Client,
+    request: ClientRequest[OutputSchema],
+    settings: LoadTestSettings,
+) -> LoadTestReport:
+    """Send the same request repeatedly and report throughput and latencies.
+
+    Without a rate, each of the concurrency slots starts its next request as
+    soon as the previous one finishes (closed loop). With a rate, request i is
+    scheduled at i / rate seconds (open loop), still capped at the concurrency.
+
+    Args:
+        client: Client to send requests with
+        request: The request to send
+        settings: Load test settings
+
+    Returns:
+        LoadTestReport
+    """
+    slots = asyncio.Semaphore(settings.concurrency)
+    started_at = perf_counter()
+    cpu_started_at = process_time()
+
+    async def send(index: int) -> RequestSample:
+        scheduled_at = started_at + index / settings.rate if settings.rate else None
+        if scheduled_at is not None:
+            await asyncio.sleep(max(scheduled_at - perf_counter(), 0.0))
+        async with slots:
+            return await measure_request(
+                client, request, settings.stream, scheduled_at or perf_counter()
+            )
+
+    samples = await asyncio.gather(
+        *(send(index) for index in range(settings.total_requests))
+    )
+
+    return build_load_test_report(
+        settings=settings,
+        target=f"{request.provider_name}:{request.model_name}",
+        samples=list(samples),
+        duration_s=perf_counter() - started_at,
+        cpu_s=process_time() - cpu_started_at,
+        peak_rss_mb=get_peak_rss_mb(),
+    )
@@ -0,0 +1,27 @@
+from electric_text.load_testing.data.latency_summary import LatencySummary
+from electric_text.load_testing.functions.percentile import percentile
+
+
+def summarize_latencies(values: list[float]) -> LatencySummary | None:
+    """Summarize latencies in milliseconds.
+
+    Args:
+        values: Latencies in any order
+
+    Returns:
+        LatencySummary, or None when there are no values
+    """
+    if not values:
+        return None
+
+    ordered = sorted(values)
+
+    return LatencySummary(
+        count=len(ordered),
+        mean=sum(ordered) / len(ordered),
+        p50=percentile(ordered, 0.50),
+        p90=percentile(ordered, 0.90),
+        p95=percentile(ordered, 0.95),
+        p99=percentile(ordered, 0.99),
+        max=ordered[-1],
+    )
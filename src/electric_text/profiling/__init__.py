@@ -0,0 +1,27 @@
+from electric_text.profiling.data.profile_mode import ProfileMode
+from electric_text.profiling.data.profile_phase import ProfilePhase
+from electric_text.profiling.data.profile_report import ProfileReport
+from electric_text.profiling.data.profile_session import ProfileSession
+from electric_text.profiling.data.profile_settings import ProfileSettings
+from electric_text.profiling.functions.format_profile_summary import (
+    format_profile_summary,
+)
+from electric_text.profiling.functions.profiling import profiling
+from electric_text.profiling.functions.record_entry_phase import record_entry_phase
+from electric_text.profiling.functions.record_iteration_phase import (
+    record_iteration_phase,
+)
+from electric_text.profiling.functions.record_phase import record_phase
+
+__all__ = [
+    "format_profile_summary",
+    "profiling",
+    "ProfileMode",
+    "ProfilePhase",
+    "ProfileReport",
+    "ProfileSession",
+    "ProfileSettings",
+    "record_entry_phase",
+    "record_iteration_phase",
+    "record_phase",
+]
@@ -0,0 +1,17 @@
+from electric_text.profiling.data.current_recorder import current_recorder
+from electric_text.profiling.data.phase_recorder import PhaseRecorder
+from electric_text.profiling.data.profile_mode import ProfileMode
+from electric_text.profiling.data.profile_phase import ProfilePhase
+from electric_text.profiling.data.profile_report import ProfileReport
+from electric_text.profiling.data.profile_session import ProfileSession
+from electric_text.profiling.data.profile_settings import ProfileSettings
+
+__all__ = [
+    "current_recorder",
+    "PhaseRecorder",
+    "ProfileMode",
+    "ProfilePhase",
+    "ProfileReport",
+    "ProfileSession",
+    "ProfileSettings",
+]
@@ -0,0 +1,9 @@
+from contextvars import ContextVar
+
+from electric_text.profiling.data.phase_recorder import PhaseRecorder
+
+# The recorder for the profiled run in the current context, if any.
+# When unset, recording a phase is a no-op.
+current_recorder: ContextVar[PhaseRecorder | None] = ContextVar(
+    "current_recorder", default=None
+)
@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class PhaseRecorder:
+    """Accumulates exclusive wall time per phase for one profiled run.
+
+    Nested phases are subtracted from their parent, so the totals never
+    double count. `stack` holds the time spent in child phases of each
+    currently open phase.
+    """
+
+    seconds: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    stack: list[float] = field(default_factory=list)
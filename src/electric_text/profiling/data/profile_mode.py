@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ProfileMode(Enum):
+    """Which CPU profiler to run during a profiled request."""
+
+    CPROFILE = "cprofile"
+    SAMPLING = "sampling"
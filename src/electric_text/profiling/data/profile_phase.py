@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class ProfilePhase(Enum):
+    """Coarse phases of a request, in the order they usually occur."""
+
+    CONFIG = "config"
+    PROMPT_LOADING = "prompt_loading"
+    REQUEST_BUILD = "request_build"
+    NETWORK = "network"
+    PARSE_VALIDATE = "parse_validate"
+    SERIALIZE = "serialize"
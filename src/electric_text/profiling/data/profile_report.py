@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ProfileReport:
+    """Results of a profiled run.
+
+    Args:
+        total_seconds: Wall time of the whole run
+        phase_seconds: Exclusive wall time per phase
+        phase_counts: Number of times each phase was entered
+        output_path: The written profile file
+        peak_memory_bytes: Peak traced memory, when memory tracing was enabled
+        top_allocations: Largest allocation sites, when memory tracing was enabled
+    """
+
+    total_seconds: float
+    phase_seconds: dict[str, float]
+    phase_counts: dict[str, int]
+    output_path: Path
+    peak_memory_bytes: int | None = None
+    top_allocations: list[str] = field(default_factory=list)
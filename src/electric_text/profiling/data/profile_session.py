@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from electric_text.profiling.data.phase_recorder import PhaseRecorder
+from electric_text.profiling.data.profile_report import ProfileReport
+from electric_text.profiling.data.profile_settings import ProfileSettings
+
+
+@dataclass
+class ProfileSession:
+    """A running profile; `report` is set when the session ends."""
+
+    settings: ProfileSettings
+    recorder: PhaseRecorder
+    report: ProfileReport | None = None
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from electric_text.profiling.data.profile_mode import ProfileMode
+
+
+@dataclass(frozen=True)
+class ProfileSettings:
+    """Settings for a profiled run.
+
+    Args:
+        output_path: Where to write the .pstats (cprofile) or collapsed-stack (sampling) file
+        mode: Which CPU profiler to use
+        memory: Whether to trace allocations with tracemalloc
+        sample_interval: Seconds between stack samples in sampling mode
+    """
+
+    output_path: Path
+    mode: ProfileMode = ProfileMode.CPROFILE
+    memory: bool = False
+    sample_interval: float = 0.001
@@ -0,0 +1,25 @@
+from electric_text.profiling.functions.format_collapsed_stack import (
+    format_collapsed_stack,
+)
+from electric_text.profiling.functions.format_collapsed_stacks import (
+    format_collapsed_stacks,
+)
+from electric_text.profiling.functions.format_profile_summary import (
+    format_profile_summary,
+)
+from electric_text.profiling.functions.profiling import profiling
+from electric_text.profiling.functions.record_entry_phase import record_entry_phase
+from electric_text.profiling.functions.record_iteration_phase import (
+    record_iteration_phase,
+)
+from electric_text.profiling.functions.record_phase import record_phase
+
+__all__ = [
+    "format_collapsed_stack",
+    "format_collapsed_stacks",
+    "format_profile_summary",
+    "profiling",
+    "record_entry_phase",
+    "record_iteration_phase",
+    "record_phase",
+]
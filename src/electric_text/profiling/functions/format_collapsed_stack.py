@@ -0,0 +1,20 @@
+from types import FrameType
+
+
+def format_collapsed_stack(frame: FrameType) -> str:
+    """Format a frame and its callers as a collapsed-stack line (root first).
+
+    Args:
+        frame: The innermost frame
+
+    Returns:
+        Semicolon-separated `module:qualname` entries, as consumed by flamegraph tools
+    """
+    entries: list[str] = []
+    current: FrameType | None = frame
+    while current is not None:
+        module = current.f_globals.get("__name__", "?")
+        entries.append(f"{module}:{current.f_code.co_qualname}")
+        current = current.f_back
+
+    return ";".join(reversed(entries))
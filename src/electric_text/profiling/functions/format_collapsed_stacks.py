@@ -0,0 +1,15 @@
+def format_collapsed_stacks(counts: dict[str, int]) -> str:
+    """Format sampled stack counts in the collapsed-stack file format.
+
+    Args:
+        counts: Number of samples per collapsed stack
+
+    Returns:
+        One `stack count` line per stack, most sampled first
+    """
+    lines = [
+        f"{stack} {count}"
+        for stack, count in sorted(counts.items(), key=lambda item: -item[1])
+    ]
+
+    return "\n".join(lines) + "\n" if lines else ""
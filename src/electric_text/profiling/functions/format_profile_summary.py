@@ -0,0 +1,37 @@
+from electric_text.profiling.data.profile_phase import ProfilePhase
+from electric_text.profiling.data.profile_report import ProfileReport
+
+
+def format_profile_summary(report: ProfileReport) -> str:
+    """Format a short per-phase summary of a profiled run.
+
+    Args:
+        report: The profile report
+
+    Returns:
+        Multi-line, human-readable summary
+    """
+    total_ms = report.total_seconds * 1000
+    lines = [f"Profile written to {report.output_path} ({total_ms:.1f} ms total)"]
+
+    accounted = 0.0
+    for phase in ProfilePhase:
+        if phase.value not in report.phase_seconds:
+            continue
+        seconds = report.phase_seconds[phase.value]
+        accounted += seconds
+        share = seconds / report.total_seconds * 100 if report.total_seconds else 0.0
+        lines.append(
+            f"  {phase.value:<16}{seconds * 1000:>10.1f} ms {share:>6.1f}%"
+            f"  ({report.phase_counts.get(phase.value, 0)}x)"
+        )
+
+    other = max(report.total_seconds - accounted, 0.0)
+    share = other / report.total_seconds * 100 if report.total_seconds else 0.0
+    lines.append(f"  {'other':<16}{other * 1000:>10.1f} ms {share:>6.1f}%")
+
+    if report.peak_memory_bytes is not None:
+        lines.append(f"  peak memory {report.peak_memory_bytes / 1024 / 1024:.2f} MiB")
+        lines.extend(f"    {allocation}" for allocation in report.top_allocations)
+
+    return "\n".join(lines)
@@ -0,0 +1,93 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from electric_text.profiling.data.current_recorder import current_recorder
+from electric_text.profiling.data.phase_recorder import PhaseRecorder
+from electric_text.profiling.data.profile_mode import ProfileMode
+from electric_text.profiling.data.profile_report import ProfileReport
+from electric_text.profiling.data.profile_session import ProfileSession
+from electric_text.profiling.data.profile_settings import ProfileSettings
+from electric_text.profiling.functions.format_collapsed_stacks import (
+    format_collapsed_stacks,
+)
+from electric_text.profiling.sampling_profiler import SamplingProfiler
+
+
+@contextmanager
+def profiling(settings: ProfileSettings) -> Iterator[ProfileSession]:
+    """Profile everything run inside the block.
+
+    Starts the configured CPU profiler (and tracemalloc if requested) and
+    records per-phase wall time for library code running in this context.
+    On exit the profile is written to `settings.output_path` and
+    `session.report` is set.
+
+    Example:
+        with profiling(ProfileSettings(Path("run.pstats"))) as session:
+            result = await generate(...)
+        print(format_profile_summary(session.report))
+
+    Args:
+        settings: What to profile and where to write it
+
+    Yields:
+        The running ProfileSession
+    """
+    # Profilers are only imported when profiling, keeping record_phase cheap to import
+    import cProfile
+    import tracemalloc
+
+    session = ProfileSession(settings=settings, recorder=PhaseRecorder())
+    token = current_recorder.set(session.recorder)
+
+    started_tracemalloc = settings.memory and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+
+    cprofiler = cProfile.Profile() if settings.mode == ProfileMode.CPROFILE else None
+    sampler = (
+        SamplingProfiler(threading.get_ident(), settings.sample_interval)
+        if settings.mode == ProfileMode.SAMPLING
+        else None
+    )
+
+    start = time.perf_counter()
+    if cprofiler:
+        cprofiler.enable()
+    if sampler:
+        sampler.start()
+
+    try:
+        yield session
+    finally:
+        if cprofiler:
+            cprofiler.disable()
+        samples = sampler.stop() if sampler else {}
+        total_seconds = time.perf_counter() - start
+
+        peak_memory_bytes: int | None = None
+        top_allocations: list[str] = []
+        if settings.memory:
+            peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+            statistics = tracemalloc.take_snapshot().statistics("lineno")
+            top_allocations = [str(statistic) for statistic in statistics[:5]]
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+        settings.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if cprofiler:
+            cprofiler.dump_stats(settings.output_path)
+        else:
+            settings.output_path.write_text(format_collapsed_stacks(samples))
+
+        current_recorder.reset(token)
+        session.report = ProfileReport(
+            total_seconds=total_seconds,
+            phase_seconds=dict(session.recorder.seconds),
+            phase_counts=dict(session.recorder.counts),
+            output_path=settings.output_path,
+            peak_memory_bytes=peak_memory_bytes,
+            top_allocations=top_allocations,
+        )
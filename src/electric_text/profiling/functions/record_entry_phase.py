@@ -0,0 +1,33 @@
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import AsyncIterator
+
+from electric_text.profiling.data.profile_phase import ProfilePhase
+from electric_text.profiling.functions.record_phase import record_phase
+
+
+@asynccontextmanager
+async def record_entry_phase[T](
+    manager: AbstractAsyncContextManager[T], phase: ProfilePhase
+) -> AsyncIterator[T]:
+    """Enter an async context manager, attributing only the time to enter it to a phase.
+
+    Useful for `client.stream(...)`, where entering waits for the response
+    headers but the body of the block is the caller's own work.
+
+    Args:
+        manager: The async context manager to enter
+        phase: The phase to attribute the entry time to
+
+    Yields:
+        Whatever the wrapped context manager yields
+    """
+    with record_phase(phase):
+        value = await manager.__aenter__()
+
+    try:
+        yield value
+    except BaseException as error:
+        if not await manager.__aexit__(type(error), error, error.__traceback__):
+            raise
+    else:
+        await manager.__aexit__(None, None, None)
@@ -0,0 +1,35 @@
+from typing import AsyncGenerator, AsyncIterator
+
+from electric_text.profiling.data.current_recorder import current_recorder
+from electric_text.profiling.data.profile_phase import ProfilePhase
+from electric_text.profiling.functions.record_phase import record_phase
+
+
+def record_iteration_phase[T](
+    iterator: AsyncIterator[T], phase: ProfilePhase
+) -> AsyncIterator[T]:
+    """Attribute the time spent waiting on each item of an async iterator to a phase.
+
+    Only the waits are recorded; the consumer's work between items is not.
+    Returns the iterator unchanged unless a profiling session is active.
+
+    Args:
+        iterator: The async iterator to wait on (e.g. response.aiter_lines())
+        phase: The phase to attribute the waits to
+
+    Returns:
+        An async iterator over the same items
+    """
+    if current_recorder.get() is None:
+        return iterator
+
+    async def recorded() -> AsyncGenerator[T, None]:
+        while True:
+            with record_phase(phase):
+                try:
+                    item = await anext(iterator)
+                except StopAsyncIteration:
+                    return
+            yield item
+
+    return recorded()
@@ -0,0 +1,37 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from electric_text.profiling.data.current_recorder import current_recorder
+from electric_text.profiling.data.profile_phase import ProfilePhase
+
+
+@contextmanager
+def record_phase(phase: ProfilePhase) -> Iterator[None]:
+    """Attribute the wall time of the enclosed block to a phase.
+
+    Does nothing unless a profiling session is active in the current context.
+    Time spent in nested phases is excluded from the enclosing phase.
+
+    Args:
+        phase: The phase to attribute the time to
+    """
+    recorder = current_recorder.get()
+    if recorder is None:
+        yield
+        return
+
+    recorder.stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        child_seconds = recorder.stack.pop()
+        name = phase.value
+        recorder.seconds[name] = (
+            recorder.seconds.get(name, 0.0) + elapsed - child_seconds
+        )
+        recorder.counts[name] = recorder.counts.get(name, 0) + 1
+        if recorder.stack:
+            recorder.stack[-1] += elapsed
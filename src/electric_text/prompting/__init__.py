@@ -1,19 +1,34 @@
-from electric_text.prompting.data import PromptConfig
-from electric_text.prompting.functions import (
-    get_prompt_list,
-    get_prompt_by_name,
-    execute_prompt,
-    get_prompt_config_and_model,
-    generate,
-    split_model_string,
-)
+import importlib
+from typing import Any
+
+# Exports are imported on first use; see electric_text/__init__.py
+EXPORTS = {
+    "PromptConfig": "electric_text.prompting.data.prompt_config",
+    "get_prompt_list": "electric_text.prompting.functions.get_prompt_list",
+    "get_prompt_by_name": "electric_text.prompting.functions.get_prompt_by_name",
+    "get_prompt_registry": "electric_text.prompting.functions.get_prompt_registry",
+    "get_client_pool": "electric_text.prompting.functions.get_client_pool",
+    "execute_prompt": "electric_text.prompting.functions.execute_prompt",
+    "get_prompt_config_and_model": "electric_text.prompting.functions.get_prompt_config_and_model",
+    "generate": "electric_text.prompting.functions.generate",
+    "split_model_string": "electric_text.prompting.functions.split_model_string",
+}
 
 __all__ = [
     "PromptConfig",
     "get_prompt_list",
     "get_prompt_by_name",
+    "get_prompt_registry",
+    "get_client_pool",
     "execute_prompt",
     "get_prompt_config_and_model",
     "generate",
     "split_model_string",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in EXPORTS:
+        return getattr(importlib.import_module(EXPORTS[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,80 @@
+import json
+
+from electric_text.clients import Client, resolve_api_key
+from electric_text.prompting.functions.create_client import create_client
+from electric_text.prompting.functions.get_http_log_dir import get_http_log_dir
+from electric_text.prompting.functions.get_http_log_options import (
+    get_http_log_options,
+)
+from electric_text.prompting.functions.get_http_logging_enabled import (
+    get_http_logging_enabled,
+)
+from electric_text.prompting.functions.get_request_coalescing_enabled import (
+    get_request_coalescing_enabled,
+)
+
+
+class ClientPool:
+    """Shares keep-alive clients between requests in a long-running process.
+
+    Disabled by default, in which case every request gets a fresh client
+    that opens and closes its own connections. Once enabled (the serve-local
+    daemon does this), clients are kept per provider, API key, and HTTP
+    logging settings, so later requests reuse warm connections. A change to
+    any of those settings gets a new client rather than a stale one. With
+    ELECTRIC_TEXT_COALESCE_REQUESTS=true, pooled clients also share one
+    upstream call between identical requests in flight.
+
+    Pooled clients hold connections bound to the event loop that opened
+    them, so a pool should only be enabled inside a single long-lived loop.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.clients: dict[str, Client] = {}
+
+    def enable(self) -> None:
+        """Start keeping clients between requests."""
+        self.enabled = True
+
+    def get_client(self, provider_name: str, api_key: str | None = None) -> Client:
+        """Get a client for a provider, reusing a pooled one when enabled.
+
+        Args:
+            provider_name: Name of the provider
+            api_key: Explicit API key (falls back to ELECTRIC_TEXT_{PROVIDER}_API_KEY)
+
+        Returns:
+            Client for the provider
+        """
+        if not self.enabled:
+            return create_client(provider_name, api_key)
+
+        coalesce = get_request_coalescing_enabled()
+        key = json.dumps(
+            [
+                provider_name,
+                resolve_api_key(provider_name, api_key),
+                get_http_logging_enabled(),
+                get_http_log_dir(),
+                get_http_log_options(),
+                coalesce,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        client = self.clients.get(key)
+        if client is None:
+            client = create_client(
+                provider_name, api_key, keep_alive=True, coalesce=coalesce
+            )
+            self.clients[key] = client
+
+        return client
+
+    async def aclose(self) -> None:
+        """Close every pooled client and empty the pool."""
+        clients = list(self.clients.values())
+        self.clients = {}
+        for client in clients:
+            await client.aclose()
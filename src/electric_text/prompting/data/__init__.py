@@ -1,10 +1,17 @@
-from electric_text.prompting.data.prompt_config import PromptConfig
-from electric_text.prompting.data.system_input import SystemInput
-from electric_text.prompting.data.system_output_type import SystemOutputType
-from electric_text.prompting.data.text_output import TextOutput
-from electric_text.prompting.data.data_output import DataOutput
-from electric_text.prompting.data.tool_call_output import ToolCallOutput
-from electric_text.prompting.data.system_output import SystemOutput
+import importlib
+from typing import Any
+
+# Exports are imported on first use; see electric_text/__init__.py
+EXPORTS = {
+    "PromptConfig": "electric_text.prompting.data.prompt_config",
+    "SystemInput": "electric_text.prompting.data.system_input",
+    "SystemOutputType": "electric_text.prompting.data.system_output_type",
+    "TextOutput": "electric_text.prompting.data.text_output",
+    "DataOutput": "electric_text.prompting.data.data_output",
+    "ToolCallOutput": "electric_text.prompting.data.tool_call_output",
+    "SystemOutput": "electric_text.prompting.data.system_output",
+    "OutputFormat": "electric_text.prompting.data.output_format",
+}
 
 __all__ = [
     "PromptConfig",
@@ -14,4 +21,12 @@ __all__ = [
     "DataOutput",
     "ToolCallOutput",
     "SystemOutput",
-]
\ No newline at end of file
+    "OutputFormat",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in EXPORTS:
+        return getattr(importlib.import_module(EXPORTS[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
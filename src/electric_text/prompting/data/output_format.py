@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class OutputFormat(Enum):
+    """How outputs are written as NDJSON.
+
+    FULL writes the whole accumulated output for every update. DELTA writes
+    only what changed (appended text, tool argument fragments, completed
+    data fields) followed by one summary record.
+    """
+
+    FULL = "full"
+    DELTA = "delta"
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+
+from electric_text.prompting.data.prompt_config import PromptConfig
+
+
+@dataclass(frozen=True)
+class PromptIndex:
+    """A snapshot of the prompt configs in one directory.
+
+    Args:
+        directory_stamp: (mtime_ns, size) of the directory when it was scanned
+        file_stamps: (mtime_ns, size) of every config file that was scanned,
+            including files that failed to load
+        configs: The loaded prompt configs, in scan order
+        by_name: The first config loaded for each name
+        sources: The config file each name was loaded from
+    """
+
+    directory_stamp: tuple[int, int] | None
+    file_stamps: dict[str, tuple[int, int] | None] = field(default_factory=dict)
+    configs: list[PromptConfig] = field(default_factory=list)
+    by_name: dict[str, PromptConfig] = field(default_factory=dict)
+    sources: dict[str, str] = field(default_factory=dict)
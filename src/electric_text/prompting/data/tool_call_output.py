@@ -4,8 +4,13 @@ from typing import Any
 
 @dataclass
 class ToolCallOutput:
-    """Output for tool call responses."""
+    """Output for tool call responses.
+
+    inputs_json holds the raw argument JSON as streamed so far, which may not
+    parse yet; it is used for delta output and not serialized.
+    """
 
     name: str
     inputs: dict[str, Any]
     output: Any | None = None
+    inputs_json: str = ""
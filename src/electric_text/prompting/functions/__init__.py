@@ -1,17 +1,25 @@
-from electric_text.prompting.functions.get_prompt_list import get_prompt_list
-from electric_text.prompting.functions.get_prompt_by_name import get_prompt_by_name
-from electric_text.prompting.functions.execute_prompt import execute_prompt
-from electric_text.prompting.functions.execute_prompt_with_return import execute_prompt_with_return
-from electric_text.prompting.functions.execute_client_request_with_return import execute_client_request_with_return
-from electric_text.prompting.functions.get_prompt_config_and_model import (
-    get_prompt_config_and_model,
-)
-from electric_text.prompting.functions.generate import generate
-from electric_text.prompting.functions.split_model_string import split_model_string
+import importlib
+from typing import Any
+
+# Exports are imported on first use; see electric_text/__init__.py
+EXPORTS = {
+    "get_prompt_list": "electric_text.prompting.functions.get_prompt_list",
+    "get_prompt_by_name": "electric_text.prompting.functions.get_prompt_by_name",
+    "get_prompt_registry": "electric_text.prompting.functions.get_prompt_registry",
+    "get_client_pool": "electric_text.prompting.functions.get_client_pool",
+    "execute_prompt": "electric_text.prompting.functions.execute_prompt",
+    "execute_prompt_with_return": "electric_text.prompting.functions.execute_prompt_with_return",
+    "execute_client_request_with_return": "electric_text.prompting.functions.execute_client_request_with_return",
+    "get_prompt_config_and_model": "electric_text.prompting.functions.get_prompt_config_and_model",
+    "generate": "electric_text.prompting.functions.generate",
+    "split_model_string": "electric_text.prompting.functions.split_model_string",
+}
 
 __all__ = [
     "get_prompt_list",
     "get_prompt_by_name",
+    "get_prompt_registry",
+    "get_client_pool",
     "execute_prompt",
     "execute_prompt_with_return",
     "execute_client_request_with_return",
@@ -19,3 +27,10 @@ __all__ = [
     "generate",
     "split_model_string",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in EXPORTS:
+        return getattr(importlib.import_module(EXPORTS[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,48 @@
+import os
+import glob
+
+from electric_text.configuration.functions.get_file_stamp import get_file_stamp
+from electric_text.prompting.data.prompt_config import PromptConfig
+from electric_text.prompting.data.prompt_index import PromptIndex
+from electric_text.prompting.functions.load_prompt_config import load_prompt_config
+
+
+def build_prompt_index(prompt_dir: str) -> PromptIndex:
+    """Scan a prompt directory and index its configs by name.
+
+    Files that fail to load are reported and skipped, but their stamps are
+    kept so that fixing them invalidates the index.
+
+    Args:
+        prompt_dir: The prompt directory to scan
+
+    Returns:
+        PromptIndex: The configs in the directory
+    """
+    directory_stamp = get_file_stamp(prompt_dir)
+    file_stamps: dict[str, tuple[int, int] | None] = {}
+    configs: list[PromptConfig] = []
+    by_name: dict[str, PromptConfig] = {}
+    sources: dict[str, str] = {}
+
+    for json_file in sorted(glob.glob(os.path.join(prompt_dir, "*.json"))):
+        file_stamps[json_file] = get_file_stamp(json_file)
+        try:
+            prompt_config = load_prompt_config(json_file, prompt_dir)
+        except Exception as e:
+            # Log the error but continue processing other files
+            print(f"Error loading prompt config from {json_file}: {e}")
+            continue
+
+        configs.append(prompt_config)
+        if prompt_config.name not in by_name:
+            by_name[prompt_config.name] = prompt_config
+            sources[prompt_config.name] = json_file
+
+    return PromptIndex(
+        directory_stamp=directory_stamp,
+        file_stamps=file_stamps,
+        configs=configs,
+        by_name=by_name,
+        sources=sources,
+    )
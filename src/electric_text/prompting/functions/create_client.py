@@ -0,0 +1,42 @@
+from electric_text.clients import Client, resolve_api_key
+from electric_text.prompting.functions.get_http_log_dir import get_http_log_dir
+from electric_text.prompting.functions.get_http_log_options import (
+    get_http_log_options,
+)
+from electric_text.prompting.functions.get_http_logging_enabled import (
+    get_http_logging_enabled,
+)
+
+
+def create_client(
+    provider_name: str,
+    api_key: str | None = None,
+    keep_alive: bool = False,
+    coalesce: bool = False,
+) -> Client:
+    """Create a client for a provider with the configured API key and HTTP logging.
+
+    Args:
+        provider_name: Name of the provider
+        api_key: Explicit API key (falls back to ELECTRIC_TEXT_{PROVIDER}_API_KEY)
+        keep_alive: Reuse one HTTP connection pool across requests until the
+            client is closed
+        coalesce: Share one upstream call between identical requests in flight
+
+    Returns:
+        Client for the provider
+    """
+    config = {}
+    resolved_api_key = resolve_api_key(provider_name, api_key)
+    if resolved_api_key:
+        config["api_key"] = resolved_api_key
+
+    return Client(
+        provider_name=provider_name,
+        config=config,
+        http_logging_enabled=get_http_logging_enabled(),
+        http_log_dir=get_http_log_dir(),
+        http_log_options=get_http_log_options(),
+        keep_alive=keep_alive,
+        coalesce=coalesce,
+    )
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional, Type
+from typing import Any, Optional, Type, Sequence
 
 from electric_text.clients.data.client_request import ClientRequest
 from electric_text.clients.data.prompt import Prompt
@@ -12,7 +12,7 @@ def create_client_request[OutputSchema: ValidationModel](
     model_name: str,
     text_input: str,
     system_message: str = "You are a helpful assistant.",
-    tools: Optional[List[Any]] = None,
+    tools: Optional[Sequence[Any]] = None,
     max_tokens: Optional[int] = None,
     output_schema: Type[OutputSchema],
 ) -> ClientRequest[OutputSchema]:
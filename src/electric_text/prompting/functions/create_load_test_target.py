@@ -0,0 +1,43 @@
+from electric_text.clients import Client
+from electric_text.clients.data.client_request import ClientRequest
+from electric_text.clients.data.default_output_schema import DefaultOutputSchema
+from electric_text.prompting.functions.create_client import create_client
+from electric_text.prompting.functions.create_client_request import (
+    create_client_request,
+)
+from electric_text.prompting.functions.get_shorthand_models import (
+    get_shorthand_models,
+)
+from electric_text.prompting.functions.resolve_model_string import (
+    resolve_model_string,
+)
+
+
+def create_load_test_target(
+    model_string: str,
+    text_input: str,
+    api_key: str | None = None,
+    max_tokens: int | None = None,
+) -> tuple[Client, ClientRequest[DefaultOutputSchema]]:
+    """Create the client and the request that a load test sends repeatedly.
+
+    Args:
+        model_string: "provider:model" or a configured shorthand
+        text_input: Prompt text
+        api_key: Explicit API key
+        max_tokens: Maximum number of tokens to generate
+
+    Returns:
+        Tuple of (client, request)
+    """
+    provider_name, model_name = resolve_model_string(
+        model_string, get_shorthand_models()
+    )
+
+    return create_client(provider_name, api_key), create_client_request(
+        provider_name=provider_name,
+        model_name=model_name,
+        text_input=text_input,
+        max_tokens=max_tokens,
+        output_schema=DefaultOutputSchema,
+    )
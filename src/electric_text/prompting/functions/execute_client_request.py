@@ -1,18 +1,22 @@
 import json
 import logging
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator
 
 from electric_text.clients import Client
 from electric_text.clients.data.client_request import ClientRequest
 from electric_text.clients.data.client_response import ClientResponse
 from electric_text.clients.data.validation_model import ValidationModel
 from electric_text.logging import get_logger
+from electric_text.prompting.data.output_format import OutputFormat
 from electric_text.prompting.data.system_output import SystemOutput
 from electric_text.prompting.functions.output_conversion.client_response_to_system_output import (
     client_response_to_system_output,
 )
-from electric_text.prompting.functions.output_conversion.system_output_to_dict import (
-    system_output_to_dict,
+from electric_text.prompting.functions.output_conversion.format_output_records import (
+    format_output_records,
+)
+from electric_text.prompting.functions.output_conversion.single_output import (
+    single_output,
 )
 
 logger: logging.Logger = get_logger(__name__)
@@ -23,6 +27,7 @@ async def execute_client_request[Schema: ValidationModel](
     client: Client,
     request: ClientRequest[Schema],
     stream: bool = False,
+    output_format: OutputFormat = OutputFormat.FULL,
 ) -> None:
     """Execute a client request with the given parameters, handling streaming and output.
 
@@ -30,19 +35,20 @@ async def execute_client_request[Schema: ValidationModel](
         client: Client instance to use for the request
         request: The ClientRequest to execute
         stream: Whether to stream the response
-        model_class: Optional model class for structured outputs
+        output_format: Print whole outputs per update, or only deltas
     """
 
     if stream:
         req: ClientRequest[Schema] = request
         gen: AsyncGenerator[ClientResponse[Schema], None] = client.stream(request=req)
-        async for part in gen:
-            stream_output: SystemOutput = client_response_to_system_output(part)
-            output_dict = system_output_to_dict(stream_output)
-            print(json.dumps(output_dict))
+        outputs: AsyncIterator[SystemOutput] = (
+            client_response_to_system_output(part) async for part in gen
+        )
 
     else:
         full_response: ClientResponse[Schema] = await client.generate(request=request)
         system_output: SystemOutput = client_response_to_system_output(full_response)
-        output_dict = system_output_to_dict(system_output)
-        print(json.dumps(output_dict))
+        outputs = single_output(system_output)
+
+    async for record in format_output_records(outputs, output_format):
+        print(json.dumps(record))
@@ -1,4 +1,5 @@
 import logging
+from contextlib import aclosing
 from typing import AsyncGenerator, Union
 
 from electric_text.clients import Client
@@ -6,6 +7,7 @@ from electric_text.clients.data.client_request import ClientRequest
 from electric_text.clients.data.client_response import ClientResponse
 from electric_text.clients.data.validation_model import ValidationModel
 from electric_text.logging import get_logger
+from electric_text.profiling import ProfilePhase, record_phase
 from electric_text.prompting.data.system_output import SystemOutput
 from electric_text.prompting.functions.output_conversion.client_response_to_system_output import (
     client_response_to_system_output,
@@ -39,11 +41,16 @@ async def execute_client_request_with_return[Schema: ValidationModel](
                 request=req
             )
 
-            async for part in gen:
-                yield client_response_to_system_output(part)
+            # Closing this generator closes the client stream right away
+            async with aclosing(gen):
+                async for part in gen:
+                    with record_phase(ProfilePhase.SERIALIZE):
+                        output = client_response_to_system_output(part)
+                    yield output
 
         return stream_generator()
 
     else:
         full_response: ClientResponse[Schema] = await client.generate(request=request)
-        return client_response_to_system_output(full_response)
+        with record_phase(ProfilePhase.SERIALIZE):
+            return client_response_to_system_output(full_response)
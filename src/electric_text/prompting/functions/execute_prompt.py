@@ -1,14 +1,16 @@
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence
 
 from electric_text.logging import get_logger
 from electric_text.clients import Client
 from electric_text.clients.data.default_output_schema import DefaultOutputSchema
+from electric_text.prompting.data.output_format import OutputFormat
 from electric_text.prompting.functions.create_client_request import (
     create_client_request,
 )
 from electric_text.prompting.functions.execute_client_request import (
     execute_client_request,
 )
+from electric_text.prompting.functions.get_prompt_registry import get_prompt_registry
 from electric_text.prompting.functions.get_prompt_config_and_model import get_prompt_config_and_model
 
 
@@ -20,10 +22,11 @@ async def execute_prompt(
     model_name: str,
     text_input: str,
     client: Client,
-    tools: Optional[List[Any]] = None,
+    tools: Optional[Sequence[Any]] = None,
     prompt_name: Optional[str] = None,
     stream: bool = False,
     max_tokens: Optional[int] = None,
+    output_format: OutputFormat = OutputFormat.FULL,
 ) -> None:
     """Execute a prompt with the given parameters.
 
@@ -41,6 +44,7 @@ async def execute_prompt(
         tool_boxes: Optional list of tool box names to use
         max_tokens: Optional maximum number of tokens for completion
         tools: Optional list of pre-loaded tools
+        output_format: Print whole outputs per update, or only deltas
     """
     # If no prompt_name, handle as a simple request with default system message
     if not prompt_name:
@@ -57,6 +61,7 @@ async def execute_prompt(
             client=client,
             request=no_prompt_request,
             stream=stream,
+            output_format=output_format,
         )
 
         return
@@ -73,7 +78,7 @@ async def execute_prompt(
         provider_name=provider_name,
         model_name=model_name,
         text_input=text_input,
-        system_message=prompt_config.get_system_message(),
+        system_message=get_prompt_registry().get_system_message(prompt_config),
         tools=tools,
         max_tokens=max_tokens,
         output_schema=model_class,
@@ -84,4 +89,5 @@ async def execute_prompt(
         client=client,
         request=request,
         stream=stream,
+        output_format=output_format,
     )
@@ -1,6 +1,7 @@
-from typing import Any, List, Optional, Union, AsyncGenerator
+from typing import Any, Optional, Union, AsyncGenerator, Sequence
 
 from electric_text.logging import get_logger
+from electric_text.profiling import ProfilePhase, record_phase
 from electric_text.clients import Client
 from electric_text.clients.data.default_output_schema import DefaultOutputSchema
 from electric_text.prompting.data.system_output import SystemOutput
@@ -10,6 +11,7 @@ from electric_text.prompting.functions.create_client_request import (
 from electric_text.prompting.functions.execute_client_request_with_return import (
     execute_client_request_with_return,
 )
+from electric_text.prompting.functions.get_prompt_registry import get_prompt_registry
 from electric_text.prompting.functions.get_prompt_config_and_model import (
     get_prompt_config_and_model,
 )
@@ -24,7 +26,7 @@ async def execute_prompt_with_return(
     model_name: str,
     text_input: str,
     client: Client,
-    tools: Optional[List[Any]] = None,
+    tools: Optional[Sequence[Any]] = None,
     prompt_name: Optional[str] = None,
     stream: bool = False,
     max_tokens: Optional[int] = None,
@@ -51,14 +53,15 @@ async def execute_prompt_with_return(
     """
     # If no prompt_name, handle as a simple request with default system message
     if not prompt_name:
-        no_prompt_request = create_client_request(
-            provider_name=provider_name,
-            model_name=model_name,
-            text_input=text_input,
-            tools=tools,
-            max_tokens=max_tokens,
-            output_schema=DefaultOutputSchema,
-        )
+        with record_phase(ProfilePhase.REQUEST_BUILD):
+            no_prompt_request = create_client_request(
+                provider_name=provider_name,
+                model_name=model_name,
+                text_input=text_input,
+                tools=tools,
+                max_tokens=max_tokens,
+                output_schema=DefaultOutputSchema,
+            )
 
         return await execute_client_request_with_return(
             client=client,
@@ -67,22 +70,24 @@ async def execute_prompt_with_return(
         )
 
     # Get prompt config and model if needed for structured prompts
-    prompt_config, model_class = await get_prompt_config_and_model(prompt_name)
+    with record_phase(ProfilePhase.PROMPT_LOADING):
+        prompt_config, model_class = await get_prompt_config_and_model(prompt_name)
 
     if not prompt_config:
         logger.error(f"{prompt_name} prompt config not found")
         raise ValueError(f"Prompt config '{prompt_name}' not found")
 
     # Create request with custom system message from prompt config
-    request = create_client_request(
-        provider_name=provider_name,
-        model_name=model_name,
-        text_input=text_input,
-        system_message=prompt_config.get_system_message(),
-        tools=tools,
-        max_tokens=max_tokens,
-        output_schema=model_class,
-    )
+    with record_phase(ProfilePhase.REQUEST_BUILD):
+        request = create_client_request(
+            provider_name=provider_name,
+            model_name=model_name,
+            text_input=text_input,
+            system_message=get_prompt_registry().get_system_message(prompt_config),
+            tools=tools,
+            max_tokens=max_tokens,
+            output_schema=model_class,
+        )
 
     # Execute the request with the appropriate model class
     return await execute_client_request_with_return(
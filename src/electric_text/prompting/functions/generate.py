@@ -1,18 +1,14 @@
-from typing import List, Union, AsyncGenerator, overload, Literal
+from typing import Any, Dict, List, Tuple, Union, AsyncGenerator, overload, Literal
 
 from electric_text.logging import get_logger
-from electric_text.clients import resolve_api_key
-from electric_text.clients import Client
+from electric_text.profiling import ProfilePhase, record_phase
 from electric_text.tools import load_tools_from_tool_boxes
 from electric_text.prompting.data.system_input import SystemInput
 from electric_text.prompting.data.system_output import SystemOutput
 from electric_text.prompting.functions.execute_prompt_with_return import (
     execute_prompt_with_return,
 )
-from electric_text.prompting.functions.get_http_logging_enabled import (
-    get_http_logging_enabled,
-)
-from electric_text.prompting.functions.get_http_log_dir import get_http_log_dir
+from electric_text.prompting.functions.get_client_pool import get_client_pool
 
 logger = get_logger(__name__)
 
@@ -96,33 +92,22 @@ async def generate(
     logger.debug(f"Model name: {system_input.model_name}")
     logger.debug(f"Provider: {system_input.provider_name}")
 
-    # Configure client with API key if available
-    config = {}
-    resolved_api_key = resolve_api_key(system_input.provider_name, system_input.api_key)
-    if resolved_api_key:
-        config["api_key"] = resolved_api_key
-
-    # Resolve HTTP logging configuration
-    http_logging_enabled = get_http_logging_enabled()
-    http_log_dir = get_http_log_dir()
-
-    client = Client(
-        provider_name=system_input.provider_name,
-        config=config,
-        http_logging_enabled=http_logging_enabled,
-        http_log_dir=http_log_dir,
-    )
+    with record_phase(ProfilePhase.CONFIG):
+        client = get_client_pool().get_client(
+            system_input.provider_name, system_input.api_key
+        )
 
     # Parse tool_boxes string into a list if provided
     tool_box_list: List[str] = []
-    tools = []
+    tools: Tuple[Dict[str, Any], ...] = ()
     tool_boxes = system_input.tool_boxes
     if tool_boxes is not None:
         tool_box_list = [tb.strip() for tb in tool_boxes.split(",")]
         logger.debug(f"Using tool boxes: {tool_box_list}")
 
         # Load and process tools from the specified tool boxes
-        tools = load_tools_from_tool_boxes(tool_box_list)
+        with record_phase(ProfilePhase.PROMPT_LOADING):
+            tools = load_tools_from_tool_boxes(tool_box_list)
         logger.debug(f"Loaded {len(tools)} tools from {len(tool_box_list)} tool boxes")
 
     # Execute the prompt and return the result
@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+from electric_text.prompting.client_pool import ClientPool
+
+
+@lru_cache(maxsize=1)
+def get_client_pool() -> ClientPool:
+    """Get the process-wide client pool.
+
+    Returns:
+        The shared ClientPool instance
+    """
+    return ClientPool()
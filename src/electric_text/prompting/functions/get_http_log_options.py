@@ -0,0 +1,30 @@
+from typing import Any
+
+from electric_text.configuration.functions.get_cached_config import get_cached_config
+
+HTTP_LOG_WRITER_OPTIONS = (
+    "queue_size",
+    "overflow",
+    "block_timeout",
+    "segment_max_bytes",
+    "compress",
+    "batch_size",
+    "buffer_size",
+    "sample_rate",
+    "errors_only",
+    "slow_threshold_ms",
+)
+
+
+def get_http_log_options() -> dict[str, Any]:
+    """Get the HTTP log writer, buffer and sampling options from config."""
+    try:
+        config = get_cached_config()
+        return {
+            key: value
+            for key, value in config.http_logging.items()
+            if key in HTTP_LOG_WRITER_OPTIONS
+        }
+    except Exception:
+        # If config loading fails, use the writer defaults
+        return {}
@@ -1,6 +1,7 @@
 from typing import Optional
-from electric_text.prompting.functions.get_prompt_list import get_prompt_list
 from electric_text.prompting.data.prompt_config import PromptConfig
+from electric_text.prompting.functions.get_prompt_directory import get_prompt_directory
+from electric_text.prompting.functions.get_prompt_registry import get_prompt_registry
 
 
 def get_prompt_by_name(name: str) -> Optional[PromptConfig]:
@@ -12,8 +13,4 @@ def get_prompt_by_name(name: str) -> Optional[PromptConfig]:
     Returns:
         The prompt config if found, None otherwise
     """
-    prompt_configs = get_prompt_list()
-    for config in prompt_configs:
-        if config.name == name:
-            return config
-    return None 
\ No newline at end of file
+    return get_prompt_registry().get_prompt(get_prompt_directory(), name)
@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+from electric_text.prompting.prompt_registry import PromptRegistry
+
+
+@lru_cache(maxsize=1)
+def get_prompt_registry() -> PromptRegistry:
+    """Get the process-wide prompt registry.
+
+    Returns:
+        The shared PromptRegistry instance
+    """
+    return PromptRegistry()
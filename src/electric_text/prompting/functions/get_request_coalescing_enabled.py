@@ -0,0 +1,9 @@
+import os
+
+
+def get_request_coalescing_enabled() -> bool:
+    """Check if pooled clients share identical in-flight requests.
+
+    Set ELECTRIC_TEXT_COALESCE_REQUESTS=true to enable it.
+    """
+    return os.getenv("ELECTRIC_TEXT_COALESCE_REQUESTS", "").lower() == "true"
@@ -0,0 +1,15 @@
+from electric_text.configuration.functions.get_config_service import (
+    get_config_service,
+)
+
+
+def get_shorthand_models(config_path: str | None = None) -> dict[str, tuple[str, str]]:
+    """Get the shorthand lookup of the current configuration snapshot.
+
+    Args:
+        config_path: Optional path to the configuration file
+
+    Returns:
+        Dict mapping shorthand strings to (provider, model) tuples
+    """
+    return get_config_service().get_snapshot(config_path).shorthand_models
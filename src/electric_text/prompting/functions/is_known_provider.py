@@ -0,0 +1,19 @@
+import importlib.util
+
+# Where Client looks for the provider named in a model string
+PROVIDER_PACKAGE = "electric_text.providers.model_providers"
+
+
+def is_known_provider(provider_name: str) -> bool:
+    """Check whether a provider exists, without importing it.
+
+    Args:
+        provider_name: The provider part of a model string
+
+    Returns:
+        True if there is a provider module of that name
+    """
+    if not provider_name.isidentifier():
+        return False
+
+    return importlib.util.find_spec(f"{PROVIDER_PACKAGE}.{provider_name}") is not None
@@ -0,0 +1,20 @@
+from electric_text.configuration.functions.get_file_stamp import get_file_stamp
+from electric_text.prompting.data.prompt_index import PromptIndex
+
+
+def is_prompt_index_current(index: PromptIndex, prompt_dir: str) -> bool:
+    """Check that no config file was added, removed, or edited since indexing.
+
+    Args:
+        index: The index to check
+        prompt_dir: The directory the index was built from
+
+    Returns:
+        True if the directory and every indexed file still have their stamps
+    """
+    if get_file_stamp(prompt_dir) != index.directory_stamp:
+        return False
+
+    return all(
+        get_file_stamp(path) == stamp for path, stamp in index.file_stamps.items()
+    )
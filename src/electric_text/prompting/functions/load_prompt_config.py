@@ -0,0 +1,61 @@
+import os
+import json
+from pathlib import Path
+
+from electric_text.prompting.data.prompt_config import PromptConfig
+
+
+def load_prompt_config(json_file: str, prompt_dir: str) -> PromptConfig:
+    """Load a single prompt configuration file.
+
+    Relative system message and model paths are resolved against the prompt
+    directory, and the name defaults to the file's stem.
+
+    Args:
+        json_file: Path to the JSON config file
+        prompt_dir: The prompt directory the file belongs to
+
+    Returns:
+        PromptConfig: The loaded prompt configuration
+
+    Raises:
+        ValueError: If a required field is missing
+    """
+    with open(json_file, "r") as f:
+        config_data = json.load(f)
+
+    # Convert relative paths to absolute if needed
+    base_dir = Path(prompt_dir)
+    system_path = config_data.get("system_message_path", "")
+
+    # Handle model_path (previously schema_path)
+    model_path = config_data.get("model_path", None)
+
+    # For backward compatibility, check schema_path if model_path is not provided
+    if model_path is None and "schema_path" in config_data:
+        print(f"Use 'model_path' instead of 'schema_path' in {json_file}.")
+        model_path = config_data.pop("schema_path")
+        config_data["model_path"] = model_path
+
+    if system_path and not os.path.isabs(system_path):
+        config_data["system_message_path"] = str(base_dir / system_path)
+
+    if model_path and not os.path.isabs(model_path):
+        config_data["model_path"] = str(base_dir / model_path)
+
+    # Add the name based on filename if not present
+    if "name" not in config_data:
+        config_data["name"] = Path(json_file).stem
+
+    # Validate required fields are present
+    required_fields = ["name", "description", "system_message_path"]
+    missing_fields = [field for field in required_fields if field not in config_data]
+    if missing_fields:
+        raise ValueError(f"Missing required fields {missing_fields} in {json_file}")
+
+    return PromptConfig(
+        name=config_data["name"],
+        description=config_data["description"],
+        system_message_path=config_data["system_message_path"],
+        model_path=config_data.get("model_path"),
+    )
@@ -30,6 +30,7 @@ def client_response_to_system_output[OutputSchema: ValidationModel](
                 tool_call=ToolCallOutput(
                     name=name,
                     inputs=inputs,
+                    inputs_json=response.first_tool_call_json or "",
                 ),
             )
 
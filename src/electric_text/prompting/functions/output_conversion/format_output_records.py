@@ -0,0 +1,50 @@
+from typing import Any, AsyncGenerator, AsyncIterator
+
+from electric_text.profiling import ProfilePhase, record_phase
+from electric_text.prompting.data.output_format import OutputFormat
+from electric_text.prompting.data.system_output import SystemOutput
+from electric_text.prompting.functions.output_conversion.get_output_deltas import (
+    get_output_deltas,
+)
+from electric_text.prompting.functions.output_conversion.get_output_summary import (
+    get_output_summary,
+)
+from electric_text.prompting.functions.output_conversion.system_output_to_dict import (
+    system_output_to_dict,
+)
+
+
+async def format_output_records(
+    outputs: AsyncIterator[SystemOutput], output_format: OutputFormat
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Turn a sequence of output updates into NDJSON records.
+
+    Args:
+        outputs: Output updates, each holding everything generated so far
+        output_format: FULL for one whole output per update, DELTA for only
+            the changes and a closing summary
+
+    Yields:
+        JSON-serializable records
+    """
+    if output_format is OutputFormat.FULL:
+        async for output in outputs:
+            with record_phase(ProfilePhase.SERIALIZE):
+                record = system_output_to_dict(output)
+            yield record
+        return
+
+    previous: SystemOutput | None = None
+    updates = 0
+    async for output in outputs:
+        with record_phase(ProfilePhase.SERIALIZE):
+            records = get_output_deltas(previous, output)
+        for record in records:
+            yield record
+        previous = output
+        updates += 1
+
+    if previous is not None:
+        for record in get_output_deltas(previous, previous, final=True):
+            yield record
+        yield get_output_summary(previous, updates)
@@ -0,0 +1,15 @@
+def get_appended_text(previous: str, current: str) -> tuple[str, bool]:
+    """Get the text added since the previous update.
+
+    Args:
+        previous: Text as of the previous update
+        current: Text as of this update
+
+    Returns:
+        (added text, False) when current extends previous; otherwise
+        (current, True), meaning current replaces everything sent before
+    """
+    if current.startswith(previous):
+        return current[len(previous) :], False
+
+    return current, True
@@ -0,0 +1,23 @@
+from typing import Any
+
+
+def get_completed_fields(
+    previous: dict[str, Any], current: dict[str, Any], final: bool
+) -> list[tuple[str, Any]]:
+    """Get the top-level data fields that completed since the previous update.
+
+    Fields stream in order, so every field but the last is complete; when
+    the output is final, the last one is too.
+
+    Args:
+        previous: Data as of the previous update
+        current: Data as of this update
+        final: Whether this is the last update
+
+    Returns:
+        (name, value) pairs of newly completed fields, in order
+    """
+    completed_before = list(previous)[:-1]
+    names = list(current) if final else list(current)[:-1]
+
+    return [(name, current[name]) for name in names if name not in completed_before]
@@ -0,0 +1,64 @@
+from typing import Any
+
+from electric_text.prompting.data.system_output import SystemOutput
+from electric_text.prompting.functions.output_conversion.get_appended_text import (
+    get_appended_text,
+)
+from electric_text.prompting.functions.output_conversion.get_completed_fields import (
+    get_completed_fields,
+)
+
+
+def get_output_deltas(
+    previous: SystemOutput | None, current: SystemOutput, final: bool = False
+) -> list[dict[str, Any]]:
+    """Describe what changed between two updates of a streamed output.
+
+    Records are {"type": "text_delta", "delta": ...} for appended text,
+    {"type": "tool_call_start", "name": ...} and {"type": "tool_call_delta",
+    "delta": ...} for tool calls and their argument JSON, and {"type":
+    "field", "name": ..., "value": ...} for completed data fields. A delta
+    that does not extend what was sent before carries "reset": true.
+
+    Args:
+        previous: The previous update (None for the first)
+        current: This update
+        final: Whether this is the last update
+
+    Returns:
+        Delta records, possibly empty
+    """
+    records: list[dict[str, Any]] = []
+
+    previous_text = previous.text.content if previous and previous.text else ""
+    if current.text is not None:
+        delta, reset = get_appended_text(previous_text, current.text.content)
+        if delta or reset:
+            records.append(
+                {"type": "text_delta", "delta": delta}
+                | ({"reset": True} if reset else {})
+            )
+
+    previous_tool = previous.tool_call if previous else None
+    if current.tool_call is not None:
+        if previous_tool is None or previous_tool.name != current.tool_call.name:
+            records.append({"type": "tool_call_start", "name": current.tool_call.name})
+            previous_tool = None
+        delta, reset = get_appended_text(
+            previous_tool.inputs_json if previous_tool else "",
+            current.tool_call.inputs_json,
+        )
+        if delta or reset:
+            records.append(
+                {"type": "tool_call_delta", "delta": delta}
+                | ({"reset": True} if reset else {})
+            )
+
+    if current.data is not None:
+        previous_data = previous.data.data if previous and previous.data else {}
+        for name, value in get_completed_fields(
+            previous_data, current.data.data, final
+        ):
+            records.append({"type": "field", "name": name, "value": value})
+
+    return records
@@ -0,0 +1,37 @@
+from typing import Any
+
+from electric_text.prompting.data.system_output import SystemOutput
+
+
+def get_output_summary(final: SystemOutput, updates: int) -> dict[str, Any]:
+    """Build the record that ends a delta stream.
+
+    Text and data values are not repeated; tool call inputs are, parsed.
+
+    Args:
+        final: The last update
+        updates: How many updates the stream had
+
+    Returns:
+        {"type": "summary", ...} with the response type, update count, data
+        validation result, and tool call
+    """
+    return {
+        "type": "summary",
+        "response_type": final.response_type.value,
+        "updates": updates,
+        "data": (
+            {
+                "is_valid": final.data.is_valid,
+                "schema_name": final.data.schema_name,
+                "validation_error": final.data.validation_error,
+            }
+            if final.data is not None
+            else None
+        ),
+        "tool_call": (
+            {"name": final.tool_call.name, "inputs": final.tool_call.inputs}
+            if final.tool_call is not None
+            else None
+        ),
+    }
@@ -0,0 +1,15 @@
+from typing import AsyncIterator
+
+from electric_text.prompting.data.system_output import SystemOutput
+
+
+async def single_output(output: SystemOutput) -> AsyncIterator[SystemOutput]:
+    """Present a completed output as a stream with one update.
+
+    Args:
+        output: The completed output
+
+    Yields:
+        The output
+    """
+    yield output
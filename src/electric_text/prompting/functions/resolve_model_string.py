@@ -1,34 +1,36 @@
-from electric_text.configuration.data.config import Config
-from electric_text.shorthand.functions.build_user_shorthand_models import (
-    build_user_shorthand_models,
-)
+from electric_text.prompting.functions.is_known_provider import is_known_provider
 from electric_text.prompting.functions.split_model_string import split_model_string
 
 
-def resolve_model_string(model_string: str, config: Config) -> tuple[str, str]:
+def resolve_model_string(
+    model_string: str, shorthand_models: dict[str, tuple[str, str]]
+) -> tuple[str, str]:
     """Resolve a model string to provider and model name, handling shorthands.
 
     Args:
         model_string: String in format 'provider:model_name' or shorthand
-        config: Configuration object
+        shorthand_models: Shorthand lookup, from get_shorthand_models
 
     Returns:
         Tuple of (provider_name, model_name)
+
+    Raises:
+        ValueError: If the string is neither 'provider:model_name' nor a
+            configured shorthand, or names an unknown provider
     """
     # Try standard format first (provider:model_name)
     try:
         provider, model_name = split_model_string(model_string)
-        return provider, model_name
     except ValueError:
         # If standard format fails, try shorthand lookup
-        shorthand_models = build_user_shorthand_models(config.shorthands)
+        if model_string not in shorthand_models:
+            raise ValueError(
+                f"Invalid model string format: '{model_string}'. "
+                f"Expected format 'provider:model_name' or a configured shorthand."
+            )
+        provider, model_name = shorthand_models[model_string]
 
-        if model_string in shorthand_models:
-            provider, model_name = shorthand_models[model_string]
-            return provider, model_name
+    if not is_known_provider(provider):
+        raise ValueError(f"Unknown provider: '{provider}'")
 
-        # If no shorthand found, raise the original error
-        raise ValueError(
-            f"Invalid model string format: '{model_string}'. "
-            f"Expected format 'provider:model_name' or a configured shorthand."
-        ) 
\ No newline at end of file
+    return provider, model_name
@@ -1,6 +1,8 @@
 from electric_text.prompting.data.system_input import SystemInput
-from electric_text.configuration.functions.get_cached_config import get_cached_config
 from electric_text.configuration.functions.get_config_value import get_config_value
+from electric_text.prompting.functions.get_shorthand_models import (
+    get_shorthand_models,
+)
 from electric_text.prompting.functions.resolve_model_string import resolve_model_string
 
 
@@ -16,8 +18,6 @@ def resolve_system_input(raw_input: SystemInput) -> SystemInput:
     Returns:
         SystemInput with resolved provider_name, model_name, and config defaults applied
     """
-    config = get_cached_config()
-
     # Construct model string - if model_name already has provider, use it directly
     # Otherwise treat as potential shorthand
     if ":" in raw_input.model_name:
@@ -26,7 +26,9 @@ def resolve_system_input(raw_input: SystemInput) -> SystemInput:
         model_string = raw_input.model_name
 
     # Resolve model string (expand shorthands and split provider:model)
-    provider_name, model_name = resolve_model_string(model_string, config)
+    provider_name, model_name = resolve_model_string(
+        model_string, get_shorthand_models()
+    )
 
     # Apply configuration defaults for log_level if using default
     log_level = raw_input.log_level
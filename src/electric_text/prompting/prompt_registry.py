@@ -0,0 +1,91 @@
+from typing import Any
+
+from electric_text.configuration.functions.get_file_stamp import get_file_stamp
+from electric_text.prompting.data.prompt_config import PromptConfig
+from electric_text.prompting.data.prompt_index import PromptIndex
+from electric_text.prompting.functions.build_prompt_index import build_prompt_index
+from electric_text.prompting.functions.is_prompt_index_current import (
+    is_prompt_index_current,
+)
+
+
+class PromptRegistry:
+    """Caches prompt configs, system messages, and schemas across requests.
+
+    Lookups by name stat only the prompt directory and the config file the
+    name came from, so resolving a prompt does not rescan the directory.
+    Anything that was added, removed, or rewritten since it was cached is
+    reloaded on the next lookup.
+    """
+
+    def __init__(self) -> None:
+        self.indexes: dict[str, PromptIndex] = {}
+        self.system_messages: dict[str, tuple[tuple[int, int] | None, str]] = {}
+        self.schemas: dict[
+            str, tuple[tuple[int, int] | None, dict[str, Any] | None]
+        ] = {}
+
+    def refresh(self, prompt_dir: str) -> PromptIndex:
+        """Rebuild and store the index for a prompt directory."""
+        index = build_prompt_index(prompt_dir)
+        self.indexes[prompt_dir] = index
+        return index
+
+    def get_prompt(self, prompt_dir: str, name: str) -> PromptConfig | None:
+        """Find a prompt config by name.
+
+        Args:
+            prompt_dir: The prompt directory to search
+            name: The name of the prompt config to find
+
+        Returns:
+            The prompt config if found, None otherwise
+        """
+        index = self.indexes.get(prompt_dir)
+        if index is None or get_file_stamp(prompt_dir) != index.directory_stamp:
+            index = self.refresh(prompt_dir)
+
+        source = index.sources.get(name)
+        if source is not None and get_file_stamp(source) == index.file_stamps[source]:
+            return index.by_name[name]
+
+        # A miss may come from a config edited in place to declare this name
+        if not is_prompt_index_current(index, prompt_dir):
+            index = self.refresh(prompt_dir)
+
+        return index.by_name.get(name)
+
+    def list_prompts(self, prompt_dir: str) -> list[PromptConfig]:
+        """List every prompt config in a prompt directory."""
+        index = self.indexes.get(prompt_dir)
+        if index is None or not is_prompt_index_current(index, prompt_dir):
+            index = self.refresh(prompt_dir)
+
+        return list(index.configs)
+
+    def get_system_message(self, prompt_config: PromptConfig) -> str:
+        """Get a prompt's system message, reading the file only when it changes."""
+        path = prompt_config.system_message_path
+        stamp = get_file_stamp(path)
+        cached = self.system_messages.get(path)
+        if cached is not None and stamp is not None and cached[0] == stamp:
+            return cached[1]
+
+        system_message = prompt_config.get_system_message()
+        self.system_messages[path] = (stamp, system_message)
+        return system_message
+
+    def get_schema(self, prompt_config: PromptConfig) -> dict[str, Any] | None:
+        """Get a prompt's JSON schema, loading its model only when the file changes."""
+        if not prompt_config.model_path:
+            return None
+
+        path = prompt_config.model_path
+        stamp = get_file_stamp(path)
+        cached = self.schemas.get(path)
+        if cached is not None and stamp is not None and cached[0] == stamp:
+            return cached[1]
+
+        schema = prompt_config.get_schema()
+        self.schemas[path] = (stamp, schema)
+        return schema
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List, Dict, Optional, Type
+from typing import Any, List, Dict, Optional, Type, Sequence
 
 
 @dataclass
@@ -12,7 +12,7 @@ class ProviderRequest:
     model_name: str
     prompt_text: str
     system_messages: Optional[List[str]] = None
-    tools: Optional[List[Dict[str, Any]]] = None
+    tools: Optional[Sequence[Dict[str, Any]]] = None
     output_schema: Optional[Type[Any]] = None
     max_tokens: Optional[int] = None
     has_custom_output_schema: bool = False
@@ -1,3 +1,4 @@
+import copy
 from typing import List
 from dataclasses import dataclass, field
 
@@ -19,6 +20,21 @@ class StreamHistory:
         self.chunks.append(chunk)
         return self
 
+    def copy(self) -> "StreamHistory":
+        """Copy the history, for a reader that must not see later changes.
+
+        Providers update content blocks in place as a stream goes on, so
+        those are copied. Chunks are never changed once added, so the copy
+        shares them in a list of its own.
+
+        Returns:
+            An independent StreamHistory with the same content
+        """
+        return StreamHistory(
+            chunks=list(self.chunks),
+            content_blocks=copy.deepcopy(self.content_blocks),
+        )
+
     def extract_text_content(self) -> str:
         """Extract text content from content blocks.
 
@@ -0,0 +1,44 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+type ToolList = Sequence[Dict[str, Any]]
+type ToolConverter = Callable[[Optional[ToolList]], Optional[List[Dict[str, Any]]]]
+
+# Maximum number of (tool tuple, converter) pairs kept
+MAX_CONVERSIONS = 64
+
+CONVERSIONS: Dict[
+    Tuple[int, int], Tuple[Tuple[Dict[str, Any], ...], Optional[List[Dict[str, Any]]]]
+] = {}
+
+
+def convert_tools_once(
+    tools: Optional[ToolList], convert: ToolConverter
+) -> Optional[List[Dict[str, Any]]]:
+    """Convert tools to a provider's format, reusing earlier conversions of tuples.
+
+    The tool registry hands out the same tuple for every request that uses
+    the same tool boxes, so conversions of tuples are cached by identity.
+    The cache holds a reference to each tuple, so an id is never reused
+    while its entry exists. Any other sequence, such as a list a caller
+    may still change, is converted every time.
+
+    Args:
+        tools: Tools in the standard format
+        convert: The provider's conversion function
+
+    Returns:
+        The converted tools, or None if tools is None
+    """
+    if not isinstance(tools, tuple):
+        return convert(tools)
+
+    key = (id(tools), id(convert))
+    cached = CONVERSIONS.get(key)
+    if cached is not None and cached[0] is tools:
+        return cached[1]
+
+    converted = convert(tools)
+    if len(CONVERSIONS) >= MAX_CONVERSIONS:
+        CONVERSIONS.pop(next(iter(CONVERSIONS)))
+    CONVERSIONS[key] = (tools, converted)
+    return converted
@@ -0,0 +1,26 @@
+from typing import Any
+
+import httpx
+
+from electric_text.providers.logging import HttpLogger, LoggingAsyncClient
+
+
+def create_http_client(
+    http_logger: HttpLogger | None, provider: str, client_kwargs: dict[str, Any]
+) -> httpx.AsyncClient | LoggingAsyncClient:
+    """Create the HTTP client a provider sends its requests through.
+
+    Args:
+        http_logger: Logger to record requests with, or None to skip logging
+        provider: Provider name recorded in HTTP log entries
+        client_kwargs: Keyword arguments for the httpx client
+
+    Returns:
+        A logging client when HTTP logging is enabled, otherwise a plain one
+    """
+    if http_logger:
+        return LoggingAsyncClient(
+            logger=http_logger, provider=provider, **client_kwargs
+        )
+
+    return httpx.AsyncClient(**client_kwargs)
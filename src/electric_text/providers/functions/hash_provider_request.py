@@ -0,0 +1,36 @@
+from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.functions.hash_request_body import hash_request_body
+
+
+def hash_provider_request(request: ProviderRequest) -> str:
+    """Hash everything that determines a provider request's response.
+
+    Uses the canonical JSON hash that keys recorded responses, so two
+    requests hash alike exactly when a response cache would treat them as
+    the same request. A custom output schema counts by its JSON schema.
+
+    Args:
+        request: The request for the provider
+
+    Returns:
+        Hex sha256 digest
+    """
+    schema = (
+        request.output_schema.model_json_schema()
+        if request.has_custom_output_schema
+        and request.output_schema is not None
+        and hasattr(request.output_schema, "model_json_schema")
+        else None
+    )
+
+    return hash_request_body(
+        {
+            "provider_name": request.provider_name,
+            "model_name": request.model_name,
+            "prompt_text": request.prompt_text,
+            "system_messages": request.system_messages,
+            "tools": request.tools,
+            "output_schema": schema,
+            "max_tokens": request.max_tokens,
+        }
+    )
@@ -0,0 +1,20 @@
+import hashlib
+import json
+
+
+def hash_request_body(body: object) -> str:
+    """Hash a request body independent of key order and whitespace.
+
+    Args:
+        body: Decoded JSON request body, or raw text
+
+    Returns:
+        Hex sha256 digest
+    """
+    canonical = (
+        body
+        if isinstance(body, str)
+        else json.dumps(body, sort_keys=True, separators=(",", ":"))
+    )
+
+    return hashlib.sha256(canonical.encode()).hexdigest()
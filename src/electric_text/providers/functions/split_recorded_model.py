@@ -0,0 +1,28 @@
+def split_recorded_model(
+    model_name: str, recorded_provider: str | None
+) -> tuple[str, str]:
+    """Split a replay or mock model name into the provider it stands for and its model.
+
+    Args:
+        model_name: "provider/model" (e.g. "anthropic/claude-3-7-sonnet-20250219"),
+            or a plain model name when recorded_provider is set
+        recorded_provider: Provider to use for plain model names (the replay
+            provider's recorded_provider, or the mock provider's shape)
+
+    Returns:
+        Tuple of (provider name, model name)
+
+    Raises:
+        ValueError: If the provider cannot be determined
+    """
+    if "/" in model_name:
+        provider_name, recorded_model = model_name.split("/", 1)
+        return provider_name, recorded_model
+
+    if recorded_provider:
+        return recorded_provider, model_name
+
+    raise ValueError(
+        f"Cannot tell which provider recorded '{model_name}': "
+        "use 'provider/model' or set recorded_provider"
+    )
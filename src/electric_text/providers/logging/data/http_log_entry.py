@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import uuid
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -14,6 +15,9 @@ class HttpLogEntry:
     response_headers: dict[str, str]
     response_body: str | dict[str, object] | None
     duration_ms: float
+    ttfb_ms: float | None = None
+    response_chunks: list[tuple[float, int]] | None = None
     provider: str | None = None
     model: str | None = None
     error: str | None = None
+    entry_id: str = field(default_factory=lambda: uuid.uuid4().hex)
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+
+from electric_text.providers.logging.data.overflow_policy import OverflowPolicy
+
+
+@dataclass(frozen=True)
+class HttpLogSettings:
+    """Settings for the background HTTP log writer.
+
+    Frozen so that equal settings share one writer.
+
+    Args:
+        log_dir: Directory for the JSONL segment files
+        queue_size: Maximum number of entries waiting to be written
+        overflow: Drop new entries or block the producer when the queue is full
+        block_timeout: Seconds to wait for queue space before dropping (block policy)
+        segment_max_bytes: Rotate to a new segment file after this many bytes
+        compress: Gzip segment files
+        batch_size: Maximum number of entries written per batch
+        buffer_size: Number of most recent entries kept in memory (0 keeps none)
+        sample_rate: Fraction of eligible entries to log (0.0 to 1.0)
+        errors_only: Only errors are eligible for logging
+        slow_threshold_ms: Only requests at least this slow are eligible;
+            combined with errors_only, errors and slow requests are eligible
+    """
+
+    log_dir: str = "./http_logs"
+    queue_size: int = 1000
+    overflow: OverflowPolicy = OverflowPolicy.DROP
+    block_timeout: float = 5.0
+    segment_max_bytes: int = 64 * 1024 * 1024
+    compress: bool = False
+    batch_size: int = 100
+    buffer_size: int = 100
+    sample_rate: float = 1.0
+    errors_only: bool = False
+    slow_threshold_ms: float | None = None
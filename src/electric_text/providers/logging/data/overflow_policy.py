@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class OverflowPolicy(Enum):
+    """What to do with a log entry when the writer queue is full."""
+
+    DROP = "drop"
+    BLOCK = "block"
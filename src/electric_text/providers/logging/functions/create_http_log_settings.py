@@ -0,0 +1,41 @@
+from typing import Any
+
+from electric_text.providers.logging.data.http_log_settings import HttpLogSettings
+from electric_text.providers.logging.data.overflow_policy import OverflowPolicy
+
+
+def create_http_log_settings(log_dir: str, options: dict[str, Any]) -> HttpLogSettings:
+    """Create writer settings from the http_logging configuration options.
+
+    Unset options keep their defaults.
+
+    Args:
+        log_dir: Directory for the log segments
+        options: Writer options (queue_size, overflow, block_timeout,
+            segment_max_bytes, compress, batch_size) and buffer/sampling
+            options (buffer_size, sample_rate, errors_only, slow_threshold_ms)
+
+    Returns:
+        HttpLogSettings
+    """
+    defaults = HttpLogSettings()
+
+    return HttpLogSettings(
+        log_dir=log_dir,
+        queue_size=int(options.get("queue_size", defaults.queue_size)),
+        overflow=OverflowPolicy(options.get("overflow", defaults.overflow.value)),
+        block_timeout=float(options.get("block_timeout", defaults.block_timeout)),
+        segment_max_bytes=int(
+            options.get("segment_max_bytes", defaults.segment_max_bytes)
+        ),
+        compress=bool(options.get("compress", defaults.compress)),
+        batch_size=int(options.get("batch_size", defaults.batch_size)),
+        buffer_size=int(options.get("buffer_size", defaults.buffer_size)),
+        sample_rate=float(options.get("sample_rate", defaults.sample_rate)),
+        errors_only=bool(options.get("errors_only", defaults.errors_only)),
+        slow_threshold_ms=(
+            float(options["slow_threshold_ms"])
+            if options.get("slow_threshold_ms") is not None
+            else defaults.slow_threshold_ms
+        ),
+    )
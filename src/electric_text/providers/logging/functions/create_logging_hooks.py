@@ -3,6 +3,9 @@ from typing import Any
 import httpx
 
 from electric_text.providers.logging.http_logger import HttpLogger
+from electric_text.providers.logging.logged_response_stream import (
+    LoggedResponseStream,
+)
 from electric_text.providers.logging.functions.extract_model_from_request import (
     extract_model_from_request,
 )
@@ -15,6 +18,11 @@ def create_logging_hooks(
 ) -> dict[str, list[Any]]:
     """Create HTTPX event hooks for request/response logging.
 
+    The response hook does not read the body. It wraps the response stream so
+    the body is captured as the caller consumes it, and the entry is logged
+    when the response is closed. Streaming callers see every chunk as soon
+    as it arrives.
+
     Args:
         logger: The HttpLogger instance to use
         provider: Provider name for logging
@@ -27,20 +35,13 @@ def create_logging_hooks(
 
     async def log_request(request: httpx.Request) -> None:
         """Log request start time."""
-        request_times[request] = time.time()
+        request_times[request] = time.perf_counter()
 
     async def log_response(response: httpx.Response) -> None:
-        """Log complete request/response pair."""
+        """Capture the response body as it is read and log it on close."""
         request = response.request
-        start_time = request_times.pop(request, time.time())
-        duration_ms = (time.time() - start_time) * 1000
-
-        # For streaming responses, read the content
-        try:
-            await response.aread()
-        except Exception:
-            # If reading fails, continue with logging
-            pass
+        start_time = request_times.pop(request, time.perf_counter())
+        headers_at = time.perf_counter()
 
         # Extract model from request
         extracted_model = extract_model_from_request(request, model)
@@ -48,13 +49,30 @@ def create_logging_hooks(
         # Determine if there was an error
         error = None if response.is_success else f"HTTP {response.status_code}"
 
-        logger.log_request_response(
-            request=request,
-            response=response,
-            duration_ms=duration_ms,
-            provider=provider,
-            model=extracted_model,
-            error=error,
-        )
+        async def log_on_close(
+            content: bytes, chunk_arrivals: list[tuple[float, int]]
+        ) -> None:
+            closed_at = time.perf_counter()
+            first_chunk_at = chunk_arrivals[0][0] if chunk_arrivals else headers_at
+            await logger.log_request_response(
+                request=request,
+                response=response,
+                response_content=content,
+                duration_ms=(closed_at - start_time) * 1000,
+                ttfb_ms=(first_chunk_at - start_time) * 1000,
+                response_chunks=[
+                    ((arrived_at - start_time) * 1000, size)
+                    for arrived_at, size in chunk_arrivals
+                ],
+                provider=provider,
+                model=extracted_model,
+                error=error,
+            )
+
+        if response.is_stream_consumed:
+            # The body was already read (e.g. a mocked transport), log it now
+            await log_on_close(response.content, [])
+        elif isinstance(response.stream, httpx.AsyncByteStream):
+            response.stream = LoggedResponseStream(response.stream, log_on_close)
 
     return {"request": [log_request], "response": [log_response]}
@@ -0,0 +1,35 @@
+import json
+
+import httpx
+
+
+def decode_response_body(
+    response: httpx.Response, content: bytes
+) -> str | dict[str, object] | None:
+    """Decode captured raw response bytes for logging.
+
+    The bytes are captured before content decoding, so they are decoded
+    according to the response headers (e.g. gzip) first.
+
+    Args:
+        response: The response the bytes belong to
+        content: The raw body bytes as received
+
+    Returns:
+        Parsed JSON, the body text if it is not JSON, or None if empty
+    """
+    if not content:
+        return None
+
+    try:
+        decoded = httpx.Response(
+            response.status_code, headers=response.headers, content=content
+        )
+    except httpx.DecodingError:
+        return content.decode(errors="replace")
+
+    try:
+        body: dict[str, object] = decoded.json()
+        return body
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return decoded.text
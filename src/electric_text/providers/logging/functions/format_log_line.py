@@ -0,0 +1,13 @@
+import json
+
+
+def format_log_line(record: dict[str, object]) -> str:
+    """Format a log record as one compact JSONL line.
+
+    Args:
+        record: The log record
+
+    Returns:
+        Compact JSON terminated by a newline
+    """
+    return json.dumps(record, separators=(",", ":"), default=str) + "\n"
@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+from electric_text.providers.logging.data.http_log_settings import HttpLogSettings
+from electric_text.providers.logging.http_log_writer import HttpLogWriter
+
+
+@lru_cache(maxsize=None)
+def get_http_log_writer(settings: HttpLogSettings) -> HttpLogWriter:
+    """Get the shared writer for the given settings.
+
+    All loggers with equal settings share one writer thread and segment file.
+
+    Args:
+        settings: The writer settings
+
+    Returns:
+        The shared HttpLogWriter
+    """
+    return HttpLogWriter(settings)
@@ -0,0 +1,20 @@
+def get_segment_name(
+    started_at: str, process_id: int, writer_id: str, sequence: int, compress: bool
+) -> str:
+    """Build the file name of a log segment.
+
+    The process and writer ids keep concurrent processes and writers sharing
+    a log directory from writing to the same segment.
+
+    Args:
+        started_at: Compact timestamp of when the writer started (e.g. 20250101T101010)
+        process_id: Id of the writing process
+        writer_id: Random id of the writer within the process
+        sequence: Index of the segment within this writer
+        compress: Whether the segment is gzipped
+
+    Returns:
+        Segment file name
+    """
+    suffix = ".jsonl.gz" if compress else ".jsonl"
+    return f"http-{started_at}-{process_id}-{writer_id}-{sequence:04d}{suffix}"
@@ -11,6 +11,7 @@ def http_log_entry_to_dict(entry: HttpLogEntry) -> dict[str, object]:
         Dictionary representation of the log entry
     """
     return {
+        "id": entry.entry_id,
         "timestamp": entry.timestamp,
         "method": entry.method,
         "url": entry.url,
@@ -22,8 +23,10 @@ def http_log_entry_to_dict(entry: HttpLogEntry) -> dict[str, object]:
             "status": entry.response_status,
             "headers": entry.response_headers,
             "body": entry.response_body,
+            "chunks": entry.response_chunks,
         },
         "duration_ms": entry.duration_ms,
+        "ttfb_ms": entry.ttfb_ms,
         "provider": entry.provider,
         "model": entry.model,
         "error": entry.error,
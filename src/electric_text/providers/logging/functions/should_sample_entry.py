@@ -0,0 +1,30 @@
+def should_sample_entry(
+    is_error: bool,
+    duration_ms: float,
+    sample_rate: float,
+    errors_only: bool,
+    slow_threshold_ms: float | None,
+    random_value: float,
+) -> bool:
+    """Decide whether a request/response pair is logged.
+
+    With errors_only and/or slow_threshold_ms set, only errors and/or
+    requests at least that slow are eligible. Eligible entries are then kept
+    at sample_rate.
+
+    Args:
+        is_error: Whether the request failed
+        duration_ms: Total request duration
+        sample_rate: Fraction of eligible entries to keep
+        errors_only: Only errors are eligible
+        slow_threshold_ms: Only requests at least this slow are eligible
+        random_value: Uniform random number in [0, 1)
+
+    Returns:
+        True if the entry should be logged
+    """
+    is_slow = slow_threshold_ms is not None and duration_ms >= slow_threshold_ms
+    filtered = errors_only or slow_threshold_ms is not None
+    is_eligible = not filtered or (errors_only and is_error) or is_slow
+
+    return is_eligible and random_value < sample_rate
@@ -0,0 +1,170 @@
+import asyncio
+import atexit
+import gzip
+import os
+import queue
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TextIO
+
+from electric_text.providers.logging.data.http_log_entry import HttpLogEntry
+from electric_text.providers.logging.data.http_log_settings import HttpLogSettings
+from electric_text.providers.logging.data.overflow_policy import OverflowPolicy
+from electric_text.providers.logging.functions.format_log_line import format_log_line
+from electric_text.providers.logging.functions.get_segment_name import (
+    get_segment_name,
+)
+from electric_text.providers.logging.functions.http_log_entry_to_dict import (
+    http_log_entry_to_dict,
+)
+
+
+class HttpLogWriter:
+    """Writes HTTP log entries to rotating JSONL segments from a background thread.
+
+    Producers only enqueue entries; serialization and all file I/O happen on
+    the writer thread, in batches. The thread starts on the first entry and
+    the queue is flushed on close() or at interpreter exit.
+    """
+
+    def __init__(self, settings: HttpLogSettings) -> None:
+        self.settings = settings
+        self.queue: queue.Queue[HttpLogEntry | None] = queue.Queue(
+            maxsize=settings.queue_size
+        )
+        self.lock = threading.Lock()
+        self.thread: threading.Thread | None = None
+        self.started_at = time.strftime("%Y%m%dT%H%M%S")
+        self.writer_id = uuid.uuid4().hex[:8]
+        self.segment: TextIO | None = None
+        self.segment_bytes = 0
+        self.segment_sequence = 0
+        self.written = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.thread = threading.Thread(
+                target=self.run, name="electric-text-http-log-writer", daemon=True
+            )
+            self.thread.start()
+            atexit.register(self.close)
+
+    def put_nowait(self, entry: HttpLogEntry) -> bool:
+        """Queue an entry without waiting, dropping it if the queue is full.
+
+        Returns:
+            True if the entry was queued
+        """
+        self.start()
+        try:
+            self.queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    async def put(self, entry: HttpLogEntry) -> bool:
+        """Queue an entry, applying the overflow policy when the queue is full.
+
+        With the block policy the caller waits (without blocking the event
+        loop) for up to `block_timeout` seconds before the entry is dropped.
+
+        Returns:
+            True if the entry was queued
+        """
+        self.start()
+        try:
+            self.queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            pass
+
+        if self.settings.overflow == OverflowPolicy.BLOCK:
+            try:
+                await asyncio.to_thread(
+                    self.queue.put, entry, True, self.settings.block_timeout
+                )
+                return True
+            except queue.Full:
+                pass
+
+        self.dropped += 1
+        return False
+
+    def run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.settings.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            entries = [entry for entry in batch if entry is not None]
+            if entries:
+                self.write_batch(entries)
+            if len(entries) < len(batch):
+                self.close_segment()
+                return
+
+    def write_batch(self, entries: list[HttpLogEntry]) -> None:
+        lines = "".join(
+            format_log_line(http_log_entry_to_dict(entry)) for entry in entries
+        )
+        segment = self.open_segment(len(lines))
+        segment.write(lines)
+        segment.flush()
+        self.segment_bytes += len(lines)
+        self.written += len(entries)
+
+    def open_segment(self, incoming_bytes: int) -> TextIO:
+        rotate = (
+            self.segment_bytes > 0
+            and self.segment_bytes + incoming_bytes > self.settings.segment_max_bytes
+        )
+        if self.segment is not None and not rotate:
+            return self.segment
+
+        self.close_segment()
+        log_dir = Path(self.settings.log_dir)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        path = log_dir / get_segment_name(
+            self.started_at,
+            os.getpid(),
+            self.writer_id,
+            self.segment_sequence,
+            self.settings.compress,
+        )
+        self.segment_sequence += 1
+        self.segment = (
+            gzip.open(path, "at", encoding="utf-8")
+            if self.settings.compress
+            else open(path, "a", encoding="utf-8")
+        )
+        return self.segment
+
+    def close_segment(self) -> None:
+        if self.segment is not None:
+            self.segment.close()
+        self.segment = None
+        self.segment_bytes = 0
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write all queued entries, close the current segment and stop the thread."""
+        with self.lock:
+            thread = self.thread
+            self.thread = None
+        if thread is None:
+            return
+
+        atexit.unregister(self.close)
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
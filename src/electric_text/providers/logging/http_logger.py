@@ -1,13 +1,22 @@
 import json
-import time
+import random
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 import httpx
 
 from electric_text.providers.logging.data.http_log_entry import HttpLogEntry
-from electric_text.providers.logging.functions.http_log_entry_to_dict import (
-    http_log_entry_to_dict,
+from electric_text.providers.logging.data.http_log_settings import HttpLogSettings
+from electric_text.providers.logging.functions.decode_response_body import (
+    decode_response_body,
 )
+from electric_text.providers.logging.functions.get_http_log_writer import (
+    get_http_log_writer,
+)
+from electric_text.providers.logging.functions.should_sample_entry import (
+    should_sample_entry,
+)
+from electric_text.providers.logging.http_log_writer import HttpLogWriter
 
 
 class HttpLogger:
@@ -18,6 +27,7 @@ class HttpLogger:
         log_dir: Path | None = None,
         enabled: bool = True,
         save_to_file: bool = True,
+        settings: HttpLogSettings | None = None,
     ):
         """Initialize the HTTP logger.
 
@@ -25,20 +35,26 @@ class HttpLogger:
             log_dir: Directory to save logs (defaults to ./http_logs)
             enabled: Whether logging is enabled
             save_to_file: Whether to save logs to files
+            settings: Writer, buffer and sampling settings (defaults use log_dir)
         """
         self.enabled = enabled
         self.save_to_file = save_to_file
         self.log_dir = log_dir or Path("./http_logs")
-        self.entries: list[HttpLogEntry] = []
+        self.settings = settings or HttpLogSettings(log_dir=str(self.log_dir))
+        self.entries: deque[HttpLogEntry] = deque(maxlen=self.settings.buffer_size)
 
+        self.writer: HttpLogWriter | None = None
         if self.save_to_file and self.enabled:
-            self.log_dir.mkdir(exist_ok=True)
+            self.writer = get_http_log_writer(self.settings)
 
-    def log_request_response(
+    async def log_request_response(
         self,
         request: httpx.Request,
         response: httpx.Response,
+        response_content: bytes,
         duration_ms: float,
+        ttfb_ms: float | None = None,
+        response_chunks: list[tuple[float, int]] | None = None,
         provider: str | None = None,
         model: str | None = None,
         error: str | None = None,
@@ -48,17 +64,30 @@ class HttpLogger:
         Args:
             request: The httpx request
             response: The httpx response
-            duration_ms: Request duration in milliseconds
+            response_content: The raw response body bytes as received
+            duration_ms: Time from sending the request until the body was closed
+            ttfb_ms: Time from sending the request until the first body byte
+            response_chunks: Arrival offset (ms) and size of each raw body chunk
             provider: Provider name (e.g., "anthropic")
             model: Model name (e.g., "claude-3-sonnet")
             error: Any error that occurred
 
         Returns:
-            The created log entry
+            The created log entry, or None if disabled or not sampled
         """
         if not self.enabled:
             return None
 
+        if not should_sample_entry(
+            is_error=error is not None,
+            duration_ms=duration_ms,
+            sample_rate=self.settings.sample_rate,
+            errors_only=self.settings.errors_only,
+            slow_threshold_ms=self.settings.slow_threshold_ms,
+            random_value=random.random(),
+        ):
+            return None
+
         # Parse request body
         request_body = None
         if request.content:
@@ -68,11 +97,7 @@ class HttpLogger:
                 request_body = request.content.decode()
 
         # Parse response body
-        response_body = None
-        try:
-            response_body = response.json()
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            response_body = response.text
+        response_body = decode_response_body(response, response_content)
 
         entry = HttpLogEntry(
             timestamp=datetime.now().isoformat(),
@@ -84,6 +109,8 @@ class HttpLogger:
             response_headers=dict(response.headers),
             response_body=response_body,
             duration_ms=duration_ms,
+            ttfb_ms=ttfb_ms,
+            response_chunks=response_chunks,
             provider=provider,
             model=model,
             error=error,
@@ -91,19 +118,21 @@ class HttpLogger:
 
         self.entries.append(entry)
 
-        if self.save_to_file:
-            self.save_entry(entry)
+        if self.writer:
+            await self.save_entry(entry)
 
         return entry
 
-    def save_entry(self, entry: HttpLogEntry) -> None:
-        """Save a log entry to file."""
-        timestamp = int(time.time())
-        name = f"{timestamp}_{entry.provider or 'unknown'}_{entry.method.lower()}.json"
-        filepath = self.log_dir / name
+    async def save_entry(self, entry: HttpLogEntry) -> bool:
+        """Queue a log entry for the background writer.
+
+        Returns:
+            True if the entry was queued, False if it was dropped
+        """
+        if self.writer is None:
+            return False
 
-        with open(filepath, "w") as f:
-            json.dump(http_log_entry_to_dict(entry), f, indent=2)
+        return await self.writer.put(entry)
 
     def clear(self) -> None:
         """Clear all logged entries."""
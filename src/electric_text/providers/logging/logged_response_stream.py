@@ -0,0 +1,41 @@
+import time
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+
+
+class LoggedResponseStream(httpx.AsyncByteStream):
+    """Tees a response body stream into memory as the consumer reads it.
+
+    Chunks are passed through as soon as they arrive, so wrapping a streamed
+    response does not delay its first line. When the stream is closed, the
+    captured body and the arrival time (perf_counter) and size of each chunk
+    are handed to `on_close`.
+    """
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        on_close: Callable[[bytes, list[tuple[float, int]]], Awaitable[None]],
+    ) -> None:
+        self.stream = stream
+        self.on_close = on_close
+        self.chunks: list[bytes] = []
+        self.chunk_arrivals: list[tuple[float, int]] = []
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            self.chunk_arrivals.append((time.perf_counter(), len(chunk)))
+            self.chunks.append(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+
+        try:
+            await self.stream.aclose()
+        finally:
+            await self.on_close(b"".join(self.chunks), self.chunk_arrivals)
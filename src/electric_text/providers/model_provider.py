@@ -43,3 +43,9 @@ class ModelProvider(Protocol):
             A StreamHistory object containing the complete response
         """
         ...
+
+    async def aclose(self) -> None:
+        """
+        Release any connections the provider keeps open between requests.
+        """
+        ...
@@ -1,5 +1,18 @@
-from electric_text.providers.model_providers.anthropic import AnthropicProvider
-from electric_text.providers.model_providers.ollama import OllamaProvider
-from electric_text.providers.model_providers.openai import OpenaiProvider
+import importlib
+from typing import Any
+
+# Providers are imported on first use, so a run only loads the provider it talks to
+PROVIDER_MODULES = {
+    "AnthropicProvider": "electric_text.providers.model_providers.anthropic",
+    "OllamaProvider": "electric_text.providers.model_providers.ollama",
+    "OpenaiProvider": "electric_text.providers.model_providers.openai",
+}
 
 __all__ = ["AnthropicProvider", "OllamaProvider", "OpenaiProvider"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in PROVIDER_MODULES:
+        return getattr(importlib.import_module(PROVIDER_MODULES[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,9 +3,19 @@ import os
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Optional
 
+from electric_text.profiling import (
+    ProfilePhase,
+    record_entry_phase,
+    record_iteration_phase,
+    record_phase,
+)
 from electric_text.providers import ModelProvider
 from electric_text.providers.logging import HttpLogger, LoggingAsyncClient
+from electric_text.providers.logging.functions.create_http_log_settings import (
+    create_http_log_settings,
+)
 from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.functions.create_http_client import create_http_client
 from electric_text.providers.model_providers.anthropic.data.anthropic_provider_inputs import (
     AnthropicProviderInputs,
 )
@@ -48,6 +58,8 @@ class AnthropicProvider(ModelProvider):
         timeout: float = 30.0,
         http_logging_enabled: bool = False,
         http_log_dir: str = "./http_logs",
+        http_log_options: dict[str, Any] | None = None,
+        keep_alive: bool = False,
         **kwargs: Any,
     ):
         """
@@ -59,6 +71,7 @@ class AnthropicProvider(ModelProvider):
             default_model: Default model to use for queries
             api_version: Anthropic API version
             timeout: Timeout for API requests in seconds
+            keep_alive: Reuse one HTTP client and its connections across requests
             **kwargs: Additional provider-specific options
         """
         self.base_url = base_url.rstrip("/")
@@ -66,6 +79,8 @@ class AnthropicProvider(ModelProvider):
         self.timeout = timeout
         self.api_version = api_version
         self.stream_history = StreamHistory()
+        self.keep_alive = keep_alive
+        self.http_client: httpx.AsyncClient | LoggingAsyncClient | None = None
         self.client_kwargs = {
             "timeout": timeout,
             "headers": {
@@ -80,7 +95,13 @@ class AnthropicProvider(ModelProvider):
         self.http_logger: Optional[HttpLogger] = None
         if http_logging_enabled:
             from pathlib import Path
-            self.http_logger = HttpLogger(log_dir=Path(http_log_dir), enabled=True)
+            self.http_logger = HttpLogger(
+                log_dir=Path(http_log_dir),
+                enabled=True,
+                settings=create_http_log_settings(
+                    http_log_dir, http_log_options or {}
+                ),
+            )
 
     def prefill_content(self) -> str:
         """
@@ -130,16 +151,29 @@ class AnthropicProvider(ModelProvider):
     async def get_client(
         self,
     ) -> AsyncGenerator[httpx.AsyncClient | LoggingAsyncClient, None]:
-        """Context manager for httpx client."""
-        if self.http_logger:
-            # Create a logging client with the same kwargs
-            async with LoggingAsyncClient(
-                logger=self.http_logger, provider="anthropic", **self.client_kwargs
+        """Context manager for httpx client.
+
+        With keep_alive, one client (and its connection pool) is shared by all
+        requests until aclose(); otherwise each request gets its own client.
+        """
+        if not self.keep_alive:
+            async with create_http_client(
+                self.http_logger, "anthropic", self.client_kwargs
             ) as client:
                 yield client
-        else:
-            async with httpx.AsyncClient(**self.client_kwargs) as client:
-                yield client
+            return
+
+        if self.http_client is None:
+            self.http_client = create_http_client(
+                self.http_logger, "anthropic", self.client_kwargs
+            )
+        yield self.http_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self.http_client is not None:
+            http_client, self.http_client = self.http_client, None
+            await http_client.aclose()
 
     async def generate_stream(
         self,
@@ -154,7 +188,8 @@ class AnthropicProvider(ModelProvider):
         Yields:
             A generator of StreamHistory objects containing the full stream history after each chunk
         """
-        self.stream_history = StreamHistory()
+        stream_history = StreamHistory()
+        self.stream_history = stream_history
 
         anthropic_inputs: AnthropicProviderInputs = convert_provider_inputs(request)
 
@@ -172,7 +207,7 @@ class AnthropicProvider(ModelProvider):
                 parsed_data=None,
             )
 
-            self.stream_history.add_chunk(prefill_chunk)
+            stream_history.add_chunk(prefill_chunk)
 
         final_messages = self.transform_messages(messages, prefill)
         tools = anthropic_inputs.tools
@@ -186,20 +221,26 @@ class AnthropicProvider(ModelProvider):
             tools=tools,
         )
 
-        yield self.stream_history  # Yield immediately so consumer gets the prefill
+        yield stream_history  # Yield immediately so consumer gets the prefill
 
         try:
             async with self.get_client() as client:
-                async with client.stream(
-                    "POST",
-                    self.base_url,
-                    json=payload,
+                async with record_entry_phase(
+                    client.stream("POST", self.base_url, json=payload),
+                    ProfilePhase.NETWORK,
                 ) as response:
                     response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        yield process_stream_response(line, self.stream_history)
+                    lines = record_iteration_phase(
+                        response.aiter_lines(), ProfilePhase.NETWORK
+                    )
+                    async for line in lines:
+                        with record_phase(ProfilePhase.PARSE_VALIDATE):
+                            history = process_stream_response(
+                                line, stream_history
+                            )
+                        yield history
         except httpx.HTTPError as e:
-            yield self.stream_history.add_chunk(
+            yield stream_history.add_chunk(
                 StreamChunk(
                     type=StreamChunkType.HTTP_ERROR,
                     raw_line="",
@@ -220,7 +261,8 @@ class AnthropicProvider(ModelProvider):
         Returns:
             StreamHistory containing the complete response
         """
-        self.stream_history = StreamHistory()
+        stream_history = StreamHistory()
+        self.stream_history = stream_history
 
         anthropic_inputs: AnthropicProviderInputs = convert_provider_inputs(request)
 
@@ -237,7 +279,7 @@ class AnthropicProvider(ModelProvider):
                 parsed_data=None,
             )
 
-            self.stream_history.add_chunk(prefill_chunk)
+            stream_history.add_chunk(prefill_chunk)
 
         final_messages = self.transform_messages(messages, prefill)
         tools = anthropic_inputs.tools
@@ -253,12 +295,14 @@ class AnthropicProvider(ModelProvider):
 
         try:
             async with self.get_client() as client:
-                response = await client.post(self.base_url, json=payload)
+                with record_phase(ProfilePhase.NETWORK):
+                    response = await client.post(self.base_url, json=payload)
                 response.raise_for_status()
                 line: str = response.text
-                return process_completion_response(line, self.stream_history)
+                with record_phase(ProfilePhase.PARSE_VALIDATE):
+                    return process_completion_response(line, stream_history)
         except httpx.HTTPError as e:
-            return self.stream_history.add_chunk(
+            return stream_history.add_chunk(
                 StreamChunk(
                     type=StreamChunkType.HTTP_ERROR,
                     raw_line="",
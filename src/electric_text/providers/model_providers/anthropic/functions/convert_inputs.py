@@ -5,6 +5,7 @@ from electric_text.providers.model_providers.anthropic.data.anthropic_provider_i
 from electric_text.providers.functions.convert_prompt_to_messages import (
     convert_prompt_to_messages,
 )
+from electric_text.providers.functions.convert_tools_once import convert_tools_once
 from electric_text.providers.model_providers.anthropic.functions.convert_tools import (
     convert_tools,
 )
@@ -28,7 +29,7 @@ def convert_provider_inputs(
     structured_prefill = request.has_custom_output_schema
 
     # Convert tools from the standard format to Anthropic's format
-    anthropic_tools = convert_tools(request.tools)
+    anthropic_tools = convert_tools_once(request.tools, convert_tools)
 
     return AnthropicProviderInputs(
         messages=messages,
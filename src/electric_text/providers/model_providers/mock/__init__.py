@@ -0,0 +1,3 @@
+from electric_text.providers.model_providers.mock.mock_provider import MockProvider
+
+__all__ = ["MockProvider"]
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class MockOutput:
+    """Provider-independent content of a synthetic response.
+
+    Args:
+        text_pieces: Text deltas, in order (empty for tool calls)
+        tool_name: Name of the called tool, if any
+        tool_arguments: Arguments of the tool call
+    """
+
+    text_pieces: list[str]
+    tool_name: str | None = None
+    tool_arguments: dict[str, Any] | None = None
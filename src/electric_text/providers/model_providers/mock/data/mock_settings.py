@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MockSettings:
+    """Settings for synthetic responses.
+
+    Args:
+        shape: Provider whose wire format is generated ("anthropic", "openai"
+            or "ollama") for model names without a "provider/" prefix
+        tokens_per_second: Streaming rate (0 sends everything at once)
+        response_tokens: Number of text tokens in unstructured responses
+        ttfb_ms: Delay before the first chunk
+        jitter_ms: Maximum random deviation added to each delay
+        error_rate: Fraction of requests answered with HTTP 500
+        truncate_rate: Fraction of streams cut off halfway with a read error
+        tool_calls: Call the first offered tool instead of answering with text
+        seed: Random seed for reproducible responses
+    """
+
+    shape: str = "openai"
+    tokens_per_second: float = 0.0
+    response_tokens: int = 64
+    ttfb_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    truncate_rate: float = 0.0
+    tool_calls: bool = True
+    seed: int | None = None
@@ -0,0 +1,40 @@
+from typing import Any
+
+from electric_text.providers.model_providers.mock.data.mock_settings import (
+    MockSettings,
+)
+
+
+def create_mock_settings(options: dict[str, Any]) -> MockSettings:
+    """Create mock settings from provider options.
+
+    Options may be strings (e.g. from a client config); unset options keep
+    their defaults.
+
+    Args:
+        options: Any of the MockSettings fields
+
+    Returns:
+        MockSettings
+    """
+    defaults = MockSettings()
+    tool_calls = options.get("tool_calls", defaults.tool_calls)
+    seed = options.get("seed", defaults.seed)
+
+    return MockSettings(
+        shape=str(options.get("shape", defaults.shape)),
+        tokens_per_second=float(
+            options.get("tokens_per_second", defaults.tokens_per_second)
+        ),
+        response_tokens=int(options.get("response_tokens", defaults.response_tokens)),
+        ttfb_ms=float(options.get("ttfb_ms", defaults.ttfb_ms)),
+        jitter_ms=float(options.get("jitter_ms", defaults.jitter_ms)),
+        error_rate=float(options.get("error_rate", defaults.error_rate)),
+        truncate_rate=float(options.get("truncate_rate", defaults.truncate_rate)),
+        tool_calls=(
+            tool_calls.lower() in ("1", "true", "yes")
+            if isinstance(tool_calls, str)
+            else bool(tool_calls)
+        ),
+        seed=int(seed) if seed is not None else None,
+    )
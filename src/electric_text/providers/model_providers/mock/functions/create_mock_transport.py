@@ -0,0 +1,30 @@
+import httpx
+
+from electric_text.providers.model_providers.mock.mock_stream import MockStream
+
+
+def create_mock_transport(
+    status: int,
+    content_type: str,
+    planned_chunks: list[tuple[float, bytes]],
+    error: str | None = None,
+) -> httpx.MockTransport:
+    """Create an in-process transport that answers with a synthetic body.
+
+    Args:
+        status: HTTP status code
+        content_type: Response content type
+        planned_chunks: List of (seconds to wait, bytes to send)
+        error: If set, the body ends with a read error with this message
+
+    Returns:
+        Transport answering every request with a fresh copy of the body
+    """
+    return httpx.MockTransport(
+        lambda request: httpx.Response(
+            status,
+            headers={"content-type": content_type},
+            stream=MockStream(planned_chunks, error),
+            request=request,
+        )
+    )
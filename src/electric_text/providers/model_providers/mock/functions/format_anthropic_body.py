@@ -0,0 +1,98 @@
+import json
+from typing import Any
+
+from electric_text.providers.model_providers.mock.data.mock_output import MockOutput
+from electric_text.providers.model_providers.mock.functions.format_sse_event import (
+    format_sse_event,
+)
+from electric_text.providers.model_providers.mock.functions.frame_events import (
+    frame_events,
+)
+from electric_text.providers.model_providers.mock.functions.split_json_pieces import (
+    split_json_pieces,
+)
+
+
+def format_anthropic_body(output: MockOutput, model: str, stream: bool) -> list[str]:
+    """Serialize a synthetic response in the Anthropic Messages format.
+
+    Args:
+        output: The response content
+        model: Model name to report
+        stream: Produce server-sent events instead of one JSON body
+
+    Returns:
+        Body pieces, one per token when streaming
+    """
+    if output.tool_name is not None:
+        arguments = output.tool_arguments or {}
+        block: dict[str, Any] = {
+            "type": "tool_use",
+            "id": "toolu_mock",
+            "name": output.tool_name,
+            "input": arguments,
+        }
+        stop_reason = "tool_use"
+        deltas = [
+            {"type": "input_json_delta", "partial_json": piece}
+            for piece in split_json_pieces(json.dumps(arguments))
+        ]
+    else:
+        block = {"type": "text", "text": "".join(output.text_pieces)}
+        stop_reason = "end_turn"
+        deltas = [{"type": "text_delta", "text": piece} for piece in output.text_pieces]
+
+    if not stream:
+        return [
+            json.dumps(
+                {
+                    "id": "msg_mock",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": model,
+                    "content": [block],
+                    "stop_reason": stop_reason,
+                }
+            )
+        ]
+
+    start_block = (
+        {**block, "input": {}}
+        if output.tool_name is not None
+        else {
+            "type": "text",
+            "text": "",
+        }
+    )
+    start = format_sse_event(
+        {
+            "type": "message_start",
+            "message": {
+                "id": "msg_mock",
+                "type": "message",
+                "role": "assistant",
+                "model": model,
+                "content": [],
+            },
+        }
+    ) + format_sse_event(
+        {"type": "content_block_start", "index": 0, "content_block": start_block}
+    )
+    stop = (
+        format_sse_event({"type": "content_block_stop", "index": 0})
+        + format_sse_event(
+            {"type": "message_delta", "delta": {"stop_reason": stop_reason}}
+        )
+        + format_sse_event({"type": "message_stop"})
+    )
+
+    return frame_events(
+        start,
+        [
+            format_sse_event(
+                {"type": "content_block_delta", "index": 0, "delta": delta}
+            )
+            for delta in deltas
+        ],
+        stop,
+    )
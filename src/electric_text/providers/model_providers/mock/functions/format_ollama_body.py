@@ -0,0 +1,53 @@
+import json
+from typing import Any
+
+from electric_text.providers.model_providers.mock.data.mock_output import MockOutput
+
+
+def format_ollama_body(output: MockOutput, model: str, stream: bool) -> list[str]:
+    """Serialize a synthetic response in the Ollama chat format.
+
+    Args:
+        output: The response content
+        model: Model name to report
+        stream: Produce newline-delimited JSON instead of one JSON body
+
+    Returns:
+        Body pieces, one per token when streaming
+    """
+
+    def line(message: dict[str, Any], done: bool) -> str:
+        return (
+            json.dumps(
+                {
+                    "model": model,
+                    "message": {"role": "assistant", **message},
+                    "done": done,
+                }
+            )
+            + "\n"
+        )
+
+    if output.tool_name is not None:
+        tool_message = {
+            "content": "",
+            "tool_calls": [
+                {
+                    "function": {
+                        "name": output.tool_name,
+                        "arguments": output.tool_arguments or {},
+                    }
+                }
+            ],
+        }
+        if not stream:
+            return [line(tool_message, True)]
+        return [line(tool_message, False) + line({"content": ""}, True)]
+
+    if not stream:
+        return [line({"content": "".join(output.text_pieces)}, True)]
+
+    pieces = [line({"content": piece}, False) for piece in output.text_pieces]
+    done = line({"content": ""}, True)
+
+    return [*pieces[:-1], pieces[-1] + done] if pieces else [done]
@@ -0,0 +1,90 @@
+import json
+from typing import Any
+
+from electric_text.providers.model_providers.mock.data.mock_output import MockOutput
+from electric_text.providers.model_providers.mock.functions.format_sse_event import (
+    format_sse_event,
+)
+from electric_text.providers.model_providers.mock.functions.frame_events import (
+    frame_events,
+)
+from electric_text.providers.model_providers.mock.functions.split_json_pieces import (
+    split_json_pieces,
+)
+
+
+def format_openai_body(output: MockOutput, model: str, stream: bool) -> list[str]:
+    """Serialize a synthetic response in the OpenAI Responses format.
+
+    Args:
+        output: The response content
+        model: Model name to report
+        stream: Produce server-sent events instead of one JSON body
+
+    Returns:
+        Body pieces, one per token when streaming
+    """
+    response: dict[str, Any] = {"id": "resp_mock", "object": "response", "model": model}
+
+    if output.tool_name is not None:
+        arguments = json.dumps(output.tool_arguments or {})
+        item: dict[str, Any] = {
+            "type": "function_call",
+            "call_id": "call_mock",
+            "name": output.tool_name,
+            "arguments": arguments,
+        }
+        if not stream:
+            return [json.dumps({**response, "output": [item]})]
+
+        start_item = {**item, "arguments": ""}
+        extra_start = ""
+        deltas = [
+            {"type": "response.function_call_arguments.delta", "delta": piece}
+            for piece in split_json_pieces(arguments)
+        ]
+        done = {"type": "response.function_call_arguments.done", "arguments": arguments}
+    else:
+        text = "".join(output.text_pieces)
+        item = {
+            "type": "message",
+            "role": "assistant",
+            "content": [{"type": "output_text", "text": text}],
+        }
+        if not stream:
+            return [json.dumps({**response, "output": [item]})]
+
+        start_item = {**item, "content": []}
+        extra_start = format_sse_event(
+            {
+                "type": "response.content_part.added",
+                "output_index": 0,
+                "part": {"type": "output_text", "text": ""},
+            }
+        )
+        deltas = [
+            {"type": "response.output_text.delta", "delta": piece}
+            for piece in output.text_pieces
+        ]
+        done = {"type": "response.output_text.done", "text": text}
+
+    start = (
+        format_sse_event({"type": "response.created", "response": response})
+        + format_sse_event(
+            {
+                "type": "response.output_item.added",
+                "output_index": 0,
+                "item": start_item,
+            }
+        )
+        + extra_start
+    )
+    stop = format_sse_event({**done, "output_index": 0}) + format_sse_event(
+        {"type": "response.completed", "response": {**response, "output": [item]}}
+    )
+
+    return frame_events(
+        start,
+        [format_sse_event({**delta, "output_index": 0}) for delta in deltas],
+        stop,
+    )
@@ -0,0 +1,14 @@
+import json
+from typing import Any
+
+
+def format_sse_event(data: dict[str, Any]) -> str:
+    """Serialize an event the way Anthropic and OpenAI stream it.
+
+    Args:
+        data: Event payload with a "type" key
+
+    Returns:
+        An "event:"/"data:" pair followed by a blank line
+    """
+    return f"event: {data['type']}\ndata: {json.dumps(data)}\n\n"
@@ -0,0 +1,19 @@
+def frame_events(start: str, deltas: list[str], stop: str) -> list[str]:
+    """Attach opening and closing events to the first and last delta.
+
+    Keeps one element per delta so each element can be timed as one token.
+
+    Args:
+        start: Events sent before the first delta
+        deltas: One serialized event per delta
+        stop: Events sent after the last delta
+
+    Returns:
+        Serialized events, one element per delta (at least one element)
+    """
+    pieces = deltas or [""]
+
+    if len(pieces) == 1:
+        return [start + pieces[0] + stop]
+
+    return [start + pieces[0], *pieces[1:-1], pieces[-1] + stop]
@@ -0,0 +1,29 @@
+import random
+
+from electric_text.providers.model_providers.mock.functions.generate_mock_value import (
+    WORDS,
+)
+
+
+def generate_mock_text(token_count: int, rng: random.Random) -> list[str]:
+    """Generate synthetic text as a list of word-sized tokens.
+
+    Args:
+        token_count: Number of tokens
+        rng: Random source
+
+    Returns:
+        Tokens that join into readable sentences
+    """
+    tokens: list[str] = []
+    for index in range(token_count):
+        word = rng.choice(WORDS)
+        starts_sentence = index == 0 or tokens[-1].endswith(".")
+        ends_sentence = index == token_count - 1 or rng.random() < 0.1
+        tokens.append(
+            ("" if index == 0 else " ")
+            + (word.capitalize() if starts_sentence else word)
+            + ("." if ends_sentence else "")
+        )
+
+    return tokens
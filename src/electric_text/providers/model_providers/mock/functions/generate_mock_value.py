@@ -0,0 +1,83 @@
+import random
+from typing import Any
+
+WORDS = [
+    "electric",
+    "text",
+    "stream",
+    "token",
+    "model",
+    "signal",
+    "river",
+    "summer",
+    "quiet",
+    "orbit",
+    "lantern",
+    "copper",
+    "meadow",
+    "cipher",
+    "harbor",
+    "echo",
+]
+
+
+def generate_mock_value(
+    schema: dict[str, Any], rng: random.Random, defs: dict[str, Any] | None = None
+) -> Any:
+    """Generate a value that conforms to a JSON schema.
+
+    Supports the subset produced by Pydantic: objects, arrays, strings,
+    numbers, integers, booleans, null, enum, const, anyOf/oneOf/allOf and
+    local $refs.
+
+    Args:
+        schema: The JSON schema
+        rng: Random source
+        defs: Definitions for $ref lookups (defaults to the schema's $defs)
+
+    Returns:
+        A JSON-compatible value
+    """
+    defs = defs if defs is not None else schema.get("$defs", {})
+
+    if "$ref" in schema:
+        return generate_mock_value(defs[schema["$ref"].split("/")[-1]], rng, defs)
+    if "const" in schema:
+        return schema["const"]
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            options = [s for s in schema[key] if s.get("type") != "null"]
+            return generate_mock_value(rng.choice(options or schema[key]), rng, defs)
+    if "allOf" in schema:
+        return generate_mock_value(schema["allOf"][0], rng, defs)
+
+    schema_type = schema.get("type", "object" if "properties" in schema else "string")
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != "null"), "null")
+
+    match schema_type:
+        case "object":
+            return {
+                name: generate_mock_value(property_schema, rng, defs)
+                for name, property_schema in schema.get("properties", {}).items()
+            }
+        case "array":
+            count = max(schema.get("minItems", 1), min(schema.get("maxItems", 3), 3))
+            return [
+                generate_mock_value(schema.get("items", {}), rng, defs)
+                for _ in range(count)
+            ]
+        case "integer":
+            return rng.randint(schema.get("minimum", 0), schema.get("maximum", 100))
+        case "number":
+            return round(
+                rng.uniform(schema.get("minimum", 0.0), schema.get("maximum", 100.0)), 2
+            )
+        case "boolean":
+            return rng.random() < 0.5
+        case "null":
+            return None
+        case _:
+            return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
@@ -0,0 +1,31 @@
+import random
+
+from electric_text.providers.model_providers.mock.data.mock_settings import (
+    MockSettings,
+)
+
+
+def plan_mock_delays(
+    count: int, settings: MockSettings, rng: random.Random
+) -> list[float]:
+    """Plan the delay before each of count streamed pieces.
+
+    Args:
+        count: Number of pieces
+        settings: Mock settings (ttfb_ms, tokens_per_second, jitter_ms)
+        rng: Random source for jitter
+
+    Returns:
+        Seconds to wait before each piece
+    """
+    token_ms = 1000 / settings.tokens_per_second if settings.tokens_per_second else 0.0
+
+    return [
+        max(
+            (settings.ttfb_ms if index == 0 else token_ms)
+            + rng.uniform(-settings.jitter_ms, settings.jitter_ms),
+            0.0,
+        )
+        / 1000
+        for index in range(count)
+    ]
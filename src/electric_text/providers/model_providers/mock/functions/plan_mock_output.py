@@ -0,0 +1,57 @@
+import json
+import random
+
+from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.model_providers.mock.data.mock_output import MockOutput
+from electric_text.providers.model_providers.mock.data.mock_settings import (
+    MockSettings,
+)
+from electric_text.providers.model_providers.mock.functions.generate_mock_text import (
+    generate_mock_text,
+)
+from electric_text.providers.model_providers.mock.functions.generate_mock_value import (
+    generate_mock_value,
+)
+from electric_text.providers.model_providers.mock.functions.split_json_pieces import (
+    split_json_pieces,
+)
+
+
+def plan_mock_output(
+    request: ProviderRequest,
+    settings: MockSettings,
+    rng: random.Random,
+    prefill: str = "",
+) -> MockOutput:
+    """Decide what a synthetic response contains.
+
+    Args:
+        request: The provider request
+        settings: Mock settings
+        rng: Random source
+        prefill: Text the provider already prefilled (omitted from the output)
+
+    Returns:
+        A tool call when tools are offered and enabled, schema-conforming
+        JSON for custom output schemas, and plain text otherwise
+    """
+    if settings.tool_calls and request.tools:
+        tool = request.tools[0]
+        return MockOutput(
+            text_pieces=[],
+            tool_name=tool.get("name", ""),
+            tool_arguments=generate_mock_value(
+                tool.get("parameters") or tool.get("input_schema") or {}, rng
+            ),
+        )
+
+    output_schema = request.output_schema
+    if (
+        request.has_custom_output_schema
+        and output_schema is not None
+        and hasattr(output_schema, "model_json_schema")
+    ):
+        text = json.dumps(generate_mock_value(output_schema.model_json_schema(), rng))
+        return MockOutput(text_pieces=split_json_pieces(text.removeprefix(prefill)))
+
+    return MockOutput(text_pieces=generate_mock_text(settings.response_tokens, rng))
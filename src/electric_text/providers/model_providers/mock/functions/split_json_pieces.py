@@ -0,0 +1,13 @@
+def split_json_pieces(text: str, piece_size: int = 4) -> list[str]:
+    """Split serialized JSON into token-sized pieces.
+
+    Args:
+        text: The JSON text
+        piece_size: Characters per piece (about one token)
+
+    Returns:
+        Pieces that join back into the text
+    """
+    return [
+        text[start : start + piece_size] for start in range(0, len(text), piece_size)
+    ]
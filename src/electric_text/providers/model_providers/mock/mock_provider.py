@@ -0,0 +1,174 @@
+import importlib
+import inspect
+import random
+from contextlib import aclosing
+from dataclasses import replace
+from typing import Any, AsyncGenerator, Callable
+
+
+from electric_text.providers import ModelProvider
+from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.data.stream_history import StreamHistory
+from electric_text.providers.model_providers.mock.data.mock_output import MockOutput
+from electric_text.providers.model_providers.mock.functions.create_mock_settings import (
+    create_mock_settings,
+)
+from electric_text.providers.model_providers.mock.functions.create_mock_transport import (
+    create_mock_transport,
+)
+from electric_text.providers.model_providers.mock.functions.format_anthropic_body import (
+    format_anthropic_body,
+)
+from electric_text.providers.model_providers.mock.functions.format_ollama_body import (
+    format_ollama_body,
+)
+from electric_text.providers.model_providers.mock.functions.format_openai_body import (
+    format_openai_body,
+)
+from electric_text.providers.model_providers.mock.functions.plan_mock_delays import (
+    plan_mock_delays,
+)
+from electric_text.providers.model_providers.mock.functions.plan_mock_output import (
+    plan_mock_output,
+)
+from electric_text.providers.functions.split_recorded_model import (
+    split_recorded_model,
+)
+
+FORMATTERS: dict[str, Callable[[MockOutput, str, bool], list[str]]] = {
+    "anthropic": format_anthropic_body,
+    "openai": format_openai_body,
+    "ollama": format_ollama_body,
+}
+
+STREAM_CONTENT_TYPES = {
+    "anthropic": "text/event-stream",
+    "openai": "text/event-stream",
+    "ollama": "application/x-ndjson",
+}
+
+
+class MockProvider(ModelProvider):
+    """Generates synthetic provider responses in-process.
+
+    Each request is answered by the real provider for the chosen shape, so
+    payload building and stream parsing run exactly as they do live; only
+    the network is replaced by a synthetic transport.
+    """
+
+    def __init__(
+        self,
+        http_logging_enabled: bool = False,
+        http_log_dir: str = "./http_logs",
+        http_log_options: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the mock provider.
+
+        Args:
+            http_logging_enabled: Log the synthetic traffic like real traffic
+            http_log_dir: Directory for HTTP log files
+            http_log_options: HTTP log writer options
+            **kwargs: MockSettings fields (strings are accepted); others are ignored
+        """
+        self.settings = create_mock_settings(kwargs)
+        self.rng = random.Random(self.settings.seed)
+        self.http_logging = {
+            "http_logging_enabled": http_logging_enabled,
+            "http_log_dir": http_log_dir,
+            "http_log_options": http_log_options,
+        }
+        self.stream_history = StreamHistory()
+
+    def create_provider(
+        self, request: ProviderRequest, stream: bool
+    ) -> tuple[ModelProvider, ProviderRequest]:
+        """Create the shaped provider, wired to a transport with a synthetic response."""
+        shape, model_name = split_recorded_model(
+            request.model_name, self.settings.shape
+        )
+        module = importlib.import_module(
+            f"electric_text.providers.model_providers.{shape}"
+        )
+        provider_class = getattr(module, f"{shape.title()}Provider")
+
+        prefill = (
+            "{" if shape == "anthropic" and request.has_custom_output_schema else ""
+        )
+        output = plan_mock_output(request, self.settings, self.rng, prefill)
+        pieces = FORMATTERS[shape](output, model_name, stream)
+        failed = self.rng.random() < self.settings.error_rate
+        truncated = stream and self.rng.random() < self.settings.truncate_rate
+
+        if failed:
+            transport = create_mock_transport(
+                500,
+                "application/json",
+                [(self.settings.ttfb_ms / 1000, b'{"error": "injected mock error"}')],
+            )
+        elif stream:
+            delays = plan_mock_delays(len(pieces), self.settings, self.rng)
+            planned = [(delay, piece.encode()) for delay, piece in zip(delays, pieces)]
+            transport = create_mock_transport(
+                200,
+                STREAM_CONTENT_TYPES[shape],
+                planned[: len(planned) // 2] if truncated else planned,
+                "injected mock stream interruption" if truncated else None,
+            )
+        else:
+            delays = plan_mock_delays(
+                max(len(output.text_pieces), 1), self.settings, self.rng
+            )
+            transport = create_mock_transport(
+                200, "application/json", [(sum(delays), pieces[0].encode())]
+            )
+
+        config: dict[str, Any] = {"transport": transport, **self.http_logging}
+        if "api_key" in inspect.signature(provider_class).parameters:
+            config["api_key"] = "mock"
+
+        return provider_class(**config), replace(
+            request, provider_name=shape, model_name=model_name
+        )
+
+    async def generate_stream(
+        self,
+        request: ProviderRequest,
+    ) -> AsyncGenerator[StreamHistory, None]:
+        """
+        Stream a synthetic response.
+
+        Args:
+            request: The request for the provider
+
+        Yields:
+            StreamHistory object containing the full stream history after each chunk
+        """
+        provider, shaped_request = self.create_provider(request, stream=True)
+
+        async with aclosing(provider.generate_stream(shaped_request)) as histories:
+            async for history in histories:
+                self.stream_history = history
+                yield history
+
+    async def generate_completion(
+        self,
+        request: ProviderRequest,
+    ) -> StreamHistory:
+        """
+        Generate a complete synthetic response.
+
+        Args:
+            request: The request for the provider
+
+        Returns:
+            StreamHistory containing the complete response
+        """
+        provider, shaped_request = self.create_provider(request, stream=False)
+
+        self.stream_history = await provider.generate_completion(shaped_request)
+        return self.stream_history
+
+    async def aclose(self) -> None:
+        """Nothing to close; each request gets its own synthetic transport."""
@@ -0,0 +1,28 @@
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+
+
+class MockStream(httpx.AsyncByteStream):
+    """Response body that yields synthetic chunks at a planned pace."""
+
+    def __init__(self, planned_chunks: list[tuple[float, bytes]], error: str | None):
+        """
+        Initialize the stream.
+
+        Args:
+            planned_chunks: List of (seconds to wait, bytes to send)
+            error: If set, raise a read error with this message after the chunks
+        """
+        self.planned_chunks = planned_chunks
+        self.error = error
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for delay, chunk in self.planned_chunks:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield chunk
+
+        if self.error is not None:
+            raise httpx.ReadError(self.error)
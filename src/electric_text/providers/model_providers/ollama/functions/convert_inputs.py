@@ -2,7 +2,7 @@ from electric_text.providers.data.provider_request import ProviderRequest
 from electric_text.providers.model_providers.ollama.data.ollama_provider_inputs import (
     OllamaProviderInputs,
 )
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Sequence
 from electric_text.providers.functions.convert_prompt_to_messages import (
     convert_prompt_to_messages,
 )
@@ -35,7 +35,7 @@ def convert_provider_inputs(
     )
 
     # Get tools from the provider request
-    tools: Optional[List[Dict[str, Any]]] = request.tools
+    tools: Optional[Sequence[Dict[str, Any]]] = request.tools
 
     return OllamaProviderInputs(
         messages=messages,
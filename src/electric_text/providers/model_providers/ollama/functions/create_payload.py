@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Sequence
 
 
 def create_payload(
@@ -7,7 +7,7 @@ def create_payload(
     messages: list[dict[str, str]],
     stream: bool,
     format_schema: Optional[Dict[str, Any]] = None,
-    tools: Optional[List[Dict[str, Any]]] = None,
+    tools: Optional[Sequence[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """
     Create the API request payload for Ollama.
@@ -35,6 +35,6 @@ def create_payload(
 
     # Add tools if provided
     if tools is not None and len(tools) > 0:
-        payload["tools"] = tools
+        payload["tools"] = list(tools)
 
     return payload
\ No newline at end of file
@@ -1,9 +1,19 @@
 import httpx
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Optional
+from electric_text.profiling import (
+    ProfilePhase,
+    record_entry_phase,
+    record_iteration_phase,
+    record_phase,
+)
 from electric_text.providers import ModelProvider
 from electric_text.providers.logging import HttpLogger, LoggingAsyncClient
+from electric_text.providers.logging.functions.create_http_log_settings import (
+    create_http_log_settings,
+)
 from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.functions.create_http_client import create_http_client
 from electric_text.providers.data.stream_chunk import StreamChunk
 from electric_text.providers.data.stream_chunk_type import StreamChunkType
 from electric_text.providers.model_providers.ollama.functions.convert_inputs import (
@@ -46,6 +56,8 @@ class OllamaProvider(ModelProvider):
         timeout: float = 30.0,
         http_logging_enabled: bool = False,
         http_log_dir: str = "./http_logs",
+        http_log_options: dict[str, Any] | None = None,
+        keep_alive: bool = False,
         **kwargs: Any,
     ):
         """
@@ -55,12 +67,15 @@ class OllamaProvider(ModelProvider):
             base_url: Base URL for the Ollama API
             default_model: Default model to use for queries
             timeout: Timeout for API requests in seconds
+            keep_alive: Reuse one HTTP client and its connections across requests
             **kwargs: Additional provider-specific options
         """
         self.base_url = base_url.rstrip("/")
         self.default_model = default_model
         self.timeout = timeout
         self.stream_history = StreamHistory()
+        self.keep_alive = keep_alive
+        self.http_client: httpx.AsyncClient | LoggingAsyncClient | None = None
         self.client_kwargs = {
             "timeout": timeout,
             "headers": {"Content-Type": "application/json"},
@@ -72,22 +87,39 @@ class OllamaProvider(ModelProvider):
         if http_logging_enabled:
             from pathlib import Path
 
-            self.http_logger = HttpLogger(log_dir=Path(http_log_dir), enabled=True)
+            self.http_logger = HttpLogger(
+                log_dir=Path(http_log_dir),
+                enabled=True,
+                settings=create_http_log_settings(http_log_dir, http_log_options or {}),
+            )
 
     @asynccontextmanager
     async def get_client(
         self,
     ) -> AsyncGenerator[httpx.AsyncClient | LoggingAsyncClient, None]:
-        """Context manager for httpx client."""
-        if self.http_logger:
-            # Create a logging client with the same kwargs
-            async with LoggingAsyncClient(
-                logger=self.http_logger, provider="ollama", **self.client_kwargs
+        """Context manager for httpx client.
+
+        With keep_alive, one client (and its connection pool) is shared by all
+        requests until aclose(); otherwise each request gets its own client.
+        """
+        if not self.keep_alive:
+            async with create_http_client(
+                self.http_logger, "ollama", self.client_kwargs
             ) as client:
                 yield client
-        else:
-            async with httpx.AsyncClient(**self.client_kwargs) as client:
-                yield client
+            return
+
+        if self.http_client is None:
+            self.http_client = create_http_client(
+                self.http_logger, "ollama", self.client_kwargs
+            )
+        yield self.http_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self.http_client is not None:
+            http_client, self.http_client = self.http_client, None
+            await http_client.aclose()
 
     async def generate_stream(
         self,
@@ -102,7 +134,8 @@ class OllamaProvider(ModelProvider):
         Yields:
             StreamHistory object containing the full stream history after each chunk
         """
-        self.stream_history = StreamHistory()  # Reset stream history
+        stream_history = StreamHistory()
+        self.stream_history = stream_history
 
         ollama_inputs: OllamaProviderInputs = convert_provider_inputs(request)
 
@@ -122,16 +155,20 @@ class OllamaProvider(ModelProvider):
 
         try:
             async with self.get_client() as client:
-                async with client.stream(
-                    "POST",
-                    self.base_url,
-                    json=payload,
+                async with record_entry_phase(
+                    client.stream("POST", self.base_url, json=payload),
+                    ProfilePhase.NETWORK,
                 ) as response:
                     response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        yield process_stream_response(line, self.stream_history)
+                    lines = record_iteration_phase(
+                        response.aiter_lines(), ProfilePhase.NETWORK
+                    )
+                    async for line in lines:
+                        with record_phase(ProfilePhase.PARSE_VALIDATE):
+                            history = process_stream_response(line, stream_history)
+                        yield history
         except httpx.HTTPError as e:
-            yield self.stream_history.add_chunk(
+            yield stream_history.add_chunk(
                 StreamChunk(
                     type=StreamChunkType.HTTP_ERROR,
                     raw_line="",
@@ -152,7 +189,8 @@ class OllamaProvider(ModelProvider):
         Returns:
             StreamHistory containing the complete response
         """
-        self.stream_history = StreamHistory()
+        stream_history = StreamHistory()
+        self.stream_history = stream_history
 
         ollama_inputs: OllamaProviderInputs = convert_provider_inputs(request)
 
@@ -172,12 +210,14 @@ class OllamaProvider(ModelProvider):
 
         try:
             async with self.get_client() as client:
-                response = await client.post(self.base_url, json=payload)
+                with record_phase(ProfilePhase.NETWORK):
+                    response = await client.post(self.base_url, json=payload)
                 response.raise_for_status()
                 line = response.text
-                return process_completion_response(line, self.stream_history)
+                with record_phase(ProfilePhase.PARSE_VALIDATE):
+                    return process_completion_response(line, stream_history)
         except httpx.HTTPError as e:
-            return self.stream_history.add_chunk(
+            return stream_history.add_chunk(
                 StreamChunk(
                     type=StreamChunkType.HTTP_ERROR,
                     raw_line="",
@@ -6,6 +6,7 @@ from electric_text.providers.model_providers.openai.openai_provider_inputs impor
 from electric_text.providers.functions.convert_prompt_to_messages import (
     convert_prompt_to_messages,
 )
+from electric_text.providers.functions.convert_tools_once import convert_tools_once
 from electric_text.providers.model_providers.openai.functions.convert_tools import (
     convert_tools as convert_tools_impl,
 )
@@ -36,7 +37,7 @@ def convert_provider_inputs(
     )
 
     # Convert tools from the standard format to OpenAI's format
-    openai_tools = convert_tools_impl(request.tools)
+    openai_tools = convert_tools_once(request.tools, convert_tools_impl)
 
     return OpenAIProviderInputs(
         messages=messages,
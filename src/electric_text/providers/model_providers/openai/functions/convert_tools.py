@@ -1,8 +1,8 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 
 
 def convert_tools(
-    tools: Optional[List[Dict[str, Any]]],
+    tools: Optional[Sequence[Dict[str, Any]]],
 ) -> Optional[List[Dict[str, Any]]]:
     """
     Convert the standard tools format to OpenAI's specific format.
@@ -0,0 +1,8 @@
+from electric_text.providers.model_providers.replay.replay_provider import (
+    ReplayProvider,
+)
+from electric_text.providers.model_providers.replay.replay_transport import (
+    ReplayTransport,
+)
+
+__all__ = ["ReplayProvider", "ReplayTransport"]
@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ReplayRecord:
+    """A recorded response, ready to be replayed.
+
+    Args:
+        status: HTTP status code
+        headers: Response headers (without transfer/content encoding)
+        body: Decoded response body
+        chunks: Arrival offset (ms since the request) and size of each recorded chunk
+        ttfb_ms: Time to first byte, used when no chunk timings were recorded
+    """
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    chunks: list[tuple[float, int]] = field(default_factory=list)
+    ttfb_ms: float = 0.0
@@ -0,0 +1,40 @@
+import gzip
+import json
+from pathlib import Path
+
+from electric_text.providers.model_providers.replay.data.replay_record import (
+    ReplayRecord,
+)
+from electric_text.providers.model_providers.replay.functions.parse_replay_record import (
+    parse_replay_record,
+)
+
+
+def load_replay_records(log_dir: Path) -> dict[str, list[ReplayRecord]]:
+    """Index all recorded HTTP logs in a directory by request hash.
+
+    Reads plain and gzipped JSONL segments. Lines that are not valid JSON
+    (e.g. a segment truncated by a crash) are skipped.
+
+    Args:
+        log_dir: Directory containing HTTP log segments
+
+    Returns:
+        Recorded responses per request hash, in recording order
+    """
+    index: dict[str, list[ReplayRecord]] = {}
+    segments = sorted([*log_dir.glob("*.jsonl"), *log_dir.glob("*.jsonl.gz")])
+
+    for segment in segments:
+        opener = gzip.open if segment.suffix == ".gz" else open
+        with opener(segment, "rt", encoding="utf-8") as lines:
+            for line in lines:
+                try:
+                    parsed = parse_replay_record(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+                if parsed is not None:
+                    request_hash, record = parsed
+                    index.setdefault(request_hash, []).append(record)
+
+    return index
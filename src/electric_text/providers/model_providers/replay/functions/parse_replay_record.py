@@ -0,0 +1,49 @@
+import json
+from typing import Any
+
+from electric_text.providers.model_providers.replay.data.replay_record import (
+    ReplayRecord,
+)
+from electric_text.providers.functions.hash_request_body import (
+    hash_request_body,
+)
+
+EXCLUDED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def parse_replay_record(record: dict[str, Any]) -> tuple[str, ReplayRecord] | None:
+    """Parse one HTTP log record into a request hash and replayable response.
+
+    Args:
+        record: A record as written by the HTTP log writer
+
+    Returns:
+        Tuple of (request hash, ReplayRecord), or None if the record has no request body
+    """
+    request_body = record.get("request", {}).get("body")
+    if request_body is None:
+        return None
+
+    response = record.get("response", {})
+    response_body = response.get("body")
+    body = (
+        b""
+        if response_body is None
+        else response_body.encode()
+        if isinstance(response_body, str)
+        else json.dumps(response_body).encode()
+    )
+
+    return hash_request_body(request_body), ReplayRecord(
+        status=int(response.get("status", 200)),
+        headers={
+            key: value
+            for key, value in (response.get("headers") or {}).items()
+            if key.lower() not in EXCLUDED_HEADERS
+        },
+        body=body,
+        chunks=[
+            (float(offset), int(size)) for offset, size in response.get("chunks") or []
+        ],
+        ttfb_ms=float(record.get("ttfb_ms") or 0.0),
+    )
@@ -0,0 +1,44 @@
+def plan_replay_chunks(
+    body: bytes,
+    chunks: list[tuple[float, int]],
+    ttfb_ms: float,
+    speed: float,
+) -> list[tuple[float, bytes]]:
+    """Split a recorded body into chunks with the delay before each one.
+
+    Recorded chunk sizes are of the raw (possibly compressed) body, so the
+    split points are scaled to the length of the decoded body.
+
+    Args:
+        body: The decoded response body
+        chunks: Arrival offset (ms since the request) and size of each recorded chunk
+        ttfb_ms: Delay before the whole body when no chunks were recorded
+        speed: Playback speed (2.0 is twice as fast); 0 means no delays
+
+    Returns:
+        List of (seconds to wait, bytes to send)
+    """
+
+    def delay(milliseconds: float) -> float:
+        return max(milliseconds, 0.0) / 1000 / speed if speed > 0 else 0.0
+
+    recorded_bytes = sum(size for _, size in chunks)
+    if not chunks or recorded_bytes == 0:
+        return [(delay(ttfb_ms), body)]
+
+    planned: list[tuple[float, bytes]] = []
+    previous_offset = 0.0
+    previous_cut = 0
+    received = 0
+    for index, (offset, size) in enumerate(chunks):
+        received += size
+        cut = (
+            len(body)
+            if index == len(chunks) - 1
+            else round(len(body) * received / recorded_bytes)
+        )
+        planned.append((delay(offset - previous_offset), body[previous_cut:cut]))
+        previous_offset = offset
+        previous_cut = cut
+
+    return planned
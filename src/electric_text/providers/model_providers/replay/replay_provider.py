@@ -0,0 +1,132 @@
+import importlib
+import inspect
+import os
+from contextlib import aclosing
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, AsyncGenerator
+
+from electric_text.providers import ModelProvider
+from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.data.stream_history import StreamHistory
+from electric_text.providers.functions.split_recorded_model import (
+    split_recorded_model,
+)
+from electric_text.providers.model_providers.replay.replay_transport import (
+    ReplayTransport,
+)
+
+
+class ReplayProvider(ModelProvider):
+    """Serves recorded HTTP logs through the provider that recorded them.
+
+    The recorded provider builds its request and parses the response exactly
+    as it would against the live API; only the network is replaced.
+    """
+
+    def __init__(
+        self,
+        log_dir: str | None = None,
+        speed: float | str | None = None,
+        recorded_provider: str | None = None,
+        http_logging_enabled: bool = False,
+        http_log_dir: str = "./http_logs",
+        http_log_options: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the replay provider.
+
+        Args:
+            log_dir: Directory of recorded HTTP logs (defaults to
+                ELECTRIC_TEXT_REPLAY_DIR, then the HTTP log directory)
+            speed: Playback speed; 1 keeps the recorded timing, 0 disables
+                delays (defaults to ELECTRIC_TEXT_REPLAY_SPEED, then 1)
+            recorded_provider: Provider to use for model names without a
+                "provider/" prefix
+            http_logging_enabled: Ignored; replayed traffic is never logged
+            http_log_dir: HTTP log directory, used when log_dir is not set
+            http_log_options: Ignored
+            **kwargs: Ignored (e.g. api_key)
+        """
+        self.log_dir = Path(
+            log_dir or os.environ.get("ELECTRIC_TEXT_REPLAY_DIR") or http_log_dir
+        )
+        self.speed = float(
+            speed
+            if speed is not None
+            else os.environ.get("ELECTRIC_TEXT_REPLAY_SPEED", "1.0")
+        )
+        self.recorded_provider = recorded_provider
+        self.transport = ReplayTransport(self.log_dir, self.speed)
+        self.providers: dict[str, ModelProvider] = {}
+        self.stream_history = StreamHistory()
+
+    def get_provider(self, provider_name: str) -> ModelProvider:
+        """Return the recorded provider, sending its traffic to the replay transport."""
+        if provider_name not in self.providers:
+            module = importlib.import_module(
+                f"electric_text.providers.model_providers.{provider_name}"
+            )
+            provider_class = getattr(module, f"{provider_name.title()}Provider")
+            config: dict[str, Any] = {"transport": self.transport}
+            if "api_key" in inspect.signature(provider_class).parameters:
+                config["api_key"] = "replay"
+            self.providers[provider_name] = provider_class(**config)
+
+        return self.providers[provider_name]
+
+    def resolve_request(
+        self, request: ProviderRequest
+    ) -> tuple[ModelProvider, ProviderRequest]:
+        """Pick the recorded provider and strip the prefix from the model name."""
+        provider_name, model_name = split_recorded_model(
+            request.model_name, self.recorded_provider
+        )
+
+        return self.get_provider(provider_name), replace(
+            request, provider_name=provider_name, model_name=model_name
+        )
+
+    async def generate_stream(
+        self,
+        request: ProviderRequest,
+    ) -> AsyncGenerator[StreamHistory, None]:
+        """
+        Replay a recorded streaming response.
+
+        Args:
+            request: The request for the provider
+
+        Yields:
+            StreamHistory object containing the full stream history after each chunk
+        """
+        provider, recorded_request = self.resolve_request(request)
+
+        async with aclosing(provider.generate_stream(recorded_request)) as histories:
+            async for history in histories:
+                self.stream_history = history
+                yield history
+
+    async def generate_completion(
+        self,
+        request: ProviderRequest,
+    ) -> StreamHistory:
+        """
+        Replay a recorded complete response.
+
+        Args:
+            request: The request for the provider
+
+        Returns:
+            StreamHistory containing the complete response
+        """
+        provider, recorded_request = self.resolve_request(request)
+
+        self.stream_history = await provider.generate_completion(recorded_request)
+        return self.stream_history
+
+    async def aclose(self) -> None:
+        """Close the recorded providers created for replay."""
+        for provider in self.providers.values():
+            await provider.aclose()
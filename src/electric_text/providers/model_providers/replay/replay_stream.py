@@ -0,0 +1,23 @@
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+
+
+class ReplayStream(httpx.AsyncByteStream):
+    """Response body that yields recorded chunks with their recorded delays."""
+
+    def __init__(self, planned_chunks: list[tuple[float, bytes]]):
+        """
+        Initialize the stream.
+
+        Args:
+            planned_chunks: List of (seconds to wait, bytes to send)
+        """
+        self.planned_chunks = planned_chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for delay, chunk in self.planned_chunks:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield chunk
@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+
+import httpx
+
+from electric_text.providers.model_providers.replay.data.replay_record import (
+    ReplayRecord,
+)
+from electric_text.providers.functions.hash_request_body import (
+    hash_request_body,
+)
+from electric_text.providers.model_providers.replay.functions.load_replay_records import (
+    load_replay_records,
+)
+from electric_text.providers.model_providers.replay.functions.plan_replay_chunks import (
+    plan_replay_chunks,
+)
+from electric_text.providers.model_providers.replay.replay_stream import ReplayStream
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """httpx transport that answers requests from recorded HTTP logs.
+
+    Requests are matched on a hash of their JSON body. When the same request
+    was recorded more than once, the recordings are served in turn.
+    """
+
+    def __init__(self, log_dir: Path, speed: float = 1.0):
+        """
+        Initialize the transport.
+
+        Args:
+            log_dir: Directory containing HTTP log segments
+            speed: Playback speed (2.0 is twice as fast); 0 means no delays
+        """
+        self.log_dir = log_dir
+        self.speed = speed
+        self.records: dict[str, list[ReplayRecord]] | None = None
+        self.served: dict[str, int] = {}
+
+    def find_record(self, request_hash: str) -> ReplayRecord | None:
+        """Return the next recording for a request hash, if any."""
+        if self.records is None:
+            self.records = load_replay_records(self.log_dir)
+
+        recordings = self.records.get(request_hash)
+        if not recordings:
+            return None
+
+        served = self.served.get(request_hash, 0)
+        self.served[request_hash] = served + 1
+        return recordings[served % len(recordings)]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        content = await request.aread()
+        try:
+            request_body: object = json.loads(content)
+        except json.JSONDecodeError:
+            request_body = content.decode("utf-8", errors="replace")
+
+        request_hash = hash_request_body(request_body)
+        record = self.find_record(request_hash)
+        if record is None:
+            return httpx.Response(
+                404,
+                json={
+                    "error": f"No recorded response in {self.log_dir}",
+                    "request_hash": request_hash,
+                },
+                request=request,
+            )
+
+        return httpx.Response(
+            record.status,
+            headers=record.headers,
+            stream=ReplayStream(
+                plan_replay_chunks(
+                    record.body, record.chunks, record.ttfb_ms, self.speed
+                )
+            ),
+            request=request,
+        )
@@ -2,8 +2,10 @@ from electric_text.tools.functions.load_tools_from_tool_boxes import (
     load_tools_from_tool_boxes,
 )
 from electric_text.tools.functions.load_tool_config import load_tool_config
+from electric_text.tools.functions.get_tool_registry import get_tool_registry
 
 __all__ = [
     "load_tools_from_tool_boxes",
     "load_tool_config",
+    "get_tool_registry",
 ]
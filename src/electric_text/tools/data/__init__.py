@@ -0,0 +1,5 @@
+from electric_text.tools.data.tool_catalog import ToolCatalog
+
+__all__ = [
+    "ToolCatalog",
+]
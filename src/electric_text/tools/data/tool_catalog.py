@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass(frozen=True)
+class ToolCatalog:
+    """The tool boxes in one tool configs directory, with their tools loaded.
+
+    Args:
+        config_dir: The tool configs directory
+        stamps: (mtime_ns, size) of the directory, tool_boxes.json and every
+            referenced tool file when they were read (None if missing)
+        tool_boxes: Tools for each valid tool box, in the order listed
+    """
+
+    config_dir: str
+    stamps: Dict[str, tuple[int, int] | None] = field(default_factory=dict)
+    tool_boxes: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
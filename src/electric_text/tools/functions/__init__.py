@@ -11,6 +11,7 @@ from electric_text.tools.functions.load_tools_from_tool_box import (
 from electric_text.tools.functions.load_tools_from_tool_boxes import (
     load_tools_from_tool_boxes,
 )
+from electric_text.tools.functions.get_tool_registry import get_tool_registry
 
 __all__ = [
     "get_tool_configs_directory",
@@ -20,4 +21,5 @@ __all__ = [
     "find_tool_box_by_name",
     "load_tools_from_tool_box",
     "load_tools_from_tool_boxes",
+    "get_tool_registry",
 ]
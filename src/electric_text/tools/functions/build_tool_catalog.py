@@ -0,0 +1,57 @@
+import os
+from typing import Any, Dict, List
+
+from electric_text.configuration.functions.get_file_stamp import get_file_stamp
+from electric_text.tools.data.tool_catalog import ToolCatalog
+from electric_text.tools.functions.read_json_file import read_json_file
+from electric_text.tools.functions.validate_tool_box import validate_tool_box
+from electric_text.tools.functions.validate_tool_config import validate_tool_config
+
+
+def build_tool_catalog(config_dir: str) -> ToolCatalog:
+    """
+    Load every tool box in a tool configs directory, reading each tool file once.
+
+    Invalid tool boxes are skipped, as are tools whose files are missing or
+    invalid. Stamps are kept for missing files too, so creating them
+    invalidates the catalog.
+
+    Args:
+        config_dir: The tool configs directory
+
+    Returns:
+        ToolCatalog: The tool boxes and their tools
+    """
+    tool_boxes_path = os.path.join(config_dir, "tool_boxes.json")
+    stamps = {
+        config_dir: get_file_stamp(config_dir),
+        tool_boxes_path: get_file_stamp(tool_boxes_path),
+    }
+
+    tool_box_configs = read_json_file(tool_boxes_path)
+    if not isinstance(tool_box_configs, list):
+        return ToolCatalog(config_dir=config_dir, stamps=stamps)
+
+    tools_by_name: Dict[str, Dict[str, Any] | None] = {}
+    tool_boxes: Dict[str, List[Dict[str, Any]]] = {}
+    for tool_box in tool_box_configs:
+        if not validate_tool_box(tool_box) or tool_box["name"] in tool_boxes:
+            continue
+
+        tools: List[Dict[str, Any]] = []
+        for tool_name in tool_box["tools"]:
+            if tool_name not in tools_by_name:
+                tool_path = os.path.join(config_dir, f"{tool_name}.json")
+                stamps[tool_path] = get_file_stamp(tool_path)
+                tool_config = read_json_file(tool_path)
+                tools_by_name[tool_name] = (
+                    tool_config if validate_tool_config(tool_config) else None
+                )
+
+            loaded = tools_by_name[tool_name]
+            if loaded is not None:
+                tools.append(loaded)
+
+        tool_boxes[tool_box["name"]] = tools
+
+    return ToolCatalog(config_dir=config_dir, stamps=stamps, tool_boxes=tool_boxes)
@@ -0,0 +1,24 @@
+from typing import Any, Dict, List, Tuple
+
+from electric_text.tools.data.tool_catalog import ToolCatalog
+
+
+def combine_tool_boxes(
+    catalog: ToolCatalog, tool_box_names: List[str]
+) -> Tuple[Dict[str, Any], ...]:
+    """
+    Combine the tools from several tool boxes, skipping unknown boxes.
+
+    Args:
+        catalog: The catalog to take tool boxes from
+        tool_box_names: Names of the tool boxes to combine
+
+    Returns:
+        Tuple[Dict[str, Any], ...]: Tools deduplicated by name
+    """
+    unique_tools: Dict[str, Dict[str, Any]] = {}
+    for tool_box_name in tool_box_names:
+        for tool in catalog.tool_boxes.get(tool_box_name, []):
+            unique_tools[tool["name"]] = tool
+
+    return tuple(unique_tools.values())
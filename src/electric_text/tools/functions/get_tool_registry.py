@@ -0,0 +1,14 @@
+from functools import lru_cache
+
+from electric_text.tools.tool_registry import ToolRegistry
+
+
+@lru_cache(maxsize=1)
+def get_tool_registry() -> ToolRegistry:
+    """
+    Get the process-wide tool registry.
+
+    Returns:
+        ToolRegistry: The shared registry
+    """
+    return ToolRegistry()
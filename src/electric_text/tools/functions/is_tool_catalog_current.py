@@ -0,0 +1,15 @@
+from electric_text.configuration.functions.get_file_stamp import get_file_stamp
+from electric_text.tools.data.tool_catalog import ToolCatalog
+
+
+def is_tool_catalog_current(catalog: ToolCatalog) -> bool:
+    """
+    Check that none of the files a catalog was built from have changed.
+
+    Args:
+        catalog: The catalog to check
+
+    Returns:
+        bool: True if every file still has the stamp it was read with
+    """
+    return all(get_file_stamp(path) == stamp for path, stamp in catalog.stamps.items())
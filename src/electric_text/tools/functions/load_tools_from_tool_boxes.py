@@ -1,34 +1,31 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
-from electric_text.tools.functions.load_tools_from_tool_box import (
-    load_tools_from_tool_box,
+from electric_text.tools.functions.get_tool_configs_directory import (
+    get_tool_configs_directory,
 )
+from electric_text.tools.functions.get_tool_registry import get_tool_registry
 
 
-def load_tools_from_tool_boxes(tool_box_names: List[str]) -> List[Dict[str, Any]]:
+def load_tools_from_tool_boxes(
+    tool_box_names: List[str],
+) -> Tuple[Dict[str, Any], ...]:
     """
     Load and combine tools from multiple tool boxes.
 
+    Tools are served from the shared tool registry, which reads the tool
+    configs once and reloads them when they change. The same tuple is
+    returned for the same tool boxes until then.
+
     Args:
         tool_box_names: List of tool box names to load tools from
 
     Returns:
-        List[Dict[str, Any]]: Flat list of all tool configurations
+        Tuple[Dict[str, Any], ...]: All tool configurations
     """
-    all_tools: List[Dict[str, Any]] = []
-
-    for tool_box_name in tool_box_names:
-        try:
-            tools = load_tools_from_tool_box(tool_box_name)
-            all_tools.extend(tools)
-        except ValueError:
-            # Skip invalid tool boxes
-            continue
-
-    # Deduplicate tools by name
-    unique_tools: Dict[str, Dict[str, Any]] = {}
-    for tool in all_tools:
-        if "name" in tool:
-            unique_tools[tool["name"]] = tool
+    try:
+        config_dir = get_tool_configs_directory()
+    except ValueError:
+        # Without a tool configs directory every tool box is unknown
+        return ()
 
-    return list(unique_tools.values())
+    return get_tool_registry().get_tools(config_dir, tool_box_names)
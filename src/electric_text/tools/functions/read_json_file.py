@@ -0,0 +1,19 @@
+import json
+from typing import Any
+
+
+def read_json_file(path: str) -> Any:
+    """
+    Read a JSON file, treating missing or malformed files as empty.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Any: The decoded JSON value, or None if it could not be read
+    """
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
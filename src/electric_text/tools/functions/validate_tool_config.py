@@ -0,0 +1,21 @@
+from typing import Any
+
+
+def validate_tool_config(tool_config: Any) -> bool:
+    """
+    Validate a tool configuration.
+
+    Args:
+        tool_config: Tool configuration to validate
+
+    Returns:
+        bool: True if it has a string name and description and a parameters object
+    """
+    if not isinstance(tool_config, dict):
+        return False
+
+    return (
+        isinstance(tool_config.get("name"), str)
+        and isinstance(tool_config.get("description"), str)
+        and isinstance(tool_config.get("parameters"), dict)
+    )
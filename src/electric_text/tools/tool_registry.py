@@ -0,0 +1,74 @@
+import time
+from typing import Any, Dict, List, Tuple
+
+from electric_text.tools.data.tool_catalog import ToolCatalog
+from electric_text.tools.functions.build_tool_catalog import build_tool_catalog
+from electric_text.tools.functions.combine_tool_boxes import combine_tool_boxes
+from electric_text.tools.functions.is_tool_catalog_current import (
+    is_tool_catalog_current,
+)
+
+
+class ToolRegistry:
+    """Caches tool boxes and their tools across requests.
+
+    Tool files are read once per catalog. They are re-stat'ed at most every
+    check_interval_s seconds, and the catalog is rebuilt when any of them
+    changed. Each combination of tool boxes resolves to the same tuple until
+    then, which lets providers cache their conversions of it.
+    """
+
+    def __init__(self, check_interval_s: float = 1.0) -> None:
+        self.check_interval_s = check_interval_s
+        self.catalogs: Dict[str, ToolCatalog] = {}
+        self.checked_at: Dict[str, float] = {}
+        self.selections: Dict[
+            Tuple[str, Tuple[str, ...]], Tuple[Dict[str, Any], ...]
+        ] = {}
+
+    def get_catalog(self, config_dir: str) -> ToolCatalog:
+        """Get the catalog for a directory, rebuilding it if its files changed."""
+        now = time.monotonic()
+        catalog = self.catalogs.get(config_dir)
+        if (
+            catalog is not None
+            and now - self.checked_at[config_dir] < self.check_interval_s
+        ):
+            return catalog
+
+        self.checked_at[config_dir] = now
+        if catalog is not None and is_tool_catalog_current(catalog):
+            return catalog
+
+        catalog = build_tool_catalog(config_dir)
+        self.catalogs[config_dir] = catalog
+        self.selections = {
+            key: tools for key, tools in self.selections.items() if key[0] != config_dir
+        }
+        return catalog
+
+    def get_tool_box(self, config_dir: str, tool_box_name: str) -> List[Dict[str, Any]]:
+        """
+        Get the tools in one tool box.
+
+        Raises:
+            ValueError: If the tool box doesn't exist or is invalid
+        """
+        catalog = self.get_catalog(config_dir)
+        if tool_box_name not in catalog.tool_boxes:
+            raise ValueError(f"Tool box not found: {tool_box_name}")
+
+        return catalog.tool_boxes[tool_box_name]
+
+    def get_tools(
+        self, config_dir: str, tool_box_names: List[str]
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Get the combined tools of several tool boxes, skipping unknown boxes."""
+        catalog = self.get_catalog(config_dir)
+        key = (config_dir, tuple(tool_box_names))
+        tools = self.selections.get(key)
+        if tools is None:
+            tools = combine_tool_boxes(catalog, tool_box_names)
+            self.selections[key] = tools
+
+        return tools
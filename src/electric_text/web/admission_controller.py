@@ -0,0 +1,146 @@
+import asyncio
+import time
+from typing import Callable
+
+from electric_text.web.admission_waiter import AdmissionWaiter
+from electric_text.web.data.admission import Admission
+from electric_text.web.data.connection_settings import ConnectionSettings
+from electric_text.web.data.priority import Priority
+
+
+class AdmissionController:
+    """Keeps the generations running against each provider within a limit.
+
+    Each provider runs at most max_provider_generations generations at once
+    (or its provider_limits entry). Further generations wait in a queue of
+    at most admission_queue_size, and start in priority order, oldest first
+    within a priority, as slots are released. A generation that cannot
+    start within admission_timeout_s is refused rather than left waiting,
+    so the latency of the ones that do start stays bounded when a provider
+    slows down. When the queue is full, a generation of higher priority
+    than the lowest waiting one takes its place and the newest of those is
+    refused; otherwise the new generation is.
+    """
+
+    def __init__(
+        self,
+        settings: ConnectionSettings,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.settings = settings
+        self.clock = clock
+        self.running: dict[str, int] = {}
+        self.waiting: dict[str, list[AdmissionWaiter]] = {}
+        self.arrivals = 0
+        self.admitted = 0
+        self.timed_out = 0
+        self.shed = 0
+        self.rejected = 0
+
+    def get_limit(self, provider_name: str) -> int:
+        """Get how many generations may run against a provider at once."""
+        return self.settings.provider_limits.get(
+            provider_name, self.settings.max_provider_generations
+        )
+
+    async def admit(self, provider_name: str, priority: Priority) -> Admission | None:
+        """Wait for a slot against a provider.
+
+        Args:
+            provider_name: The provider the generation calls
+            priority: How soon the generation should start
+
+        Returns:
+            The admission, to be released once the generation ends, or None
+            if the generation was refused
+        """
+        started = self.clock()
+        waiting = self.waiting.setdefault(provider_name, [])
+        if not waiting and self.running.get(provider_name, 0) < self.get_limit(
+            provider_name
+        ):
+            return self.grant(provider_name, priority, started)
+
+        if len(waiting) >= self.settings.admission_queue_size:
+            lowest = min(waiting, key=AdmissionWaiter.get_rank, default=None)
+            if lowest is None or lowest.priority >= priority:
+                self.rejected += 1
+                return None
+            waiting.remove(lowest)
+            if not lowest.is_admitted.done():
+                lowest.is_admitted.set_result(False)
+                self.shed += 1
+
+        self.arrivals += 1
+        waiter = AdmissionWaiter(priority, self.arrivals)
+        waiting.append(waiter)
+        try:
+            async with asyncio.timeout(self.settings.admission_timeout_s):
+                is_admitted = await waiter.is_admitted
+        except TimeoutError:
+            self.withdraw(provider_name, waiter)
+            self.timed_out += 1
+            return None
+        except asyncio.CancelledError:
+            self.withdraw(provider_name, waiter)
+            raise
+
+        if not is_admitted:
+            return None
+        self.admitted += 1
+        return Admission(provider_name, priority, self.clock() - started)
+
+    def withdraw(self, provider_name: str, waiter: AdmissionWaiter) -> None:
+        """Take a waiter that stopped waiting out of line."""
+        waiting = self.waiting[provider_name]
+        if waiter in waiting:
+            waiting.remove(waiter)
+        elif not waiter.is_admitted.cancelled() and waiter.is_admitted.result():
+            # Granted just as the wait ended: pass the slot on
+            self.running[provider_name] -= 1
+            self.admit_waiting(provider_name)
+
+    def grant(
+        self, provider_name: str, priority: Priority, started: float
+    ) -> Admission:
+        """Take a free slot right away."""
+        self.running[provider_name] = self.running.get(provider_name, 0) + 1
+        self.admitted += 1
+        return Admission(provider_name, priority, self.clock() - started)
+
+    def release(self, admission: Admission) -> None:
+        """Give an admission's slot to the next waiting generation.
+
+        Releasing an admission a second time does nothing.
+        """
+        if admission.is_released:
+            return
+        admission.is_released = True
+        self.running[admission.provider_name] -= 1
+        self.admit_waiting(admission.provider_name)
+
+    def admit_waiting(self, provider_name: str) -> None:
+        """Start waiting generations while their provider has free slots."""
+        waiting = self.waiting.get(provider_name, [])
+        while waiting and self.running.get(provider_name, 0) < self.get_limit(
+            provider_name
+        ):
+            next_waiter = max(waiting, key=AdmissionWaiter.get_rank)
+            waiting.remove(next_waiter)
+            if next_waiter.is_admitted.done():
+                continue  # Gave up waiting, and is yet to withdraw
+            self.running[provider_name] = self.running.get(provider_name, 0) + 1
+            next_waiter.is_admitted.set_result(True)
+
+    def get_gauges(self) -> dict[str, int]:
+        """Report running and waiting generations, and how many were turned away."""
+        return {
+            "running_generations": sum(self.running.values()),
+            "waiting_generations": sum(
+                len(waiting) for waiting in self.waiting.values()
+            ),
+            "admitted_generations": self.admitted,
+            "timed_out_generations": self.timed_out,
+            "shed_generations": self.shed,
+            "rejected_generations": self.rejected,
+        }
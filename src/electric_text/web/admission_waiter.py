@@ -0,0 +1,22 @@
+import asyncio
+
+from electric_text.web.data.priority import Priority
+
+
+class AdmissionWaiter:
+    """A generation waiting for a slot against its provider.
+
+    arrival orders waiters of the same priority. is_admitted resolves to
+    True when the waiter is given a slot, or False when it is shed.
+    """
+
+    def __init__(self, priority: Priority, arrival: int) -> None:
+        self.priority = priority
+        self.arrival = arrival
+        self.is_admitted: asyncio.Future[bool] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+    def get_rank(self) -> tuple[Priority, int]:
+        """Get the waiter's place in line: the highest rank starts first."""
+        return (self.priority, -self.arrival)
@@ -0,0 +1,247 @@
+import time
+from typing import Callable
+
+from electric_text.web.admission_controller import AdmissionController
+from electric_text.web.data.connection_settings import ConnectionSettings
+from electric_text.web.data.prompt_outcome import PromptOutcome
+from electric_text.web.functions.is_trivial_extension import is_trivial_extension
+from electric_text.web.stream_state import StreamState
+
+
+class ConnectionManager:
+    """Keeps the web server's response streams within fixed limits.
+
+    At most max_connections streams are open at once; a new one is refused
+    once the limit is reached, after first closing any that have gone idle.
+    A stream is idle when it has no prompt running and has seen no prompt
+    or response for idle_timeout_s, as happens with abandoned tabs. Each
+    stream's prompt queue is bounded, so a client that floods prompts is
+    refused rather than buffered.
+
+    Streams are built for type-ahead: each prompt supersedes the one before
+    it. A prompt that only adds trailing whitespace or punctuation reuses
+    the response already streaming; any other prompt cancels it right away.
+    Generations on one stream start at most once every restart_interval_s.
+
+    A stream outlives the HTTP connection relaying it. When the browser
+    disconnects, the stream is detached and its generation pauses; a
+    reconnect carrying Last-Event-ID within resume_timeout_s reattaches it
+    and is sent only the events it missed. Otherwise it is closed.
+
+    Up to max_watchers more subscribers may follow a stream's responses.
+    They read at their own pace and never slow the generation down; one
+    that falls further behind than the replay buffer reaches is dropped.
+
+    Generations, from streams and the JSON API alike, are started through
+    admission, which limits how many run against each provider at once.
+    """
+
+    def __init__(
+        self,
+        settings: ConnectionSettings,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.settings = settings
+        self.clock = clock
+        self.admission = AdmissionController(settings, clock)
+        self.connections: dict[str, StreamState] = {}
+        self.evicted = 0
+        self.rejected_connections = 0
+        self.rejected_prompts = 0
+        self.reused_prompts = 0
+        self.superseded_prompts = 0
+        self.resumed_streams = 0
+        self.rejected_watchers = 0
+        self.dropped_watchers = 0
+
+    def open(self, connection_id: str) -> StreamState | None:
+        """Open a stream, replacing an earlier one with the same id.
+
+        Returns:
+            The new stream's state, or None if the server is full
+        """
+        previous = self.connections.get(connection_id)
+        if previous is not None:
+            self.close(connection_id, previous)
+
+        self.evict_idle()
+        if len(self.connections) >= self.settings.max_connections:
+            self.rejected_connections += 1
+            return None
+
+        state = StreamState(
+            self.settings.prompt_queue_size,
+            self.settings.replay_events,
+            self.clock(),
+        )
+        self.connections[connection_id] = state
+        return state
+
+    def resume(self, connection_id: str, last_event_id: int) -> StreamState | None:
+        """Find an open stream that can resend every event after last_event_id.
+
+        Returns:
+            The stream's state, or None if there is no such stream
+        """
+        state = self.connections.get(connection_id)
+        if state is None or self.is_expired(state):
+            return None
+        if not state.replay.can_resume(last_event_id):
+            return None
+
+        self.resumed_streams += 1
+        return state
+
+    def attach(self, state: StreamState) -> int:
+        """Make a new event stream the one relaying a stream's events.
+
+        Returns:
+            The event stream's consumer number
+        """
+        state.consumer += 1
+        state.is_attached = True
+        self.touch(state)
+        return state.consumer
+
+    def detach(self, state: StreamState, consumer: int) -> None:
+        """Record that an event stream stopped relaying, unless it was replaced."""
+        if state.consumer == consumer:
+            state.is_attached = False
+            self.touch(state)
+
+    def watch(self, state: StreamState) -> bool:
+        """Add a watcher to a stream.
+
+        Returns:
+            False if the stream already has max_watchers watchers
+        """
+        if state.watchers >= self.settings.max_watchers:
+            self.rejected_watchers += 1
+            return False
+
+        state.watchers += 1
+        return True
+
+    def unwatch(self, state: StreamState, is_dropped: bool) -> None:
+        """Remove a watcher from a stream, counting it if it fell behind."""
+        state.watchers -= 1
+        if is_dropped:
+            self.dropped_watchers += 1
+
+    def get(self, connection_id: str) -> StreamState | None:
+        """Get an open stream, marking it active."""
+        state = self.connections.get(connection_id)
+        if state is not None:
+            self.touch(state)
+        return state
+
+    def touch(self, state: StreamState) -> None:
+        """Mark a stream active now."""
+        state.last_active = self.clock()
+
+    def submit(self, state: StreamState, prompt: str) -> PromptOutcome:
+        """Queue a prompt on a stream, superseding the one before it.
+
+        Returns:
+            REUSED if the latest prompt's response already answers it,
+            REJECTED if prompt_queue_size prompts are already waiting,
+            QUEUED otherwise (cancelling the running generation)
+        """
+        if state.latest_prompt is not None and is_trivial_extension(
+            state.latest_prompt, prompt
+        ):
+            self.reused_prompts += 1
+            return PromptOutcome.REUSED
+
+        if state.queue.full():
+            self.rejected_prompts += 1
+            return PromptOutcome.REJECTED
+
+        if state.task is not None and state.task.cancel():
+            state.is_superseded = True
+            self.superseded_prompts += 1
+
+        state.latest_prompt = prompt
+        state.queue.put_nowait({"type": "prompt", "data": prompt})
+        return PromptOutcome.QUEUED
+
+    def cancel(self, state: StreamState) -> bool:
+        """Cancel a stream's running generation and any prompts waiting.
+
+        Returns:
+            False if no generation was running
+        """
+        state.is_cancelled = True
+        state.latest_prompt = None
+        while not state.queue.empty():
+            state.queue.get_nowait()
+
+        return state.task is not None and state.task.cancel()
+
+    def get_restart_delay(self, state: StreamState) -> float:
+        """Get how long a stream must wait before starting another generation."""
+        ready_at = state.last_started + self.settings.restart_interval_s
+        return max(0.0, ready_at - self.clock())
+
+    def start(self, state: StreamState) -> None:
+        """Record that a stream started a generation."""
+        state.last_started = self.clock()
+        state.last_active = state.last_started
+
+    def is_expired(self, state: StreamState) -> bool:
+        """Check whether a stream was closed, abandoned, or has gone idle."""
+        idle_s = self.clock() - state.last_active
+        return (
+            state.is_closed
+            or (not state.is_attached and idle_s > self.settings.resume_timeout_s)
+            or (state.task is None and idle_s > self.settings.idle_timeout_s)
+        )
+
+    def close(self, connection_id: str, state: StreamState) -> None:
+        """Close a stream, cancelling its runner and running prompt."""
+        state.is_closed = True
+        state.replay.notify()
+        if state.runner is not None:
+            state.runner.cancel()
+        if state.task is not None:
+            state.task.cancel()
+        if self.connections.get(connection_id) is state:
+            del self.connections[connection_id]
+
+    def evict_idle(self) -> int:
+        """Close every expired stream.
+
+        Returns:
+            The number of streams closed
+        """
+        expired = [
+            (connection_id, state)
+            for connection_id, state in self.connections.items()
+            if self.is_expired(state)
+        ]
+        for connection_id, state in expired:
+            self.close(connection_id, state)
+
+        self.evicted += len(expired)
+        return len(expired)
+
+    def get_gauges(self) -> dict[str, int]:
+        """Report current usage and how much work was turned away."""
+        states = list(self.connections.values())
+        return {
+            "connections": len(states),
+            "max_connections": self.settings.max_connections,
+            "streaming": sum(state.task is not None for state in states),
+            "detached": sum(not state.is_attached for state in states),
+            "watchers": sum(state.watchers for state in states),
+            "queued_prompts": sum(state.queue.qsize() for state in states),
+            "evicted": self.evicted,
+            "rejected_connections": self.rejected_connections,
+            "rejected_prompts": self.rejected_prompts,
+            "reused_prompts": self.reused_prompts,
+            "superseded_prompts": self.superseded_prompts,
+            "resumed_streams": self.resumed_streams,
+            "rejected_watchers": self.rejected_watchers,
+            "dropped_watchers": self.dropped_watchers,
+            **self.admission.get_gauges(),
+        }
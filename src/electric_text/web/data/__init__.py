@@ -0,0 +1,13 @@
+from electric_text.web.data.admission import Admission
+from electric_text.web.data.connection_settings import ConnectionSettings
+from electric_text.web.data.generation_request import GenerationRequest
+from electric_text.web.data.priority import Priority
+from electric_text.web.data.prompt_outcome import PromptOutcome
+
+__all__ = [
+    "Admission",
+    "ConnectionSettings",
+    "GenerationRequest",
+    "Priority",
+    "PromptOutcome",
+]
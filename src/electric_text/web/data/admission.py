@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from electric_text.web.data.priority import Priority
+
+
+@dataclass
+class Admission:
+    """A generation's slot against its provider, held until released.
+
+    Args:
+        provider_name: The provider the generation calls
+        priority: The priority the generation waited with
+        waited_s: Seconds the generation waited for its slot
+        is_released: Whether the slot was given back
+    """
+
+    provider_name: str
+    priority: Priority
+    waited_s: float
+    is_released: bool = False
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ConnectionSettings:
+    """Limits on the web server's streaming connections and API requests.
+
+    Args:
+        max_connections: Maximum number of open response streams
+        prompt_queue_size: Maximum number of prompts waiting on one stream
+        idle_timeout_s: Seconds a stream may go without a prompt or a
+            response before it is closed
+        heartbeat_s: Seconds between keep-alive comments on a quiet stream
+        restart_interval_s: Minimum seconds between starting generations on
+            one stream; prompts arriving sooner wait, and only the newest runs
+        flush_interval_s: Longest time streamed output is held back so that
+            bursts go out as one write (0 sends every update on its own)
+        flush_chars: Amount of new output that is sent without waiting
+        replay_events: Number of recent events kept per stream for browsers
+            that reconnect with Last-Event-ID
+        resume_timeout_s: Seconds a disconnected stream, and any generation
+            it is running, waits for the browser to reconnect
+        max_watchers: Maximum number of extra subscribers following one
+            stream's responses
+        max_request_bytes: Largest JSON API request body accepted
+        max_provider_generations: Maximum number of generations running
+            against one provider at once
+        provider_limits: Per-provider overrides of max_provider_generations
+        admission_queue_size: Maximum number of generations waiting for one
+            provider; a full queue sheds its lowest-priority waiter
+        admission_timeout_s: Seconds a generation may wait for its provider
+            before it is refused
+    """
+
+    max_connections: int = 100
+    prompt_queue_size: int = 4
+    idle_timeout_s: float = 300.0
+    heartbeat_s: float = 15.0
+    restart_interval_s: float = 1.0
+    flush_interval_s: float = 0.03
+    flush_chars: int = 1024
+    replay_events: int = 1000
+    resume_timeout_s: float = 30.0
+    max_watchers: int = 8
+    max_request_bytes: int = 65536
+    max_provider_generations: int = 8
+    provider_limits: dict[str, int] = field(default_factory=dict)
+    admission_queue_size: int = 32
+    admission_timeout_s: float = 10.0
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from electric_text.prompting.data.output_format import OutputFormat
+from electric_text.web.data.priority import Priority
+
+
+@dataclass(frozen=True)
+class GenerationRequest:
+    """A generation requested through the JSON API.
+
+    Args:
+        prompt: The text to be processed
+        model: The model to use, as "provider:model" or a shorthand
+        prompt_name: Prompt config supplying the system message and, for
+            structured prompts, the output schema
+        tool_boxes: Comma-separated tool box names
+        max_tokens: Maximum number of tokens to generate
+        stream: Whether to stream the response as NDJSON
+        output_format: FULL or DELTA records when streaming
+        priority: How soon the generation starts while its provider is busy
+    """
+
+    prompt: str
+    model: str
+    prompt_name: str | None = None
+    tool_boxes: str | None = None
+    max_tokens: int | None = None
+    stream: bool = False
+    output_format: OutputFormat = OutputFormat.FULL
+    priority: Priority = Priority.NORMAL
@@ -0,0 +1,13 @@
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """How soon a generation waiting for its provider is started.
+
+    Higher priorities start first, and are the last to be shed when the
+    wait queue is full.
+    """
+
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
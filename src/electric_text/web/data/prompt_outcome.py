@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class PromptOutcome(Enum):
+    """What happened to a prompt submitted on a response stream."""
+
+    QUEUED = "queued"
+    REUSED = "reused"
+    REJECTED = "rejected"
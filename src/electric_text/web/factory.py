@@ -1,10 +1,16 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 from starlette.applications import Starlette
 from starlette.responses import Response
 from starlette.staticfiles import StaticFiles
+from electric_text.prompting.functions.get_client_pool import get_client_pool
 from electric_text.web.routes import routes
+from electric_text.web.functions.get_connection_manager import get_connection_manager
 from electric_text.web.functions.get_log_level import get_log_level
+from electric_text.web.functions.sweep_connections import sweep_connections
 
 
 def setup_logging() -> None:
@@ -15,11 +21,27 @@ def setup_logging() -> None:
     )
 
 
+@asynccontextmanager
+async def lifespan(app: Starlette) -> AsyncIterator[None]:
+    # Prompts share keep-alive clients for as long as the server runs
+    client_pool = get_client_pool()
+    client_pool.enable()
+    # Streams the browser disconnected from are closed once they can no
+    # longer be resumed
+    sweeper = asyncio.create_task(sweep_connections(get_connection_manager()))
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        await client_pool.aclose()
+
+
 def create_app() -> Starlette:
     setup_logging()
 
     server = Starlette(
         routes=routes,
+        lifespan=lifespan,
         middleware=[],
         exception_handlers={
             Exception: lambda request, exc: Response(
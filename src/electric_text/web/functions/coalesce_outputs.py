@@ -0,0 +1,64 @@
+import asyncio
+from typing import AsyncGenerator, AsyncIterator
+
+from electric_text.prompting.data.system_output import SystemOutput
+from electric_text.web.functions.get_output_length import get_output_length
+
+
+async def coalesce_outputs(
+    outputs: AsyncIterator[SystemOutput], interval_s: float, max_chars: int
+) -> AsyncGenerator[SystemOutput, None]:
+    """Merge bursts of streamed output updates into fewer, larger ones.
+
+    Updates are cumulative, so merging a burst means passing on only its
+    newest update. An update is passed on at once if interval_s has passed
+    since the last one (so the first token is never held back) or if it
+    adds max_chars or more; otherwise it is held until the window closes,
+    a newer update replaces it, or the stream ends. At most one update is
+    read ahead, so a slow consumer still slows the stream.
+
+    Args:
+        outputs: Output updates, each holding everything generated so far
+        interval_s: Longest time an update is held back
+        max_chars: Growth in streamed text that is passed on without waiting
+
+    Yields:
+        SystemOutput: Output updates, ending with the last one
+    """
+    loop = asyncio.get_running_loop()
+    iterator = aiter(outputs)
+    reading: asyncio.Future[SystemOutput] | None = None
+    held: SystemOutput | None = None
+    flushed_at = float("-inf")
+    flushed_length = 0
+
+    try:
+        while True:
+            if reading is None:
+                reading = asyncio.ensure_future(anext(iterator))
+            timeout = None
+            if held is not None:
+                timeout = max(0.0, flushed_at + interval_s - loop.time())
+
+            done, _ = await asyncio.wait({reading}, timeout=timeout)
+            if done:
+                finished, reading = reading, None
+                try:
+                    held = finished.result()
+                except StopAsyncIteration:
+                    break
+
+            # Nothing new means the window closed while the stream was quiet
+            assert held is not None
+            grown = get_output_length(held) - flushed_length
+            if loop.time() - flushed_at >= interval_s or grown >= max_chars:
+                flushed_at, flushed_length = loop.time(), get_output_length(held)
+                output, held = held, None
+                yield output
+
+        if held is not None:
+            yield held
+    finally:
+        if reading is not None:
+            reading.cancel()
+            await asyncio.wait({reading})
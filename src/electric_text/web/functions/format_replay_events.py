@@ -0,0 +1,13 @@
+def format_replay_events(events: list[tuple[int, str]]) -> str:
+    """Join numbered server-sent events into one chunk, each with its id.
+
+    Every event carries its own id, so a browser that loses the connection
+    partway through a chunk reports exactly which events it received.
+
+    Args:
+        events: (id, event) pairs, each event terminated by a blank line
+
+    Returns:
+        str: The events with an "id:" field prepended to each
+    """
+    return "".join(f"id: {event_id}\n{event}" for event_id, event in events)
@@ -0,0 +1,15 @@
+def format_sse_event(event: str, data: str) -> str:
+    """Format a server-sent event.
+
+    Each line of data gets its own "data:" field, so multi-line data
+    arrives in the browser exactly as it was sent.
+
+    Args:
+        event: The event name
+        data: The event data
+
+    Returns:
+        str: The event, terminated by a blank line
+    """
+    fields = "".join(f"data: {line}\n" for line in data.split("\n"))
+    return f"event: {event}\n{fields}\n"
@@ -0,0 +1,17 @@
+import os
+from functools import lru_cache
+
+from electric_text.web.connection_manager import ConnectionManager
+from electric_text.web.functions.get_connection_settings import (
+    get_connection_settings,
+)
+
+
+@lru_cache(maxsize=1)
+def get_connection_manager() -> ConnectionManager:
+    """Get the process-wide connection manager.
+
+    Returns:
+        The shared ConnectionManager instance
+    """
+    return ConnectionManager(get_connection_settings(os.environ))
@@ -0,0 +1,90 @@
+from collections.abc import Mapping
+
+from electric_text.web.data.connection_settings import ConnectionSettings
+from electric_text.web.functions.parse_provider_limits import parse_provider_limits
+
+
+def get_connection_settings(environ: Mapping[str, str]) -> ConnectionSettings:
+    """Get the connection limits from the environment.
+
+    Args:
+        environ: Environment variables (ELECTRIC_TEXT_WEB_MAX_CONNECTIONS,
+            ELECTRIC_TEXT_WEB_PROMPT_QUEUE_SIZE, ELECTRIC_TEXT_WEB_IDLE_TIMEOUT_S,
+            ELECTRIC_TEXT_WEB_HEARTBEAT_S, ELECTRIC_TEXT_WEB_RESTART_INTERVAL_S,
+            ELECTRIC_TEXT_WEB_FLUSH_INTERVAL_S, ELECTRIC_TEXT_WEB_FLUSH_CHARS,
+            ELECTRIC_TEXT_WEB_REPLAY_EVENTS, ELECTRIC_TEXT_WEB_RESUME_TIMEOUT_S,
+            ELECTRIC_TEXT_WEB_MAX_WATCHERS, ELECTRIC_TEXT_WEB_MAX_REQUEST_BYTES,
+            ELECTRIC_TEXT_WEB_MAX_PROVIDER_GENERATIONS,
+            ELECTRIC_TEXT_WEB_PROVIDER_LIMITS,
+            ELECTRIC_TEXT_WEB_ADMISSION_QUEUE_SIZE and
+            ELECTRIC_TEXT_WEB_ADMISSION_TIMEOUT_S override the defaults)
+
+    Returns:
+        ConnectionSettings
+
+    Raises:
+        ValueError: If a value is not a number, or a provider limit is not
+            written as provider=number
+    """
+    defaults = ConnectionSettings()
+
+    return ConnectionSettings(
+        max_connections=int(
+            environ.get("ELECTRIC_TEXT_WEB_MAX_CONNECTIONS", defaults.max_connections)
+        ),
+        prompt_queue_size=int(
+            environ.get(
+                "ELECTRIC_TEXT_WEB_PROMPT_QUEUE_SIZE", defaults.prompt_queue_size
+            )
+        ),
+        idle_timeout_s=float(
+            environ.get("ELECTRIC_TEXT_WEB_IDLE_TIMEOUT_S", defaults.idle_timeout_s)
+        ),
+        heartbeat_s=float(
+            environ.get("ELECTRIC_TEXT_WEB_HEARTBEAT_S", defaults.heartbeat_s)
+        ),
+        restart_interval_s=float(
+            environ.get(
+                "ELECTRIC_TEXT_WEB_RESTART_INTERVAL_S", defaults.restart_interval_s
+            )
+        ),
+        flush_interval_s=float(
+            environ.get("ELECTRIC_TEXT_WEB_FLUSH_INTERVAL_S", defaults.flush_interval_s)
+        ),
+        flush_chars=int(
+            environ.get("ELECTRIC_TEXT_WEB_FLUSH_CHARS", defaults.flush_chars)
+        ),
+        replay_events=int(
+            environ.get("ELECTRIC_TEXT_WEB_REPLAY_EVENTS", defaults.replay_events)
+        ),
+        resume_timeout_s=float(
+            environ.get("ELECTRIC_TEXT_WEB_RESUME_TIMEOUT_S", defaults.resume_timeout_s)
+        ),
+        max_watchers=int(
+            environ.get("ELECTRIC_TEXT_WEB_MAX_WATCHERS", defaults.max_watchers)
+        ),
+        max_request_bytes=int(
+            environ.get(
+                "ELECTRIC_TEXT_WEB_MAX_REQUEST_BYTES", defaults.max_request_bytes
+            )
+        ),
+        max_provider_generations=int(
+            environ.get(
+                "ELECTRIC_TEXT_WEB_MAX_PROVIDER_GENERATIONS",
+                defaults.max_provider_generations,
+            )
+        ),
+        provider_limits=parse_provider_limits(
+            environ.get("ELECTRIC_TEXT_WEB_PROVIDER_LIMITS", "")
+        ),
+        admission_queue_size=int(
+            environ.get(
+                "ELECTRIC_TEXT_WEB_ADMISSION_QUEUE_SIZE", defaults.admission_queue_size
+            )
+        ),
+        admission_timeout_s=float(
+            environ.get(
+                "ELECTRIC_TEXT_WEB_ADMISSION_TIMEOUT_S", defaults.admission_timeout_s
+            )
+        ),
+    )
@@ -0,0 +1,15 @@
+from electric_text.prompting.data.system_output import SystemOutput
+
+
+def get_output_length(output: SystemOutput) -> int:
+    """Measure the streamed text of an output update.
+
+    Args:
+        output: An output update
+
+    Returns:
+        int: Characters of response text plus tool call argument JSON
+    """
+    text_length = len(output.text.content) if output.text else 0
+    tool_length = len(output.tool_call.inputs_json) if output.tool_call else 0
+    return text_length + tool_length
@@ -0,0 +1,40 @@
+import json
+from html import escape
+from typing import Any
+
+from electric_text.web.functions.format_sse_event import format_sse_event
+
+
+def get_response_events(record: dict[str, Any]) -> list[str]:
+    """Turn a delta output record into the events the prompt form renders.
+
+    Text and tool call argument deltas are appended to the response as
+    escaped HTML; a delta that rewrites what was sent before is preceded
+    by a "reset" event that clears it. Structured outputs carry no text,
+    so each completed data field is appended as a name and its JSON value.
+    The summary sends nothing, since the "complete" event ends the response.
+
+    Args:
+        record: A delta output record
+
+    Returns:
+        list[str]: Server-sent events, possibly empty
+    """
+    if record["type"] == "tool_call_start":
+        name = escape(record["name"])
+        return [format_sse_event("response", f"<div class='tool-call'>{name}</div>")]
+
+    if record["type"] == "field":
+        name = escape(record["name"])
+        value = escape(json.dumps(record["value"]))
+        field = f"<div class='data-field'><b>{name}</b>: {value}</div>"
+        return [format_sse_event("response", field)]
+
+    if record["type"] not in ("text_delta", "tool_call_delta"):
+        return []
+
+    response = format_sse_event("response", escape(record["delta"]))
+    if record.get("reset"):
+        return [format_sse_event("reset", ""), response]
+
+    return [response]
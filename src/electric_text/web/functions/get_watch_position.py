@@ -0,0 +1,22 @@
+from electric_text.web.replay_buffer import ReplayBuffer
+
+
+def get_watch_position(
+    replay: ReplayBuffer, response_start: int, last_event_id: int | None
+) -> int:
+    """Get where a new watcher starts reading a stream's events.
+
+    Args:
+        replay: The stream's replay buffer
+        response_start: The position just before the latest response began
+        last_event_id: The last event id a reconnecting watcher received
+
+    Returns:
+        int: last_event_id if every event after it is still kept, otherwise
+            response_start if it is, otherwise the newest event's id
+    """
+    if last_event_id is not None and replay.can_resume(last_event_id):
+        return last_event_id
+    if replay.can_resume(response_start):
+        return response_start
+    return replay.last_id
@@ -0,0 +1,12 @@
+import os
+
+from electric_text.prompting.functions.get_default_model import get_default_model
+
+
+def get_web_model() -> str:
+    """Get the model that prompts from the web UI are sent to.
+
+    Returns:
+        str: Model from ELECTRIC_TEXT_WEB_MODEL, defaults to the configured default model
+    """
+    return os.getenv("ELECTRIC_TEXT_WEB_MODEL") or get_default_model()
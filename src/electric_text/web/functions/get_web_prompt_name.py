@@ -0,0 +1,10 @@
+import os
+
+
+def get_web_prompt_name() -> str | None:
+    """Get the prompt that prompts from the web UI are run with.
+
+    Returns:
+        str | None: Prompt name from ELECTRIC_TEXT_WEB_PROMPT_NAME, None if not set
+    """
+    return os.getenv("ELECTRIC_TEXT_WEB_PROMPT_NAME") or None
@@ -0,0 +1,21 @@
+import unicodedata
+
+
+def is_trivial_extension(previous: str, current: str) -> bool:
+    """Check whether a prompt only adds trailing whitespace or punctuation to another.
+
+    Args:
+        previous: The earlier prompt
+        current: The new prompt
+
+    Returns:
+        bool: True if current is previous followed by nothing but whitespace
+            and punctuation (including nothing at all)
+    """
+    if not current.startswith(previous):
+        return False
+
+    return all(
+        char.isspace() or unicodedata.category(char).startswith("P")
+        for char in current[len(previous) :]
+    )
@@ -0,0 +1,79 @@
+from typing import Any
+
+from electric_text.prompting.data.output_format import OutputFormat
+from electric_text.web.data.generation_request import GenerationRequest
+from electric_text.web.data.priority import Priority
+
+
+def parse_generation_request(body: Any, default_model: str) -> GenerationRequest:
+    """Validate a JSON API request body.
+
+    Args:
+        body: The decoded JSON body: {"prompt": str, "model"?: str,
+            "prompt_name"?: str, "tool_boxes"?: [str], "max_tokens"?: int,
+            "stream"?: bool, "format"?: "full" | "delta",
+            "priority"?: "low" | "normal" | "high"}
+        default_model: Model used when the body names none
+
+    Returns:
+        GenerationRequest
+
+    Raises:
+        ValueError: If the body is not an object or a field has the wrong type
+    """
+    if not isinstance(body, dict):
+        raise ValueError("Request body must be a JSON object")
+
+    prompt = body.get("prompt")
+    if not isinstance(prompt, str) or not prompt:
+        raise ValueError("prompt must be a non-empty string")
+
+    model = body.get("model", default_model)
+    if not isinstance(model, str) or not model:
+        raise ValueError("model must be a non-empty string")
+
+    prompt_name = body.get("prompt_name")
+    if prompt_name is not None and not isinstance(prompt_name, str):
+        raise ValueError("prompt_name must be a string")
+
+    tool_boxes = body.get("tool_boxes")
+    if tool_boxes is not None and (
+        not isinstance(tool_boxes, list)
+        or not all(isinstance(name, str) for name in tool_boxes)
+    ):
+        raise ValueError("tool_boxes must be a list of strings")
+
+    max_tokens = body.get("max_tokens")
+    if max_tokens is not None and (
+        not isinstance(max_tokens, int)
+        or isinstance(max_tokens, bool)
+        or max_tokens < 1
+    ):
+        raise ValueError("max_tokens must be a positive integer")
+
+    stream = body.get("stream", False)
+    if not isinstance(stream, bool):
+        raise ValueError("stream must be true or false")
+
+    formats = {output_format.value: output_format for output_format in OutputFormat}
+    format_name = body.get("format", OutputFormat.FULL.value)
+    output_format = formats.get(format_name) if isinstance(format_name, str) else None
+    if output_format is None:
+        raise ValueError(f"format must be one of: {', '.join(formats)}")
+
+    priorities = {priority.name.lower(): priority for priority in Priority}
+    priority_name = body.get("priority", Priority.NORMAL.name.lower())
+    priority = priorities.get(priority_name) if isinstance(priority_name, str) else None
+    if priority is None:
+        raise ValueError(f"priority must be one of: {', '.join(priorities)}")
+
+    return GenerationRequest(
+        prompt=prompt,
+        model=model,
+        prompt_name=prompt_name,
+        tool_boxes=",".join(tool_boxes) if tool_boxes else None,
+        max_tokens=max_tokens,
+        stream=stream,
+        output_format=output_format,
+        priority=priority,
+    )
@@ -0,0 +1,13 @@
+def parse_last_event_id(value: str | None) -> int | None:
+    """Parse the Last-Event-ID header a reconnecting EventSource sends.
+
+    Args:
+        value: The header value, if the request had one
+
+    Returns:
+        int | None: The id of the last event the browser received, or None
+            if the header is missing or is not an id this server sent
+    """
+    if value is None or not value.strip().isdigit():
+        return None
+    return int(value)
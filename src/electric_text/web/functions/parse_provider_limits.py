@@ -0,0 +1,23 @@
+def parse_provider_limits(value: str) -> dict[str, int]:
+    """Parse per-provider generation limits written as "ollama=2,anthropic=16".
+
+    Args:
+        value: Comma-separated provider=limit pairs; empty for none
+
+    Returns:
+        dict[str, int]: The limit for each named provider
+
+    Raises:
+        ValueError: If a pair is not a provider name and a positive number
+    """
+    limits = {}
+    for pair in value.split(","):
+        if not pair.strip():
+            continue
+        provider_name, separator, limit = pair.partition("=")
+        if not separator or not provider_name.strip() or not limit.strip().isdigit():
+            raise ValueError(f"Provider limit must be provider=number: {pair.strip()}")
+        if int(limit) < 1:
+            raise ValueError(f"Provider limit must be positive: {pair.strip()}")
+        limits[provider_name.strip()] = int(limit)
+    return limits
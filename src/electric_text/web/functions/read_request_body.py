@@ -0,0 +1,27 @@
+from starlette.requests import Request
+
+
+async def read_request_body(request: Request, max_bytes: int) -> bytes | None:
+    """Read a request body, giving up as soon as it grows past max_bytes.
+
+    A declared Content-Length over the limit is refused before anything is
+    read; otherwise the body is read chunk by chunk, so a client cannot make
+    the server buffer more than max_bytes.
+
+    Args:
+        request: The incoming request
+        max_bytes: The largest body accepted
+
+    Returns:
+        bytes | None: The body, or None if it is larger than max_bytes
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        return None
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            return None
+    return bytes(body)
@@ -0,0 +1,40 @@
+import json
+from contextlib import aclosing
+from typing import AsyncGenerator
+
+from electric_text.prompting.data.output_format import OutputFormat
+from electric_text.prompting.data.system_output import SystemOutput
+from electric_text.prompting.functions.output_conversion.format_output_records import (
+    format_output_records,
+)
+
+
+async def stream_generation_records(
+    outputs: AsyncGenerator[SystemOutput, None], output_format: OutputFormat
+) -> AsyncGenerator[str, None]:
+    """Turn streamed output updates into NDJSON lines for the JSON API.
+
+    The records are the CLI's --output-format full or delta records. A failure
+    after the response has started ends the stream with an error record,
+    since the status code has already been sent. The upstream stream is
+    closed as soon as this generator is, as when the caller disconnects.
+
+    Args:
+        outputs: Output updates, each holding everything generated so far
+        output_format: FULL or DELTA records
+
+    Yields:
+        str: One JSON record per line
+    """
+    async with (
+        aclosing(outputs),
+        aclosing(format_output_records(outputs, output_format)) as records,
+    ):
+        try:
+            async for record in records:
+                yield json.dumps(record) + "\n"
+        except Exception as e:
+            yield (
+                json.dumps({"type": "error", "error": f"{type(e).__name__}: {e}"})
+                + "\n"
+            )
@@ -0,0 +1,45 @@
+from typing import AsyncGenerator, AsyncIterator
+
+from electric_text.prompting.data.system_output import SystemOutput
+from electric_text.prompting.functions.output_conversion.get_output_deltas import (
+    get_output_deltas,
+)
+from electric_text.web.functions.get_response_events import get_response_events
+
+
+async def stream_response_events(
+    outputs: AsyncIterator[SystemOutput],
+) -> AsyncGenerator[list[str], None]:
+    """Turn streamed output updates into server-sent events.
+
+    The events for one update are yielded together, so each update costs
+    one write. Nothing is read ahead: the next update is only pulled from
+    outputs once the previous events have been consumed. Once outputs end,
+    the fields only the final update completes are sent too.
+
+    Args:
+        outputs: Output updates, each holding everything generated so far
+
+    Yields:
+        list[str]: The server-sent events for each update that changed what
+            the browser shows
+    """
+    previous: SystemOutput | None = None
+    async for output in outputs:
+        events = [
+            event
+            for record in get_output_deltas(previous, output)
+            for event in get_response_events(record)
+        ]
+        if events:
+            yield events
+        previous = output
+
+    if previous is not None:
+        events = [
+            event
+            for record in get_output_deltas(previous, previous, final=True)
+            for event in get_response_events(record)
+        ]
+        if events:
+            yield events
@@ -0,0 +1,18 @@
+import asyncio
+
+from electric_text.web.connection_manager import ConnectionManager
+
+
+async def sweep_connections(manager: ConnectionManager) -> None:
+    """Close expired streams every heartbeat_s until cancelled.
+
+    Streams the browser disconnected from have no event stream checking on
+    them, so without a sweep a paused generation would hold its upstream
+    connection until the next stream is opened.
+
+    Args:
+        manager: The connection manager to sweep
+    """
+    while True:
+        await asyncio.sleep(manager.settings.heartbeat_s)
+        manager.evict_idle()
@@ -1,25 +1,42 @@
 # ------------------------------
 #  Log Events
 # ------------------------------
+API_REQUEST_FAILED = "api_request_failed"
+API_REQUEST_INVALID = "api_request_invalid"
+API_REQUEST_RECEIVED = "api_request_received"
+API_REQUEST_TOO_LARGE = "api_request_too_large"
 EVENT_AWAITED = "event_awaited"
 EVENT_PROCESSED = "event_processed"
 EVENT_RECEIVED = "event_received"
 EVENT_STREAMED = "event_streamed"
+GENERATION_ADMITTED = "generation_admitted"
+GENERATION_REFUSED = "generation_refused"
+PROMPT_REJECTED = "prompt_rejected"
+PROMPT_REUSED = "prompt_reused"
 STREAM_CANCEL_RECEIVED = "stream_cancel_received"
 STREAM_CANCELED = "stream_canceled"
 STREAM_CLOSED = "stream_closed"
 STREAM_CREATED = "stream_created"
+STREAM_EVICTED = "stream_evicted"
 STREAM_FAILED = "stream_failed"
 STREAM_MISSING = "stream_missing"
 STREAM_QUEUED = "stream_queued"
+STREAM_REJECTED = "stream_rejected"
 STREAM_REMADE = "stream_remade"
 STREAM_REQUESTED = "stream_requested"
+STREAM_RESUMED = "stream_resumed"
 STREAM_STARTED = "stream_started"
+STREAM_WATCHED = "stream_watched"
 TASK_CANCEL_FAILED = "task_cancel_failed"
 TASK_CANCELED = "task_canceled"
 TASK_CANCELLED = "task_cancelled"
 TASK_CHUNK_STREAMED = "task_chunk_streamed"
 TASK_CLEARED = "task_cleared"
 TASK_COMPLETED = "task_completed"
+TASK_FAILED = "task_failed"
 TASK_MISSING = "task_missing"
+TASK_SUPERSEDED = "task_superseded"
+TASK_THROTTLED = "task_throttled"
 USER_TEXT_RECEIVED = "user_text_received"
+WATCHER_DROPPED = "watcher_dropped"
+WATCHER_REJECTED = "watcher_rejected"
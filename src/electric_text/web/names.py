@@ -13,3 +13,14 @@ SUBMIT_PROMPT = "/submit-prompt"
 # ------------------------------
 RESPONSE_STREAM = "/response-stream"
 CANCEL_STREAM = "/cancel-stream"
+WATCH_STREAM = "/watch-stream"
+
+# ------------------------------
+#  API
+# ------------------------------
+GENERATE_API = "/api/generate"
+
+# ------------------------------
+#  Monitoring
+# ------------------------------
+CONNECTION_STATS = "/connection-stats"
@@ -0,0 +1,65 @@
+import asyncio
+from collections import deque
+
+
+class ReplayBuffer:
+    """Numbered server-sent events of one response stream.
+
+    Events are numbered from 1 and the newest size of them are kept, so a
+    browser that reconnects with the id of the last event it received can
+    be sent everything it missed, and any number of readers can follow the
+    same events from their own positions. sent_id is the newest event
+    handed to the browser that owns the stream; publishing waits while a
+    published event is still unsent to it, so a slow or disconnected owner
+    pauses the model stream instead of buffering it. Other readers never
+    hold up publishing.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.events: deque[tuple[int, str]] = deque(maxlen=size)
+        self.last_id = 0
+        self.sent_id = 0
+        self.changed = asyncio.Event()
+
+    def notify(self) -> None:
+        """Wake everything waiting on changed."""
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+    async def publish(self, events: list[str]) -> None:
+        """Add events once every earlier event has been sent."""
+        while self.sent_id < self.last_id:
+            await self.changed.wait()
+        self.publish_nowait(events)
+
+    def publish_nowait(self, events: list[str]) -> None:
+        """Add events right away."""
+        for event in events:
+            self.last_id += 1
+            self.events.append((self.last_id, event))
+        self.notify()
+
+    def discard_unsent(self) -> None:
+        """Drop the events the owner was not sent.
+
+        Their ids are not reused, since other readers may have seen them.
+        """
+        while self.events and self.events[-1][0] > self.sent_id:
+            self.events.pop()
+        self.sent_id = self.last_id
+        self.notify()
+
+    def mark_sent(self, event_id: int) -> None:
+        """Record that a browser was sent every event up to event_id."""
+        if event_id > self.sent_id:
+            self.sent_id = event_id
+            self.notify()
+
+    def can_resume(self, event_id: int) -> bool:
+        """Check whether every event after event_id is still kept."""
+        first_id = self.events[0][0] if self.events else self.last_id + 1
+        return first_id - 1 <= event_id <= self.last_id
+
+    def get_after(self, event_id: int) -> list[tuple[int, str]]:
+        """Get the kept events newer than event_id, oldest first."""
+        return [event for event in self.events if event[0] > event_id]
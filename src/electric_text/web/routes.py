@@ -1,43 +1,106 @@
 import uuid
 import asyncio
+import json
 import logging
-from typing import AsyncGenerator, Dict, TypedDict, Any
+from contextlib import aclosing
+from html import escape
+from typing import AsyncGenerator
+from starlette.background import BackgroundTask
 from starlette.routing import Route
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, StreamingResponse
+from starlette.responses import (
+    HTMLResponse,
+    JSONResponse,
+    Response,
+    StreamingResponse,
+)
 
 from electric_text.web.names import (
     CANCEL_STREAM,
+    CONNECTION_STATS,
+    GENERATE_API,
     RESPONSE_STREAM,
     ROOT_PAGE,
     SUBMIT_PROMPT,
+    WATCH_STREAM,
 )
 
 from electric_text.web.logging import (
+    API_REQUEST_FAILED,
+    API_REQUEST_INVALID,
+    API_REQUEST_RECEIVED,
+    API_REQUEST_TOO_LARGE,
     EVENT_AWAITED,
     EVENT_PROCESSED,
     EVENT_RECEIVED,
     EVENT_STREAMED,
+    GENERATION_ADMITTED,
+    GENERATION_REFUSED,
+    PROMPT_REJECTED,
+    PROMPT_REUSED,
     STREAM_CANCEL_RECEIVED,
     STREAM_CANCELED,
     STREAM_CLOSED,
     STREAM_CREATED,
+    STREAM_EVICTED,
     STREAM_FAILED,
     STREAM_MISSING,
     STREAM_QUEUED,
+    STREAM_REJECTED,
     STREAM_REMADE,
     STREAM_REQUESTED,
+    STREAM_RESUMED,
     STREAM_STARTED,
+    STREAM_WATCHED,
     TASK_CANCEL_FAILED,
     TASK_CANCELED,
     TASK_CANCELLED,
     TASK_CHUNK_STREAMED,
     TASK_CLEARED,
     TASK_COMPLETED,
+    TASK_FAILED,
     TASK_MISSING,
+    TASK_SUPERSEDED,
+    TASK_THROTTLED,
     USER_TEXT_RECEIVED,
+    WATCHER_DROPPED,
+    WATCHER_REJECTED,
 )
 
+from electric_text.prompting.data.system_input import SystemInput
+from electric_text.prompting.functions.generate import generate
+from electric_text.prompting.functions.output_conversion.system_output_to_dict import (
+    system_output_to_dict,
+)
+from electric_text.prompting.functions.resolve_system_input import (
+    resolve_system_input,
+)
+from electric_text.web.admission_controller import AdmissionController
+from electric_text.web.data.admission import Admission
+from electric_text.web.data.connection_settings import ConnectionSettings
+from electric_text.web.data.priority import Priority
+from electric_text.web.data.prompt_outcome import PromptOutcome
+from electric_text.web.functions.coalesce_outputs import coalesce_outputs
+from electric_text.web.functions.format_replay_events import format_replay_events
+from electric_text.web.functions.format_sse_event import format_sse_event
+from electric_text.web.functions.get_connection_manager import (
+    get_connection_manager,
+)
+from electric_text.web.functions.get_web_model import get_web_model
+from electric_text.web.functions.get_watch_position import get_watch_position
+from electric_text.web.functions.get_web_prompt_name import get_web_prompt_name
+from electric_text.web.functions.parse_generation_request import (
+    parse_generation_request,
+)
+from electric_text.web.functions.parse_last_event_id import parse_last_event_id
+from electric_text.web.functions.read_request_body import read_request_body
+from electric_text.web.functions.stream_generation_records import (
+    stream_generation_records,
+)
+from electric_text.web.functions.stream_response_events import (
+    stream_response_events,
+)
+from electric_text.web.stream_state import StreamState
 from electric_text.web.views.nav import nav
 from electric_text.web.views.render_html import render_html
 from electric_text.web.views.container import container
@@ -47,19 +110,8 @@ from electric_text.web.views.prompt_form import prompt_form
 logger = logging.getLogger(__name__)
 
 
-class EventMessage(TypedDict):
-    type: str
-    data: Any
-
-
-class StreamState:
-    def __init__(self) -> None:
-        self.queue: asyncio.Queue[EventMessage] = asyncio.Queue()
-        self.task: asyncio.Task[None] | None = None
-        self.is_cancelled = False
-
-
-active_connections: Dict[str, StreamState] = {}
+# Sent on quiet streams so proxies keep them open; browsers ignore comments
+HEARTBEAT = ": heartbeat\n\n"
 
 
 def render_page(*, title: str, content: str) -> HTMLResponse:
@@ -102,24 +154,27 @@ async def submit_prompt(request: Request) -> HTMLResponse:
 
     logger.info(f"{USER_TEXT_RECEIVED} (cid: {connection_id})")
 
-    if connection_id not in active_connections:
+    manager = get_connection_manager()
+    state = manager.get(connection_id)
+    if state is None:
         log = f"{STREAM_MISSING} (cid: {connection_id})"
         logger.error(log)
         return HTMLResponse(log, status_code=404)
 
-    state = active_connections[connection_id]
-
     prev_cancelled = state.is_cancelled
     state.is_cancelled = False
     if prev_cancelled:
         logger.info(f"{STREAM_REMADE} (cid: {connection_id})")
 
-    await state.queue.put(
-        {
-            "type": "prompt",
-            "data": prompt,
-        }
-    )
+    outcome = manager.submit(state, prompt)
+    if outcome is PromptOutcome.REJECTED:
+        log = f"{PROMPT_REJECTED} (cid: {connection_id})"
+        logger.warning(log)
+        return HTMLResponse(log, status_code=429, headers={"Retry-After": "1"})
+
+    if outcome is PromptOutcome.REUSED:
+        logger.info(f"{PROMPT_REUSED} (cid: {connection_id})")
+        return HTMLResponse("Reused")
 
     logger.info(f"{STREAM_QUEUED} (cid: {connection_id})")
     return HTMLResponse("OK")
@@ -129,37 +184,57 @@ async def cancel_stream(request: Request) -> HTMLResponse:
     connection_id = request.query_params.get("connection_id")
     logger.info(f"{STREAM_CANCEL_RECEIVED} (cid: {connection_id})")
 
-    if connection_id not in active_connections:
+    manager = get_connection_manager()
+    state = manager.get(str(connection_id))
+    if state is None:
         log = f"{STREAM_MISSING} (cid: {connection_id})"
         logger.error(log)
         return HTMLResponse(log, status_code=404)
-
-    state = active_connections[connection_id]
-    state.is_cancelled = True
     logger.info(f"{STREAM_CANCELED} (cid: {connection_id})")
 
-    if state.task:
-        try:
-            state.task.cancel()
-            logger.info(f"{TASK_CANCELLED} (cid: {connection_id})")
-        except Exception:
-            log = f"{TASK_CANCEL_FAILED} (cid: {connection_id})"
-            logger.error(log)
-            return HTMLResponse(log, status_code=500)
-    else:
+    try:
+        cancelled = manager.cancel(state)
+    except Exception:
+        log = f"{TASK_CANCEL_FAILED} (cid: {connection_id})"
+        logger.error(log)
+        return HTMLResponse(log, status_code=500)
+
+    if not cancelled:
         log = f"{TASK_MISSING} (cid: {connection_id})"
         logger.warning(log)
         return HTMLResponse(log, status_code=404)
 
+    logger.info(f"{TASK_CANCELLED} (cid: {connection_id})")
     return HTMLResponse("Cancelled")
 
 
-async def response_stream(request: Request) -> StreamingResponse:
+async def response_stream(request: Request) -> Response:
     connection_id = str(request.query_params.get("connection_id"))
     logger.info(f"{STREAM_REQUESTED} (cid: {connection_id})")
 
-    new_stream_state = StreamState()
-    active_connections[connection_id] = new_stream_state
+    manager = get_connection_manager()
+
+    # A reconnecting EventSource picks up the stream it lost, if it still can
+    last_event_id = parse_last_event_id(request.headers.get("last-event-id"))
+    if last_event_id is not None:
+        state = manager.resume(connection_id, last_event_id)
+        if state is not None:
+            logger.info(
+                f"{STREAM_RESUMED} (cid: {connection_id}) (last_event_id: {last_event_id})"
+            )
+            return StreamingResponse(
+                event_stream(connection_id, state, last_event_id),
+                media_type="text/event-stream",
+            )
+
+    new_stream_state = manager.open(connection_id)
+    if new_stream_state is None:
+        log = (
+            f"{STREAM_REJECTED} (cid: {connection_id}) (gauges: {manager.get_gauges()})"
+        )
+        logger.warning(log)
+        return HTMLResponse(log, status_code=503, headers={"Retry-After": "5"})
+
     logger.info(f"{STREAM_CREATED} (cid: {connection_id})")
 
     return StreamingResponse(
@@ -168,72 +243,360 @@ async def response_stream(request: Request) -> StreamingResponse:
     )
 
 
+async def watch_stream(request: Request) -> Response:
+    connection_id = str(request.query_params.get("connection_id"))
+
+    manager = get_connection_manager()
+    state = manager.connections.get(connection_id)
+    if state is None or state.is_closed:
+        log = f"{STREAM_MISSING} (cid: {connection_id})"
+        logger.error(log)
+        return HTMLResponse(log, status_code=404)
+
+    if not manager.watch(state):
+        log = f"{WATCHER_REJECTED} (cid: {connection_id}) (watchers: {state.watchers})"
+        logger.warning(log)
+        return HTMLResponse(log, status_code=503, headers={"Retry-After": "5"})
+
+    last_event_id = parse_last_event_id(request.headers.get("last-event-id"))
+    position = get_watch_position(state.replay, state.response_start, last_event_id)
+    logger.info(f"{STREAM_WATCHED} (cid: {connection_id}) (position: {position})")
+
+    return StreamingResponse(
+        watch_events(connection_id, state, position),
+        media_type="text/event-stream",
+    )
+
+
+async def generate_api(request: Request) -> Response:
+    """Run one generation for another service, as JSON or streamed NDJSON."""
+    manager = get_connection_manager()
+    body = await read_request_body(request, manager.settings.max_request_bytes)
+    if body is None:
+        log = f"{API_REQUEST_TOO_LARGE} (limit: {manager.settings.max_request_bytes})"
+        logger.warning(log)
+        return JSONResponse({"error": "Request body too large"}, status_code=413)
+
+    try:
+        generation = parse_generation_request(json.loads(body), get_web_model())
+    except ValueError as e:
+        logger.warning(f"{API_REQUEST_INVALID} (error: {e})")
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+    logger.info(f"{API_REQUEST_RECEIVED} (model: {generation.model})")
+
+    try:
+        system_input = resolve_system_input(
+            SystemInput(
+                text_input=generation.prompt,
+                provider_name="",
+                model_name=generation.model,
+                max_tokens=generation.max_tokens,
+                prompt_name=generation.prompt_name,
+                stream=generation.stream,
+                tool_boxes=generation.tool_boxes,
+            )
+        )
+    except Exception as e:
+        return api_error(e)
+
+    provider_name = system_input.provider_name
+    admission = await manager.admission.admit(provider_name, generation.priority)
+    if admission is None:
+        logger.warning(f"{GENERATION_REFUSED} (provider: {provider_name})")
+        return JSONResponse(
+            {"error": f"Server busy: too many {provider_name} requests"},
+            status_code=503,
+            headers={"Retry-After": "1"},
+        )
+    logger.info(f"{GENERATION_ADMITTED} (waited_s: {admission.waited_s:.2f})")
+
+    is_streaming = False
+    try:
+        if generation.stream:
+            outputs = await generate(
+                text_input=system_input.text_input,
+                provider_name=system_input.provider_name,
+                model_name=system_input.model_name,
+                max_tokens=system_input.max_tokens,
+                prompt_name=system_input.prompt_name,
+                stream=True,
+                tool_boxes=system_input.tool_boxes,
+            )
+            records = stream_generation_records(outputs, generation.output_format)
+            is_streaming = True
+            return StreamingResponse(
+                hold_admission(records, admission, manager.admission),
+                media_type="application/x-ndjson",
+                # Covers a response that ends before streaming starts
+                background=BackgroundTask(manager.admission.release, admission),
+            )
+
+        output = await generate(
+            text_input=system_input.text_input,
+            provider_name=system_input.provider_name,
+            model_name=system_input.model_name,
+            max_tokens=system_input.max_tokens,
+            prompt_name=system_input.prompt_name,
+            tool_boxes=system_input.tool_boxes,
+        )
+    except Exception as e:
+        return api_error(e)
+    finally:
+        # A streamed response holds its admission until the stream ends
+        if not is_streaming:
+            manager.admission.release(admission)
+
+    return JSONResponse(system_output_to_dict(output))
+
+
+def api_error(e: Exception) -> JSONResponse:
+    logger.error(f"{API_REQUEST_FAILED} (error: {e})")
+    # Bad prompt names and model strings surface as ValueError
+    status_code = 400 if isinstance(e, ValueError) else 500
+    return JSONResponse({"error": f"{type(e).__name__}: {e}"}, status_code=status_code)
+
+
+async def hold_admission(
+    lines: AsyncGenerator[str, None],
+    admission: Admission,
+    controller: AdmissionController,
+) -> AsyncGenerator[str, None]:
+    """Relay a streamed response, releasing its admission once it ends."""
+    try:
+        async with aclosing(lines):
+            async for line in lines:
+                yield line
+    finally:
+        controller.release(admission)
+
+
+async def connection_stats(request: Request) -> JSONResponse:
+    return JSONResponse(get_connection_manager().get_gauges())
+
+
 async def error_stream(message: str) -> AsyncGenerator[str, None]:
     logger.error(f"{STREAM_FAILED} (message: {message})")
     yield f"event: error\ndata: {message}\n\n"
     yield "event: close\ndata: N/A\n\n"
 
 
-async def process_prompt(prompt: str, state: StreamState) -> AsyncGenerator[str, None]:
-    state.task = asyncio.current_task()
+async def process_prompt(
+    prompt: str,
+    state: StreamState,
+    settings: ConnectionSettings,
+    admission: AdmissionController,
+) -> None:
+    """Stream a model response to a prompt into the stream's replay buffer.
+
+    Runs as its own task so cancel_stream or a superseding prompt can
+    cancel it: the upstream HTTP stream is closed as soon as the
+    cancellation lands, whether the task was waiting on the model, on the
+    browser, or for admission to the provider.
+    """
+    # The browser replaces whatever the previous prompt produced
+    await state.replay.publish([format_sse_event("reset", "")])
+    state.response_start = state.replay.last_id - 1
 
     try:
-        for i in range(1, 11):
-            if state.is_cancelled:
-                logger.info(f"{TASK_CANCELED} (step: {i})")
-                yield f"event: cancelled\ndata: Processing cancelled at step {i}\n\n"
-                break
-            message = f"[{i}] — {prompt}"
-            logger.info(f"{TASK_CHUNK_STREAMED} (step: {i}) (message: {message})")
-            yield f"event: response\ndata: <span class='message'>{message}</span><br>\n\n"
-            await asyncio.sleep(0.3)  # Simulate processing time
-
-        if not state.is_cancelled:
-            logger.info(f"{TASK_COMPLETED} (cid: TBD)")
-            yield "event: complete\ndata: Response complete\n\n"
-    except asyncio.CancelledError:
-        logger.info(f"{TASK_CANCELLED} (via CancelledError)")
-        yield "event: cancelled\ndata: Task cancelled\n\n"
-        raise
-    finally:
-        logger.info(f"{TASK_CLEARED} (cid: TBD)")
-        state.task = None
+        system_input = resolve_system_input(
+            SystemInput(
+                text_input=prompt,
+                provider_name="",
+                model_name=get_web_model(),
+                prompt_name=get_web_prompt_name(),
+                stream=True,
+            )
+        )
+        provider_name = system_input.provider_name
+        # Typing is interactive, so it goes ahead of API requests
+        granted = await admission.admit(provider_name, Priority.HIGH)
+        if granted is None:
+            logger.warning(f"{GENERATION_REFUSED} (provider: {provider_name})")
+            if state.latest_prompt == prompt:
+                state.latest_prompt = None
+            message = f"Server busy: too many {provider_name} requests, try again"
+            await state.replay.publish([format_sse_event("error", escape(message))])
+            return
+        logger.info(f"{GENERATION_ADMITTED} (waited_s: {granted.waited_s:.2f})")
+
+        try:
+            outputs = await generate(
+                text_input=system_input.text_input,
+                provider_name=system_input.provider_name,
+                model_name=system_input.model_name,
+                prompt_name=system_input.prompt_name,
+                stream=True,
+            )
+            updates = coalesce_outputs(
+                outputs, settings.flush_interval_s, settings.flush_chars
+            )
+            async with (
+                aclosing(outputs),
+                aclosing(updates),
+                aclosing(stream_response_events(updates)) as messages,
+            ):
+                async for events in messages:
+                    logger.debug(f"{TASK_CHUNK_STREAMED} (events: {len(events)})")
+                    await state.replay.publish(events)
+        finally:
+            admission.release(granted)
+    except Exception as e:
+        logger.error(f"{TASK_FAILED} (error: {e})")
+        # A failed response answers nothing; let the same prompt try again
+        if state.latest_prompt == prompt:
+            state.latest_prompt = None
+        message = format_sse_event("error", escape(f"{type(e).__name__}: {e}"))
+        await state.replay.publish([message])
+        return
+
+    logger.info(f"{TASK_COMPLETED}")
+    await state.replay.publish([format_sse_event("complete", "Response complete")])
+
+
+def finish_prompt(state: StreamState, task: asyncio.Task[None]) -> None:
+    """Clear a finished prompt task, reporting it if it was cancelled."""
+    state.task = None
+    logger.info(f"{TASK_CLEARED}")
+
+    if not task.cancelled():
+        return
+
+    # Events still waiting for the browser belong to the cancelled response
+    state.replay.discard_unsent()
+
+    if state.is_superseded:
+        # The next prompt's response follows and resets the browser's view
+        logger.info(f"{TASK_SUPERSEDED}")
+        state.is_superseded = False
+        return
+
+    logger.info(f"{TASK_CANCELED}")
+    state.replay.publish_nowait([format_sse_event("cancelled", "Task cancelled")])
+
+
+async def run_prompts(connection_id: str, state: StreamState) -> None:
+    """Run a stream's queued prompts one at a time until the stream is closed.
+
+    Runs as its own task, so a generation carries on (paused once the
+    replay buffer holds an unsent event) while the browser reconnects.
+    """
+    manager = get_connection_manager()
+    while True:
+        logger.info(f"{EVENT_AWAITED} (cid: {connection_id})")
+        event = await state.queue.get()
+        msg = f"{EVENT_RECEIVED} (cid: {connection_id}) (type: {event['type']})"
+        logger.info(msg)
+
+        delay = manager.get_restart_delay(state)
+        if delay > 0:
+            logger.info(f"{TASK_THROTTLED} (cid: {connection_id}) (delay: {delay:.2f})")
+            await asyncio.sleep(delay)
+
+        # Prompts that arrived meanwhile supersede this one
+        while not state.queue.empty():
+            event = state.queue.get_nowait()
+        if event["data"] != state.latest_prompt:
+            continue  # Cancelled while waiting
+
+        logger.info(f"{EVENT_PROCESSED} (cid: {connection_id})")
+        manager.start(state)
+        task = asyncio.create_task(
+            process_prompt(event["data"], state, manager.settings, manager.admission)
+        )
+        task.add_done_callback(lambda task: finish_prompt(state, task))
+        state.task = task
+        await asyncio.wait([task])
+        manager.touch(state)
 
 
 async def event_stream(
-    connection_id: str, state: StreamState
+    connection_id: str, state: StreamState, last_event_id: int | None = None
 ) -> AsyncGenerator[str, None]:
+    """Relay a stream's events to one browser connection.
+
+    Starts after last_event_id when the browser is reconnecting, and stops
+    quietly if a later reconnect takes the stream over.
+    """
+    manager = get_connection_manager()
+    consumer = manager.attach(state)
+    if state.runner is None:
+        state.runner = asyncio.create_task(run_prompts(connection_id, state))
+    position = state.replay.sent_id if last_event_id is None else last_event_id
+    # The browser has everything up to position, so the response may go on
+    state.replay.mark_sent(position)
+
     try:
         logger.info(f"{STREAM_STARTED} (cid: {connection_id})")
         yield "event: connected\ndata: Connection established\n\n"
 
-        while True:
+        while state.consumer == consumer:
+            events = state.replay.get_after(position)
+            if events:
+                log = f"{EVENT_STREAMED} (cid: {connection_id}) (events: {len(events)})"
+                logger.debug(log)
+                yield format_replay_events(events)
+                position = events[-1][0]
+                state.replay.mark_sent(position)
+                manager.touch(state)
+                continue
+
+            # Wait for new events, checking in on quiet streams
+            try:
+                await asyncio.wait_for(
+                    state.replay.changed.wait(), manager.settings.heartbeat_s
+                )
+            except TimeoutError:
+                if manager.is_expired(state):
+                    logger.info(f"{STREAM_EVICTED} (cid: {connection_id})")
+                    manager.close(connection_id, state)
+                    yield "event: close\ndata: Connection idle\n\n"
+                    break
+                yield HEARTBEAT
+
+    finally:
+        # The stream outlives the connection, for the browser to resume
+        logger.info(f"{STREAM_CLOSED} (cid: {connection_id})")
+        manager.detach(state, consumer)
+
+
+async def watch_events(
+    connection_id: str, state: StreamState, position: int
+) -> AsyncGenerator[str, None]:
+    """Relay a stream's events to a watcher from position, at its own pace.
+
+    Reads the replay buffer without holding up the generation; a watcher
+    that falls further behind than the buffer reaches is dropped.
+    """
+    manager = get_connection_manager()
+    is_dropped = False
+    try:
+        yield "event: connected\ndata: Watching stream\n\n"
+
+        while not state.is_closed:
+            if not state.replay.can_resume(position):
+                logger.warning(f"{WATCHER_DROPPED} (cid: {connection_id})")
+                is_dropped = True
+                yield "event: close\ndata: Watcher fell behind\n\n"
+                return
+
+            events = state.replay.get_after(position)
+            if events:
+                yield format_replay_events(events)
+                position = events[-1][0]
+                continue
+
             try:
-                # Wait for events from the queue
-                logger.info(f"{EVENT_AWAITED} (cid: {connection_id})")
-                event = await state.queue.get()
-                msg = f"{EVENT_RECEIVED} (cid: {connection_id}) (type: {event['type']})"
-                logger.info(msg)
-
-                if event["type"] == "prompt":
-                    prompt = event["data"]
-                    msg = f"{EVENT_PROCESSED} (cid: {connection_id})"
-                    logger.info(msg)
-                    async for message in process_prompt(prompt, state):
-                        log = f"{EVENT_STREAMED} (cid: {connection_id}) (length: {len(message)})"
-                        logger.info(log)
-                        yield message
-
-            except asyncio.CancelledError:
-                logger.info(f"{STREAM_CANCELED} (cid: {connection_id})")
-                yield "event: cancelled\ndata: Stream cancelled\n\n"
-                break
+                await asyncio.wait_for(
+                    state.replay.changed.wait(), manager.settings.heartbeat_s
+                )
+            except TimeoutError:
+                yield HEARTBEAT
+
+        yield "event: close\ndata: Stream closed\n\n"
 
     finally:
-        if connection_id in active_connections:
-            logger.info(f"{STREAM_CLOSED} (cid: {connection_id})")
-            del active_connections[connection_id]
-        yield "event: close\ndata: N/A\n\n"
+        manager.unwatch(state, is_dropped)
 
 
 routes = [
@@ -241,4 +604,7 @@ routes = [
     Route(SUBMIT_PROMPT, submit_prompt, methods=["POST"]),
     Route(RESPONSE_STREAM, response_stream, methods=["GET"]),
     Route(CANCEL_STREAM, cancel_stream, methods=["POST"]),
+    Route(WATCH_STREAM, watch_stream, methods=["GET"]),
+    Route(GENERATE_API, generate_api, methods=["POST"]),
+    Route(CONNECTION_STATS, connection_stats, methods=["GET"]),
 ]
@@ -0,0 +1,44 @@
+import asyncio
+from typing import Any, TypedDict
+
+from electric_text.web.replay_buffer import ReplayBuffer
+
+
+class EventMessage(TypedDict):
+    type: str
+    data: Any
+
+
+class StreamState:
+    """Everything one browser connection's response stream is waiting on.
+
+    Prompts wait in a bounded queue until the stream's runner picks them
+    up. Responses are published to a replay buffer that outlives any one
+    HTTP connection, so a browser that reconnects picks up where it left
+    off; consumer numbers the event streams attached over time, and only
+    the newest one relays. Watchers follow the same buffer from their own
+    positions, joining at response_start, the position just before the
+    latest response's reset event. latest_prompt is the prompt whose
+    response the browser is getting (or will get next), so a resubmission
+    of it can be answered by that response.
+    """
+
+    def __init__(
+        self, prompt_queue_size: int, replay_size: int, last_active: float
+    ) -> None:
+        self.queue: asyncio.Queue[EventMessage] = asyncio.Queue(
+            maxsize=prompt_queue_size
+        )
+        self.replay = ReplayBuffer(replay_size)
+        self.runner: asyncio.Task[None] | None = None
+        self.task: asyncio.Task[None] | None = None
+        self.consumer = 0
+        self.is_attached = False
+        self.watchers = 0
+        self.response_start = 0
+        self.is_cancelled = False
+        self.is_superseded = False
+        self.latest_prompt: str | None = None
+        self.last_started = float("-inf")
+        self.is_closed = False
+        self.last_active = last_active
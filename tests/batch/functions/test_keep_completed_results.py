@@ -0,0 +1,32 @@
+from electric_text.batch.functions.keep_completed_results import (
+    keep_completed_results,
+)
+
+
+def test_keeps_only_completed_results(tmp_path):
+    """Drops result lines for ids the journal does not record as completed."""
+    path = tmp_path / "out.jsonl"
+    path.write_text('{"id": "a", "output": {}}\n{"id": "b", "error": "x"}\n')
+
+    keep_completed_results(str(path), {"a"})
+
+    assert path.read_text() == '{"id": "a", "output": {}}\n'
+
+
+def test_drops_truncated_lines(tmp_path):
+    """Drops a line cut short by an interrupted write."""
+    path = tmp_path / "out.jsonl"
+    path.write_text('{"id": "a", "output": {}}\n{"id": "a", "outp')
+
+    keep_completed_results(str(path), {"a"})
+
+    assert path.read_text() == '{"id": "a", "output": {}}\n'
+
+
+def test_ignores_missing_output(tmp_path):
+    """Does nothing when there is no earlier output."""
+    path = tmp_path / "out.jsonl"
+
+    keep_completed_results(str(path), {"a"})
+
+    assert not path.exists()
@@ -0,0 +1,22 @@
+from electric_text.batch.functions.load_batch_journal import load_batch_journal
+
+
+def test_reads_completed_ids(tmp_path):
+    """Returns every id recorded in the journal."""
+    path = tmp_path / "journal.jsonl"
+    path.write_text('{"id": "a"}\n{"id": "b"}\n')
+
+    assert load_batch_journal(str(path)) == {"a", "b"}
+
+
+def test_returns_empty_set_for_missing_journal(tmp_path):
+    """Treats a missing journal as a fresh run."""
+    assert load_batch_journal(str(tmp_path / "journal.jsonl")) == set()
+
+
+def test_ignores_truncated_last_line(tmp_path):
+    """Ignores a journal line cut short by an interrupted write."""
+    path = tmp_path / "journal.jsonl"
+    path.write_text('{"id": "a"}\n{"id": "b')
+
+    assert load_batch_journal(str(path)) == {"a"}
@@ -0,0 +1,58 @@
+import pytest
+
+from electric_text.batch.data.batch_record import BatchRecord
+from electric_text.batch.functions.parse_batch_line import parse_batch_line
+
+
+def test_parses_plain_text_with_line_number_id():
+    """Treats a non-JSON line as the text, identified by its line number."""
+    assert parse_batch_line("Hello there", 3) == BatchRecord(
+        id="3", text_input="Hello there"
+    )
+
+
+def test_parses_json_record_with_overrides():
+    """Reads the id and per-record overrides from a JSON line."""
+    line = '{"id": "a", "text": "Hi", "model": "ollama:llama3", "prompt_name": "poetry", "max_tokens": 9}'
+
+    assert parse_batch_line(line, 1) == BatchRecord(
+        id="a",
+        text_input="Hi",
+        model="ollama:llama3",
+        prompt_name="poetry",
+        max_tokens=9,
+    )
+
+
+def test_uses_line_number_for_json_without_id():
+    """Identifies a JSON record without an id by its line number."""
+    assert parse_batch_line('{"text": "Hi"}', 7).id == "7"
+
+
+def test_stringifies_numeric_ids():
+    """Converts numeric ids to strings."""
+    assert parse_batch_line('{"id": 42, "text": "Hi"}', 1).id == "42"
+
+
+def test_rejects_unknown_fields():
+    """Rejects JSON fields it does not know."""
+    with pytest.raises(ValueError, match="Line 2: unknown fields txt"):
+        parse_batch_line('{"txt": "Hi"}', 2)
+
+
+def test_rejects_missing_text():
+    """Rejects a JSON record without text."""
+    with pytest.raises(ValueError, match="'text' must be a string"):
+        parse_batch_line('{"id": "a"}', 1)
+
+
+def test_rejects_non_integer_max_tokens():
+    """Rejects a max_tokens that is not an integer."""
+    with pytest.raises(ValueError, match="'max_tokens' must be an integer"):
+        parse_batch_line('{"text": "Hi", "max_tokens": "9"}', 1)
+
+
+def test_rejects_malformed_json():
+    """Rejects a line that starts like JSON but does not parse."""
+    with pytest.raises(ValueError):
+        parse_batch_line('{"text": ', 1)
@@ -0,0 +1,18 @@
+import pytest
+
+from electric_text.batch.functions.read_batch_records import read_batch_records
+
+
+def test_skips_blank_lines_but_counts_them():
+    """Skips blank lines while keeping line-number ids."""
+    records = read_batch_records(["one\n", "\n", "three\r\n"])
+
+    assert [(r.id, r.text_input) for r in records] == [("1", "one"), ("3", "three")]
+
+
+def test_rejects_duplicate_ids():
+    """Rejects an id that an earlier line already used."""
+    lines = ['{"id": "a", "text": "x"}\n', '{"id": "a", "text": "y"}\n']
+
+    with pytest.raises(ValueError, match="Line 2: duplicate id 'a'"):
+        list(read_batch_records(lines))
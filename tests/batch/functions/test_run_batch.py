@@ -0,0 +1,126 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from electric_text.batch.data.batch_record import BatchRecord
+from electric_text.batch.data.batch_settings import BatchSettings
+from electric_text.batch.data.batch_summary import BatchSummary
+from electric_text.batch.functions.read_batch_records import read_batch_records
+from electric_text.batch.functions.run_batch import run_batch
+
+
+async def echo(record: BatchRecord) -> dict:
+    """Answer a record with its text, failing on request."""
+    if record.text_input == "fail":
+        raise RuntimeError("boom")
+    await asyncio.sleep(0.01 if record.id == "1" else 0)
+    return {"text": record.text_input}
+
+
+def written_lines(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_writes_tagged_output_per_record():
+    """Writes one output line per record, tagged with its id."""
+    output = io.StringIO()
+
+    await run_batch(read_batch_records(["a", "b"]), echo, output, BatchSettings())
+
+    assert sorted(written_lines(output), key=lambda line: line["id"]) == [
+        {"id": "1", "output": {"text": "a"}},
+        {"id": "2", "output": {"text": "b"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_writes_records_as_they_finish():
+    """Writes faster records before slower ones that started earlier."""
+    output = io.StringIO()
+
+    await run_batch(read_batch_records(["slow", "fast"]), echo, output, BatchSettings())
+
+    assert [line["id"] for line in written_lines(output)] == ["2", "1"]
+
+
+@pytest.mark.asyncio
+async def test_limits_records_in_flight():
+    """Never runs more records at once than the concurrency allows."""
+    running = 0
+    peak = 0
+
+    async def track(record: BatchRecord) -> dict:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.005)
+        running -= 1
+        return {}
+
+    await run_batch(
+        read_batch_records(["x"] * 10),
+        track,
+        io.StringIO(),
+        BatchSettings(concurrency=3),
+    )
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_reports_failures_without_journaling_them():
+    """Writes an error line for a failed record and journals only successes."""
+    output, journal = io.StringIO(), io.StringIO()
+
+    summary = await run_batch(
+        read_batch_records(["fail", "ok"]),
+        echo,
+        output,
+        BatchSettings(),
+        journal=journal,
+    )
+
+    assert (summary, written_lines(journal), written_lines(output)[0]) == (
+        BatchSummary(succeeded=1, failed=1),
+        [{"id": "2"}],
+        {"id": "1", "error": "RuntimeError: boom"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_skips_completed_ids():
+    """Skips records an earlier run already completed."""
+    output = io.StringIO()
+
+    summary = await run_batch(
+        read_batch_records(["a", "b"]),
+        echo,
+        output,
+        BatchSettings(),
+        completed_ids={"1"},
+    )
+
+    assert (summary, written_lines(output)) == (
+        BatchSummary(succeeded=1, skipped=1),
+        [{"id": "2", "output": {"text": "b"}}],
+    )
+
+
+@pytest.mark.asyncio
+async def test_finishes_started_records_before_input_error():
+    """Journals records started before a malformed line, then raises."""
+    journal = io.StringIO()
+
+    with pytest.raises(ValueError, match="Line 2"):
+        await run_batch(
+            read_batch_records(["slow", '{"bad": 1}']),
+            echo,
+            io.StringIO(),
+            BatchSettings(),
+            journal=journal,
+        )
+
+    assert written_lines(journal) == [{"id": "1"}]
@@ -0,0 +1,31 @@
+from benchmarks.data.benchmark_result import BenchmarkResult
+from benchmarks.functions.compare_to_baseline import compare_to_baseline
+
+
+def make_result(median_us: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        case="case",
+        size=10,
+        length=100,
+        median_us=median_us,
+        min_us=1.0,
+        loops=1,
+        repeats=1,
+    )
+
+
+def test_reports_slowdown_beyond_tolerance():
+    """Reports results slower than baseline beyond the tolerance."""
+    regressions = compare_to_baseline([make_result(20.0)], {"case": {"10": 10.0}}, 0.5)
+
+    assert regressions == ["case[10]: 20.00us vs baseline 10.00us"]
+
+
+def test_accepts_slowdown_within_tolerance():
+    """Accepts results slower than baseline within the tolerance."""
+    assert compare_to_baseline([make_result(14.0)], {"case": {"10": 10.0}}, 0.5) == []
+
+
+def test_ignores_results_missing_from_baseline():
+    """Ignores results without a baseline entry."""
+    assert compare_to_baseline([make_result(99.0)], {"other": {"10": 1.0}}, 0.5) == []
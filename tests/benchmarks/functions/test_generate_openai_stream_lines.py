@@ -0,0 +1,17 @@
+from electric_text.providers.data.stream_history import StreamHistory
+from electric_text.providers.model_providers.openai.functions.process_stream_response import (
+    process_stream_response,
+)
+
+from benchmarks.functions.generate_openai_stream_lines import (
+    generate_openai_stream_lines,
+)
+
+
+def test_generates_stream_with_all_text_deltas():
+    """Generates a stream whose text deltas all reach the history."""
+    history = StreamHistory()
+    for line in generate_openai_stream_lines(3):
+        history = process_stream_response(line, history)
+
+    assert history.extract_text_content() == " token0 token1 token2"
@@ -0,0 +1,12 @@
+from electric_text.clients.functions.parse_partial_response import (
+    parse_partial_response,
+)
+
+from benchmarks.functions.generate_partial_json import generate_partial_json
+
+
+def test_generates_parseable_truncated_object():
+    """Generates a truncated object that partial parsing recovers in full."""
+    parsed = parse_partial_response(generate_partial_json(8))
+
+    assert len(parsed) == 9
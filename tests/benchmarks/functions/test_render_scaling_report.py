@@ -0,0 +1,25 @@
+from benchmarks.data.benchmark_result import BenchmarkResult
+from benchmarks.functions.render_scaling_report import render_scaling_report
+
+
+def test_renders_table_row_per_size():
+    """Renders one table row per size with time per character."""
+    report = render_scaling_report(
+        [BenchmarkResult("case", 10, 200, 4.0, 3.0, 1, 1)], {"case": "Example"}
+    )
+
+    assert "| 10 | 200 | 4.00 | 20.00 |" in report
+
+
+def test_scales_bars_to_slowest_result():
+    """Scales chart bars relative to the slowest result."""
+    report = render_scaling_report(
+        [
+            BenchmarkResult("case", 1, 10, 1.0, 1.0, 1, 1),
+            BenchmarkResult("case", 2, 20, 4.0, 1.0, 1, 1),
+        ],
+        {},
+        bar_width=8,
+    )
+
+    assert "10 | ## 1.00us" in report
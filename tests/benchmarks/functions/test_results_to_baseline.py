@@ -0,0 +1,16 @@
+from benchmarks.data.benchmark_result import BenchmarkResult
+from benchmarks.functions.results_to_baseline import results_to_baseline
+
+
+def test_groups_medians_by_case_and_size():
+    """Groups rounded medians by case name and size."""
+    results = [
+        BenchmarkResult("a", 1, 10, 1.23456, 1.0, 1, 1),
+        BenchmarkResult("a", 2, 20, 2.0, 1.0, 1, 1),
+        BenchmarkResult("b", 1, 10, 3.0, 1.0, 1, 1),
+    ]
+
+    assert results_to_baseline(results) == {
+        "a": {"1": 1.235, "2": 2.0},
+        "b": {"1": 3.0},
+    }
@@ -20,6 +20,10 @@ from dataclasses import dataclass, field
 import respx
 from httpx import Response
 
+from electric_text.configuration.functions.get_config_service import (
+    get_config_service,
+)
+
 
 # ==============================================================================
 # HTTP
@@ -182,12 +186,16 @@ def mock_env(variables: dict[str, str] | None = None, clear_prefix: str | None =
             for key, value in variables.items():
                 os.environ[key] = value
 
+        # Reload configuration that depends on the environment
+        get_config_service().invalidate()
+
         yield
 
     finally:
         # Restore original environment
         os.environ.clear()
         os.environ.update(env_backup)
+        get_config_service().invalidate()
 
 
 def ollama_api_response(
@@ -0,0 +1,29 @@
+import argparse
+
+import pytest
+
+from electric_text.cli.functions.add_output_format_argument import (
+    add_output_format_argument,
+)
+
+
+def test_defaults_to_full():
+    """Defaults --output-format to full."""
+    parser = add_output_format_argument(argparse.ArgumentParser())
+
+    assert parser.parse_args([]).output_format == "full"
+
+
+def test_accepts_short_option():
+    """Accepts -of as a short form."""
+    parser = add_output_format_argument(argparse.ArgumentParser())
+
+    assert parser.parse_args(["-of", "delta"]).output_format == "delta"
+
+
+def test_rejects_unknown_format():
+    """Rejects formats other than full and delta."""
+    parser = add_output_format_argument(argparse.ArgumentParser())
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--output-format", "xml"])
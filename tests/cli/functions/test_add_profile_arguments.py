@@ -0,0 +1,16 @@
+import argparse
+
+from electric_text.cli.functions.add_profile_arguments import add_profile_arguments
+
+
+def test_defaults_to_profiling_disabled() -> None:
+    """Defaults to no profile path, cprofile mode and no memory tracing."""
+    parser = add_profile_arguments(argparse.ArgumentParser())
+
+    parsed = parser.parse_args([])
+
+    assert (parsed.profile, parsed.profile_mode, parsed.profile_memory) == (
+        None,
+        "cprofile",
+        False,
+    )
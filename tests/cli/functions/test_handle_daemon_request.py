@@ -0,0 +1,94 @@
+import asyncio
+import json
+import socket
+
+import pytest
+
+from electric_text.cli.functions.start_daemon_server import start_daemon_server
+from tests.fixtures import forward_in_thread
+
+
+@pytest.mark.asyncio
+async def test_runs_forwarded_prompt(tmp_path, clean_env, client_pool):
+    """Runs the invocation and streams its JSON output back."""
+    path = str(tmp_path / "d.sock")
+    server = await start_daemon_server(path, "same")
+
+    exit_code, stdout, _ = await forward_in_thread(
+        path, ["Hello", "-m", "mock:ollama/m", "--max-tokens", "5"], "same"
+    )
+    server.close()
+    await client_pool.aclose()
+
+    assert (exit_code, json.loads(stdout)["response_type"]) == (0, "TEXT")
+
+
+@pytest.mark.asyncio
+async def test_answers_help_with_usage(tmp_path, clean_env, client_pool):
+    """Sends --help output back with exit code 0."""
+    path = str(tmp_path / "d.sock")
+    server = await start_daemon_server(path, "same")
+
+    exit_code, stdout, _ = await forward_in_thread(path, ["--help"], "same")
+    server.close()
+
+    assert (exit_code, stdout.startswith("usage: electric_text")) == (0, True)
+
+
+@pytest.mark.asyncio
+async def test_reports_usage_errors(tmp_path, clean_env, client_pool):
+    """Sends argparse errors to stderr with exit code 2."""
+    path = str(tmp_path / "d.sock")
+    server = await start_daemon_server(path, "same")
+
+    exit_code, _, stderr = await forward_in_thread(path, ["--max-tokens"], "same")
+    server.close()
+
+    assert (exit_code, "expected one argument" in stderr) == (2, True)
+
+
+@pytest.mark.asyncio
+async def test_reports_failing_commands(tmp_path, clean_env, client_pool):
+    """Sends the traceback of a command that raises to stderr with exit code 1."""
+    path = str(tmp_path / "d.sock")
+    server = await start_daemon_server(path, "same")
+
+    exit_code, _, stderr = await forward_in_thread(
+        path, ["Hello", "-m", "mock:ollama/m", "--config", "/no/such.json"], "same"
+    )
+    server.close()
+
+    assert (exit_code, "FileNotFoundError: Config file not found" in stderr) == (
+        1,
+        True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_rejects_other_fingerprints(tmp_path, clean_env, client_pool):
+    """Declines requests from a different directory or environment."""
+    path = str(tmp_path / "d.sock")
+    server = await start_daemon_server(path, "daemon")
+
+    result = await forward_in_thread(path, ["Hello"], "caller")
+    server.close()
+
+    assert result == (None, "", "")
+
+
+@pytest.mark.asyncio
+async def test_closes_connection_on_malformed_request(tmp_path, client_pool):
+    """Closes the connection without a reply when the request is not JSON."""
+    path = str(tmp_path / "d.sock")
+    server = await start_daemon_server(path, "same")
+
+    def send_garbage():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(path)
+            connection.sendall(b"not json\n")
+            return connection.recv(1024)
+
+    reply = await asyncio.to_thread(send_garbage)
+    server.close()
+
+    assert reply == b""
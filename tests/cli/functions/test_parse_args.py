@@ -1,5 +1,7 @@
 """Tests for the command-line interface."""
 
+import pytest
+
 from electric_text.cli.functions.parse_args import parse_args
 from electric_text.prompting.data.system_input import SystemInput
 
@@ -50,3 +52,9 @@ def test_parse_args() -> None:
 
     raw_input, config_path = parse_args(["hello", "--config", "/path/to/config"])
     assert config_path == "/path/to/config"
+
+
+def test_rejects_abbreviated_options() -> None:
+    """Rejects abbreviated options such as --str for --stream."""
+    with pytest.raises(SystemExit):
+        parse_args(["hello", "--str"])
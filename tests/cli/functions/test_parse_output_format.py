@@ -0,0 +1,14 @@
+from electric_text.cli.functions.parse_output_format import parse_output_format
+from electric_text.prompting.data.output_format import OutputFormat
+
+
+def test_defaults_to_full():
+    """Defaults to the full output format."""
+    assert parse_output_format(["hello"]) is OutputFormat.FULL
+
+
+def test_reads_delta_among_other_arguments():
+    """Reads --output-format while ignoring other arguments."""
+    args = ["hello", "--stream", "--output-format", "delta", "-m", "x"]
+
+    assert parse_output_format(args) is OutputFormat.DELTA
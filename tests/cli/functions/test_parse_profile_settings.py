@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from electric_text.cli.functions.parse_profile_settings import parse_profile_settings
+from electric_text.profiling import ProfileMode, ProfileSettings
+
+
+def test_returns_none_without_profile_option() -> None:
+    """Returns None when --profile is not given."""
+    assert parse_profile_settings(["hello", "--stream"]) is None
+
+
+def test_ignores_abbreviated_profile_option() -> None:
+    """Returns None for an abbreviation of --profile, which the CLI rejects."""
+    assert parse_profile_settings(["hello", "--prof", "out.pstats"]) is None
+
+
+def test_parses_profile_options_among_other_arguments() -> None:
+    """Parses the profile options and ignores everything else."""
+    settings = parse_profile_settings(
+        [
+            "hello",
+            "--model",
+            "anything",
+            "--profile",
+            "out.collapsed",
+            "--profile-mode",
+            "sampling",
+            "--profile-memory",
+        ]
+    )
+
+    assert settings == ProfileSettings(
+        output_path=Path("out.collapsed"), mode=ProfileMode.SAMPLING, memory=True
+    )
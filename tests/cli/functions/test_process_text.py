@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from tests.fixtures import run_process_text
+
+
+@pytest.mark.asyncio
+async def test_prints_output_records(clean_env):
+    """Prints the output as JSON records and exits with status 0."""
+    exit_code, out, _ = await run_process_text(["Hello", "-m", "mock:openai/m"])
+
+    records = [json.loads(line) for line in out.splitlines()]
+    assert exit_code == 0
+    assert [record["response_type"] for record in records] == ["TEXT"]
+
+
+@pytest.mark.asyncio
+async def test_rejects_invalid_model(clean_env):
+    """Reports a model that cannot be resolved and exits with status 2."""
+    result = await run_process_text(["Hello", "-m", "nope:x"])
+
+    assert result == (2, "", "Error: Unknown provider: 'nope'\n")
+
+
+@pytest.mark.asyncio
+async def test_reports_failed_generation(clean_env):
+    """Reports an error raised during generation and exits with status 1."""
+    exit_code, out, _ = await run_process_text(["Hello", "-m", "replay:x"])
+
+    assert exit_code == 1
+    assert out.startswith("Error: Cannot tell which provider recorded 'x'")
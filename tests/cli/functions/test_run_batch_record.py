@@ -0,0 +1,35 @@
+import pytest
+
+from electric_text.batch import BatchRecord
+from electric_text.cli.functions.run_batch_record import run_batch_record
+from electric_text.prompting.data.system_input import SystemInput
+
+DEFAULTS = SystemInput(text_input="", provider_name="", model_name="mock:anthropic/m")
+
+
+@pytest.mark.asyncio
+async def test_generates_output_dict(clean_env):
+    """Returns the generated output as a dict."""
+    output = await run_batch_record(BatchRecord(id="1", text_input="Hi"), DEFAULTS)
+
+    assert output["response_type"] == "TEXT"
+
+
+@pytest.mark.asyncio
+async def test_applies_record_model(clean_env):
+    """Uses the record's model over the default."""
+    defaults = SystemInput(text_input="", provider_name="", model_name="nonsense")
+    record = BatchRecord(id="1", text_input="Hi", model="mock:openai/m")
+
+    output = await run_batch_record(record, defaults)
+
+    assert output["response_type"] == "TEXT"
+
+
+@pytest.mark.asyncio
+async def test_rejects_unresolvable_model(clean_env):
+    """Raises ValueError for a record model that cannot be resolved."""
+    record = BatchRecord(id="1", text_input="Hi", model="nonsense")
+
+    with pytest.raises(ValueError):
+        await run_batch_record(record, DEFAULTS)
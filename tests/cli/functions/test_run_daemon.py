@@ -0,0 +1,38 @@
+import asyncio
+import io
+import os
+
+import pytest
+
+from electric_text.cli.functions.run_daemon import run_daemon
+from electric_text.cli.functions.start_daemon_server import start_daemon_server
+
+
+@pytest.mark.asyncio
+async def test_removes_socket_when_cancelled(tmp_path, client_pool):
+    """Stops serving and removes its socket when cancelled."""
+    path = str(tmp_path / "d.sock")
+    task = asyncio.create_task(run_daemon(path, "same", stderr=io.StringIO()))
+    while not os.path.exists(path):
+        await asyncio.sleep(0.01)
+
+    task.cancel()
+    exit_code = await task
+
+    assert (exit_code, os.path.exists(path)) == (0, False)
+
+
+@pytest.mark.asyncio
+async def test_fails_when_daemon_running(tmp_path, client_pool):
+    """Exits with an error while another daemon listens on the socket."""
+    path = str(tmp_path / "d.sock")
+    server = await start_daemon_server(path, "same")
+    stderr = io.StringIO()
+
+    exit_code = await run_daemon(path, "same", stderr=stderr)
+    server.close()
+
+    assert (exit_code, stderr.getvalue()) == (
+        1,
+        f"Error: A daemon is already listening on {path}\n",
+    )
@@ -0,0 +1,89 @@
+import os
+import socket
+import stat
+
+import pytest
+
+from electric_text.cli.functions.start_daemon_server import start_daemon_server
+from electric_text.daemon import is_daemon_listening
+
+
+@pytest.mark.asyncio
+async def test_listens_on_socket(tmp_path, client_pool):
+    """Accepts connections on the socket path."""
+    path = str(tmp_path / "d.sock")
+
+    server = await start_daemon_server(path, "same")
+    listening = is_daemon_listening(path)
+    server.close()
+
+    assert listening is True
+
+
+@pytest.mark.asyncio
+async def test_enables_client_pool(tmp_path, client_pool):
+    """Turns on the process-wide client pool."""
+    server = await start_daemon_server(str(tmp_path / "d.sock"), "same")
+    server.close()
+
+    assert client_pool.enabled is True
+
+
+@pytest.mark.asyncio
+async def test_replaces_stale_socket(tmp_path, client_pool):
+    """Replaces a socket file left behind by a daemon that exited."""
+    path = str(tmp_path / "d.sock")
+    socket.socket(socket.AF_UNIX, socket.SOCK_STREAM).bind(path)
+
+    server = await start_daemon_server(path, "same")
+    listening = is_daemon_listening(path)
+    server.close()
+
+    assert listening is True
+
+
+@pytest.mark.asyncio
+async def test_refuses_when_daemon_running(tmp_path, client_pool):
+    """Refuses to start while another daemon listens on the socket."""
+    path = str(tmp_path / "d.sock")
+    server = await start_daemon_server(path, "same")
+
+    with pytest.raises(RuntimeError, match="already listening"):
+        await start_daemon_server(path, "same")
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_creates_socket_private(tmp_path, client_pool):
+    """Creates the socket readable and writable by its owner only."""
+    path = str(tmp_path / "d.sock")
+
+    server = await start_daemon_server(path, "same")
+    mode = stat.S_IMODE(os.stat(path).st_mode)
+    server.close()
+
+    assert mode == 0o600
+
+
+@pytest.mark.asyncio
+async def test_creates_private_directory(tmp_path, client_pool):
+    """Creates a missing socket directory that only its owner can enter."""
+    path = str(tmp_path / "run" / "d.sock")
+
+    server = await start_daemon_server(path, "same")
+    mode = stat.S_IMODE(os.stat(tmp_path / "run").st_mode)
+    server.close()
+
+    assert mode == 0o700
+
+
+@pytest.mark.skipif(os.getuid() != 0, reason="needs root to change the owner")
+@pytest.mark.asyncio
+async def test_refuses_directory_of_another_user(tmp_path, client_pool):
+    """Refuses to listen in a directory another user owns."""
+    directory = tmp_path / "run"
+    directory.mkdir()
+    os.chown(directory, 65534, 65534)
+
+    with pytest.raises(RuntimeError, match="belongs to another user"):
+        await start_daemon_server(str(directory / "d.sock"), "same")
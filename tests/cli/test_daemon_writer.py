@@ -0,0 +1,53 @@
+import asyncio
+import json
+import socket
+
+import pytest
+
+from electric_text.cli.daemon_writer import DaemonWriter
+
+
+async def sent_messages(writer, peer):
+    """Close the writer and decode the JSON lines the peer received."""
+    writer.close()
+    await writer.wait_closed()
+    with peer.makefile("rb") as received:
+        return [json.loads(line) for line in received]
+
+
+@pytest.mark.asyncio
+async def test_sends_complete_lines():
+    """Sends output once a line is complete."""
+    local, peer = socket.socketpair()
+    _, writer = await asyncio.open_unix_connection(sock=local)
+
+    print("one", file=DaemonWriter(writer, "stdout"))
+
+    assert await sent_messages(writer, peer) == [{"stdout": "one\n"}]
+
+
+@pytest.mark.asyncio
+async def test_holds_partial_line_until_flush():
+    """Sends a partial line only when flushed."""
+    local, peer = socket.socketpair()
+    _, writer = await asyncio.open_unix_connection(sock=local)
+    daemon_writer = DaemonWriter(writer, "stderr")
+
+    daemon_writer.write("par")
+    daemon_writer.write("tial")
+    daemon_writer.flush()
+
+    assert await sent_messages(writer, peer) == [{"stderr": "partial"}]
+
+
+@pytest.mark.asyncio
+async def test_drops_output_after_close():
+    """Discards output once the connection is closing."""
+    local, peer = socket.socketpair()
+    _, writer = await asyncio.open_unix_connection(sock=local)
+    daemon_writer = DaemonWriter(writer, "stdout")
+    writer.close()
+
+    print("late", file=daemon_writer)
+
+    assert await sent_messages(writer, peer) == []
@@ -0,0 +1,31 @@
+from electric_text.clients.functions.get_validation_module_name import (
+    get_validation_module_name,
+)
+
+
+def test_names_differ_per_file():
+    """Gives different files different module names."""
+    assert get_validation_module_name("/a.py", 1, 10) != get_validation_module_name(
+        "/b.py", 1, 10
+    )
+
+
+def test_names_differ_per_version():
+    """Gives each version of a file its own module name."""
+    assert get_validation_module_name("/a.py", 1, 10) != get_validation_module_name(
+        "/a.py", 2, 10
+    )
+
+
+def test_names_differ_per_size():
+    """Tells apart versions written within the same modification time."""
+    assert get_validation_module_name("/a.py", 1, 10) != get_validation_module_name(
+        "/a.py", 1, 11
+    )
+
+
+def test_names_are_stable():
+    """Returns the same name for the same file and version."""
+    assert get_validation_module_name("/a.py", 1, 10) == get_validation_module_name(
+        "/a.py", 1, 10
+    )
@@ -0,0 +1,57 @@
+import sys
+from textwrap import dedent
+
+from electric_text.clients.functions.get_validation_module_name import (
+    get_validation_module_name,
+)
+from electric_text.clients.functions.import_validation_model import (
+    import_validation_model,
+)
+
+
+def test_registers_module_under_unique_name(tmp_path):
+    """Registers the imported module under its per-file, per-version name."""
+    model_path = tmp_path / "answer.py"
+    model_path.write_text(
+        dedent("""
+            from pydantic import BaseModel
+
+            class Answer(BaseModel):
+                text: str
+            """)
+    )
+
+    result = import_validation_model(str(model_path), 123, 0)
+
+    module = sys.modules[get_validation_module_name(str(model_path), 123, 0)]
+    assert module.Answer is result.model_class
+
+
+def test_unregisters_module_that_fails_to_import(tmp_path):
+    """Removes the module from sys.modules when its code raises."""
+    model_path = tmp_path / "broken.py"
+    model_path.write_text("raise RuntimeError('boom')\n")
+
+    result = import_validation_model(str(model_path), 456, 0)
+
+    module_name = get_validation_module_name(str(model_path), 456, 0)
+    assert (result.error, module_name in sys.modules) == ("OTHER", False)
+
+
+def test_unregisters_the_previous_version(tmp_path):
+    """Removes a file's earlier version from sys.modules once a newer one loads."""
+    model_path = tmp_path / "answer.py"
+    model_path.write_text(
+        dedent("""
+            from pydantic import BaseModel
+
+            class Answer(BaseModel):
+                text: str
+            """)
+    )
+    import_validation_model(str(model_path), 789, 1)
+
+    import_validation_model(str(model_path), 789, 2)
+
+    names = [get_validation_module_name(str(model_path), 789, size) for size in (1, 2)]
+    assert [name in sys.modules for name in names] == [False, True]
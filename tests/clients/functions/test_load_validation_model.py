@@ -81,3 +81,53 @@ def test_load_invalid_model_file():
         assert not result.is_valid
         assert result.error == "NO_MODEL"
         assert "No validation model found" in result.error_message
+
+
+def write_named_model_file(path, field_name):
+    """Write a validation model named Answer with a single string field."""
+    path.write_text(
+        dedent(f"""
+            from pydantic import BaseModel
+
+            class Answer(BaseModel):
+                {field_name}: str
+            """)
+    )
+
+
+def test_returns_same_class_for_repeated_loads(tmp_path):
+    """Returns the same class object while the file is unchanged."""
+    model_path = tmp_path / "answer.py"
+    write_named_model_file(model_path, "text")
+
+    first = load_validation_model(str(model_path)).model_class
+
+    assert load_validation_model(str(model_path)).model_class is first
+
+
+def test_reloads_edited_model_file(tmp_path):
+    """Imports the file again after it is rewritten."""
+    import os
+
+    model_path = tmp_path / "answer.py"
+    write_named_model_file(model_path, "text")
+    load_validation_model(str(model_path))
+
+    write_named_model_file(model_path, "answer")
+    stat = model_path.stat()
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**10))
+
+    assert list(load_validation_model(str(model_path)).model_class.model_fields) == [
+        "answer"
+    ]
+
+
+def test_keeps_models_from_different_files_apart(tmp_path):
+    """Loads same-named models from different files as distinct classes."""
+    write_named_model_file(tmp_path / "a.py", "first")
+    write_named_model_file(tmp_path / "b.py", "second")
+
+    a = load_validation_model(str(tmp_path / "a.py")).model_class
+    b = load_validation_model(str(tmp_path / "b.py")).model_class
+
+    assert (list(a.model_fields), list(b.model_fields)) == (["first"], ["second"])
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from electric_text.clients import Client
+from electric_text.clients.data.client_request import ClientRequest
+from electric_text.clients.data.default_output_schema import DefaultOutputSchema
+from electric_text.clients.data.prompt import Prompt
+from electric_text.clients.data.template_fragment import TemplateFragment
+from tests.fixtures import endless_ollama_transport, ollama_chat_transport
+
+REQUEST = ClientRequest(
+    provider_name="ollama",
+    model_name="llama3",
+    prompt=Prompt(prompt="Hi", system_message=[TemplateFragment(text="Be brief")]),
+    output_schema=DefaultOutputSchema,
+)
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_closes_http_stream():
+    """Closes the provider's HTTP stream as soon as the stream is closed."""
+    closed_streams: list[object] = []
+    client = Client("ollama", {"transport": endless_ollama_transport(closed_streams)})
+    stream = client.stream(REQUEST)
+    await anext(stream)
+    await anext(stream)
+
+    await stream.aclose()
+
+    assert len(closed_streams) == 1
+
+
+@pytest.mark.asyncio
+async def test_coalescing_clients_share_identical_completions():
+    """Sends one HTTP request for identical completions made at once."""
+    requests_seen: list[object] = []
+    client = Client(
+        "ollama", {"transport": ollama_chat_transport(requests_seen)}, coalesce=True
+    )
+
+    await asyncio.gather(client.generate(REQUEST), client.generate(REQUEST))
+
+    assert len(requests_seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_clients_send_every_request_without_coalescing():
+    """Sends an HTTP request per completion by default."""
+    requests_seen: list[object] = []
+    client = Client("ollama", {"transport": ollama_chat_transport(requests_seen)})
+
+    await asyncio.gather(client.generate(REQUEST), client.generate(REQUEST))
+
+    assert len(requests_seen) == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescing_clients_share_identical_streams():
+    """Opens one HTTP stream for identical streams and closes it after both."""
+    closed_streams: list[object] = []
+    client = Client(
+        "ollama",
+        {"transport": endless_ollama_transport(closed_streams)},
+        coalesce=True,
+    )
+    streams = [client.stream(REQUEST), client.stream(REQUEST)]
+    for stream in streams:
+        await anext(stream)
+        await anext(stream)
+
+    for stream in streams:
+        await stream.aclose()
+
+    assert (len(closed_streams), client.coalescer.coalesced) == (1, 1)
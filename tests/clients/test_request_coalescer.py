@@ -0,0 +1,230 @@
+import asyncio
+
+import pytest
+
+from electric_text.clients.request_coalescer import RequestCoalescer
+from electric_text.providers.data.content_block import (
+    ContentBlock,
+    ContentBlockType,
+    TextData,
+)
+from electric_text.providers.data.stream_history import StreamHistory
+
+
+def counted_completion(calls, result):
+    """Completion call recording each time it is made."""
+
+    async def call():
+        calls.append(True)
+        await asyncio.sleep(0.01)
+        return result
+
+    return call
+
+
+def counted_stream(opened, closed, updates=3):
+    """Stream opener recording each open and close, yielding one shared history."""
+
+    async def open_stream():
+        opened.append(True)
+        history = StreamHistory()
+        try:
+            for _ in range(updates):
+                await asyncio.sleep(0.01)
+                yield history
+        finally:
+            closed.append(True)
+
+    return open_stream
+
+
+@pytest.mark.asyncio
+async def test_shares_one_completion_between_identical_requests():
+    """Makes one call for identical completions in flight and gives all the result."""
+    coalescer = RequestCoalescer()
+    calls: list[bool] = []
+    result = StreamHistory()
+    call = counted_completion(calls, result)
+
+    results = await asyncio.gather(
+        coalescer.complete("key", call), coalescer.complete("key", call)
+    )
+
+    assert (results, len(calls), coalescer.coalesced) == ([result, result], 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_gives_each_caller_its_own_completion():
+    """Hands identical callers independent copies of the result."""
+    coalescer = RequestCoalescer()
+    call = counted_completion([], StreamHistory())
+
+    first, second = await asyncio.gather(
+        coalescer.complete("key", call), coalescer.complete("key", call)
+    )
+
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_keeps_completions_with_different_keys_apart():
+    """Makes a call per key."""
+    coalescer = RequestCoalescer()
+    calls: list[bool] = []
+    call = counted_completion(calls, StreamHistory())
+
+    await asyncio.gather(coalescer.complete("a", call), coalescer.complete("b", call))
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_calls_again_once_a_completion_finished():
+    """Caches nothing: a request after the call finished makes a new call."""
+    coalescer = RequestCoalescer()
+    calls: list[bool] = []
+    call = counted_completion(calls, StreamHistory())
+
+    await coalescer.complete("key", call)
+    await coalescer.complete("key", call)
+
+    assert (len(calls), coalescer.completions) == (2, {})
+
+
+@pytest.mark.asyncio
+async def test_cancelled_callers_leave_the_completion_running():
+    """Delivers the result to the remaining callers when one gives up."""
+    coalescer = RequestCoalescer()
+    result = StreamHistory()
+    call = counted_completion([], result)
+    leaving = asyncio.create_task(coalescer.complete("key", call))
+    staying = asyncio.create_task(coalescer.complete("key", call))
+    await asyncio.sleep(0)
+
+    leaving.cancel()
+
+    assert await staying == result
+
+
+@pytest.mark.asyncio
+async def test_cancels_the_completion_once_every_caller_gave_up():
+    """Cancels the upstream call when nobody is waiting for it any more."""
+    coalescer = RequestCoalescer()
+    started = asyncio.Event()
+
+    async def call():
+        started.set()
+        await asyncio.sleep(10)
+        return StreamHistory()
+
+    callers = [asyncio.create_task(coalescer.complete("key", call)) for _ in range(2)]
+    await started.wait()
+    upstream = coalescer.completions["key"]
+
+    for caller in callers:
+        caller.cancel()
+    await asyncio.wait(callers)
+    await asyncio.wait([upstream])
+
+    assert (upstream.cancelled(), coalescer.completions, coalescer.waiters) == (
+        True,
+        {},
+        {},
+    )
+
+
+@pytest.mark.asyncio
+async def test_shares_one_stream_between_identical_requests():
+    """Opens one upstream stream for identical streams and sends each every update."""
+    coalescer = RequestCoalescer()
+    opened: list[bool] = []
+    open_stream = counted_stream(opened, [])
+
+    async def read():
+        return [history async for history in coalescer.stream("key", open_stream)]
+
+    first, second = await asyncio.gather(read(), read())
+
+    assert (len(first), len(second), len(opened)) == (3, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_late_joiners_start_from_the_history_so_far():
+    """Sends a late joiner the current history before any later update."""
+    coalescer = RequestCoalescer()
+    early = coalescer.stream("key", counted_stream([], []))
+    history = await anext(early)
+
+    late = coalescer.stream("key", counted_stream([], []))
+    joined = await anext(late)
+    await late.aclose()
+    await early.aclose()
+
+    assert (joined == history, joined is history) == (True, False)
+
+
+@pytest.mark.asyncio
+async def test_gives_each_subscriber_its_own_history():
+    """Keeps one subscriber's changes to a history out of the others'."""
+    coalescer = RequestCoalescer()
+
+    async def open_stream():
+        history = StreamHistory()
+        history.content_blocks.append(
+            ContentBlock(type=ContentBlockType.TEXT, data=TextData(text="Hi"))
+        )
+        yield history
+        await asyncio.sleep(0.01)
+
+    first = coalescer.stream("key", open_stream)
+    second = coalescer.stream("key", open_stream)
+    mine = await anext(first)
+    theirs = await anext(second)
+
+    mine.content_blocks[0].data.text = "changed"
+    mine.chunks.append(None)
+    await first.aclose()
+    await second.aclose()
+
+    assert (str(theirs), theirs.chunks) == ("Hi", [])
+
+
+@pytest.mark.asyncio
+async def test_closes_the_upstream_stream_once_every_subscriber_left():
+    """Keeps the stream open for remaining subscribers and closes it after the last."""
+    coalescer = RequestCoalescer()
+    closed: list[bool] = []
+    open_stream = counted_stream([], closed, updates=100)
+    first = coalescer.stream("key", open_stream)
+    second = coalescer.stream("key", open_stream)
+    await anext(first)
+    await anext(second)
+
+    await first.aclose()
+    still_open = closed == []
+    await second.aclose()
+
+    assert (still_open, closed, coalescer.streams) == (True, [True], {})
+
+
+@pytest.mark.asyncio
+async def test_raises_upstream_errors_in_every_subscriber():
+    """Raises an upstream failure in each subscriber."""
+    coalescer = RequestCoalescer()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream went away")
+        yield StreamHistory()
+
+    async def read():
+        try:
+            async for _ in coalescer.stream("key", failing):
+                pass
+        except RuntimeError as e:
+            return str(e)
+
+    assert await asyncio.gather(read(), read()) == [
+        "upstream went away",
+        "upstream went away",
+    ]
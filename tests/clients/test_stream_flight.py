@@ -0,0 +1,17 @@
+import asyncio
+
+import pytest
+
+from electric_text.clients.stream_flight import StreamFlight
+
+
+@pytest.mark.asyncio
+async def test_notify_wakes_waiting_subscribers():
+    """Wakes every subscriber waiting on changed."""
+    flight = StreamFlight()
+    waiters = [asyncio.create_task(flight.changed.wait()) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    flight.notify()
+
+    assert await asyncio.gather(*waiters) == [True, True]
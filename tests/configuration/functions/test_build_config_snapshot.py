@@ -0,0 +1,26 @@
+from electric_text.configuration.functions.build_config_snapshot import (
+    build_config_snapshot,
+)
+
+
+def test_records_config_and_file_stamp(tmp_path):
+    """Loads the config and records the stamp of the file it came from."""
+    path = tmp_path / "config.yaml"
+    path.write_text("logging:\n  level: DEBUG\n")
+
+    snapshot = build_config_snapshot(str(path))
+
+    assert (snapshot.config.logging, list(snapshot.stamps)) == (
+        {"level": "DEBUG"},
+        [str(path)],
+    )
+
+
+def test_builds_shorthand_lookup(clean_env, tmp_path):
+    """Builds the shorthand lookup for the loaded config."""
+    path = tmp_path / "config.yaml"
+    path.write_text("shorthands:\n  models:\n    ollama:\n      llama3.1:8b: llama\n")
+
+    snapshot = build_config_snapshot(str(path))
+
+    assert snapshot.shorthand_models == {"llama": ("ollama", "llama3.1:8b")}
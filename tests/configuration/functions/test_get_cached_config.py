@@ -2,6 +2,9 @@ from pathlib import Path
 from textwrap import dedent
 
 from electric_text.configuration.functions.get_cached_config import get_cached_config
+from electric_text.configuration.functions.get_config_service import (
+    get_config_service,
+)
 from electric_text.configuration.data.config import Config
 from tests.boundaries import mock_filesystem, MockFileSystem, MockFile
 
@@ -27,7 +30,7 @@ def test_get_cached_config() -> None:
         config_path = str(temp_dir / "config.yaml")
 
         # Clear cache before test
-        get_cached_config.cache_clear()
+        get_config_service().invalidate()
 
         # Call get_cached_config multiple times with the same path
         config1 = get_cached_config(config_path)
@@ -45,7 +48,7 @@ def test_get_cached_config() -> None:
 
 
 def test_get_cached_config_different_paths() -> None:
-    """Cache is keyed by path, but with maxsize=1 only last path is cached."""
+    """Reloads when a different path is requested, keeping only the last one."""
     file_structure = MockFileSystem(
         [
             MockFile(
@@ -70,7 +73,7 @@ def test_get_cached_config_different_paths() -> None:
         config2_path = str(temp_dir / "config2.yaml")
 
         # Clear cache before test
-        get_cached_config.cache_clear()
+        get_config_service().invalidate()
 
         # Get configs from different paths
         config1 = get_cached_config(config1_path)
@@ -80,12 +83,11 @@ def test_get_cached_config_different_paths() -> None:
         assert config1.logging == {"level": "INFO"}
         assert config2.logging == {"level": "ERROR"}
 
-        # With maxsize=1, calling with config2_path evicted config1 from cache
-        # So calling config2_path again should return the cached object
+        # Calling config2_path again should return the cached object
         config2_again = get_cached_config(config2_path)
         assert config2 is config2_again
 
         # But calling config1_path again will create a new object (not cached)
         config1_again = get_cached_config(config1_path)
-        assert config1 is not config1_again  # Different objects due to cache eviction
+        assert config1 is not config1_again  # Different objects due to reload
         assert config1_again.logging == {"level": "INFO"}  # But same content
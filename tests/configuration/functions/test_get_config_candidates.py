@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+
+from electric_text.configuration.functions.get_config_candidates import (
+    get_config_candidates,
+)
+from tests.boundaries import mock_env
+
+
+def test_returns_explicit_path(tmp_path):
+    """Returns only the explicit path when one is given."""
+    path = tmp_path / "config.yaml"
+    path.write_text("{}")
+
+    assert get_config_candidates(str(path)) == [path]
+
+
+def test_raises_for_missing_explicit_path(tmp_path):
+    """Raises FileNotFoundError when the explicit path does not exist."""
+    with pytest.raises(FileNotFoundError):
+        get_config_candidates(str(tmp_path / "missing.yaml"))
+
+
+def test_returns_search_locations_without_env(tmp_path):
+    """Falls back to the search locations when no path is configured."""
+    with mock_env({}, clear_prefix="ELECTRIC_TEXT_CONFIG"):
+        candidates = get_config_candidates(search_locations=["~/a.yaml"])
+
+    assert candidates == [Path("~/a.yaml").expanduser()]
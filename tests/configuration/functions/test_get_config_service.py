@@ -0,0 +1,8 @@
+from electric_text.configuration.functions.get_config_service import (
+    get_config_service,
+)
+
+
+def test_returns_shared_service():
+    """Returns the same service on every call."""
+    assert get_config_service() is get_config_service()
@@ -0,0 +1,15 @@
+from electric_text.configuration.functions.get_environment_fingerprint import (
+    get_environment_fingerprint,
+)
+from tests.boundaries import mock_env
+
+
+def test_collects_only_electric_text_variables():
+    """Collects ELECTRIC_TEXT_* variables in sorted order."""
+    with mock_env(
+        {"ELECTRIC_TEXT_B": "2", "ELECTRIC_TEXT_A": "1", "OTHER": "x"},
+        clear_prefix="ELECTRIC_TEXT_",
+    ):
+        fingerprint = get_environment_fingerprint()
+
+    assert fingerprint == (("ELECTRIC_TEXT_A", "1"), ("ELECTRIC_TEXT_B", "2"))
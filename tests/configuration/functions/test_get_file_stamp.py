@@ -0,0 +1,14 @@
+from electric_text.configuration.functions.get_file_stamp import get_file_stamp
+
+
+def test_returns_mtime_and_size(tmp_path):
+    """Returns the file's modification time in nanoseconds and its size."""
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1")
+
+    assert get_file_stamp(str(path)) == (path.stat().st_mtime_ns, 4)
+
+
+def test_returns_none_for_missing_file(tmp_path):
+    """Returns None when the path does not exist."""
+    assert get_file_stamp(str(tmp_path / "missing.yaml")) is None
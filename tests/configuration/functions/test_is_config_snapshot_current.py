@@ -0,0 +1,36 @@
+from electric_text.configuration.functions.build_config_snapshot import (
+    build_config_snapshot,
+)
+from electric_text.configuration.functions.is_config_snapshot_current import (
+    is_config_snapshot_current,
+)
+from tests.boundaries import mock_env
+from tests.fixtures import touch_later
+
+
+def test_current_when_nothing_changed(tmp_path):
+    """Reports an unchanged snapshot as current."""
+    path = tmp_path / "config.yaml"
+    path.write_text("{}")
+
+    assert is_config_snapshot_current(build_config_snapshot(str(path)))
+
+
+def test_stale_when_file_changes(tmp_path):
+    """Reports the snapshot as stale when the config file is rewritten."""
+    path = tmp_path / "config.yaml"
+    path.write_text("{}")
+    snapshot = build_config_snapshot(str(path))
+    touch_later(path)
+
+    assert not is_config_snapshot_current(snapshot)
+
+
+def test_stale_when_environment_changes(tmp_path):
+    """Reports the snapshot as stale when an ELECTRIC_TEXT_* variable changes."""
+    path = tmp_path / "config.yaml"
+    path.write_text("{}")
+    snapshot = build_config_snapshot(str(path))
+
+    with mock_env({"ELECTRIC_TEXT_OLLAMA_MODEL_SHORTHAND_X": "m++x"}):
+        assert not is_config_snapshot_current(snapshot)
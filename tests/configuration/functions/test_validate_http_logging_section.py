@@ -45,3 +45,52 @@ def test_multiple_invalid_fields():
     assert len(issues) == 2
     assert "http_logging.enabled must be a boolean" in issues
     assert "http_logging.log_dir must be a string" in issues
+
+
+def test_valid_writer_options():
+    """Valid background writer options have no issues"""
+    config = {
+        "queue_size": 10,
+        "overflow": "block",
+        "block_timeout": 0.5,
+        "segment_max_bytes": 1024,
+        "compress": True,
+        "batch_size": 5,
+    }
+    issues = validate_http_logging_section(config)
+    assert issues == []
+
+
+def test_invalid_queue_size():
+    """Non-positive queue_size returns issue"""
+    config = {"queue_size": 0}
+    issues = validate_http_logging_section(config)
+    assert "http_logging.queue_size must be a positive integer" in issues
+
+
+def test_invalid_overflow():
+    """Unknown overflow policy returns issue"""
+    config = {"overflow": "wait"}
+    issues = validate_http_logging_section(config)
+    assert "http_logging.overflow must be 'drop' or 'block'" in issues
+
+
+def test_invalid_compress_type():
+    """Invalid compress type returns issue"""
+    config = {"compress": "yes"}
+    issues = validate_http_logging_section(config)
+    assert "http_logging.compress must be a boolean" in issues
+
+
+def test_invalid_sample_rate():
+    """Sample rate outside 0..1 returns issue"""
+    config = {"sample_rate": 1.5}
+    issues = validate_http_logging_section(config)
+    assert "http_logging.sample_rate must be a number between 0 and 1" in issues
+
+
+def test_invalid_buffer_size():
+    """Negative buffer_size returns issue"""
+    config = {"buffer_size": -1}
+    issues = validate_http_logging_section(config)
+    assert "http_logging.buffer_size must be a non-negative integer" in issues
@@ -0,0 +1,55 @@
+from electric_text.configuration.config_service import ConfigService
+from tests.fixtures import touch_later
+
+
+def write_config(path, level):
+    """Write a config file that sets the logging level."""
+    path.write_text(f"logging:\n  level: {level}\n")
+
+
+def test_returns_same_snapshot_within_interval(tmp_path):
+    """Serves the current snapshot without re-checking inside the interval."""
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+    service = ConfigService(check_interval_s=3600)
+    first = service.get_snapshot(str(path))
+
+    write_config(path, "DEBUG")
+    touch_later(path)
+
+    assert service.get_snapshot(str(path)) is first
+
+
+def test_reloads_changed_file_after_interval(tmp_path):
+    """Swaps in a new snapshot when the file changed since it was loaded."""
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+    service = ConfigService(check_interval_s=0)
+    service.get_snapshot(str(path))
+
+    write_config(path, "DEBUG")
+    touch_later(path)
+
+    assert service.get_snapshot(str(path)).config.logging == {"level": "DEBUG"}
+
+
+def test_keeps_snapshot_when_unchanged(tmp_path):
+    """Keeps the same snapshot when a check finds nothing changed."""
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+    service = ConfigService(check_interval_s=0)
+    first = service.get_snapshot(str(path))
+
+    assert service.get_snapshot(str(path)) is first
+
+
+def test_reloads_after_invalidate(tmp_path):
+    """Builds a new snapshot after being invalidated."""
+    path = tmp_path / "config.yaml"
+    write_config(path, "INFO")
+    service = ConfigService(check_interval_s=3600)
+    first = service.get_snapshot(str(path))
+
+    service.invalidate()
+
+    assert service.get_snapshot(str(path)) is not first
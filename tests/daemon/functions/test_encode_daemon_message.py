@@ -0,0 +1,8 @@
+from electric_text.daemon.functions.encode_daemon_message import (
+    encode_daemon_message,
+)
+
+
+def test_encodes_json_line():
+    """Encodes a message as one newline-terminated JSON line."""
+    assert encode_daemon_message({"stdout": "a\nb"}) == b'{"stdout": "a\\nb"}\n'
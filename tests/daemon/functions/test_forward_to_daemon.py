@@ -0,0 +1,107 @@
+import io
+import os
+import socket
+import threading
+
+import pytest
+
+from electric_text.daemon.data.daemon_request import DaemonRequest
+from electric_text.daemon.functions.forward_to_daemon import forward_to_daemon
+
+
+def serve_once(path, reply):
+    """Listen on a socket and answer one connection with fixed bytes."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+
+    def answer():
+        connection, _ = server.accept()
+        with connection, server:
+            connection.makefile("rb").readline()
+            connection.sendall(reply)
+
+    thread = threading.Thread(target=answer)
+    thread.start()
+    return thread
+
+
+def forward(path):
+    """Forward a request and capture what it writes."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = forward_to_daemon(DaemonRequest(args=["Hi"]), path, stdout, stderr)
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def test_returns_none_without_daemon(tmp_path):
+    """Falls back to in-process when nothing listens on the socket."""
+    assert forward(str(tmp_path / "d.sock")) == (None, "", "")
+
+
+@pytest.mark.skipif(os.getuid() != 0, reason="needs root to change the owner")
+def test_refuses_socket_of_another_user(tmp_path):
+    """Runs in-process rather than sending arguments to another user's socket."""
+    path = str(tmp_path / "d.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    os.chown(path, 65534, 65534)
+
+    with server:
+        result = forward(path)
+
+    assert result == (
+        None,
+        "",
+        f"Warning: not forwarding to {path}, which belongs to another user\n",
+    )
+
+
+def test_copies_output_and_returns_exit_code(tmp_path):
+    """Writes streamed output to stdout and stderr and returns the exit code."""
+    path = str(tmp_path / "d.sock")
+    thread = serve_once(
+        path, b'{"stdout": "out\\n"}\n{"stderr": "err\\n"}\n{"exit_code": 3}\n'
+    )
+
+    result = forward(path)
+    thread.join()
+
+    assert result == (3, "out\n", "err\n")
+
+
+def test_returns_none_on_mismatch(tmp_path):
+    """Falls back to in-process when the daemon reports a mismatch."""
+    path = str(tmp_path / "d.sock")
+    thread = serve_once(path, b'{"mismatch": "fingerprint"}\n')
+
+    result = forward(path)
+    thread.join()
+
+    assert result == (None, "", "")
+
+
+def test_fails_when_connection_drops_after_output(tmp_path):
+    """Reports an error when the daemon disappears mid-response."""
+    path = str(tmp_path / "d.sock")
+    thread = serve_once(path, b'{"stdout": "partial\\n"}\n')
+
+    result = forward(path)
+    thread.join()
+
+    assert result == (
+        1,
+        "partial\n",
+        "Error: lost connection to the electric_text daemon\n",
+    )
+
+
+def test_returns_none_when_connection_drops_before_output(tmp_path):
+    """Falls back to in-process when the daemon closes without answering."""
+    path = str(tmp_path / "d.sock")
+    thread = serve_once(path, b"")
+
+    result = forward(path)
+    thread.join()
+
+    assert result == (None, "", "")
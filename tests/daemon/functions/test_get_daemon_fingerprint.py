@@ -0,0 +1,45 @@
+from electric_text.daemon.functions.get_daemon_fingerprint import (
+    get_daemon_fingerprint,
+)
+
+
+def test_matches_for_same_directory_and_environment():
+    """Produces the same fingerprint regardless of variable order."""
+    first = get_daemon_fingerprint(
+        "/work", {"ELECTRIC_TEXT_A": "1", "ELECTRIC_TEXT_B": "2"}
+    )
+
+    assert first == get_daemon_fingerprint(
+        "/work", {"ELECTRIC_TEXT_B": "2", "ELECTRIC_TEXT_A": "1"}
+    )
+
+
+def test_differs_by_directory():
+    """Changes with the working directory."""
+    assert get_daemon_fingerprint("/a", {}) != get_daemon_fingerprint("/b", {})
+
+
+def test_differs_by_electric_text_variable():
+    """Changes when an ELECTRIC_TEXT_* variable changes."""
+    first = get_daemon_fingerprint("/work", {"ELECTRIC_TEXT_API_KEY": "one"})
+
+    assert first != get_daemon_fingerprint("/work", {"ELECTRIC_TEXT_API_KEY": "two"})
+
+
+def test_ignores_other_variables():
+    """Ignores variables outside the ELECTRIC_TEXT_ prefix."""
+    first = get_daemon_fingerprint("/work", {"PATH": "/bin"})
+
+    assert first == get_daemon_fingerprint("/work", {"PATH": "/usr/bin"})
+
+
+def test_ignores_daemon_control_variables():
+    """Ignores the variables that only control forwarding."""
+    environ = {
+        "ELECTRIC_TEXT_DAEMON_SOCKET": "/run/et.sock",
+        "ELECTRIC_TEXT_NO_DAEMON": "0",
+    }
+
+    assert get_daemon_fingerprint("/work", environ) == get_daemon_fingerprint(
+        "/work", {}
+    )
@@ -0,0 +1,32 @@
+import os
+import tempfile
+
+from electric_text.daemon.functions.get_daemon_socket_path import (
+    get_daemon_socket_path,
+)
+
+
+def test_uses_configured_socket():
+    """Uses ELECTRIC_TEXT_DAEMON_SOCKET when it is set."""
+    environ = {
+        "ELECTRIC_TEXT_DAEMON_SOCKET": "/run/et.sock",
+        "XDG_RUNTIME_DIR": "/run/user/1000",
+    }
+
+    assert get_daemon_socket_path(environ) == "/run/et.sock"
+
+
+def test_uses_runtime_dir():
+    """Puts the socket in XDG_RUNTIME_DIR when it is set."""
+    environ = {"XDG_RUNTIME_DIR": "/run/user/1000"}
+
+    assert get_daemon_socket_path(environ) == "/run/user/1000/electric_text.sock"
+
+
+def test_defaults_to_per_user_temp_directory():
+    """Defaults to a socket in a temp subdirectory named for the current user."""
+    expected = os.path.join(
+        tempfile.gettempdir(), f"electric_text-{os.getuid()}", "daemon.sock"
+    )
+
+    assert get_daemon_socket_path({}) == expected
@@ -0,0 +1,26 @@
+import socket
+
+from electric_text.daemon.functions.is_daemon_listening import is_daemon_listening
+
+
+def test_detects_listening_socket(tmp_path):
+    """Returns True while something listens on the socket."""
+    path = str(tmp_path / "d.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        server.listen()
+
+        assert is_daemon_listening(path) is True
+
+
+def test_reports_missing_socket(tmp_path):
+    """Returns False when there is no socket file."""
+    assert is_daemon_listening(str(tmp_path / "d.sock")) is False
+
+
+def test_reports_stale_socket(tmp_path):
+    """Returns False for a socket file nothing listens on."""
+    path = str(tmp_path / "d.sock")
+    socket.socket(socket.AF_UNIX, socket.SOCK_STREAM).bind(path)
+
+    assert is_daemon_listening(path) is False
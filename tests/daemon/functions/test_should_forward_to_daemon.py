@@ -0,0 +1,37 @@
+from electric_text.daemon.functions.should_forward_to_daemon import (
+    should_forward_to_daemon,
+)
+
+
+def test_forwards_plain_runs():
+    """Forwards an ordinary prompt run."""
+    assert should_forward_to_daemon(["Hello", "-m", "ollama:llama3"], {}) is True
+
+
+def test_keeps_profiled_runs_in_process():
+    """Runs --profile invocations in-process."""
+    assert should_forward_to_daemon(["Hello", "--profile", "out.pstats"], {}) is False
+
+
+def test_keeps_profile_options_in_process():
+    """Runs --profile-* invocations in-process."""
+    assert should_forward_to_daemon(["Hello", "--profile-memory"], {}) is False
+
+
+def test_keeps_profile_with_value_in_process():
+    """Runs --profile=PATH invocations in-process."""
+    assert should_forward_to_daemon(["Hello", "--profile=out.pstats"], {}) is False
+
+
+def test_respects_no_daemon():
+    """Runs in-process when ELECTRIC_TEXT_NO_DAEMON is set."""
+    environ = {"ELECTRIC_TEXT_NO_DAEMON": "1"}
+
+    assert should_forward_to_daemon(["Hello"], environ) is False
+
+
+def test_forwards_when_no_daemon_is_zero():
+    """Forwards when ELECTRIC_TEXT_NO_DAEMON is 0."""
+    environ = {"ELECTRIC_TEXT_NO_DAEMON": "0"}
+
+    assert should_forward_to_daemon(["Hello"], environ) is True
@@ -1,8 +1,8 @@
 import os
 import pytest
 import respx
-from electric_text.configuration.functions.get_cached_config import (
-    get_cached_config,
+from electric_text.configuration.functions.get_config_service import (
+    get_config_service,
 )
 
 
@@ -25,7 +25,7 @@ def clean_env():
             del os.environ[key]
 
     # Clear config cache
-    get_cached_config.cache_clear()
+    get_config_service().invalidate()
 
     yield
 
@@ -34,7 +34,20 @@ def clean_env():
     os.environ.update(env_backup)
 
     # Clear config cache again
-    get_cached_config.cache_clear()
+    get_config_service().invalidate()
+
+
+@pytest.fixture
+def example_config(tmp_path):
+    """Copy examples/config.yaml with its HTTP logs going to a temporary directory."""
+    import yaml
+
+    with open("examples/config.yaml") as file:
+        config = yaml.safe_load(file)
+    config["http_logging"]["log_dir"] = str(tmp_path / "http_logs")
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump(config))
+    return str(path)
 
 
 def sample_http_log_entry():
@@ -57,9 +70,12 @@ def sample_http_log_entry():
         response_headers={"Content-Type": "application/json"},
         response_body={"choices": [{"message": {"content": "Hi there!"}}]},
         duration_ms=1222.2,
+        ttfb_ms=310.5,
+        response_chunks=[(310.5, 48)],
         provider="openai",
         model="gpt-4",
         error=None,
+        entry_id="entry-1",
     )
 
 
@@ -80,4 +96,276 @@ def minimal_http_log_entry():
         provider=None,
         model=None,
         error="HTTP 404",
+        entry_id="entry-2",
+    )
+
+
+def http_log_settings(log_dir, **overrides):
+    """Create HttpLogSettings for a temporary log directory."""
+    from electric_text.providers.logging.data.http_log_settings import (
+        HttpLogSettings,
+    )
+
+    return HttpLogSettings(log_dir=str(log_dir), **overrides)
+
+
+def replay_log_record(request_body, response_body, **response_overrides):
+    """Create one HTTP log record as written by the HTTP log writer."""
+    return {
+        "id": "entry-1",
+        "request": {"method": "POST", "body": request_body},
+        "response": {
+            "status": 200,
+            "headers": {"content-type": "application/x-ndjson"},
+            "body": response_body,
+            **response_overrides,
+        },
+        "ttfb_ms": 12.0,
+    }
+
+
+def write_replay_log(log_dir, records, name="http-replay.jsonl"):
+    """Write HTTP log records to a JSONL segment in log_dir."""
+    import json
+
+    path = log_dir / name
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return path
+
+
+def sample_load_test_report(**overrides):
+    """Create a LoadTestReport with one failed request for testing."""
+    from electric_text.load_testing import (
+        LatencySummary,
+        LoadTestReport,
+        LoadTestSettings,
+    )
+
+    latency = LatencySummary(
+        count=9, mean=120.0, p50=110.0, p90=150.0, p95=160.0, p99=190.0, max=200.0
+    )
+    defaults = dict(
+        settings=LoadTestSettings(total_requests=10, concurrency=2),
+        target="mock:ollama/m",
+        succeeded=9,
+        failed=1,
+        duration_s=2.0,
+        throughput_rps=5.0,
+        ttft=latency,
+        latency=latency,
+        errors={"http_error": 1},
+        cpu_s=0.5,
+        peak_rss_mb=64.0,
+    )
+
+    return LoadTestReport(**{**defaults, **overrides})
+
+
+def write_prompt_config(prompt_dir, name, system_message="Be brief.", **fields):
+    """Write a prompt config and its system message file to prompt_dir."""
+    import json
+
+    (prompt_dir / f"{name}.txt").write_text(system_message)
+    config = {
+        "name": name,
+        "description": f"The {name} prompt",
+        "system_message_path": f"{name}.txt",
+        **fields,
+    }
+    path = prompt_dir / f"{name}.json"
+    path.write_text(json.dumps(config))
+    return path
+
+
+def touch_later(path, seconds=10):
+    """Move a file's mtime forward so edits are visible to stamp checks."""
+    import os
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def write_tool_configs(config_dir, tool_boxes, tool_names):
+    """Write tool_boxes.json and a weather-style config for each tool name."""
+    import json
+
+    (config_dir / "tool_boxes.json").write_text(json.dumps(tool_boxes))
+    for name in tool_names:
+        tool = {
+            "name": name,
+            "description": f"The {name} tool",
+            "parameters": {"type": "object", "properties": {}},
+        }
+        (config_dir / f"{name}.json").write_text(json.dumps(tool))
+
+
+@pytest.fixture
+def client_pool():
+    """Provide a fresh process-wide client pool and discard it afterwards."""
+    from electric_text.prompting.functions.get_client_pool import get_client_pool
+
+    get_client_pool.cache_clear()
+    yield get_client_pool()
+    get_client_pool.cache_clear()
+
+
+@pytest.fixture
+def connection_manager(clean_env):
+    """Provide a fresh web connection manager, configured from the environment.
+
+    Set ELECTRIC_TEXT_WEB_* variables before first using the manager.
+    """
+    from electric_text.web.functions.get_connection_manager import (
+        get_connection_manager,
+    )
+
+    get_connection_manager.cache_clear()
+    yield get_connection_manager
+    get_connection_manager.cache_clear()
+
+
+class ManualClock:
+    """Monotonic clock that only moves when a test sets now."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def ollama_chat_transport(requests_seen, content="Hello"):
+    """Mock transport answering Ollama chat requests, recording each request."""
+    import httpx
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "model": "llama3",
+                "message": {"role": "assistant", "content": content},
+                "done": True,
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def endless_ollama_transport(closed_streams):
+    """Mock transport streaming Ollama chunks until the response is closed."""
+    import asyncio
+    import json
+
+    import httpx
+
+    chunk = json.dumps(
+        {"model": "llama3", "message": {"role": "assistant", "content": "word "}}
+    )
+
+    class EndlessStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            while True:
+                await asyncio.sleep(0)
+                yield f"{chunk}\n".encode()
+
+        async def aclose(self):
+            closed_streams.append(self)
+
+    return httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            headers={"content-type": "application/x-ndjson"},
+            stream=EndlessStream(),
+        )
+    )
+
+
+async def forward_in_thread(socket_path, args, fingerprint):
+    """Forward a CLI invocation from a worker thread, as a separate CLI would."""
+    import asyncio
+    import io
+
+    from electric_text.daemon import DaemonRequest, forward_to_daemon
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = await asyncio.to_thread(
+        forward_to_daemon,
+        DaemonRequest(args=args, fingerprint=fingerprint),
+        socket_path,
+        stdout,
+        stderr,
+    )
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def text_output(content):
+    """Create a TEXT SystemOutput."""
+    from electric_text.prompting.data.system_output import SystemOutput
+    from electric_text.prompting.data.system_output_type import SystemOutputType
+    from electric_text.prompting.data.text_output import TextOutput
+
+    return SystemOutput(
+        response_type=SystemOutputType.TEXT, text=TextOutput(content=content)
+    )
+
+
+def data_output(data, is_valid=False):
+    """Create a DATA SystemOutput."""
+    from electric_text.prompting.data.data_output import DataOutput
+    from electric_text.prompting.data.system_output import SystemOutput
+    from electric_text.prompting.data.system_output_type import SystemOutputType
+
+    return SystemOutput(
+        response_type=SystemOutputType.DATA,
+        data=DataOutput(data=data, is_valid=is_valid),
+    )
+
+
+def tool_call_output(name, inputs_json, inputs=None):
+    """Create a TOOL_CALL SystemOutput."""
+    from electric_text.prompting.data.system_output import SystemOutput
+    from electric_text.prompting.data.system_output_type import SystemOutputType
+    from electric_text.prompting.data.tool_call_output import ToolCallOutput
+
+    return SystemOutput(
+        response_type=SystemOutputType.TOOL_CALL,
+        tool_call=ToolCallOutput(
+            name=name, inputs=inputs or {}, inputs_json=inputs_json
+        ),
     )
+
+
+def start_prompt(prompt, state, settings=None):
+    """Start a prompt task the way event_stream does."""
+    import asyncio
+
+    from electric_text.web.admission_controller import AdmissionController
+    from electric_text.web.data import ConnectionSettings
+    from electric_text.web.routes import finish_prompt, process_prompt
+
+    settings = settings or ConnectionSettings()
+    admission = AdmissionController(settings)
+    task = asyncio.create_task(process_prompt(prompt, state, settings, admission))
+    task.add_done_callback(lambda task: finish_prompt(state, task))
+    state.task = task
+    return task
+
+
+def use_config_file(config_dir, text):
+    """Write a config file to config_dir and point ELECTRIC_TEXT_CONFIG at it."""
+    path = config_dir / "config.yaml"
+    path.write_text(text)
+    os.environ["ELECTRIC_TEXT_CONFIG"] = str(path)
+    return path
+
+
+async def run_process_text(args):
+    """Run the default CLI command and capture its exit code, stdout and stderr."""
+    import io
+
+    from electric_text.cli.functions.process_text import process_text
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = await process_text(args, stdout, stderr)
+    return exit_code, stdout.getvalue(), stderr.getvalue()
@@ -0,0 +1,42 @@
+from electric_text.load_testing.data.load_test_settings import LoadTestSettings
+from electric_text.load_testing.data.request_sample import RequestSample
+from electric_text.load_testing.functions.build_load_test_report import (
+    build_load_test_report,
+)
+
+
+def test_aggregates_samples():
+    """Aggregates samples, summarizing latencies of successful requests only."""
+    samples = [
+        RequestSample(10.0, 100.0),
+        RequestSample(20.0, 200.0),
+        RequestSample(None, 1.0, ("http_error",)),
+        RequestSample(None, 300.0),
+    ]
+
+    report = build_load_test_report(
+        LoadTestSettings(), "mock:m", samples, 2.0, 0.1, None
+    )
+
+    assert (
+        report.succeeded,
+        report.failed,
+        report.throughput_rps,
+        report.ttft.count if report.ttft else 0,
+        report.latency.max if report.latency else 0,
+        report.errors,
+    ) == (3, 1, 2.0, 2, 300.0, {"http_error": 1})
+
+
+def test_has_no_distributions_when_everything_failed():
+    """Has no latency distributions when every request failed."""
+    report = build_load_test_report(
+        LoadTestSettings(),
+        "mock:m",
+        [RequestSample(None, 1.0, ("exception:ValueError",))],
+        1.0,
+        0.1,
+        None,
+    )
+
+    assert (report.ttft, report.latency) == (None, None)
@@ -0,0 +1,18 @@
+from electric_text.load_testing.data.request_sample import RequestSample
+from electric_text.load_testing.functions.count_errors import count_errors
+
+
+def test_counts_requests_per_error_kind_most_frequent_first():
+    """Counts requests per error kind, most frequent first."""
+    samples = [
+        RequestSample(None, 1.0, ("parse_error",)),
+        RequestSample(None, 1.0, ("http_error",)),
+        RequestSample(None, 1.0, ("http_error", "parse_error")),
+        RequestSample(None, 1.0, ("http_error",)),
+        RequestSample(None, 1.0),
+    ]
+
+    assert list(count_errors(samples).items()) == [
+        ("http_error", 3),
+        ("parse_error", 2),
+    ]
@@ -0,0 +1,34 @@
+from electric_text.load_testing.functions.format_load_test_report import (
+    format_load_test_report,
+)
+from tests.fixtures import sample_load_test_report
+
+
+def test_formats_summary_percentiles_and_errors():
+    """Formats throughput, resources, percentile rows and the error breakdown."""
+    text = format_load_test_report(sample_load_test_report())
+
+    for expected in [
+        "mock:ollama/m (stream, concurrency 2, closed loop)",
+        "10 (9 ok, 1 failed) in 2.00s",
+        "5.0 req/s",
+        "0.50s (25% of one core)",
+        "64.0 MB",
+        "TTFT               110.0     150.0     160.0     190.0     200.0",
+        "http_error",
+    ]:
+        assert expected in text
+
+
+def test_omits_errors_section_without_errors():
+    """Omits the errors section when nothing failed."""
+    text = format_load_test_report(sample_load_test_report(errors={}, failed=0))
+
+    assert "Errors" not in text
+
+
+def test_shows_missing_distribution_as_dash():
+    """Shows a dash for a missing distribution."""
+    text = format_load_test_report(sample_load_test_report(ttft=None))
+
+    assert "TTFT                   -" in text
@@ -0,0 +1,12 @@
+from electric_text.load_testing.functions.get_cpu_percent import get_cpu_percent
+from tests.fixtures import sample_load_test_report
+
+
+def test_relates_cpu_time_to_duration():
+    """Relates CPU time to wall-clock duration."""
+    assert get_cpu_percent(sample_load_test_report(cpu_s=0.5, duration_s=2.0)) == 25.0
+
+
+def test_returns_zero_without_duration():
+    """Returns zero for a test without duration."""
+    assert get_cpu_percent(sample_load_test_report(duration_s=0.0)) == 0.0
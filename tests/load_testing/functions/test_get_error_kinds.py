@@ -0,0 +1,13 @@
+from electric_text.load_testing.functions.get_error_kinds import get_error_kinds
+
+
+def test_lists_distinct_error_types_in_order():
+    """Lists each error chunk type once, in order of appearance."""
+    assert get_error_kinds(
+        ["parse_error", "text_delta", "parse_error", "http_error"]
+    ) == ("parse_error", "http_error")
+
+
+def test_returns_nothing_for_clean_response():
+    """Returns no errors for a response without error chunks."""
+    assert get_error_kinds(["full_text"]) == ()
@@ -0,0 +1,8 @@
+from electric_text.load_testing.functions.get_peak_rss_mb import get_peak_rss_mb
+
+
+def test_reports_positive_peak_memory():
+    """Reports a positive peak memory where available."""
+    peak = get_peak_rss_mb()
+
+    assert peak is None or peak > 0
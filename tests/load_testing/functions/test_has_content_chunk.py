@@ -0,0 +1,11 @@
+from electric_text.load_testing.functions.has_content_chunk import has_content_chunk
+
+
+def test_detects_text_delta():
+    """Detects a text delta."""
+    assert has_content_chunk(["stream_start", "text_delta"])
+
+
+def test_ignores_framing_chunks():
+    """Ignores chunks without generated content."""
+    assert not has_content_chunk(["prefilled_content", "text_start"])
@@ -0,0 +1,18 @@
+import json
+
+from electric_text.load_testing.functions.load_test_report_to_dict import (
+    load_test_report_to_dict,
+)
+from tests.fixtures import sample_load_test_report
+
+
+def test_converts_report_to_json_ready_dict():
+    """Converts the report, including nested summaries, to a JSON-ready dict."""
+    result = load_test_report_to_dict(sample_load_test_report())
+
+    assert (
+        result["latency"]["p99"],
+        result["settings"]["concurrency"],
+        result["cpu_percent"],
+        json.loads(json.dumps(result)) == result,
+    ) == (190.0, 2, 25.0, True)
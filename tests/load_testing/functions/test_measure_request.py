@@ -0,0 +1,53 @@
+from time import perf_counter
+
+import pytest
+
+from electric_text.clients import Client
+from electric_text.load_testing.functions.measure_request import measure_request
+from electric_text.prompting.functions.create_load_test_target import (
+    create_load_test_target,
+)
+
+
+@pytest.mark.asyncio
+async def test_measures_streamed_request():
+    """Measures TTFT and latency of a streamed request."""
+    client, request = create_load_test_target("mock:ollama/m", "Hi")
+
+    sample = await measure_request(client, request, True, perf_counter())
+
+    assert (
+        sample.errors,
+        sample.ttft_ms is not None and sample.ttft_ms <= sample.latency_ms,
+    ) == ((), True)
+
+
+@pytest.mark.asyncio
+async def test_measures_completion_without_ttft():
+    """Measures only latency for completions."""
+    client, request = create_load_test_target("mock:openai/m", "Hi")
+
+    sample = await measure_request(client, request, False, perf_counter())
+
+    assert (sample.errors, sample.ttft_ms) == ((), None)
+
+
+@pytest.mark.asyncio
+async def test_records_error_chunks():
+    """Records error chunk types as errors."""
+    _, request = create_load_test_target("mock:anthropic/m", "Hi")
+    client = Client("mock", {"error_rate": "1"})
+
+    sample = await measure_request(client, request, True, perf_counter())
+
+    assert sample.errors == ("http_error",)
+
+
+@pytest.mark.asyncio
+async def test_records_exceptions():
+    """Records exceptions by type instead of raising them."""
+    client, request = create_load_test_target("mock:unknown/m", "Hi")
+
+    sample = await measure_request(client, request, True, perf_counter())
+
+    assert sample.errors == ("exception:ModuleNotFoundError",)
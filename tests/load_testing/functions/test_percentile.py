@@ -0,0 +1,19 @@
+from electric_text.load_testing.functions.percentile import percentile
+
+
+def test_interpolates_between_ranks():
+    """Interpolates linearly between the closest ranks."""
+    assert percentile([10.0, 20.0, 30.0, 40.0], 0.5) == 25.0
+
+
+def test_returns_extremes():
+    """Returns the minimum at 0 and the maximum at 1."""
+    assert (percentile([1.0, 5.0, 9.0], 0.0), percentile([1.0, 5.0, 9.0], 1.0)) == (
+        1.0,
+        9.0,
+    )
+
+
+def test_handles_single_value():
+    """Returns the only value for any percentile."""
+    assert percentile([7.0], 0.99) == 7.0
@@ -0,0 +1,49 @@
+import pytest
+
+from electric_text.clients import Client
+from electric_text.load_testing import LoadTestSettings, run_load_test
+from electric_text.prompting.functions.create_load_test_target import (
+    create_load_test_target,
+)
+
+
+@pytest.mark.asyncio
+async def test_sends_all_requests_concurrently():
+    """Sends every request and overlaps them up to the concurrency."""
+    _, request = create_load_test_target("mock:ollama/m", "Hi")
+    client = Client("mock", {"tokens_per_second": "1000", "response_tokens": "20"})
+
+    report = await run_load_test(
+        client, request, LoadTestSettings(total_requests=20, concurrency=10)
+    )
+
+    assert (report.succeeded, report.failed, report.duration_s < 0.02 * 20 / 2) == (
+        20,
+        0,
+        True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_paces_requests_at_target_rate():
+    """Spreads request starts over the duration implied by the rate."""
+    client, request = create_load_test_target("mock:ollama/m", "Hi")
+
+    report = await run_load_test(
+        client, request, LoadTestSettings(total_requests=5, concurrency=5, rate=100)
+    )
+
+    assert report.duration_s >= 4 / 100
+
+
+@pytest.mark.asyncio
+async def test_reports_failures_by_error_kind():
+    """Reports failed requests by error kind."""
+    _, request = create_load_test_target("mock:ollama/m", "Hi")
+    client = Client("mock", {"error_rate": "1"})
+
+    report = await run_load_test(
+        client, request, LoadTestSettings(total_requests=3, concurrency=3)
+    )
+
+    assert (report.failed, report.errors) == (3, {"http_error": 3})
@@ -0,0 +1,32 @@
+from dataclasses import astuple
+
+import pytest
+
+from electric_text.load_testing.data.latency_summary import LatencySummary
+from electric_text.load_testing.functions.summarize_latencies import (
+    summarize_latencies,
+)
+
+
+def test_summarizes_distribution():
+    """Summarizes count, mean, percentiles and maximum."""
+    summary = summarize_latencies([float(value) for value in range(100, 0, -1)])
+
+    assert summary is not None and astuple(summary) == pytest.approx(
+        astuple(
+            LatencySummary(
+                count=100,
+                mean=50.5,
+                p50=50.5,
+                p90=90.1,
+                p95=95.05,
+                p99=99.01,
+                max=100.0,
+            )
+        )
+    )
+
+
+def test_returns_none_without_values():
+    """Returns None when there are no values."""
+    assert summarize_latencies([]) is None
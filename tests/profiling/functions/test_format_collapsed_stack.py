@@ -0,0 +1,12 @@
+import sys
+
+from electric_text.profiling.functions.format_collapsed_stack import (
+    format_collapsed_stack,
+)
+
+
+def test_formats_innermost_frame_last() -> None:
+    """Formats callers first and the innermost frame last."""
+    stack = format_collapsed_stack(sys._getframe())
+
+    assert stack.endswith(f"{__name__}:test_formats_innermost_frame_last")
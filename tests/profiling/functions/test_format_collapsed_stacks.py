@@ -0,0 +1,15 @@
+from electric_text.profiling.functions.format_collapsed_stacks import (
+    format_collapsed_stacks,
+)
+
+
+def test_formats_most_sampled_stack_first() -> None:
+    """Formats one line per stack, most sampled first."""
+    output = format_collapsed_stacks({"a;b": 1, "a;c": 5})
+
+    assert output == "a;c 5\na;b 1\n"
+
+
+def test_formats_no_samples_as_empty() -> None:
+    """Formats an empty sample set as an empty file."""
+    assert format_collapsed_stacks({}) == ""
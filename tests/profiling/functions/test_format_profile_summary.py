@@ -0,0 +1,39 @@
+from pathlib import Path
+from textwrap import dedent
+
+from electric_text.profiling.data.profile_report import ProfileReport
+from electric_text.profiling.functions.format_profile_summary import (
+    format_profile_summary,
+)
+
+
+def test_formats_phases_in_request_order_with_remainder() -> None:
+    """Formats recorded phases in request order followed by unattributed time."""
+    report = ProfileReport(
+        total_seconds=1.0,
+        phase_seconds={"network": 0.5, "config": 0.25},
+        phase_counts={"network": 4, "config": 1},
+        output_path=Path("out.pstats"),
+    )
+
+    assert format_profile_summary(report) == dedent("""\
+        Profile written to out.pstats (1000.0 ms total)
+          config               250.0 ms   25.0%  (1x)
+          network              500.0 ms   50.0%  (4x)
+          other                250.0 ms   25.0%""")
+
+
+def test_includes_memory_when_traced() -> None:
+    """Includes peak memory and top allocations when memory was traced."""
+    report = ProfileReport(
+        total_seconds=1.0,
+        phase_seconds={},
+        phase_counts={},
+        output_path=Path("out.pstats"),
+        peak_memory_bytes=2 * 1024 * 1024,
+        top_allocations=["module.py:1: size=1 KiB"],
+    )
+
+    assert format_profile_summary(report).endswith(
+        "  peak memory 2.00 MiB\n    module.py:1: size=1 KiB"
+    )
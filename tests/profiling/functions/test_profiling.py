@@ -0,0 +1,51 @@
+import pstats
+from pathlib import Path
+
+from electric_text.profiling.data.current_recorder import current_recorder
+from electric_text.profiling.data.profile_mode import ProfileMode
+from electric_text.profiling.data.profile_phase import ProfilePhase
+from electric_text.profiling.data.profile_settings import ProfileSettings
+from electric_text.profiling.functions.profiling import profiling
+from electric_text.profiling.functions.record_phase import record_phase
+
+
+def busy() -> int:
+    return sum(range(200_000))
+
+
+def test_writes_pstats_and_phase_report(tmp_path: Path) -> None:
+    """Writes a loadable pstats file and reports recorded phases."""
+    output_path = tmp_path / "run.pstats"
+    with profiling(ProfileSettings(output_path=output_path)) as session:
+        with record_phase(ProfilePhase.PARSE_VALIDATE):
+            busy()
+
+    assert session.report is not None
+    assert session.report.phase_counts == {"parse_validate": 1}
+    assert pstats.Stats(str(output_path)).total_calls > 0
+    assert current_recorder.get() is None
+
+
+def test_writes_collapsed_stacks_in_sampling_mode(tmp_path: Path) -> None:
+    """Writes collapsed stacks of the profiled thread in sampling mode."""
+    output_path = tmp_path / "run.collapsed"
+    settings = ProfileSettings(
+        output_path=output_path, mode=ProfileMode.SAMPLING, sample_interval=0.0005
+    )
+    with profiling(settings):
+        for _ in range(20):
+            busy()
+
+    assert ":busy " in output_path.read_text()
+
+
+def test_reports_peak_memory_when_requested(tmp_path: Path) -> None:
+    """Reports peak memory and allocation sites when memory tracing is on."""
+    settings = ProfileSettings(output_path=tmp_path / "run.pstats", memory=True)
+    with profiling(settings) as session:
+        data = [bytes(1024) for _ in range(100)]
+
+    assert session.report is not None
+    assert session.report.peak_memory_bytes is not None
+    assert session.report.peak_memory_bytes >= 100 * 1024
+    assert len(data) == 100
@@ -0,0 +1,53 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import pytest
+
+from electric_text.profiling.data.current_recorder import current_recorder
+from electric_text.profiling.data.phase_recorder import PhaseRecorder
+from electric_text.profiling.data.profile_phase import ProfilePhase
+from electric_text.profiling.functions.record_entry_phase import record_entry_phase
+from electric_text.profiling.functions.record_phase import record_phase
+
+
+@asynccontextmanager
+async def resource(events: list[str]) -> AsyncIterator[str]:
+    events.append("enter")
+    try:
+        yield "value"
+    finally:
+        events.append("exit")
+
+
+@pytest.mark.asyncio
+async def test_yields_wrapped_value_and_exits() -> None:
+    """Yields the wrapped value and exits the wrapped manager."""
+    events: list[str] = []
+    async with record_entry_phase(resource(events), ProfilePhase.NETWORK) as value:
+        events.append(value)
+
+    assert events == ["enter", "value", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_exits_wrapped_manager_on_error() -> None:
+    """Exits the wrapped manager and re-raises when the block fails."""
+    events: list[str] = []
+    with pytest.raises(ValueError):
+        async with record_entry_phase(resource(events), ProfilePhase.NETWORK):
+            raise ValueError("boom")
+
+    assert events == ["enter", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_records_only_entry_time() -> None:
+    """Records the entry under the phase but not the body of the block."""
+    recorder = PhaseRecorder()
+    token = current_recorder.set(recorder)
+    async with record_entry_phase(resource([]), ProfilePhase.NETWORK):
+        with record_phase(ProfilePhase.PARSE_VALIDATE):
+            pass
+    current_recorder.reset(token)
+
+    assert recorder.counts == {"network": 1, "parse_validate": 1}
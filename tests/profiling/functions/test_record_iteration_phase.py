@@ -0,0 +1,35 @@
+from typing import AsyncGenerator
+
+import pytest
+
+from electric_text.profiling.data.current_recorder import current_recorder
+from electric_text.profiling.data.phase_recorder import PhaseRecorder
+from electric_text.profiling.data.profile_phase import ProfilePhase
+from electric_text.profiling.functions.record_iteration_phase import (
+    record_iteration_phase,
+)
+
+
+async def numbers() -> AsyncGenerator[int, None]:
+    for number in range(3):
+        yield number
+
+
+def test_returns_iterator_unchanged_without_active_session() -> None:
+    """Returns the iterator itself when no profiling session is active."""
+    iterator = numbers()
+
+    assert record_iteration_phase(iterator, ProfilePhase.NETWORK) is iterator
+
+
+@pytest.mark.asyncio
+async def test_records_each_wait_including_exhaustion() -> None:
+    """Records one wait per item plus the final exhausting wait."""
+    recorder = PhaseRecorder()
+    token = current_recorder.set(recorder)
+    items = [
+        item async for item in record_iteration_phase(numbers(), ProfilePhase.NETWORK)
+    ]
+    current_recorder.reset(token)
+
+    assert (items, recorder.counts) == ([0, 1, 2], {"network": 4})
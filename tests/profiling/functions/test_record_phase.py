@@ -0,0 +1,36 @@
+from electric_text.profiling.data.current_recorder import current_recorder
+from electric_text.profiling.data.phase_recorder import PhaseRecorder
+from electric_text.profiling.data.profile_phase import ProfilePhase
+from electric_text.profiling.functions.record_phase import record_phase
+
+
+def test_records_nothing_without_active_session() -> None:
+    """Records nothing when no profiling session is active."""
+    with record_phase(ProfilePhase.CONFIG):
+        pass
+
+    assert current_recorder.get() is None
+
+
+def test_counts_phase_entries() -> None:
+    """Counts each entry into a phase."""
+    recorder = PhaseRecorder()
+    token = current_recorder.set(recorder)
+    for _ in range(3):
+        with record_phase(ProfilePhase.NETWORK):
+            pass
+    current_recorder.reset(token)
+
+    assert recorder.counts == {"network": 3}
+
+
+def test_excludes_nested_phase_time_from_parent() -> None:
+    """Excludes time spent in nested phases from the enclosing phase."""
+    recorder = PhaseRecorder()
+    token = current_recorder.set(recorder)
+    with record_phase(ProfilePhase.CONFIG):
+        with record_phase(ProfilePhase.PROMPT_LOADING):
+            sum(range(100_000))
+    current_recorder.reset(token)
+
+    assert recorder.seconds["config"] < recorder.seconds["prompt_loading"]
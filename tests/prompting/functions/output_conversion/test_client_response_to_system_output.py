@@ -46,6 +46,7 @@ def test_client_response_to_system_output_tool_call():
     assert tool_call is not None
     assert tool_call.name == "test_tool"
     assert tool_call.inputs == {"param1": "value1", "param2": 42}
+    assert tool_call.inputs_json == '{"param1": "value1", "param2": 42}'
     assert result.text is None
     assert result.data is None
 
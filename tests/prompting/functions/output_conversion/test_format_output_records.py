@@ -0,0 +1,63 @@
+import pytest
+
+from electric_text.prompting.data.output_format import OutputFormat
+from electric_text.prompting.functions.output_conversion.format_output_records import (
+    format_output_records,
+)
+from tests.fixtures import data_output, text_output
+
+
+async def updates(*outputs):
+    for output in outputs:
+        yield output
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+@pytest.mark.asyncio
+async def test_full_format_repeats_whole_output():
+    """Writes the whole accumulated output for every update."""
+    records = await collect(
+        format_output_records(
+            updates(text_output("Hi"), text_output("Hi there")), OutputFormat.FULL
+        )
+    )
+
+    assert [record["text"]["content"] for record in records] == ["Hi", "Hi there"]
+
+
+@pytest.mark.asyncio
+async def test_delta_format_writes_changes_then_summary():
+    """Writes appended text per update and a closing summary."""
+    records = await collect(
+        format_output_records(
+            updates(text_output("Hi"), text_output("Hi there")), OutputFormat.DELTA
+        )
+    )
+
+    assert [(record["type"], record.get("delta")) for record in records] == [
+        ("text_delta", "Hi"),
+        ("text_delta", " there"),
+        ("summary", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delta_format_completes_last_field():
+    """Writes the last data field before the summary."""
+    records = await collect(
+        format_output_records(
+            updates(data_output({"a": 1}), data_output({"a": 1, "b": 2})),
+            OutputFormat.DELTA,
+        )
+    )
+
+    assert [record.get("name") for record in records] == ["a", "b", None]
+
+
+@pytest.mark.asyncio
+async def test_delta_format_writes_nothing_without_updates():
+    """Writes no records, not even a summary, for an empty stream."""
+    assert await collect(format_output_records(updates(), OutputFormat.DELTA)) == []
@@ -0,0 +1,18 @@
+from electric_text.prompting.functions.output_conversion.get_appended_text import (
+    get_appended_text,
+)
+
+
+def test_returns_appended_suffix():
+    """Returns only the text added after the previous update."""
+    assert get_appended_text("Hello", "Hello world") == (" world", False)
+
+
+def test_returns_empty_when_unchanged():
+    """Returns nothing when the text did not change."""
+    assert get_appended_text("Hello", "Hello") == ("", False)
+
+
+def test_resets_when_text_was_rewritten():
+    """Returns the whole text as a reset when it no longer extends the previous."""
+    assert get_appended_text("Hello", "Help") == ("Help", True)
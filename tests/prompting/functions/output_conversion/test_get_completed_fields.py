@@ -0,0 +1,31 @@
+from electric_text.prompting.functions.output_conversion.get_completed_fields import (
+    get_completed_fields,
+)
+
+
+def test_completes_fields_followed_by_another():
+    """Reports a field once the next field has started."""
+    previous = {"title": "Ra"}
+    current = {"title": "Rain", "lines": []}
+
+    assert get_completed_fields(previous, current, final=False) == [("title", "Rain")]
+
+
+def test_holds_last_field_until_final():
+    """Holds back the field still streaming."""
+    assert get_completed_fields({}, {"title": "Ra"}, final=False) == []
+
+
+def test_completes_last_field_when_final():
+    """Reports the last field when the output is final."""
+    data = {"title": "Rain", "lines": ["a"]}
+
+    assert get_completed_fields(data, data, final=True) == [("lines", ["a"])]
+
+
+def test_does_not_repeat_completed_fields():
+    """Reports each field only once."""
+    previous = {"title": "Rain", "lines": ["a"]}
+    current = {"title": "Rain", "lines": ["a", "b"]}
+
+    assert get_completed_fields(previous, current, final=False) == []
@@ -0,0 +1,68 @@
+from electric_text.prompting.functions.output_conversion.get_output_deltas import (
+    get_output_deltas,
+)
+from tests.fixtures import data_output, text_output, tool_call_output
+
+
+def test_emits_appended_text():
+    """Emits only the text appended since the previous update."""
+    records = get_output_deltas(text_output("Hello"), text_output("Hello world"))
+
+    assert records == [{"type": "text_delta", "delta": " world"}]
+
+
+def test_emits_first_text_whole():
+    """Emits all text for the first update."""
+    assert get_output_deltas(None, text_output("Hi")) == [
+        {"type": "text_delta", "delta": "Hi"}
+    ]
+
+
+def test_emits_nothing_for_unchanged_output():
+    """Emits no records when nothing changed."""
+    assert get_output_deltas(text_output("Hi"), text_output("Hi")) == []
+
+
+def test_marks_rewritten_text_as_reset():
+    """Marks text that no longer extends the previous text as a reset."""
+    records = get_output_deltas(text_output("Hello"), text_output("Help"))
+
+    assert records == [{"type": "text_delta", "delta": "Help", "reset": True}]
+
+
+def test_starts_tool_call_with_its_name():
+    """Announces a new tool call before its first argument fragment."""
+    records = get_output_deltas(None, tool_call_output("weather", '{"ci'))
+
+    assert records == [
+        {"type": "tool_call_start", "name": "weather"},
+        {"type": "tool_call_delta", "delta": '{"ci'},
+    ]
+
+
+def test_emits_tool_argument_fragments():
+    """Emits only the argument JSON appended since the previous update."""
+    records = get_output_deltas(
+        tool_call_output("weather", '{"ci'),
+        tool_call_output("weather", '{"city": "Oslo"}'),
+    )
+
+    assert records == [{"type": "tool_call_delta", "delta": 'ty": "Oslo"}'}]
+
+
+def test_emits_completed_fields():
+    """Emits data fields as they complete."""
+    records = get_output_deltas(
+        data_output({"title": "Ra"}), data_output({"title": "Rain", "lines": []})
+    )
+
+    assert records == [{"type": "field", "name": "title", "value": "Rain"}]
+
+
+def test_emits_last_field_when_final():
+    """Emits the last data field once the output is final."""
+    output = data_output({"title": "Rain"})
+
+    assert get_output_deltas(output, output, final=True) == [
+        {"type": "field", "name": "title", "value": "Rain"}
+    ]
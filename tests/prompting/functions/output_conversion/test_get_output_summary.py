@@ -0,0 +1,36 @@
+from electric_text.prompting.functions.output_conversion.get_output_summary import (
+    get_output_summary,
+)
+from tests.fixtures import data_output, text_output, tool_call_output
+
+
+def test_summarizes_text_output():
+    """Summarizes a text output without repeating the text."""
+    assert get_output_summary(text_output("Hi"), 3) == {
+        "type": "summary",
+        "response_type": "TEXT",
+        "updates": 3,
+        "data": None,
+        "tool_call": None,
+    }
+
+
+def test_includes_data_validation_result():
+    """Includes whether structured data validated."""
+    summary = get_output_summary(data_output({"a": 1}, is_valid=True), 1)
+
+    assert summary["data"] == {
+        "is_valid": True,
+        "schema_name": None,
+        "validation_error": None,
+    }
+
+
+def test_includes_parsed_tool_call():
+    """Includes the tool call with its parsed inputs."""
+    output = tool_call_output("weather", '{"city": "Oslo"}', {"city": "Oslo"})
+
+    assert get_output_summary(output, 2)["tool_call"] == {
+        "name": "weather",
+        "inputs": {"city": "Oslo"},
+    }
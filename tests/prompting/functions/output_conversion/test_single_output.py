@@ -0,0 +1,14 @@
+import pytest
+
+from electric_text.prompting.functions.output_conversion.single_output import (
+    single_output,
+)
+from tests.fixtures import text_output
+
+
+@pytest.mark.asyncio
+async def test_yields_output_once():
+    """Yields the completed output as the only update."""
+    output = text_output("Hi")
+
+    assert [update async for update in single_output(output)] == [output]
@@ -0,0 +1,37 @@
+from electric_text.prompting.functions.build_prompt_index import build_prompt_index
+from tests.fixtures import write_prompt_config
+
+
+def test_indexes_configs_by_name_and_source(tmp_path):
+    """Indexes each config by name along with the file it came from."""
+    path = write_prompt_config(tmp_path, "poetry")
+
+    index = build_prompt_index(str(tmp_path))
+
+    assert (index.by_name["poetry"].name, index.sources["poetry"]) == (
+        "poetry",
+        str(path),
+    )
+
+
+def test_keeps_stamps_for_files_that_fail_to_load(tmp_path, capsys):
+    """Records stamps for broken files so fixing them invalidates the index."""
+    (tmp_path / "broken.json").write_text("{not json")
+
+    index = build_prompt_index(str(tmp_path))
+
+    assert (index.configs, list(index.file_stamps)) == (
+        [],
+        [str(tmp_path / "broken.json")],
+    )
+
+
+def test_keeps_first_config_for_duplicate_names(tmp_path):
+    """Resolves a duplicated name to the first file in sorted order."""
+    write_prompt_config(tmp_path, "a", system_message="first")
+    second = write_prompt_config(tmp_path, "b")
+    second.write_text(second.read_text().replace('"name": "b"', '"name": "a"'))
+
+    index = build_prompt_index(str(tmp_path))
+
+    assert (len(index.configs), index.sources["a"]) == (2, str(tmp_path / "a.json"))
@@ -0,0 +1,26 @@
+import os
+from pathlib import Path
+
+from electric_text.prompting.functions.create_client import create_client
+
+
+def test_creates_client_for_provider(clean_env):
+    """Creates a client for the named provider."""
+    assert create_client("mock").provider_name == "mock"
+
+
+def test_passes_api_key_to_provider(clean_env):
+    """Passes an explicit API key to the provider."""
+    client = create_client("anthropic", "test-key")
+
+    assert client.provider.client_kwargs["headers"]["x-api-key"] == "test-key"
+
+
+def test_applies_http_logging_settings(clean_env, tmp_path):
+    """Logs HTTP traffic to the configured directory when logging is enabled."""
+    os.environ["ELECTRIC_TEXT_HTTP_LOGGING"] = "true"
+    os.environ["ELECTRIC_TEXT_HTTP_LOG_DIR"] = str(tmp_path)
+
+    client = create_client("ollama")
+
+    assert client.provider.http_logger.log_dir == Path(tmp_path)
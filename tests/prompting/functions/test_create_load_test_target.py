@@ -0,0 +1,24 @@
+import pytest
+
+from electric_text.prompting.functions.create_load_test_target import (
+    create_load_test_target,
+)
+
+
+def test_creates_client_and_request(clean_env):
+    """Creates a client for the provider and a request for the model."""
+    client, request = create_load_test_target(
+        "mock:anthropic/m", "Say hello.", max_tokens=5
+    )
+
+    assert (client.provider_name, request.model_name, request.max_tokens) == (
+        "mock",
+        "anthropic/m",
+        5,
+    )
+
+
+def test_rejects_unknown_provider(clean_env):
+    """Raises ValueError for a model string naming an unknown provider."""
+    with pytest.raises(ValueError, match="Unknown provider: 'nope'"):
+        create_load_test_target("nope:x", "Say hello.")
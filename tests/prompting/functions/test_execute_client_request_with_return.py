@@ -0,0 +1,43 @@
+import pytest
+
+from electric_text.clients import Client
+from electric_text.clients.data.client_request import ClientRequest
+from electric_text.clients.data.default_output_schema import DefaultOutputSchema
+from electric_text.clients.data.prompt import Prompt
+from electric_text.clients.data.template_fragment import TemplateFragment
+from electric_text.prompting.functions.execute_client_request_with_return import (
+    execute_client_request_with_return,
+)
+from tests.fixtures import endless_ollama_transport
+
+REQUEST = ClientRequest(
+    provider_name="ollama",
+    model_name="llama3",
+    prompt=Prompt(prompt="Hi", system_message=[TemplateFragment(text="Be brief")]),
+    output_schema=DefaultOutputSchema,
+)
+
+
+@pytest.mark.asyncio
+async def test_returns_complete_output():
+    """Returns one output for the whole response without streaming."""
+    client = Client("mock", {"shape": "ollama"})
+
+    output = await execute_client_request_with_return(client=client, request=REQUEST)
+
+    assert len(output.text.content.split()) == 64
+
+
+@pytest.mark.asyncio
+async def test_closing_outputs_closes_http_stream():
+    """Closes the HTTP stream as soon as the streamed outputs are closed."""
+    closed_streams: list[object] = []
+    client = Client("ollama", {"transport": endless_ollama_transport(closed_streams)})
+    outputs = await execute_client_request_with_return(
+        client=client, request=REQUEST, stream=True
+    )
+    await anext(outputs)
+
+    await outputs.aclose()
+
+    assert len(closed_streams) == 1
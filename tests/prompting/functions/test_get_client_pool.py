@@ -0,0 +1,11 @@
+from electric_text.prompting.functions.get_client_pool import get_client_pool
+
+
+def test_returns_shared_pool(client_pool):
+    """Returns the same pool on every call."""
+    assert get_client_pool() is client_pool
+
+
+def test_starts_disabled(client_pool):
+    """Starts with pooling disabled."""
+    assert client_pool.enabled is False
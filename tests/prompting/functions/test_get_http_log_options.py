@@ -0,0 +1,25 @@
+from electric_text.prompting.functions.get_http_log_options import (
+    get_http_log_options,
+)
+from tests.fixtures import use_config_file
+
+
+def test_reads_writer_options(clean_env, tmp_path):
+    """Returns the writer options of the http_logging section and nothing else."""
+    use_config_file(
+        tmp_path,
+        "http_logging:\n"
+        "  enabled: true\n"
+        "  log_dir: ./logs\n"
+        "  queue_size: 10\n"
+        "  overflow: block\n",
+    )
+
+    assert get_http_log_options() == {"queue_size": 10, "overflow": "block"}
+
+
+def test_defaults_without_options(clean_env, tmp_path):
+    """Returns no options when the config sets none."""
+    use_config_file(tmp_path, "logging:\n  level: ERROR\n")
+
+    assert get_http_log_options() == {}
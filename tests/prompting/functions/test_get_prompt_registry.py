@@ -0,0 +1,6 @@
+from electric_text.prompting.functions.get_prompt_registry import get_prompt_registry
+
+
+def test_returns_shared_registry():
+    """Returns the same registry on every call."""
+    assert get_prompt_registry() is get_prompt_registry()
@@ -0,0 +1,17 @@
+import os
+
+from electric_text.prompting.functions.get_request_coalescing_enabled import (
+    get_request_coalescing_enabled,
+)
+
+
+def test_disabled_by_default(clean_env):
+    """Leaves coalescing off without ELECTRIC_TEXT_COALESCE_REQUESTS."""
+    assert get_request_coalescing_enabled() is False
+
+
+def test_enabled_from_environment(clean_env):
+    """Turns coalescing on with ELECTRIC_TEXT_COALESCE_REQUESTS=true."""
+    os.environ["ELECTRIC_TEXT_COALESCE_REQUESTS"] = "TRUE"
+
+    assert get_request_coalescing_enabled() is True
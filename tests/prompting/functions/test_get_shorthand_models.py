@@ -0,0 +1,26 @@
+from electric_text.prompting.functions.get_shorthand_models import (
+    get_shorthand_models,
+)
+from tests.fixtures import use_config_file
+
+SHORTHANDS_CONFIG = """
+shorthands:
+  provider_names: {}
+  models:
+    ollama:
+      llama3.1:8b: llama
+"""
+
+
+def test_reads_lookup_from_config(clean_env, tmp_path):
+    """Maps configured shorthands to (provider, model)."""
+    use_config_file(tmp_path, SHORTHANDS_CONFIG)
+
+    assert get_shorthand_models()["llama"] == ("ollama", "llama3.1:8b")
+
+
+def test_reuses_lookup_of_snapshot(clean_env, tmp_path):
+    """Returns the lookup built with the current snapshot on every call."""
+    use_config_file(tmp_path, SHORTHANDS_CONFIG)
+
+    assert get_shorthand_models() is get_shorthand_models()
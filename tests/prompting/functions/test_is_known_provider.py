@@ -0,0 +1,16 @@
+from electric_text.prompting.functions.is_known_provider import is_known_provider
+
+
+def test_knows_bundled_provider():
+    """Knows a provider that ships with the package."""
+    assert is_known_provider("ollama") is True
+
+
+def test_rejects_unknown_provider():
+    """Rejects a provider that has no module."""
+    assert is_known_provider("nope") is False
+
+
+def test_rejects_names_that_are_not_modules():
+    """Rejects names that cannot be module names."""
+    assert is_known_provider("no.pe") is False
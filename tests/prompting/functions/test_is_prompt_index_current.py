@@ -0,0 +1,31 @@
+from electric_text.prompting.functions.build_prompt_index import build_prompt_index
+from electric_text.prompting.functions.is_prompt_index_current import (
+    is_prompt_index_current,
+)
+from tests.fixtures import touch_later, write_prompt_config
+
+
+def test_current_when_nothing_changed(tmp_path):
+    """Reports an untouched directory as current."""
+    write_prompt_config(tmp_path, "poetry")
+    index = build_prompt_index(str(tmp_path))
+
+    assert is_prompt_index_current(index, str(tmp_path))
+
+
+def test_stale_when_a_config_is_edited(tmp_path):
+    """Reports the index as stale when a config file is rewritten."""
+    path = write_prompt_config(tmp_path, "poetry")
+    index = build_prompt_index(str(tmp_path))
+    touch_later(path)
+
+    assert not is_prompt_index_current(index, str(tmp_path))
+
+
+def test_stale_when_a_config_is_added(tmp_path):
+    """Reports the index as stale when a config file is added."""
+    index = build_prompt_index(str(tmp_path))
+    write_prompt_config(tmp_path, "poetry")
+    touch_later(tmp_path)
+
+    assert not is_prompt_index_current(index, str(tmp_path))
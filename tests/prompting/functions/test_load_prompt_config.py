@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from electric_text.prompting.data.prompt_config import PromptConfig
+from electric_text.prompting.functions.load_prompt_config import load_prompt_config
+from tests.fixtures import write_prompt_config
+
+
+def test_resolves_relative_paths_against_prompt_dir(tmp_path):
+    """Resolves relative system message and model paths against the prompt directory."""
+    path = write_prompt_config(tmp_path, "poetry", model_path="models/poem.py")
+
+    assert load_prompt_config(str(path), str(tmp_path)) == PromptConfig(
+        name="poetry",
+        description="The poetry prompt",
+        system_message_path=str(tmp_path / "poetry.txt"),
+        model_path=str(tmp_path / "models/poem.py"),
+    )
+
+
+def test_defaults_name_to_file_stem(tmp_path):
+    """Uses the file's stem when the config has no name."""
+    path = tmp_path / "haiku.json"
+    path.write_text(json.dumps({"description": "d", "system_message_path": "/s.txt"}))
+
+    assert load_prompt_config(str(path), str(tmp_path)).name == "haiku"
+
+
+def test_raises_for_missing_fields(tmp_path):
+    """Raises ValueError when a required field is missing."""
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps({"name": "broken"}))
+
+    with pytest.raises(ValueError, match="Missing required fields"):
+        load_prompt_config(str(path), str(tmp_path))
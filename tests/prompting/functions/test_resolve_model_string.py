@@ -0,0 +1,38 @@
+import pytest
+
+from electric_text.prompting.functions.resolve_model_string import (
+    resolve_model_string,
+)
+
+SHORTHANDS = {"llama": ("ollama", "llama3.1:8b"), "bad": ("nope", "x")}
+
+
+def test_splits_provider_and_model():
+    """Splits 'provider:model_name' on the first colon."""
+    assert resolve_model_string("ollama:llama3.1:8b", SHORTHANDS) == (
+        "ollama",
+        "llama3.1:8b",
+    )
+
+
+def test_expands_shorthand():
+    """Expands a configured shorthand."""
+    assert resolve_model_string("llama", SHORTHANDS) == ("ollama", "llama3.1:8b")
+
+
+def test_rejects_unknown_model_string():
+    """Rejects a string that is neither 'provider:model_name' nor a shorthand."""
+    with pytest.raises(ValueError, match="Invalid model string format"):
+        resolve_model_string("zzz", SHORTHANDS)
+
+
+def test_rejects_unknown_provider():
+    """Rejects a model string naming a provider that does not exist."""
+    with pytest.raises(ValueError, match="Unknown provider: 'nope'"):
+        resolve_model_string("nope:x", SHORTHANDS)
+
+
+def test_rejects_shorthand_for_unknown_provider():
+    """Rejects a shorthand that expands to a provider that does not exist."""
+    with pytest.raises(ValueError, match="Unknown provider: 'nope'"):
+        resolve_model_string("bad", SHORTHANDS)
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from electric_text.prompting.client_pool import ClientPool
+
+
+def test_creates_fresh_clients_when_disabled(clean_env):
+    """Creates a new client for every request until enabled."""
+    pool = ClientPool()
+
+    assert pool.get_client("ollama") is not pool.get_client("ollama")
+
+
+def test_reuses_client_when_enabled(clean_env):
+    """Returns the pooled client for repeated requests to a provider."""
+    pool = ClientPool()
+    pool.enable()
+
+    assert pool.get_client("ollama") is pool.get_client("ollama")
+
+
+def test_pools_keep_alive_clients(clean_env):
+    """Pools clients that keep their connections open."""
+    pool = ClientPool()
+    pool.enable()
+
+    assert pool.get_client("ollama").provider.keep_alive is True
+
+
+def test_separates_clients_by_api_key(clean_env):
+    """Uses a separate client for a different API key."""
+    pool = ClientPool()
+    pool.enable()
+
+    assert pool.get_client("openai", "one") is not pool.get_client("openai", "two")
+
+
+def test_pools_coalescing_clients_when_enabled(clean_env):
+    """Pools clients that share identical requests with ELECTRIC_TEXT_COALESCE_REQUESTS."""
+    os.environ["ELECTRIC_TEXT_COALESCE_REQUESTS"] = "true"
+    pool = ClientPool()
+    pool.enable()
+
+    assert pool.get_client("ollama").coalescer is not None
+
+
+@pytest.mark.asyncio
+async def test_aclose_empties_pool(clean_env):
+    """Closes pooled clients and starts over with new ones."""
+    pool = ClientPool()
+    pool.enable()
+    first = pool.get_client("ollama")
+
+    await pool.aclose()
+
+    assert pool.get_client("ollama") is not first
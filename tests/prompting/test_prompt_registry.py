@@ -0,0 +1,121 @@
+from textwrap import dedent
+
+from electric_text.prompting.prompt_registry import PromptRegistry
+from tests.fixtures import touch_later, write_prompt_config
+
+
+def write_model_file(path, field_name):
+    """Write a validation model with a single string field."""
+    path.write_text(
+        dedent(f"""
+            from pydantic import BaseModel
+
+            class Answer(BaseModel):
+                {field_name}: str
+            """)
+    )
+
+
+def test_returns_same_config_for_repeated_lookups(tmp_path):
+    """Serves repeated lookups from the index without reloading the config."""
+    write_prompt_config(tmp_path, "poetry")
+    registry = PromptRegistry()
+
+    first = registry.get_prompt(str(tmp_path), "poetry")
+
+    assert registry.get_prompt(str(tmp_path), "poetry") is first
+
+
+def test_returns_none_for_unknown_name(tmp_path):
+    """Returns None when no config declares the name."""
+    write_prompt_config(tmp_path, "poetry")
+
+    assert PromptRegistry().get_prompt(str(tmp_path), "prose") is None
+
+
+def test_reloads_config_edited_in_place(tmp_path):
+    """Picks up a config whose file changed since it was indexed."""
+    path = write_prompt_config(tmp_path, "poetry")
+    registry = PromptRegistry()
+    registry.get_prompt(str(tmp_path), "poetry")
+
+    path.write_text(path.read_text().replace("The poetry prompt", "Edited"))
+    touch_later(path)
+
+    assert registry.get_prompt(str(tmp_path), "poetry").description == "Edited"
+
+
+def test_finds_config_added_after_indexing(tmp_path):
+    """Finds a prompt that was added to the directory after the first lookup."""
+    registry = PromptRegistry()
+    registry.get_prompt(str(tmp_path), "poetry")
+
+    write_prompt_config(tmp_path, "poetry")
+    touch_later(tmp_path)
+
+    assert registry.get_prompt(str(tmp_path), "poetry").name == "poetry"
+
+
+def test_finds_name_declared_by_edited_config(tmp_path):
+    """Finds a name that an existing config was edited to declare."""
+    path = write_prompt_config(tmp_path, "poetry")
+    registry = PromptRegistry()
+    registry.get_prompt(str(tmp_path), "poetry")
+
+    path.write_text(path.read_text().replace('"name": "poetry"', '"name": "verse"'))
+    touch_later(path)
+
+    assert registry.get_prompt(str(tmp_path), "verse").name == "verse"
+
+
+def test_lists_configs_after_removal(tmp_path):
+    """Drops configs whose files were removed."""
+    write_prompt_config(tmp_path, "poetry")
+    prose = write_prompt_config(tmp_path, "prose")
+    registry = PromptRegistry()
+    registry.list_prompts(str(tmp_path))
+
+    prose.unlink()
+    touch_later(tmp_path)
+
+    assert [c.name for c in registry.list_prompts(str(tmp_path))] == ["poetry"]
+
+
+def test_rereads_system_message_only_after_it_changes(tmp_path):
+    """Caches the system message until its file is rewritten."""
+    write_prompt_config(tmp_path, "poetry", system_message="Rhyme.")
+    registry = PromptRegistry()
+    config = registry.get_prompt(str(tmp_path), "poetry")
+    first = registry.get_system_message(config)
+
+    message_path = tmp_path / "poetry.txt"
+    message_path.write_text("Do not rhyme.")
+    touch_later(message_path)
+
+    assert (first, registry.get_system_message(config)) == ("Rhyme.", "Do not rhyme.")
+
+
+def test_caches_schema_until_model_file_changes(tmp_path):
+    """Reuses the schema until the model file is rewritten."""
+    model_path = tmp_path / "answer.py"
+    write_model_file(model_path, "text")
+    write_prompt_config(tmp_path, "poetry", model_path="answer.py")
+    registry = PromptRegistry()
+    config = registry.get_prompt(str(tmp_path), "poetry")
+    first = registry.get_schema(config)
+    cached = registry.get_schema(config)
+
+    write_model_file(model_path, "answer")
+    touch_later(model_path)
+    edited = registry.get_schema(config)
+
+    assert (cached is first, list(edited["properties"])) == (True, ["answer"])
+
+
+def test_returns_no_schema_without_model_path(tmp_path):
+    """Returns None for prompts without a validation model."""
+    write_prompt_config(tmp_path, "poetry")
+    registry = PromptRegistry()
+    config = registry.get_prompt(str(tmp_path), "poetry")
+
+    assert registry.get_schema(config) is None
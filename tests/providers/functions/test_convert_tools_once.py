@@ -0,0 +1,40 @@
+from electric_text.providers.functions.convert_tools_once import convert_tools_once
+from electric_text.providers.model_providers.anthropic.functions.convert_tools import (
+    convert_tools,
+)
+
+WEATHER = {"name": "weather", "description": "d", "parameters": {"type": "object"}}
+
+
+def test_reuses_conversion_for_same_tuple():
+    """Returns the earlier conversion when given the same tuple."""
+    tools = (WEATHER,)
+
+    first = convert_tools_once(tools, convert_tools)
+
+    assert convert_tools_once(tools, convert_tools) is first
+
+
+def test_converts_equal_tuples_separately():
+    """Converts a different tuple even if its contents are equal."""
+    first = convert_tools_once((WEATHER,), convert_tools)
+
+    assert convert_tools_once((WEATHER,), convert_tools) is not first
+
+
+def test_converts_lists_every_time():
+    """Sees a tool appended to a list since its last conversion."""
+    tools = [WEATHER]
+    convert_tools_once(tools, convert_tools)
+
+    tools.append(WEATHER | {"name": "flights"})
+
+    assert [tool["name"] for tool in convert_tools_once(tools, convert_tools)] == [
+        "weather",
+        "flights",
+    ]
+
+
+def test_returns_none_without_tools():
+    """Returns None when there are no tools."""
+    assert convert_tools_once(None, convert_tools) is None
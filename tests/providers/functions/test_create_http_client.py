@@ -0,0 +1,23 @@
+import httpx
+
+from electric_text.providers.functions.create_http_client import create_http_client
+from electric_text.providers.logging import HttpLogger, LoggingAsyncClient
+from tests.fixtures import http_log_settings
+
+
+def test_creates_plain_client_without_logger():
+    """Creates a plain httpx client when logging is off."""
+    client = create_http_client(None, "ollama", {"timeout": 5})
+
+    assert type(client) is httpx.AsyncClient
+
+
+def test_creates_logging_client_with_logger(tmp_path):
+    """Creates a logging client when a logger is given."""
+    logger = HttpLogger(
+        log_dir=tmp_path, enabled=True, settings=http_log_settings(tmp_path)
+    )
+
+    client = create_http_client(logger, "ollama", {"timeout": 5})
+
+    assert isinstance(client, LoggingAsyncClient)
@@ -0,0 +1,47 @@
+from pydantic import BaseModel
+
+from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.functions.hash_provider_request import (
+    hash_provider_request,
+)
+
+
+class Answer(BaseModel):
+    text: str
+
+
+class OtherAnswer(BaseModel):
+    value: int
+
+
+def request(**overrides):
+    fields = {"provider_name": "ollama", "model_name": "llama3", "prompt_text": "Hi"}
+    return ProviderRequest(**{**fields, **overrides})
+
+
+def test_hashes_equal_requests_alike():
+    """Gives separately built identical requests the same hash."""
+    assert hash_provider_request(request(system_messages=["Be brief"])) == (
+        hash_provider_request(request(system_messages=["Be brief"]))
+    )
+
+
+def test_distinguishes_anything_that_changes_the_response():
+    """Hashes requests differing in prompt, tools or max_tokens differently."""
+    variants = [
+        request(),
+        request(prompt_text="Bye"),
+        request(tools=[{"name": "search"}]),
+        request(max_tokens=10),
+    ]
+
+    assert len({hash_provider_request(variant) for variant in variants}) == 4
+
+
+def test_distinguishes_output_schemas():
+    """Hashes requests for different custom output schemas differently."""
+    assert hash_provider_request(
+        request(output_schema=Answer, has_custom_output_schema=True)
+    ) != hash_provider_request(
+        request(output_schema=OtherAnswer, has_custom_output_schema=True)
+    )
@@ -0,0 +1,22 @@
+from electric_text.providers.functions.hash_request_body import (
+    hash_request_body,
+)
+
+
+def test_ignores_key_order():
+    """Hashes JSON bodies independent of key order."""
+    assert hash_request_body({"a": 1, "b": [1, 2]}) == hash_request_body(
+        {"b": [1, 2], "a": 1}
+    )
+
+
+def test_distinguishes_different_bodies():
+    """Hashes different bodies differently."""
+    assert hash_request_body({"a": 1}) != hash_request_body({"a": 2})
+
+
+def test_hashes_raw_text():
+    """Hashes text bodies as-is."""
+    assert hash_request_body("hello") == (
+        "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"
+    )
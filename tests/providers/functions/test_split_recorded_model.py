@@ -0,0 +1,24 @@
+import pytest
+
+from electric_text.providers.functions.split_recorded_model import (
+    split_recorded_model,
+)
+
+
+def test_splits_provider_prefix():
+    """Splits the provider from the model at the first slash."""
+    assert split_recorded_model("ollama/llama3.1:8b", None) == (
+        "ollama",
+        "llama3.1:8b",
+    )
+
+
+def test_uses_recorded_provider_for_plain_model():
+    """Uses the recorded provider when the model has no prefix."""
+    assert split_recorded_model("gpt-4o", "openai") == ("openai", "gpt-4o")
+
+
+def test_rejects_unknown_provider():
+    """Raises when the provider cannot be determined."""
+    with pytest.raises(ValueError):
+        split_recorded_model("gpt-4o", None)
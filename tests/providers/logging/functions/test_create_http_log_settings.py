@@ -0,0 +1,23 @@
+from electric_text.providers.logging.data.http_log_settings import HttpLogSettings
+from electric_text.providers.logging.data.overflow_policy import OverflowPolicy
+from electric_text.providers.logging.functions.create_http_log_settings import (
+    create_http_log_settings,
+)
+
+
+def test_uses_defaults_without_options():
+    """Uses default writer settings when no options are given."""
+    assert create_http_log_settings("./logs", {}) == HttpLogSettings(log_dir="./logs")
+
+
+def test_applies_options():
+    """Applies configured writer options."""
+    settings = create_http_log_settings(
+        "./logs", {"overflow": "block", "compress": True, "queue_size": 5}
+    )
+
+    assert (settings.overflow, settings.compress, settings.queue_size) == (
+        OverflowPolicy.BLOCK,
+        True,
+        5,
+    )
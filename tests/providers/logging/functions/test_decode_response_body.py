@@ -0,0 +1,33 @@
+import gzip
+
+import httpx
+
+from electric_text.providers.logging.functions.decode_response_body import (
+    decode_response_body,
+)
+
+
+def test_decodes_json_body():
+    """Decodes a JSON body into a dictionary."""
+    response = httpx.Response(200, headers={"content-type": "application/json"})
+
+    assert decode_response_body(response, b'{"ok": true}') == {"ok": True}
+
+
+def test_decodes_text_body():
+    """Decodes a non-JSON body as text."""
+    response = httpx.Response(200, headers={"content-type": "text/event-stream"})
+
+    assert decode_response_body(response, b"data: hi\n\n") == "data: hi\n\n"
+
+
+def test_decodes_compressed_body():
+    """Decompresses a body according to its content-encoding."""
+    response = httpx.Response(200, headers={"content-encoding": "gzip"})
+
+    assert decode_response_body(response, gzip.compress(b'{"a": 1}')) == {"a": 1}
+
+
+def test_decodes_empty_body_as_none():
+    """Decodes an empty body as None."""
+    assert decode_response_body(httpx.Response(204), b"") is None
@@ -0,0 +1,13 @@
+from electric_text.providers.logging.functions.format_log_line import format_log_line
+
+
+def test_formats_compact_json_line():
+    """Formats a record as compact JSON ending in a newline."""
+    assert format_log_line({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}\n'
+
+
+def test_formats_unserializable_values_as_strings():
+    """Formats values JSON cannot encode as strings."""
+    assert (
+        format_log_line({"value": {1, 2}.__class__}) == '{"value":"<class \'set\'>"}\n'
+    )
@@ -0,0 +1,20 @@
+from electric_text.providers.logging.data.http_log_settings import HttpLogSettings
+from electric_text.providers.logging.functions.get_http_log_writer import (
+    get_http_log_writer,
+)
+
+
+def test_shares_writer_for_equal_settings():
+    """Returns the same writer for equal settings."""
+    first = get_http_log_writer(HttpLogSettings(log_dir="./shared"))
+    second = get_http_log_writer(HttpLogSettings(log_dir="./shared"))
+
+    assert first is second
+
+
+def test_separates_writers_for_different_settings():
+    """Returns different writers for different settings."""
+    first = get_http_log_writer(HttpLogSettings(log_dir="./one"))
+    second = get_http_log_writer(HttpLogSettings(log_dir="./two"))
+
+    assert first is not second
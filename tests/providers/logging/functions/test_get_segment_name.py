@@ -0,0 +1,17 @@
+from electric_text.providers.logging.functions.get_segment_name import (
+    get_segment_name,
+)
+
+
+def test_names_plain_segment():
+    """Names an uncompressed segment with start time, pid, writer id and sequence."""
+    assert get_segment_name("20250101T101010", 42, "a1b2c3d4", 3, False) == (
+        "http-20250101T101010-42-a1b2c3d4-0003.jsonl"
+    )
+
+
+def test_names_compressed_segment():
+    """Names a compressed segment with a .gz suffix."""
+    assert get_segment_name("20250101T101010", 42, "a1b2c3d4", 0, True).endswith(
+        ".jsonl.gz"
+    )
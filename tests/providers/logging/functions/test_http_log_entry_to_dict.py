@@ -9,6 +9,7 @@ def test_converts_complete_log_entry_to_dict():
     result = http_log_entry_to_dict(sample_http_log_entry())
 
     expected = {
+        "id": "entry-1",
         "timestamp": "2024-01-01T12:00:00Z",
         "method": "POST",
         "url": "https://api.example.com/chat",
@@ -26,8 +27,10 @@ def test_converts_complete_log_entry_to_dict():
             "status": 200,
             "headers": {"Content-Type": "application/json"},
             "body": {"choices": [{"message": {"content": "Hi there!"}}]},
+            "chunks": [(310.5, 48)],
         },
         "duration_ms": 1222.2,
+        "ttfb_ms": 310.5,
         "provider": "openai",
         "model": "gpt-4",
         "error": None,
@@ -41,12 +44,14 @@ def test_converts_minimal_log_entry_to_dict():
     result = http_log_entry_to_dict(minimal_http_log_entry())
 
     expected = {
+        "id": "entry-2",
         "timestamp": "2024-01-01T12:00:00Z",
         "method": "GET",
         "url": "https://api.example.com/chat",
         "request": {"headers": {}, "body": None},
-        "response": {"status": 404, "headers": {}, "body": None},
+        "response": {"status": 404, "headers": {}, "body": None, "chunks": None},
         "duration_ms": 100.0,
+        "ttfb_ms": None,
         "provider": None,
         "model": None,
         "error": "HTTP 404",
@@ -60,12 +65,14 @@ def test_dict_structure_matches_expected_format():
     result = http_log_entry_to_dict(sample_http_log_entry())
 
     expected_keys = {
+        "id",
         "timestamp",
         "method",
         "url",
         "request",
         "response",
         "duration_ms",
+        "ttfb_ms",
         "provider",
         "model",
         "error",
@@ -83,4 +90,4 @@ def test_nested_request_response_structure():
     assert isinstance(request_dict, dict)
     assert isinstance(response_dict, dict)
     assert set(request_dict.keys()) == {"headers", "body"}
-    assert set(response_dict.keys()) == {"status", "headers", "body"}
+    assert set(response_dict.keys()) == {"status", "headers", "body", "chunks"}
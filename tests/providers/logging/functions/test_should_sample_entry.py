@@ -0,0 +1,48 @@
+from electric_text.providers.logging.functions.should_sample_entry import (
+    should_sample_entry,
+)
+
+
+def test_keeps_everything_by_default():
+    """Keeps every entry with the default rate and no filters."""
+    assert should_sample_entry(False, 10.0, 1.0, False, None, 0.99) is True
+
+
+def test_drops_entries_above_sample_rate():
+    """Drops entries whose random value is not below the sample rate."""
+    assert should_sample_entry(False, 10.0, 0.25, False, None, 0.5) is False
+
+
+def test_keeps_entries_below_sample_rate():
+    """Keeps entries whose random value is below the sample rate."""
+    assert should_sample_entry(False, 10.0, 0.25, False, None, 0.1) is True
+
+
+def test_drops_successes_when_errors_only():
+    """Drops successful requests when only errors are logged."""
+    assert should_sample_entry(False, 10.0, 1.0, True, None, 0.0) is False
+
+
+def test_keeps_errors_when_errors_only():
+    """Keeps errors when only errors are logged."""
+    assert should_sample_entry(True, 10.0, 1.0, True, None, 0.0) is True
+
+
+def test_drops_fast_requests_below_threshold():
+    """Drops requests faster than the slow threshold."""
+    assert should_sample_entry(False, 10.0, 1.0, False, 500.0, 0.0) is False
+
+
+def test_keeps_slow_requests_at_threshold():
+    """Keeps requests at least as slow as the threshold."""
+    assert should_sample_entry(False, 500.0, 1.0, False, 500.0, 0.0) is True
+
+
+def test_keeps_fast_errors_with_both_filters():
+    """Keeps fast errors when filtering on errors and slowness together."""
+    assert should_sample_entry(True, 10.0, 1.0, True, 500.0, 0.0) is True
+
+
+def test_drops_everything_at_zero_rate():
+    """Drops everything when the sample rate is zero."""
+    assert should_sample_entry(True, 900.0, 0.0, False, None, 0.0) is False
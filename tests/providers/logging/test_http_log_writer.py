@@ -0,0 +1,67 @@
+import gzip
+import json
+
+import pytest
+
+from electric_text.providers.logging.data.overflow_policy import OverflowPolicy
+from electric_text.providers.logging.http_log_writer import HttpLogWriter
+from tests.fixtures import http_log_settings, sample_http_log_entry
+
+
+def test_appends_entries_as_jsonl_on_close(tmp_path):
+    """Appends every queued entry as one JSON line and flushes on close."""
+    writer = HttpLogWriter(http_log_settings(tmp_path))
+    for _ in range(3):
+        writer.put_nowait(sample_http_log_entry())
+    writer.close()
+
+    [segment] = tmp_path.glob("*.jsonl")
+    lines = segment.read_text().splitlines()
+
+    assert [json.loads(line)["provider"] for line in lines] == ["openai"] * 3
+
+
+def test_rotates_segments_by_size(tmp_path):
+    """Starts a new segment once the current one exceeds the size limit."""
+    writer = HttpLogWriter(
+        http_log_settings(tmp_path, segment_max_bytes=100, batch_size=1)
+    )
+    for _ in range(3):
+        writer.put_nowait(sample_http_log_entry())
+    writer.close()
+
+    assert len(list(tmp_path.glob("*.jsonl"))) == 3
+
+
+def test_compresses_segments(tmp_path):
+    """Writes gzipped segments when compression is enabled."""
+    writer = HttpLogWriter(http_log_settings(tmp_path, compress=True))
+    writer.put_nowait(sample_http_log_entry())
+    writer.close()
+
+    [segment] = tmp_path.glob("*.jsonl.gz")
+
+    assert json.loads(gzip.open(segment, "rt").read())["method"] == "POST"
+
+
+def test_accounts_every_entry_as_written_or_dropped(tmp_path):
+    """Accounts for every entry as either written or dropped with a tiny queue."""
+    writer = HttpLogWriter(http_log_settings(tmp_path, queue_size=1))
+    for _ in range(200):
+        writer.put_nowait(sample_http_log_entry())
+    writer.close()
+
+    assert writer.written + writer.dropped == 200
+
+
+@pytest.mark.asyncio
+async def test_blocks_instead_of_dropping_with_block_policy(tmp_path):
+    """Waits for queue space instead of dropping with the block policy."""
+    writer = HttpLogWriter(
+        http_log_settings(tmp_path, queue_size=1, overflow=OverflowPolicy.BLOCK)
+    )
+    for _ in range(50):
+        await writer.put(sample_http_log_entry())
+    writer.close()
+
+    assert (writer.written, writer.dropped) == (50, 0)
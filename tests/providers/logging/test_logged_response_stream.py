@@ -0,0 +1,51 @@
+import httpx
+import pytest
+
+from electric_text.providers.logging.logged_response_stream import (
+    LoggedResponseStream,
+)
+
+
+@pytest.mark.asyncio
+async def test_passes_chunks_through_and_reports_body_once_on_close():
+    """Passes chunks through unchanged and reports the body once when closed."""
+    closes: list[bytes] = []
+
+    async def on_close(content: bytes, arrivals: list[tuple[float, int]]) -> None:
+        closes.append(content)
+
+    stream = LoggedResponseStream(httpx.ByteStream(b"hello"), on_close)
+    chunks = [chunk async for chunk in stream]
+    await stream.aclose()
+    await stream.aclose()
+
+    assert (chunks, closes) == ([b"hello"], [b"hello"])
+
+
+@pytest.mark.asyncio
+async def test_reports_size_of_each_chunk_read():
+    """Reports the size of each chunk read, in arrival order."""
+    sizes: list[list[int]] = []
+
+    async def on_close(content: bytes, arrivals: list[tuple[float, int]]) -> None:
+        sizes.append([size for _, size in arrivals])
+
+    stream = LoggedResponseStream(httpx.ByteStream(b"hello"), on_close)
+    [chunk async for chunk in stream]
+    await stream.aclose()
+
+    assert sizes == [[5]]
+
+
+@pytest.mark.asyncio
+async def test_reports_no_chunks_for_unread_body():
+    """Reports no chunk arrivals when closed before anything was read."""
+    arrivals_seen: list[list[tuple[float, int]]] = []
+
+    async def on_close(content: bytes, arrivals: list[tuple[float, int]]) -> None:
+        arrivals_seen.append(arrivals)
+
+    stream = LoggedResponseStream(httpx.ByteStream(b"hello"), on_close)
+    await stream.aclose()
+
+    assert arrivals_seen == [[]]
@@ -0,0 +1,138 @@
+import asyncio
+
+import httpx
+import pytest
+
+from electric_text.providers.logging import HttpLogger, LoggingAsyncClient
+from tests.fixtures import http_log_settings
+
+
+class GatedStream(httpx.AsyncByteStream):
+    """Yields one line, then waits until the test releases the rest."""
+
+    def __init__(self, release: asyncio.Event) -> None:
+        self.release = release
+
+    async def __aiter__(self):
+        yield b"data: first\n\n"
+        await self.release.wait()
+        yield b"data: second\n\n"
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    """Yields the given chunks as a not-yet-read body."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def gated_transport(release: asyncio.Event) -> httpx.MockTransport:
+    return httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            stream=GatedStream(release),
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_streams_first_line_before_body_completes(tmp_path):
+    """Delivers the first streamed line before the rest of the body exists."""
+    release = asyncio.Event()
+    logger = HttpLogger(log_dir=tmp_path, save_to_file=False)
+
+    async with LoggingAsyncClient(
+        logger=logger, provider="test", transport=gated_transport(release)
+    ) as client:
+        async with client.stream("POST", "https://example.test/", json={}) as response:
+            lines = response.aiter_lines()
+            first = await asyncio.wait_for(anext(lines), timeout=1)
+            release.set()
+            rest = [line async for line in lines]
+
+    assert (first, rest) == ("data: first", ["", "data: second", ""])
+
+
+@pytest.mark.asyncio
+async def test_logs_streamed_body_with_timings_on_close(tmp_path):
+    """Logs the full streamed body with TTFB and total duration on close."""
+    release = asyncio.Event()
+    release.set()
+    logger = HttpLogger(log_dir=tmp_path, save_to_file=False)
+
+    async with LoggingAsyncClient(
+        logger=logger, provider="test", transport=gated_transport(release)
+    ) as client:
+        async with client.stream("POST", "https://example.test/", json={}) as response:
+            async for _ in response.aiter_lines():
+                pass
+
+    [entry] = logger.entries
+
+    assert entry.response_body == "data: first\n\ndata: second\n\n"
+    assert entry.response_chunks is not None and len(entry.response_chunks) == 2
+    assert entry.ttfb_ms is not None and entry.ttfb_ms <= entry.duration_ms
+
+
+@pytest.mark.asyncio
+async def test_logs_non_streamed_json_body(tmp_path):
+    """Logs a non-streamed JSON body once it has been read."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            headers={"content-type": "application/json"},
+            stream=ChunkedStream([b'{"ok":', b" true}"]),
+        )
+    )
+    logger = HttpLogger(log_dir=tmp_path, save_to_file=False)
+
+    async with LoggingAsyncClient(logger=logger, transport=transport) as client:
+        response = await client.post("https://example.test/", json={"model": "m"})
+
+    [entry] = logger.entries
+
+    assert (response.json(), entry.response_body, entry.model) == (
+        {"ok": True},
+        {"ok": True},
+        "m",
+    )
+
+
+@pytest.mark.asyncio
+async def test_keeps_only_most_recent_entries_in_buffer(tmp_path):
+    """Keeps only the most recent entries up to the buffer size."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    logger = HttpLogger(
+        save_to_file=False, settings=http_log_settings(tmp_path, buffer_size=2)
+    )
+
+    async with LoggingAsyncClient(logger=logger, transport=transport) as client:
+        for index in range(3):
+            await client.post(f"https://example.test/{index}", json={})
+
+    assert [entry.url for entry in logger.entries] == [
+        "https://example.test/1",
+        "https://example.test/2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_skips_unsampled_entries(tmp_path):
+    """Skips successful requests when only errors are sampled."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(500 if "fail" in str(request.url) else 200)
+    )
+    logger = HttpLogger(
+        save_to_file=False, settings=http_log_settings(tmp_path, errors_only=True)
+    )
+
+    async with LoggingAsyncClient(logger=logger, transport=transport) as client:
+        await client.post("https://example.test/ok", json={})
+        await client.post("https://example.test/fail", json={})
+
+    assert [entry.error for entry in logger.entries] == ["HTTP 500"]
@@ -0,0 +1,30 @@
+from electric_text.providers.model_providers.mock.data.mock_settings import (
+    MockSettings,
+)
+from electric_text.providers.model_providers.mock.functions.create_mock_settings import (
+    create_mock_settings,
+)
+
+
+def test_keeps_defaults_for_unset_options():
+    """Keeps defaults and ignores unknown options."""
+    assert create_mock_settings({"api_key": "x"}) == MockSettings()
+
+
+def test_parses_string_options():
+    """Parses options given as strings."""
+    assert create_mock_settings(
+        {
+            "shape": "ollama",
+            "tokens_per_second": "50",
+            "response_tokens": "10",
+            "tool_calls": "false",
+            "seed": "7",
+        }
+    ) == MockSettings(
+        shape="ollama",
+        tokens_per_second=50.0,
+        response_tokens=10,
+        tool_calls=False,
+        seed=7,
+    )
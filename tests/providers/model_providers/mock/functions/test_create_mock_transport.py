@@ -0,0 +1,31 @@
+import httpx
+import pytest
+
+from electric_text.providers.model_providers.mock.functions.create_mock_transport import (
+    create_mock_transport,
+)
+
+
+@pytest.mark.asyncio
+async def test_answers_every_request_with_the_body():
+    """Answers every request with a fresh copy of the synthetic body."""
+    transport = create_mock_transport(200, "text/plain", [(0.0, b"a"), (0.0, b"b")])
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        bodies = [(await client.get("https://mock.test/")).text for _ in range(2)]
+
+    assert bodies == ["ab", "ab"]
+
+
+@pytest.mark.asyncio
+async def test_answers_with_given_status_and_content_type():
+    """Answers with the given status and content type."""
+    transport = create_mock_transport(500, "application/json", [(0.0, b"{}")])
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://mock.test/")
+
+    assert (response.status_code, response.headers["content-type"]) == (
+        500,
+        "application/json",
+    )
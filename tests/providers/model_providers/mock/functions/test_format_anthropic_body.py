@@ -0,0 +1,50 @@
+import json
+
+from electric_text.providers.data.stream_history import StreamHistory
+from electric_text.providers.model_providers.anthropic.functions.process_stream_response import (
+    process_stream_response,
+)
+from electric_text.providers.model_providers.mock.data.mock_output import MockOutput
+from electric_text.providers.model_providers.mock.functions.format_anthropic_body import (
+    format_anthropic_body,
+)
+
+
+def parse_stream(pieces: list[str]) -> StreamHistory:
+    history = StreamHistory()
+    for line in "".join(pieces).splitlines():
+        history = process_stream_response(line, history)
+    return history
+
+
+def test_streams_one_piece_per_token():
+    """Streams one piece per text token."""
+    pieces = format_anthropic_body(MockOutput(["Hi", " there"]), "m", True)
+
+    assert len(pieces) == 2
+
+
+def test_streams_text_the_parser_understands():
+    """Streams text that the Anthropic parser reassembles."""
+    pieces = format_anthropic_body(MockOutput(["Hi", " there"]), "m", True)
+
+    assert parse_stream(pieces).extract_text_content() == "Hi there"
+
+
+def test_streams_tool_call_the_parser_understands():
+    """Streams a tool call that the Anthropic parser reassembles."""
+    output = MockOutput([], tool_name="get_weather", tool_arguments={"unit": "c"})
+
+    [block] = parse_stream(format_anthropic_body(output, "m", True)).content_blocks
+
+    assert (block.data.name, json.loads(block.data.input_json_string)) == (
+        "get_weather",
+        {"unit": "c"},
+    )
+
+
+def test_returns_single_message_body_without_streaming():
+    """Returns one Messages API body when not streaming."""
+    [body] = format_anthropic_body(MockOutput(["Hi"]), "m", False)
+
+    assert json.loads(body)["content"] == [{"type": "text", "text": "Hi"}]
@@ -0,0 +1,50 @@
+from electric_text.providers.data.stream_history import StreamHistory
+from electric_text.providers.model_providers.mock.data.mock_output import MockOutput
+from electric_text.providers.model_providers.mock.functions.format_ollama_body import (
+    format_ollama_body,
+)
+from electric_text.providers.model_providers.ollama.functions.process_completion_response import (
+    process_completion_response,
+)
+from electric_text.providers.model_providers.ollama.functions.process_stream_response import (
+    process_stream_response,
+)
+
+
+def parse_stream(pieces: list[str]) -> StreamHistory:
+    history = StreamHistory()
+    for line in "".join(pieces).splitlines():
+        history = process_stream_response(line, history)
+    return history
+
+
+def test_streams_one_line_per_token_plus_done():
+    """Streams one line per token, with the done line attached to the last."""
+    pieces = format_ollama_body(MockOutput(["Hi", " there"]), "m", True)
+
+    assert [piece.count("\n") for piece in pieces] == [1, 2]
+
+
+def test_streams_text_the_parser_understands():
+    """Streams text that the Ollama parser reassembles."""
+    pieces = format_ollama_body(MockOutput(["Hi", " there"]), "m", True)
+
+    assert parse_stream(pieces).extract_text_content() == "Hi there"
+
+
+def test_streams_tool_call_the_parser_understands():
+    """Streams a tool call that the Ollama parser understands."""
+    output = MockOutput([], tool_name="get_weather", tool_arguments={"unit": "c"})
+
+    [block] = parse_stream(format_ollama_body(output, "m", True)).content_blocks
+
+    assert (block.data.name, block.data.input) == ("get_weather", {"unit": "c"})
+
+
+def test_returns_completion_the_parser_understands():
+    """Returns one chat body that the Ollama parser understands."""
+    [body] = format_ollama_body(MockOutput(["Hi", " there"]), "m", False)
+
+    history = process_completion_response(body, StreamHistory())
+
+    assert history.extract_text_content() == "Hi there"
@@ -0,0 +1,45 @@
+import json
+
+from electric_text.providers.data.stream_history import StreamHistory
+from electric_text.providers.model_providers.mock.data.mock_output import MockOutput
+from electric_text.providers.model_providers.mock.functions.format_openai_body import (
+    format_openai_body,
+)
+from electric_text.providers.model_providers.openai.functions.process_completion_response import (
+    process_completion_response,
+)
+from electric_text.providers.model_providers.openai.functions.process_stream_response import (
+    process_stream_response,
+)
+
+
+def parse_stream(pieces: list[str]) -> StreamHistory:
+    history = StreamHistory()
+    for line in "".join(pieces).splitlines():
+        history = process_stream_response(line, history)
+    return history
+
+
+def test_streams_text_the_parser_understands():
+    """Streams text that the OpenAI parser reassembles."""
+    pieces = format_openai_body(MockOutput(["Hi", " there"]), "m", True)
+
+    assert parse_stream(pieces).extract_text_content() == "Hi there"
+
+
+def test_streams_tool_call_the_parser_understands():
+    """Streams a tool call that the OpenAI parser reassembles."""
+    output = MockOutput([], tool_name="get_weather", tool_arguments={"unit": "c"})
+
+    [block] = parse_stream(format_openai_body(output, "m", True)).content_blocks
+
+    assert (block.data.name, block.data.input) == ("get_weather", {"unit": "c"})
+
+
+def test_returns_completion_the_parser_understands():
+    """Returns one Responses API body that the OpenAI parser understands."""
+    [body] = format_openai_body(MockOutput(["Hi"]), "m", False)
+
+    history = process_completion_response(body, StreamHistory())
+
+    assert (history.extract_text_content(), json.loads(body)["model"]) == ("Hi", "m")
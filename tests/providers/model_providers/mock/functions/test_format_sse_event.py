@@ -0,0 +1,10 @@
+from electric_text.providers.model_providers.mock.functions.format_sse_event import (
+    format_sse_event,
+)
+
+
+def test_formats_event_and_data_lines():
+    """Formats an event line, a data line and a blank line."""
+    assert (
+        format_sse_event({"type": "ping"}) == 'event: ping\ndata: {"type": "ping"}\n\n'
+    )
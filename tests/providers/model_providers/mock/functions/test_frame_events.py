@@ -0,0 +1,18 @@
+from electric_text.providers.model_providers.mock.functions.frame_events import (
+    frame_events,
+)
+
+
+def test_attaches_start_and_stop_to_outer_deltas():
+    """Attaches start to the first delta and stop to the last."""
+    assert frame_events("<", ["a", "b", "c"], ">") == ["<a", "b", "c>"]
+
+
+def test_frames_single_delta():
+    """Frames a single delta with both start and stop."""
+    assert frame_events("<", ["a"], ">") == ["<a>"]
+
+
+def test_frames_no_deltas():
+    """Returns start and stop as one piece when there are no deltas."""
+    assert frame_events("<", [], ">") == ["<>"]
@@ -0,0 +1,22 @@
+import random
+
+from electric_text.providers.model_providers.mock.functions.generate_mock_text import (
+    generate_mock_text,
+)
+
+
+def test_generates_requested_token_count():
+    """Generates exactly the requested number of tokens."""
+    assert len(generate_mock_text(25, random.Random(1))) == 25
+
+
+def test_ends_with_full_stop():
+    """Ends the text with a full stop."""
+    assert "".join(generate_mock_text(5, random.Random(1))).endswith(".")
+
+
+def test_is_reproducible_with_seed():
+    """Generates the same text for the same seed."""
+    assert generate_mock_text(10, random.Random(3)) == generate_mock_text(
+        10, random.Random(3)
+    )
@@ -0,0 +1,47 @@
+import random
+
+from pydantic import BaseModel
+
+from electric_text.providers.model_providers.mock.functions.generate_mock_value import (
+    generate_mock_value,
+)
+
+
+class Line(BaseModel):
+    text: str
+    syllables: int
+
+
+class Poem(BaseModel):
+    title: str
+    mood: str | None
+    lines: list[Line]
+    rhymes: bool
+    score: float
+
+
+def test_generates_value_valid_for_pydantic_schema():
+    """Generates a value that validates against a nested Pydantic schema."""
+    value = generate_mock_value(Poem.model_json_schema(), random.Random(1))
+
+    assert isinstance(Poem.model_validate(value), Poem)
+
+
+def test_picks_from_enum():
+    """Picks enum values from the enum."""
+    assert generate_mock_value({"enum": ["a"]}, random.Random(1)) == "a"
+
+
+def test_respects_integer_bounds():
+    """Keeps integers within minimum and maximum."""
+    assert (
+        generate_mock_value(
+            {"type": "integer", "minimum": 3, "maximum": 3}, random.Random(1)
+        )
+        == 3
+    )
+
+
+def test_returns_const():
+    """Returns const values unchanged."""
+    assert generate_mock_value({"const": {"k": 1}}, random.Random(1)) == {"k": 1}
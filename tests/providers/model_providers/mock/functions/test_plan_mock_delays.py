@@ -0,0 +1,29 @@
+import random
+
+from electric_text.providers.model_providers.mock.data.mock_settings import (
+    MockSettings,
+)
+from electric_text.providers.model_providers.mock.functions.plan_mock_delays import (
+    plan_mock_delays,
+)
+
+
+def test_waits_ttfb_then_one_token_interval():
+    """Waits the TTFB before the first piece and 1/rate before the rest."""
+    settings = MockSettings(ttfb_ms=200, tokens_per_second=10)
+
+    assert plan_mock_delays(3, settings, random.Random(1)) == [0.2, 0.1, 0.1]
+
+
+def test_sends_immediately_without_rate():
+    """Sends everything immediately with no rate and no TTFB."""
+    assert plan_mock_delays(2, MockSettings(), random.Random(1)) == [0.0, 0.0]
+
+
+def test_keeps_jittered_delays_within_bounds():
+    """Keeps jittered delays within the jitter range and never negative."""
+    settings = MockSettings(tokens_per_second=100, jitter_ms=20)
+
+    delays = plan_mock_delays(50, settings, random.Random(1))
+
+    assert all(0.0 <= delay <= 0.03 for delay in delays)
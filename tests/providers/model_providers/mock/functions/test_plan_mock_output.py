@@ -0,0 +1,77 @@
+import json
+import random
+
+from pydantic import BaseModel
+
+from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.model_providers.mock.data.mock_settings import (
+    MockSettings,
+)
+from electric_text.providers.model_providers.mock.functions.plan_mock_output import (
+    plan_mock_output,
+)
+
+WEATHER_TOOL = {
+    "name": "get_weather",
+    "description": "Get the weather",
+    "parameters": {
+        "type": "object",
+        "properties": {"unit": {"type": "string", "enum": ["celsius"]}},
+    },
+}
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+def mock_request(**overrides) -> ProviderRequest:
+    return ProviderRequest(
+        provider_name="mock", model_name="m", prompt_text="Hi", **overrides
+    )
+
+
+def test_calls_first_offered_tool():
+    """Calls the first offered tool with schema-conforming arguments."""
+    output = plan_mock_output(
+        mock_request(tools=[WEATHER_TOOL]), MockSettings(), random.Random(1)
+    )
+
+    assert (output.tool_name, output.tool_arguments) == (
+        "get_weather",
+        {"unit": "celsius"},
+    )
+
+
+def test_answers_with_text_when_tool_calls_disabled():
+    """Answers with text when tool calls are disabled."""
+    output = plan_mock_output(
+        mock_request(tools=[WEATHER_TOOL]),
+        MockSettings(tool_calls=False, response_tokens=3),
+        random.Random(1),
+    )
+
+    assert (output.tool_name, len(output.text_pieces)) == (None, 3)
+
+
+def test_answers_custom_schema_with_conforming_json():
+    """Answers a custom output schema with JSON that validates against it."""
+    output = plan_mock_output(
+        mock_request(output_schema=Answer, has_custom_output_schema=True),
+        MockSettings(),
+        random.Random(1),
+    )
+
+    assert Answer.model_validate(json.loads("".join(output.text_pieces)))
+
+
+def test_omits_prefilled_text():
+    """Omits text the provider already prefilled."""
+    output = plan_mock_output(
+        mock_request(output_schema=Answer, has_custom_output_schema=True),
+        MockSettings(),
+        random.Random(1),
+        prefill="{",
+    )
+
+    assert not "".join(output.text_pieces).startswith("{")
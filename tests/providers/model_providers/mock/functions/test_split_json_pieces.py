@@ -0,0 +1,13 @@
+from electric_text.providers.model_providers.mock.functions.split_json_pieces import (
+    split_json_pieces,
+)
+
+
+def test_splits_into_fixed_size_pieces():
+    """Splits text into pieces of the given size."""
+    assert split_json_pieces('{"a": 1}', 3) == ['{"a', '": ', "1}"]
+
+
+def test_returns_no_pieces_for_empty_text():
+    """Returns no pieces for empty text."""
+    assert split_json_pieces("") == []
@@ -0,0 +1,144 @@
+import asyncio
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from electric_text.clients import Client
+from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.data.stream_chunk_type import StreamChunkType
+from electric_text.providers.model_providers.mock import MockProvider
+
+SHAPES = ["anthropic", "openai", "ollama"]
+
+WEATHER_TOOL = {
+    "name": "get_weather",
+    "description": "Get the weather",
+    "parameters": {
+        "type": "object",
+        "properties": {"city": {"type": "string"}},
+        "required": ["city"],
+    },
+}
+
+
+class Answer(BaseModel):
+    answer: str
+    confidence: float
+
+
+def mock_request(model_name: str, **overrides) -> ProviderRequest:
+    return ProviderRequest(
+        provider_name="mock",
+        model_name=model_name,
+        prompt_text="Hi",
+        system_messages=["Be brief"],
+        **overrides,
+    )
+
+
+async def final_history(provider: MockProvider, request: ProviderRequest):
+    async for history in provider.generate_stream(request):
+        pass
+    return history
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shape", SHAPES)
+async def test_streams_requested_number_of_tokens(shape):
+    """Streams text with the requested number of words in every shape."""
+    provider = MockProvider(response_tokens="12", seed=1)
+
+    history = await final_history(provider, mock_request(f"{shape}/m"))
+
+    assert len(history.extract_text_content().split()) == 12
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shape", SHAPES)
+async def test_completes_with_text(shape):
+    """Completes with the same text length in every shape."""
+    provider = MockProvider(response_tokens=5, seed=1)
+
+    history = await provider.generate_completion(mock_request(f"{shape}/m"))
+
+    assert len(history.extract_text_content().split()) == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shape", SHAPES)
+async def test_streams_schema_conforming_output(shape):
+    """Streams structured output that validates against the schema."""
+    provider = MockProvider(seed=1)
+    request = mock_request(
+        f"{shape}/m", output_schema=Answer, has_custom_output_schema=True
+    )
+
+    text = (await final_history(provider, request)).extract_text_content()
+
+    assert Answer.model_validate_json(text if text.startswith("{") else "{" + text)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shape", SHAPES)
+async def test_streams_tool_call(shape):
+    """Streams a call to the offered tool."""
+    provider = MockProvider(seed=1)
+
+    history = await final_history(
+        provider, mock_request(f"{shape}/m", tools=[WEATHER_TOOL])
+    )
+
+    [block] = history.content_blocks
+    assert (block.data.name, set(json.loads(block.data.input_json_string))) == (
+        "get_weather",
+        {"city"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_injects_http_errors():
+    """Reports injected server errors as HTTP errors."""
+    provider = MockProvider(shape="openai", error_rate=1)
+
+    history = await final_history(provider, mock_request("m"))
+
+    assert history.chunks[-1].type is StreamChunkType.HTTP_ERROR
+
+
+@pytest.mark.asyncio
+async def test_injects_stream_interruptions():
+    """Reports streams cut off halfway as HTTP errors."""
+    provider = MockProvider(shape="ollama", truncate_rate=1, response_tokens=10)
+
+    history = await final_history(provider, mock_request("m"))
+
+    assert history.chunks[-1].type is StreamChunkType.HTTP_ERROR
+
+
+@pytest.mark.asyncio
+async def test_paces_stream_by_token_rate():
+    """Takes at least the token count divided by the rate to stream."""
+    provider = MockProvider(shape="ollama", tokens_per_second=500, response_tokens=20)
+
+    started = asyncio.get_running_loop().time()
+    await final_history(provider, mock_request("m"))
+
+    assert asyncio.get_running_loop().time() - started >= 19 / 500
+
+
+@pytest.mark.asyncio
+async def test_serves_concurrent_streams():
+    """Serves many concurrent streams through one provider."""
+    provider = MockProvider(shape="anthropic", response_tokens=8)
+
+    histories = await asyncio.gather(
+        *(final_history(provider, mock_request("m")) for _ in range(50))
+    )
+
+    assert all(len(h.extract_text_content().split()) == 8 for h in histories)
+
+
+def test_is_available_through_client():
+    """Is created by name through Client."""
+    assert isinstance(Client("mock", {"shape": "ollama"}).provider, MockProvider)
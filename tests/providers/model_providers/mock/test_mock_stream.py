@@ -0,0 +1,21 @@
+import httpx
+import pytest
+
+from electric_text.providers.model_providers.mock.mock_stream import MockStream
+
+
+@pytest.mark.asyncio
+async def test_yields_planned_chunks():
+    """Yields the planned chunks in order."""
+    stream = MockStream([(0.0, b"a"), (0.001, b"b")], None)
+
+    assert [chunk async for chunk in stream] == [b"a", b"b"]
+
+
+@pytest.mark.asyncio
+async def test_raises_read_error_after_chunks():
+    """Raises a read error after the chunks when an error is set."""
+    stream = MockStream([(0.0, b"a")], "cut")
+
+    with pytest.raises(httpx.ReadError):
+        [chunk async for chunk in stream]
@@ -0,0 +1,51 @@
+import pytest
+
+from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.model_providers.ollama import OllamaProvider
+from tests.fixtures import ollama_chat_transport
+
+REQUEST = ProviderRequest(
+    provider_name="ollama",
+    model_name="llama3",
+    prompt_text="Hi",
+    system_messages=["Be brief"],
+)
+
+
+@pytest.mark.asyncio
+async def test_keep_alive_reuses_one_client():
+    """Sends every request through the same client when keep_alive is set."""
+    provider = OllamaProvider(
+        keep_alive=True, transport=ollama_chat_transport(requests_seen=[])
+    )
+
+    await provider.generate_completion(REQUEST)
+    first = provider.http_client
+    await provider.generate_completion(REQUEST)
+
+    assert provider.http_client is first
+    await provider.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_shared_client():
+    """Closes and forgets the shared client."""
+    provider = OllamaProvider(
+        keep_alive=True, transport=ollama_chat_transport(requests_seen=[])
+    )
+    await provider.generate_completion(REQUEST)
+    shared = provider.http_client
+
+    await provider.aclose()
+
+    assert (provider.http_client, shared.is_closed) == (None, True)
+
+
+@pytest.mark.asyncio
+async def test_opens_client_per_request_by_default():
+    """Keeps no client between requests without keep_alive."""
+    provider = OllamaProvider(transport=ollama_chat_transport(requests_seen=[]))
+
+    history = await provider.generate_completion(REQUEST)
+
+    assert (provider.http_client, history.extract_text_content()) == (None, "Hello")
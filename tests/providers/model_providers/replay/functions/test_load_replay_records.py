@@ -0,0 +1,33 @@
+import gzip
+import json
+
+from electric_text.providers.functions.hash_request_body import (
+    hash_request_body,
+)
+from electric_text.providers.model_providers.replay.functions.load_replay_records import (
+    load_replay_records,
+)
+from tests.fixtures import replay_log_record, write_replay_log
+
+
+def test_indexes_plain_and_gzipped_segments_in_order(tmp_path):
+    """Indexes records from plain and gzipped segments in recording order."""
+    write_replay_log(tmp_path, [replay_log_record({"q": 1}, "first")], "http-a.jsonl")
+    with gzip.open(tmp_path / "http-b.jsonl.gz", "wt") as segment:
+        segment.write(json.dumps(replay_log_record({"q": 1}, "second")) + "\n")
+
+    index = load_replay_records(tmp_path)
+
+    assert [record.body for record in index[hash_request_body({"q": 1})]] == [
+        b"first",
+        b"second",
+    ]
+
+
+def test_skips_truncated_lines(tmp_path):
+    """Skips lines that are not valid JSON."""
+    path = write_replay_log(tmp_path, [replay_log_record({"q": 1}, "ok")])
+    with path.open("a") as segment:
+        segment.write('{"request": {"bo')
+
+    assert list(load_replay_records(tmp_path)) == [hash_request_body({"q": 1})]
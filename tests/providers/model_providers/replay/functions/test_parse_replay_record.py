@@ -0,0 +1,43 @@
+from electric_text.providers.model_providers.replay.data.replay_record import (
+    ReplayRecord,
+)
+from electric_text.providers.functions.hash_request_body import (
+    hash_request_body,
+)
+from electric_text.providers.model_providers.replay.functions.parse_replay_record import (
+    parse_replay_record,
+)
+from tests.fixtures import replay_log_record
+
+
+def test_parses_streamed_text_response():
+    """Parses a text body with its chunk timings, keyed by request hash."""
+    record = replay_log_record(
+        {"model": "m"},
+        "line\n",
+        headers={"content-type": "text/plain", "content-encoding": "gzip"},
+        chunks=[[12.0, 5]],
+    )
+
+    assert parse_replay_record(record) == (
+        hash_request_body({"model": "m"}),
+        ReplayRecord(
+            status=200,
+            headers={"content-type": "text/plain"},
+            body=b"line\n",
+            chunks=[(12.0, 5)],
+            ttfb_ms=12.0,
+        ),
+    )
+
+
+def test_reencodes_json_response():
+    """Re-encodes a decoded JSON body."""
+    parsed = parse_replay_record(replay_log_record({"model": "m"}, {"ok": True}))
+
+    assert parsed is not None and parsed[1].body == b'{"ok": true}'
+
+
+def test_skips_record_without_request_body():
+    """Returns None for records without a request body."""
+    assert parse_replay_record(replay_log_record(None, "x")) is None
@@ -0,0 +1,40 @@
+from electric_text.providers.model_providers.replay.functions.plan_replay_chunks import (
+    plan_replay_chunks,
+)
+
+
+def test_splits_body_at_recorded_offsets():
+    """Splits the body by recorded chunk sizes with the gaps between arrivals."""
+    assert plan_replay_chunks(b"abcdef", [(100.0, 2), (250.0, 4)], 0.0, 1.0) == [
+        (0.1, b"ab"),
+        (0.15, b"cdef"),
+    ]
+
+
+def test_scales_delays_by_speed():
+    """Divides delays by the playback speed."""
+    assert plan_replay_chunks(b"ab", [(100.0, 1), (300.0, 1)], 0.0, 2.0) == [
+        (0.05, b"a"),
+        (0.1, b"b"),
+    ]
+
+
+def test_skips_delays_at_zero_speed():
+    """Sends all chunks without delay at speed 0."""
+    assert plan_replay_chunks(b"ab", [(100.0, 1), (300.0, 1)], 0.0, 0.0) == [
+        (0.0, b"a"),
+        (0.0, b"b"),
+    ]
+
+
+def test_scales_split_points_to_decoded_body():
+    """Scales split points when recorded sizes differ from the decoded body."""
+    assert plan_replay_chunks(b"abcdefgh", [(0.0, 1), (0.0, 1)], 0.0, 1.0) == [
+        (0.0, b"abcd"),
+        (0.0, b"efgh"),
+    ]
+
+
+def test_sends_whole_body_after_ttfb_without_chunks():
+    """Sends the whole body after the time to first byte when no chunks were recorded."""
+    assert plan_replay_chunks(b"abc", [], 500.0, 1.0) == [(0.5, b"abc")]
@@ -0,0 +1,86 @@
+import json
+
+import httpx
+import pytest
+
+from electric_text.providers.data.provider_request import ProviderRequest
+from electric_text.providers.logging.functions.create_http_log_settings import (
+    create_http_log_settings,
+)
+from electric_text.providers.logging.functions.get_http_log_writer import (
+    get_http_log_writer,
+)
+from electric_text.providers.model_providers.ollama import OllamaProvider
+from electric_text.providers.model_providers.replay import ReplayProvider
+
+OLLAMA_LINES = [
+    {"message": {"role": "assistant", "content": "Hello"}, "done": False},
+    {"message": {"role": "assistant", "content": " there"}, "done": False},
+    {"message": {"role": "assistant", "content": ""}, "done": True},
+]
+
+
+def ollama_transport() -> httpx.MockTransport:
+    body = "".join(json.dumps(line) + "\n" for line in OLLAMA_LINES)
+    return httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, headers={"content-type": "application/x-ndjson"}, text=body
+        )
+    )
+
+
+def ollama_request(model_name: str) -> ProviderRequest:
+    return ProviderRequest(
+        provider_name="replay",
+        model_name=model_name,
+        prompt_text="Hi",
+        system_messages=["Be brief"],
+    )
+
+
+async def record_ollama_stream(log_dir) -> str:
+    recorder = OllamaProvider(
+        http_logging_enabled=True,
+        http_log_dir=str(log_dir),
+        transport=ollama_transport(),
+    )
+    async for history in recorder.generate_stream(ollama_request("llama3.1:8b")):
+        pass
+    get_http_log_writer(create_http_log_settings(str(log_dir), {})).close()
+    return history.extract_text_content()
+
+
+@pytest.mark.asyncio
+async def test_replays_recorded_stream(tmp_path):
+    """Replays a recorded stream through the provider that recorded it."""
+    recorded = await record_ollama_stream(tmp_path)
+    provider = ReplayProvider(log_dir=str(tmp_path), speed=0)
+
+    async for history in provider.generate_stream(ollama_request("ollama/llama3.1:8b")):
+        pass
+
+    assert history.extract_text_content() == recorded == "Hello there"
+
+
+@pytest.mark.asyncio
+async def test_uses_recorded_provider_for_plain_model(tmp_path):
+    """Uses the configured recorded provider for model names without a prefix."""
+    await record_ollama_stream(tmp_path)
+    provider = ReplayProvider(
+        log_dir=str(tmp_path), speed="0", recorded_provider="ollama"
+    )
+
+    async for history in provider.generate_stream(ollama_request("llama3.1:8b")):
+        pass
+
+    assert history.extract_text_content() == "Hello there"
+
+
+@pytest.mark.asyncio
+async def test_reports_unrecorded_request_as_http_error(tmp_path):
+    """Reports a request that was never recorded as an HTTP error."""
+    provider = ReplayProvider(log_dir=str(tmp_path), speed=0)
+
+    history = await provider.generate_completion(ollama_request("ollama/other"))
+
+    assert history.chunks[-1].type.name == "HTTP_ERROR"
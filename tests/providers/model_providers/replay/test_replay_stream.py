@@ -0,0 +1,11 @@
+import pytest
+
+from electric_text.providers.model_providers.replay.replay_stream import ReplayStream
+
+
+@pytest.mark.asyncio
+async def test_yields_planned_chunks_in_order():
+    """Yields the planned chunks in order."""
+    stream = ReplayStream([(0.0, b"a"), (0.001, b"b")])
+
+    assert [chunk async for chunk in stream] == [b"a", b"b"]
@@ -0,0 +1,49 @@
+import httpx
+import pytest
+
+from electric_text.providers.model_providers.replay import ReplayTransport
+from tests.fixtures import replay_log_record, write_replay_log
+
+
+@pytest.mark.asyncio
+async def test_serves_recorded_response_for_matching_body(tmp_path):
+    """Serves the recorded body for a request with the same JSON body."""
+    write_replay_log(
+        tmp_path,
+        [
+            replay_log_record(
+                {"a": 1, "b": 2}, "line one\nline two\n", chunks=[[1.0, 9], [2.0, 9]]
+            )
+        ],
+    )
+
+    async with httpx.AsyncClient(transport=ReplayTransport(tmp_path, 0)) as client:
+        response = await client.post("https://example.test/", json={"b": 2, "a": 1})
+
+    assert (response.status_code, response.text) == (200, "line one\nline two\n")
+
+
+@pytest.mark.asyncio
+async def test_cycles_through_repeated_recordings(tmp_path):
+    """Serves repeated recordings of the same request in turn."""
+    write_replay_log(
+        tmp_path,
+        [replay_log_record({"a": 1}, "first"), replay_log_record({"a": 1}, "second")],
+    )
+
+    async with httpx.AsyncClient(transport=ReplayTransport(tmp_path, 0)) as client:
+        bodies = [
+            (await client.post("https://example.test/", json={"a": 1})).text
+            for _ in range(3)
+        ]
+
+    assert bodies == ["first", "second", "first"]
+
+
+@pytest.mark.asyncio
+async def test_returns_not_found_for_unrecorded_request(tmp_path):
+    """Returns 404 for a request that was never recorded."""
+    async with httpx.AsyncClient(transport=ReplayTransport(tmp_path, 0)) as client:
+        response = await client.post("https://example.test/", json={"a": 1})
+
+    assert response.status_code == 404
@@ -0,0 +1,99 @@
+import json
+
+from electric_text.cli.commands.batch import batch_command
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_batch_writes_output_per_record(tmp_path, clean_env, capsys):
+    """Processes every record and prints one tagged output line each."""
+    source = tmp_path / "in.jsonl"
+    source.write_text('first\n{"id": "b", "text": "second", "max_tokens": 3}\n')
+
+    exit_code = batch_command([str(source), "-m", "mock:anthropic/m", "-j", "2"])
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert exit_code == 0
+    assert sorted(line["id"] for line in lines) == ["1", "b"]
+
+
+def test_batch_resumes_from_journal(tmp_path, clean_env, capsys):
+    """Skips journaled records and appends only the rest to the output."""
+    source = tmp_path / "in.jsonl"
+    source.write_text("first\nsecond\n")
+    output = tmp_path / "out.jsonl"
+    output.write_text('{"id": "1", "output": {}}\n')
+    journal = tmp_path / "journal.jsonl"
+    journal.write_text('{"id": "1"}\n')
+
+    exit_code = batch_command(
+        [
+            str(source),
+            "-m",
+            "mock:anthropic/m",
+            "-o",
+            str(output),
+            "--journal",
+            str(journal),
+        ]
+    )
+
+    assert exit_code == 0
+    assert [line["id"] for line in read_lines(output)] == ["1", "2"]
+    assert read_lines(journal) == [{"id": "1"}, {"id": "2"}]
+    assert capsys.readouterr().err == "1 succeeded, 0 failed, 1 skipped\n"
+
+
+def test_batch_resume_replaces_earlier_failures(tmp_path, clean_env, capsys):
+    """Reruns a record that failed before, leaving one output line per id."""
+    source = tmp_path / "in.jsonl"
+    source.write_text("first\nsecond\n")
+    output = tmp_path / "out.jsonl"
+    output.write_text(
+        '{"id": "1", "output": {}}\n{"id": "2", "error": "RuntimeError: down"}\n'
+    )
+    journal = tmp_path / "journal.jsonl"
+    journal.write_text('{"id": "1"}\n')
+
+    exit_code = batch_command(
+        [
+            str(source),
+            "-m",
+            "mock:anthropic/m",
+            "-o",
+            str(output),
+            "--journal",
+            str(journal),
+        ]
+    )
+
+    lines = read_lines(output)
+    assert exit_code == 0
+    assert [(line["id"], "output" in line) for line in lines] == [
+        ("1", True),
+        ("2", True),
+    ]
+
+
+def test_batch_rejects_malformed_input(tmp_path, clean_env, capsys):
+    """Exits with 2 and reports the malformed line."""
+    source = tmp_path / "in.jsonl"
+    source.write_text('{"txt": "typo"}\n')
+
+    exit_code = batch_command([str(source), "-m", "mock:anthropic/m"])
+
+    assert exit_code == 2
+    assert capsys.readouterr().err == "Error: Line 1: unknown fields txt\n"
+
+
+def test_batch_fails_when_a_record_fails(tmp_path, clean_env, capsys):
+    """Exits with 1 when any record produced an error."""
+    source = tmp_path / "in.jsonl"
+    source.write_text('{"text": "Hi", "model": "nonsense"}\n')
+
+    exit_code = batch_command([str(source), "-m", "mock:anthropic/m"])
+
+    assert exit_code == 1
+    assert "error" in json.loads(capsys.readouterr().out)
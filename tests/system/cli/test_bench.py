@@ -0,0 +1,38 @@
+import json
+
+from electric_text.cli.commands.bench import bench_command
+
+
+def test_bench_prints_percentile_table(capsys):
+    """Runs the load test and prints throughput and percentiles as a table."""
+    exit_code = bench_command(["-m", "mock:anthropic/m", "-n", "20", "-j", "5"])
+
+    output = capsys.readouterr().out
+    assert exit_code == 0
+    assert "20 (20 ok, 0 failed)" in output
+    assert "TTFT" in output and "Latency" in output
+
+
+def test_bench_prints_json_report_for_completions(capsys):
+    """Prints a JSON report in completion mode."""
+    exit_code = bench_command(
+        ["-m", "mock:openai/m", "-n", "4", "--mode", "completion", "-f", "json"]
+    )
+
+    report = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert (report["succeeded"], report["settings"]["stream"], report["ttft"]) == (
+        4,
+        False,
+        None,
+    )
+
+
+def test_bench_reports_unknown_provider(capsys):
+    """Reports an unknown provider on stderr and exits with status 2."""
+    exit_code = bench_command(["-m", "nope:x", "-n", "1"])
+
+    assert (exit_code, capsys.readouterr().err) == (
+        2,
+        "Error: Unknown provider: 'nope'\n",
+    )
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+
+
+# Modules, including the interpreter's own, the CLI entry point may import;
+# about 200 today, while pydantic and httpx together add over a hundred
+MODULE_BUDGET = 240
+
+# Cumulative import time of the entry point; about 50 ms today, so only a
+# gross regression (such as loading the client stack) exceeds it
+IMPORT_TIME_BUDGET_US = 500_000
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Run a statement in a fresh interpreter and time every module it imported.
+
+    Returns:
+        The cumulative import time of each module, in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def imported_modules(statement: str) -> set[str]:
+    """Run a statement in a fresh interpreter and list the modules it imported."""
+    return set(import_times(statement))
+
+
+def test_cli_entry_point_skips_client_stack():
+    """Imports the CLI entry point without pydantic, httpx, yaml, or providers."""
+    modules = imported_modules("import electric_text.cli.functions.main")
+
+    heavy = {
+        "pydantic",
+        "httpx",
+        "yaml",
+        "cProfile",
+        "electric_text.web",
+        "electric_text.clients",
+        "electric_text.providers.model_providers.anthropic",
+        "electric_text.providers.model_providers.openai",
+        "electric_text.providers.model_providers.ollama",
+    }
+    assert modules & heavy == set()
+
+
+def test_cli_entry_point_stays_within_budget():
+    """Imports the CLI entry point within the module count and time budgets."""
+    times = import_times("import electric_text.cli.functions.main")
+
+    assert len(times) <= MODULE_BUDGET
+    assert times["electric_text.cli.functions.main"] <= IMPORT_TIME_BUDGET_US
+
+
+def test_package_resolves_generate_on_first_use():
+    """Resolves electric_text.generate lazily from the prompting layer."""
+    import electric_text
+    from electric_text.prompting.functions.generate import generate
+
+    assert electric_text.generate is generate
@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from electric_text.cli.functions.main import main
+
+
+@pytest.mark.asyncio
+async def test_delta_stream_reassembles_text(clean_env, capsys):
+    """Streams text deltas that join into the full text, then a summary."""
+    exit_code = await main(
+        ["Hello", "-m", "mock:anthropic/m", "--stream", "--output-format", "delta"]
+    )
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    text = "".join(record["delta"] for record in records[:-1])
+    assert exit_code == 0
+    assert all(record["type"] == "text_delta" for record in records[:-1])
+    assert (records[-1]["type"], len(text.split())) == ("summary", 64)
+
+
+@pytest.mark.asyncio
+async def test_delta_completion_writes_text_once(clean_env, capsys):
+    """Writes a completion as one text delta and a summary."""
+    exit_code = await main(["Hello", "-m", "mock:openai/m", "-of", "delta"])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert exit_code == 0
+    assert [record["type"] for record in records] == ["text_delta", "summary"]
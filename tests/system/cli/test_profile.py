@@ -0,0 +1,47 @@
+import pstats
+
+import pytest
+from httpx import Response
+
+from electric_text.cli.functions.main import main
+
+
+@pytest.mark.asyncio
+async def test_profile_writes_stats_and_phase_summary(fake_http, capsys, tmp_path):
+    """Profiles the request, writes pstats and prints a phase summary to stderr."""
+
+    fake_http.post("https://api.anthropic.com/v1/messages").mock(
+        return_value=Response(
+            200,
+            json={
+                "id": "id-123",
+                "type": "message",
+                "role": "assistant",
+                "model": "claude-3-7-sonnet-20250219",
+                "content": [{"type": "text", "text": "Rain on the corn"}],
+                "stop_reason": "end_turn",
+                "usage": {"input_tokens": 50, "output_tokens": 20},
+            },
+        )
+    )
+    output_path = tmp_path / "run.pstats"
+
+    exit_code = await main(
+        [
+            "Write a haiku about rain in farm fields",
+            "--model",
+            "anthropic:claude-3-7-sonnet-20250219",
+            "--api-key",
+            "test-key",
+            "--profile",
+            str(output_path),
+        ]
+    )
+
+    assert exit_code == 0
+
+    captured = capsys.readouterr()
+    assert "Rain on the corn" in captured.out
+    for phase in ["config", "request_build", "network", "parse_validate", "serialize"]:
+        assert phase in captured.err
+    assert pstats.Stats(str(output_path)).total_calls > 0
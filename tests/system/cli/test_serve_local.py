@@ -0,0 +1,75 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run `electric_text serve-local` on a temporary socket."""
+    environ = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith("ELECTRIC_TEXT_")
+    }
+    environ["ELECTRIC_TEXT_DAEMON_SOCKET"] = str(tmp_path / "d.sock")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "electric_text", "serve-local"],
+        env=environ,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stderr is not None
+    process.stderr.readline()
+    yield environ, process
+    process.terminate()
+    process.wait(timeout=10)
+
+
+def run_cli(environ, *args):
+    """Run the electric_text CLI with the given environment."""
+    return subprocess.run(
+        [sys.executable, "-m", "electric_text", *args],
+        env=environ,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+
+def test_forwards_prompt_to_daemon(daemon):
+    """Prints the daemon's result for a forwarded prompt."""
+    environ, _ = daemon
+
+    result = run_cli(environ, "Hello", "-m", "mock:anthropic/m", "--max-tokens", "5")
+
+    assert (result.returncode, json.loads(result.stdout)["response_type"]) == (
+        0,
+        "TEXT",
+    )
+
+
+def test_runs_in_process_for_other_environment(daemon):
+    """Runs in-process when the caller's environment differs from the daemon's."""
+    environ, _ = daemon
+
+    result = run_cli(
+        {**environ, "ELECTRIC_TEXT_LOG_LEVEL": "ERROR"},
+        "Hello",
+        "-m",
+        "mock:anthropic/m",
+    )
+
+    assert result.returncode == 0
+
+
+def test_removes_socket_on_terminate(daemon):
+    """Removes its socket when terminated."""
+    environ, process = daemon
+
+    process.terminate()
+    process.wait(timeout=10)
+
+    assert os.path.exists(environ["ELECTRIC_TEXT_DAEMON_SOCKET"]) is False
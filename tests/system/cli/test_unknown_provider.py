@@ -0,0 +1,14 @@
+import pytest
+
+from electric_text.cli.functions.main import main
+
+
+@pytest.mark.asyncio
+async def test_unknown_provider_exits_with_usage_error(capsys):
+    """Reports an unknown provider on stderr and exits with status 2."""
+    exit_code = await main(["Hello", "--model", "nope:x"])
+
+    captured = capsys.readouterr()
+    assert exit_code == 2
+    assert captured.err == "Error: Unknown provider: 'nope'\n"
+    assert captured.out == ""
@@ -18,7 +18,7 @@ from tests.boundaries import (
 
 
 @pytest.mark.asyncio
-async def test_prompt_no_config():
+async def test_prompt_no_config(example_config):
     """System test: prompt config is not specified"""
 
     expected_haiku = dedent(
@@ -35,7 +35,7 @@ async def test_prompt_no_config():
 
     with mock_boundaries(
         http_mocks=mocks,
-        env_vars={"ELECTRIC_TEXT_CONFIG": "examples/config.yaml"},
+        env_vars={"ELECTRIC_TEXT_CONFIG": example_config},
     ):
         result = await generate(
             text_input="Write a haiku.",
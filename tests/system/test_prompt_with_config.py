@@ -18,7 +18,7 @@ from tests.boundaries import (
 
 
 @pytest.mark.asyncio
-async def test_poetry_with_prompt_config():
+async def test_poetry_with_prompt_config(example_config):
     """System test: poetry prompt config is specified"""
 
     expected_poem = dedent(
@@ -36,7 +36,7 @@ async def test_poetry_with_prompt_config():
     with mock_boundaries(
         http_mocks=mocks,
         env_vars={
-            "ELECTRIC_TEXT_CONFIG": "examples/config.yaml",
+            "ELECTRIC_TEXT_CONFIG": example_config,
         },
     ):
         result = await generate(
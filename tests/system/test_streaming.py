@@ -16,7 +16,7 @@ from tests.boundaries import (
 
 
 @pytest.mark.asyncio
-async def test_streaming():
+async def test_streaming(example_config):
     """System test: streaming"""
 
     mocks = {
@@ -25,7 +25,7 @@ async def test_streaming():
 
     with mock_boundaries(
         http_mocks=mocks,
-        env_vars={"ELECTRIC_TEXT_CONFIG": "examples/config.yaml"},
+        env_vars={"ELECTRIC_TEXT_CONFIG": example_config},
     ):
         result_generator = await generate(
             text_input="Write a haiku.",
@@ -17,7 +17,7 @@ from tests.boundaries import (
 
 
 @pytest.mark.asyncio
-async def test_tools_streaming():
+async def test_tools_streaming(example_config):
     """System test: tool usage with streaming enabled"""
 
     mocks = {
@@ -30,7 +30,7 @@ async def test_tools_streaming():
     with mock_boundaries(
         http_mocks=mocks,
         env_vars={
-            "ELECTRIC_TEXT_CONFIG": "examples/config.yaml",
+            "ELECTRIC_TEXT_CONFIG": example_config,
             "ELECTRIC_TEXT_TOOLS_DIRECTORY": "examples/tool_configs",
         },
     ):
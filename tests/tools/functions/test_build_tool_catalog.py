@@ -0,0 +1,51 @@
+from electric_text.tools.functions.build_tool_catalog import build_tool_catalog
+from tests.fixtures import write_tool_configs
+
+
+def test_loads_tools_for_each_box(tmp_path):
+    """Loads the tools of every valid tool box, in the order listed."""
+    write_tool_configs(
+        tmp_path,
+        [{"name": "travel", "tools": ["flights", "weather"]}, {"bad": "box"}],
+        ["flights", "weather"],
+    )
+
+    catalog = build_tool_catalog(str(tmp_path))
+
+    assert {
+        name: [tool["name"] for tool in tools]
+        for name, tools in catalog.tool_boxes.items()
+    } == {"travel": ["flights", "weather"]}
+
+
+def test_shares_tools_between_boxes(tmp_path):
+    """Reads a tool used by several boxes once and shares the config."""
+    write_tool_configs(
+        tmp_path,
+        [{"name": "a", "tools": ["weather"]}, {"name": "b", "tools": ["weather"]}],
+        ["weather"],
+    )
+
+    catalog = build_tool_catalog(str(tmp_path))
+
+    assert catalog.tool_boxes["a"][0] is catalog.tool_boxes["b"][0]
+
+
+def test_skips_missing_tools_but_stamps_them(tmp_path):
+    """Skips tools without a file and records them so creating one invalidates."""
+    write_tool_configs(tmp_path, [{"name": "a", "tools": ["missing"]}], [])
+
+    catalog = build_tool_catalog(str(tmp_path))
+
+    assert (
+        catalog.tool_boxes["a"],
+        catalog.stamps[str(tmp_path / "missing.json")],
+    ) == (
+        [],
+        None,
+    )
+
+
+def test_returns_empty_catalog_without_tool_boxes(tmp_path):
+    """Returns no tool boxes when tool_boxes.json is missing."""
+    assert build_tool_catalog(str(tmp_path)).tool_boxes == {}
@@ -0,0 +1,14 @@
+from electric_text.tools.data.tool_catalog import ToolCatalog
+from electric_text.tools.functions.combine_tool_boxes import combine_tool_boxes
+
+
+def test_combines_and_deduplicates_by_name():
+    """Combines the tools of several boxes, keeping each name once."""
+    weather = {"name": "weather"}
+    flights = {"name": "flights"}
+    catalog = ToolCatalog(
+        config_dir="/tools",
+        tool_boxes={"a": [weather], "b": [flights, weather]},
+    )
+
+    assert combine_tool_boxes(catalog, ["a", "b", "unknown"]) == (weather, flights)
@@ -0,0 +1,6 @@
+from electric_text.tools.functions.get_tool_registry import get_tool_registry
+
+
+def test_returns_shared_registry():
+    """Returns the same registry on every call."""
+    assert get_tool_registry() is get_tool_registry()
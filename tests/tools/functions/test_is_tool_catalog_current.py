@@ -0,0 +1,21 @@
+from electric_text.tools.functions.build_tool_catalog import build_tool_catalog
+from electric_text.tools.functions.is_tool_catalog_current import (
+    is_tool_catalog_current,
+)
+from tests.fixtures import touch_later, write_tool_configs
+
+
+def test_current_when_nothing_changed(tmp_path):
+    """Reports an untouched catalog as current."""
+    write_tool_configs(tmp_path, [{"name": "a", "tools": ["weather"]}], ["weather"])
+
+    assert is_tool_catalog_current(build_tool_catalog(str(tmp_path)))
+
+
+def test_stale_when_a_tool_is_edited(tmp_path):
+    """Reports the catalog as stale when a tool file is rewritten."""
+    write_tool_configs(tmp_path, [{"name": "a", "tools": ["weather"]}], ["weather"])
+    catalog = build_tool_catalog(str(tmp_path))
+    touch_later(tmp_path / "weather.json")
+
+    assert not is_tool_catalog_current(catalog)
@@ -19,3 +19,9 @@ def test_load_tools_from_tool_boxes():
             assert len(only_empty_box) == 0
             assert len(nonexistent_box) == 0
             assert len(mixed_boxes) == 2  # Should still load tools from valid boxes
+
+
+def test_load_tools_without_tool_configs_directory():
+    """Loads no tools when no tool configs directory is set."""
+    with mock_env({}, clear_prefix="ELECTRIC_TEXT_TOOLS_"):
+        assert load_tools_from_tool_boxes(["test_box"]) == ()
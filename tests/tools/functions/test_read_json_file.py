@@ -0,0 +1,22 @@
+from electric_text.tools.functions.read_json_file import read_json_file
+
+
+def test_reads_json_value(tmp_path):
+    """Returns the decoded JSON value."""
+    path = tmp_path / "a.json"
+    path.write_text('{"a": 1}')
+
+    assert read_json_file(str(path)) == {"a": 1}
+
+
+def test_returns_none_for_malformed_json(tmp_path):
+    """Returns None when the file is not valid JSON."""
+    path = tmp_path / "a.json"
+    path.write_text("{not json")
+
+    assert read_json_file(str(path)) is None
+
+
+def test_returns_none_for_missing_file(tmp_path):
+    """Returns None when the file does not exist."""
+    assert read_json_file(str(tmp_path / "missing.json")) is None
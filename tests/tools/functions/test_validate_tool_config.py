@@ -0,0 +1,18 @@
+from electric_text.tools.functions.validate_tool_config import validate_tool_config
+
+
+def test_accepts_complete_tool():
+    """Accepts a tool with a name, description, and parameters object."""
+    assert validate_tool_config(
+        {"name": "weather", "description": "d", "parameters": {"type": "object"}}
+    )
+
+
+def test_rejects_tool_without_parameters():
+    """Rejects a tool that has no parameters object."""
+    assert not validate_tool_config({"name": "weather", "description": "d"})
+
+
+def test_rejects_non_dict():
+    """Rejects values that are not objects."""
+    assert not validate_tool_config(["weather"])
@@ -0,0 +1,52 @@
+import pytest
+
+from electric_text.tools.tool_registry import ToolRegistry
+from tests.fixtures import touch_later, write_tool_configs
+
+TOOL_BOXES = [
+    {"name": "travel", "tools": ["flights", "weather"]},
+    {"name": "meteorology", "tools": ["weather"]},
+]
+
+
+def test_returns_same_tuple_for_repeated_selections(tmp_path):
+    """Returns the same tuple for the same tool boxes."""
+    write_tool_configs(tmp_path, TOOL_BOXES, ["flights", "weather"])
+    registry = ToolRegistry()
+
+    first = registry.get_tools(str(tmp_path), ["travel", "meteorology"])
+
+    assert registry.get_tools(str(tmp_path), ["travel", "meteorology"]) is first
+
+
+def test_skips_file_checks_within_interval(tmp_path):
+    """Serves the cached catalog without re-checking files inside the interval."""
+    write_tool_configs(tmp_path, TOOL_BOXES, ["flights", "weather"])
+    registry = ToolRegistry(check_interval_s=3600)
+    first = registry.get_tools(str(tmp_path), ["travel"])
+
+    (tmp_path / "flights.json").unlink()
+
+    assert registry.get_tools(str(tmp_path), ["travel"]) is first
+
+
+def test_reloads_edited_tool_after_interval(tmp_path):
+    """Rebuilds the catalog when a tool file changed since it was read."""
+    write_tool_configs(tmp_path, TOOL_BOXES, ["flights", "weather"])
+    registry = ToolRegistry(check_interval_s=0)
+    registry.get_tools(str(tmp_path), ["meteorology"])
+
+    path = tmp_path / "weather.json"
+    path.write_text(path.read_text().replace("The weather tool", "Edited"))
+    touch_later(path)
+
+    tools = registry.get_tools(str(tmp_path), ["meteorology"])
+    assert tools[0]["description"] == "Edited"
+
+
+def test_raises_for_unknown_tool_box(tmp_path):
+    """Raises ValueError for a tool box that is not configured."""
+    write_tool_configs(tmp_path, TOOL_BOXES, ["flights", "weather"])
+
+    with pytest.raises(ValueError, match="Tool box not found: unknown"):
+        ToolRegistry().get_tool_box(str(tmp_path), "unknown")
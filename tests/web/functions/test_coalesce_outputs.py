@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from electric_text.web.functions.coalesce_outputs import coalesce_outputs
+from tests.fixtures import text_output
+
+
+async def burst(*contents, then=None):
+    """Yield text updates back to back, then wait on an optional event."""
+    for content in contents:
+        yield text_output(content)
+    if then is not None:
+        await then.wait()
+
+
+def contents(outputs):
+    return [output.text.content for output in outputs]
+
+
+@pytest.mark.asyncio
+async def test_merges_bursts_into_the_newest_update():
+    """Passes on the first update at once and only the newest of the rest."""
+    updates = coalesce_outputs(burst("a", "ab", "abc"), 10.0, 1024)
+
+    assert contents([output async for output in updates]) == ["a", "abc"]
+
+
+@pytest.mark.asyncio
+async def test_passes_on_large_growth_without_waiting():
+    """Passes on an update that adds max_chars or more."""
+    updates = coalesce_outputs(burst("a", "ab", "abc", "abcd"), 10.0, 2)
+
+    assert contents([output async for output in updates]) == ["a", "abc", "abcd"]
+
+
+@pytest.mark.asyncio
+async def test_passes_on_held_update_when_window_closes():
+    """Passes on a held update once interval_s passes without anything new."""
+    quiet = asyncio.Event()
+    updates = coalesce_outputs(burst("a", "ab", then=quiet), 0.01, 1024)
+
+    received = [await anext(updates), await anext(updates)]
+    quiet.set()
+
+    assert contents(received) == ["a", "ab"]
+    await updates.aclose()
+
+
+@pytest.mark.asyncio
+async def test_zero_interval_passes_on_every_update():
+    """Passes on every update when interval_s is 0."""
+    updates = coalesce_outputs(burst("a", "ab", "abc"), 0.0, 1024)
+
+    assert contents([output async for output in updates]) == ["a", "ab", "abc"]
+
+
+@pytest.mark.asyncio
+async def test_stops_reading_when_cancelled():
+    """Closes the stream it was waiting on when its consumer is cancelled."""
+    closed = []
+
+    async def stalled():
+        try:
+            yield text_output("a")
+            await asyncio.Event().wait()
+        finally:
+            closed.append(True)
+
+    updates = coalesce_outputs(stalled(), 0.01, 1024)
+    await anext(updates)
+    waiting = asyncio.create_task(anext(updates))
+    await asyncio.sleep(0.01)
+
+    waiting.cancel()
+    await asyncio.wait([waiting])
+
+    assert closed == [True]
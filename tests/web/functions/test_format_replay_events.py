@@ -0,0 +1,15 @@
+from electric_text.web.functions.format_replay_events import format_replay_events
+
+
+def test_prepends_an_id_to_every_event():
+    """Gives each event in the chunk its own id field."""
+    events = [(1, "event: reset\ndata: \n\n"), (2, "event: response\ndata: Hi\n\n")]
+
+    assert format_replay_events(events) == (
+        "id: 1\nevent: reset\ndata: \n\nid: 2\nevent: response\ndata: Hi\n\n"
+    )
+
+
+def test_formats_nothing_as_an_empty_chunk():
+    """Returns an empty string for no events."""
+    assert format_replay_events([]) == ""
@@ -0,0 +1,13 @@
+from electric_text.web.functions.format_sse_event import format_sse_event
+
+
+def test_formats_single_line_event():
+    """Formats an event with a single data field."""
+    assert format_sse_event("complete", "Done") == "event: complete\ndata: Done\n\n"
+
+
+def test_splits_multi_line_data():
+    """Sends each line of data in its own data field."""
+    assert format_sse_event("response", "a\nb") == (
+        "event: response\ndata: a\ndata: b\n\n"
+    )
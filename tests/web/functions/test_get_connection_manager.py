@@ -0,0 +1,13 @@
+import os
+
+
+def test_returns_one_shared_manager(connection_manager):
+    """Returns the same manager on every call."""
+    assert connection_manager() is connection_manager()
+
+
+def test_configures_manager_from_environment(connection_manager):
+    """Applies the limits from the environment."""
+    os.environ["ELECTRIC_TEXT_WEB_MAX_CONNECTIONS"] = "3"
+
+    assert connection_manager().settings.max_connections == 3
@@ -0,0 +1,44 @@
+import pytest
+
+from electric_text.web.data import ConnectionSettings
+from electric_text.web.functions.get_connection_settings import (
+    get_connection_settings,
+)
+
+
+def test_defaults_without_environment():
+    """Uses the default limits when nothing is set."""
+    assert get_connection_settings({}) == ConnectionSettings()
+
+
+def test_reads_limits_from_environment():
+    """Reads every limit from ELECTRIC_TEXT_WEB_* variables."""
+    settings = get_connection_settings(
+        {
+            "ELECTRIC_TEXT_WEB_MAX_CONNECTIONS": "2",
+            "ELECTRIC_TEXT_WEB_PROMPT_QUEUE_SIZE": "1",
+            "ELECTRIC_TEXT_WEB_IDLE_TIMEOUT_S": "30",
+            "ELECTRIC_TEXT_WEB_HEARTBEAT_S": "0.5",
+            "ELECTRIC_TEXT_WEB_RESTART_INTERVAL_S": "0.25",
+            "ELECTRIC_TEXT_WEB_FLUSH_INTERVAL_S": "0.05",
+            "ELECTRIC_TEXT_WEB_FLUSH_CHARS": "256",
+            "ELECTRIC_TEXT_WEB_REPLAY_EVENTS": "50",
+            "ELECTRIC_TEXT_WEB_RESUME_TIMEOUT_S": "10",
+            "ELECTRIC_TEXT_WEB_MAX_WATCHERS": "3",
+            "ELECTRIC_TEXT_WEB_MAX_REQUEST_BYTES": "1024",
+            "ELECTRIC_TEXT_WEB_MAX_PROVIDER_GENERATIONS": "4",
+            "ELECTRIC_TEXT_WEB_PROVIDER_LIMITS": "ollama=1",
+            "ELECTRIC_TEXT_WEB_ADMISSION_QUEUE_SIZE": "6",
+            "ELECTRIC_TEXT_WEB_ADMISSION_TIMEOUT_S": "2.5",
+        }
+    )
+
+    assert settings == ConnectionSettings(
+        2, 1, 30.0, 0.5, 0.25, 0.05, 256, 50, 10.0, 3, 1024, 4, {"ollama": 1}, 6, 2.5
+    )
+
+
+def test_rejects_non_numbers():
+    """Raises ValueError for a limit that is not a number."""
+    with pytest.raises(ValueError):
+        get_connection_settings({"ELECTRIC_TEXT_WEB_MAX_CONNECTIONS": "many"})
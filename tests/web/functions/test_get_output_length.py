@@ -0,0 +1,17 @@
+from electric_text.web.functions.get_output_length import get_output_length
+from tests.fixtures import data_output, text_output, tool_call_output
+
+
+def test_measures_text():
+    """Counts the characters of a text response."""
+    assert get_output_length(text_output("Hello")) == 5
+
+
+def test_measures_tool_call_arguments():
+    """Counts the characters of a tool call's argument JSON."""
+    assert get_output_length(tool_call_output("search", '{"q": "a"}')) == 10
+
+
+def test_ignores_data():
+    """Counts nothing for structured data."""
+    assert get_output_length(data_output({"a": 1})) == 0
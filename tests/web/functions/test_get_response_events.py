@@ -0,0 +1,46 @@
+from electric_text.web.functions.get_response_events import get_response_events
+
+
+def test_escapes_text_deltas():
+    """Sends text deltas as escaped HTML."""
+    events = get_response_events({"type": "text_delta", "delta": "<b>"})
+
+    assert events == ["event: response\ndata: &lt;b&gt;\n\n"]
+
+
+def test_resets_before_rewritten_text():
+    """Clears the response before a delta that rewrites it."""
+    events = get_response_events({"type": "text_delta", "delta": "x", "reset": True})
+
+    assert events == ["event: reset\ndata: \n\n", "event: response\ndata: x\n\n"]
+
+
+def test_announces_tool_calls():
+    """Shows the name of a started tool call."""
+    events = get_response_events({"type": "tool_call_start", "name": "search"})
+
+    assert events == ["event: response\ndata: <div class='tool-call'>search</div>\n\n"]
+
+
+def test_sends_tool_call_deltas():
+    """Sends tool call argument deltas as escaped HTML."""
+    events = get_response_events({"type": "tool_call_delta", "delta": '{"q"'})
+
+    assert events == ["event: response\ndata: {&quot;q&quot;\n\n"]
+
+
+def test_shows_completed_fields():
+    """Sends a completed data field as its name and escaped JSON value."""
+    events = get_response_events({"type": "field", "name": "a", "value": "<x>"})
+
+    assert events == [
+        "event: response\ndata: <div class='data-field'><b>a</b>: "
+        "&quot;&lt;x&gt;&quot;</div>\n\n"
+    ]
+
+
+def test_skips_the_summary():
+    """Sends nothing for the summary."""
+    record = {"type": "summary", "response_type": "text", "updates": 1}
+
+    assert get_response_events(record) == []
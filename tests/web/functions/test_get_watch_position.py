@@ -0,0 +1,27 @@
+from electric_text.web.functions.get_watch_position import get_watch_position
+from electric_text.web.replay_buffer import ReplayBuffer
+
+
+def replay_of(size, count):
+    replay = ReplayBuffer(size)
+    replay.publish_nowait([f"event {number}" for number in range(count)])
+    return replay
+
+
+def test_resumes_from_the_last_event_id():
+    """Starts after the last event a reconnecting watcher received."""
+    assert get_watch_position(replay_of(8, 5), 1, last_event_id=3) == 3
+
+
+def test_starts_new_watchers_at_the_latest_response():
+    """Starts at the latest response when there is no usable last event id."""
+    replay = replay_of(2, 5)
+
+    assert [
+        get_watch_position(replay, 3, last_event_id) for last_event_id in (None, 0)
+    ] == [3, 3]
+
+
+def test_starts_at_the_newest_event_when_the_response_start_was_dropped():
+    """Starts after the newest event when the response began before the buffer."""
+    assert get_watch_position(replay_of(2, 5), 0, None) == 5
@@ -0,0 +1,17 @@
+import os
+
+from electric_text.web.functions.get_web_model import get_web_model
+
+
+def test_reads_model_from_environment(clean_env):
+    """Uses the model from ELECTRIC_TEXT_WEB_MODEL."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+
+    assert get_web_model() == "mock:ollama/m"
+
+
+def test_defaults_to_configured_default_model(clean_env):
+    """Falls back to the configured default model."""
+    os.environ["ELECTRIC_TEXT_CONFIG"] = os.devnull
+
+    assert get_web_model() == "ollama:llama3.1:8b"
@@ -0,0 +1,15 @@
+import os
+
+from electric_text.web.functions.get_web_prompt_name import get_web_prompt_name
+
+
+def test_reads_prompt_name_from_environment(clean_env):
+    """Uses the prompt name from ELECTRIC_TEXT_WEB_PROMPT_NAME."""
+    os.environ["ELECTRIC_TEXT_WEB_PROMPT_NAME"] = "concise"
+
+    assert get_web_prompt_name() == "concise"
+
+
+def test_defaults_to_no_prompt(clean_env):
+    """Runs prompts without a prompt config by default."""
+    assert get_web_prompt_name() is None
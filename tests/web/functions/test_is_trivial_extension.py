@@ -0,0 +1,26 @@
+from electric_text.web.functions.is_trivial_extension import is_trivial_extension
+
+
+def test_accepts_trailing_whitespace_and_punctuation():
+    """Accepts a prompt extended only by whitespace and punctuation."""
+    assert is_trivial_extension("Tell me a joke", "Tell me a joke?! ") is True
+
+
+def test_accepts_identical_prompts():
+    """Accepts a prompt identical to the previous one."""
+    assert is_trivial_extension("Tell me a joke", "Tell me a joke") is True
+
+
+def test_accepts_unicode_punctuation():
+    """Accepts punctuation outside ASCII."""
+    assert is_trivial_extension("Tell me a joke", "Tell me a joke…") is True
+
+
+def test_rejects_added_words():
+    """Rejects a prompt extended by more text."""
+    assert is_trivial_extension("Tell me a joke", "Tell me a joke about") is False
+
+
+def test_rejects_edited_prompts():
+    """Rejects a prompt that changes what came before."""
+    assert is_trivial_extension("Tell me a joke.", "Tell me a joke") is False
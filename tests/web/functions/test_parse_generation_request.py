@@ -0,0 +1,62 @@
+import pytest
+
+from electric_text.prompting.data.output_format import OutputFormat
+from electric_text.web.data import GenerationRequest, Priority
+from electric_text.web.functions.parse_generation_request import (
+    parse_generation_request,
+)
+
+
+def test_fills_defaults_for_a_bare_prompt():
+    """Uses the default model and a non-streaming full response."""
+    assert parse_generation_request({"prompt": "Hi"}, "mock:ollama/m") == (
+        GenerationRequest(prompt="Hi", model="mock:ollama/m")
+    )
+
+
+def test_reads_every_field():
+    """Reads model, prompt name, tool boxes, max tokens, stream, format and priority."""
+    body = {
+        "prompt": "Hi",
+        "model": "ollama:llama3",
+        "prompt_name": "concise",
+        "tool_boxes": ["search", "math"],
+        "max_tokens": 100,
+        "stream": True,
+        "format": "delta",
+        "priority": "low",
+    }
+
+    assert parse_generation_request(body, "mock:ollama/m") == GenerationRequest(
+        prompt="Hi",
+        model="ollama:llama3",
+        prompt_name="concise",
+        tool_boxes="search,math",
+        max_tokens=100,
+        stream=True,
+        output_format=OutputFormat.DELTA,
+        priority=Priority.LOW,
+    )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        ["Hi"],
+        {},
+        {"prompt": ""},
+        {"prompt": "Hi", "model": 3},
+        {"prompt": "Hi", "prompt_name": ["concise"]},
+        {"prompt": "Hi", "tool_boxes": "search"},
+        {"prompt": "Hi", "max_tokens": 0},
+        {"prompt": "Hi", "max_tokens": True},
+        {"prompt": "Hi", "stream": "yes"},
+        {"prompt": "Hi", "format": "xml"},
+        {"prompt": "Hi", "format": ["delta"]},
+        {"prompt": "Hi", "priority": "urgent"},
+    ],
+)
+def test_rejects_malformed_bodies(body):
+    """Raises ValueError for a body that is not a valid request."""
+    with pytest.raises(ValueError):
+        parse_generation_request(body, "mock:ollama/m")
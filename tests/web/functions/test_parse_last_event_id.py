@@ -0,0 +1,21 @@
+from electric_text.web.functions.parse_last_event_id import parse_last_event_id
+
+
+def test_parses_event_ids():
+    """Returns the id as an integer."""
+    assert parse_last_event_id("42") == 42
+
+
+def test_ignores_missing_header():
+    """Returns None without a header."""
+    assert parse_last_event_id(None) is None
+
+
+def test_ignores_ids_this_server_never_sends():
+    """Returns None for an id that is not a non-negative integer."""
+    assert [parse_last_event_id(value) for value in ("", "abc", "-1", "1.5")] == [
+        None,
+        None,
+        None,
+        None,
+    ]
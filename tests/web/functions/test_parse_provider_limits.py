@@ -0,0 +1,23 @@
+import pytest
+
+from electric_text.web.functions.parse_provider_limits import parse_provider_limits
+
+
+def test_parses_provider_limit_pairs():
+    """Maps each provider to its limit, ignoring spaces and empty entries."""
+    assert parse_provider_limits(" ollama=2, anthropic = 16,") == {
+        "ollama": 2,
+        "anthropic": 16,
+    }
+
+
+def test_parses_nothing_as_no_limits():
+    """Returns no limits for an empty value."""
+    assert parse_provider_limits("") == {}
+
+
+@pytest.mark.parametrize("value", ["ollama", "ollama=many", "=2", "ollama=0"])
+def test_rejects_malformed_pairs(value):
+    """Raises ValueError for a pair that is not a provider and a positive number."""
+    with pytest.raises(ValueError):
+        parse_provider_limits(value)
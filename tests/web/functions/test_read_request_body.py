@@ -0,0 +1,42 @@
+import pytest
+from starlette.requests import Request
+
+from electric_text.web.functions.read_request_body import read_request_body
+
+
+def request_with(chunks, headers=()):
+    """Request whose body arrives in the given chunks."""
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+        for index, chunk in enumerate(chunks)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": list(headers)}
+    return Request(scope, receive)
+
+
+@pytest.mark.asyncio
+async def test_reads_bodies_within_the_limit():
+    """Returns the whole body when it fits."""
+    request = request_with([b"ab", b"cd"])
+
+    assert await read_request_body(request, 4) == b"abcd"
+
+
+@pytest.mark.asyncio
+async def test_refuses_declared_lengths_over_the_limit():
+    """Returns None for a Content-Length over the limit without reading."""
+    request = request_with([b"ab"], [(b"content-length", b"100")])
+
+    assert await read_request_body(request, 4) is None
+
+
+@pytest.mark.asyncio
+async def test_stops_reading_once_the_limit_is_passed():
+    """Returns None when the body outgrows the limit as it streams in."""
+    request = request_with([b"abc", b"def", b"ghi"])
+
+    assert await read_request_body(request, 4) is None
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from electric_text.prompting.data.output_format import OutputFormat
+from electric_text.web.functions.stream_generation_records import (
+    stream_generation_records,
+)
+from tests.fixtures import text_output
+
+
+async def updates(*outputs):
+    for output in outputs:
+        yield output
+
+
+@pytest.mark.asyncio
+async def test_streams_one_json_record_per_line():
+    """Writes each record as a line of JSON."""
+    outputs = updates(text_output("Hel"), text_output("Hello"))
+
+    lines = [
+        line async for line in stream_generation_records(outputs, OutputFormat.DELTA)
+    ]
+
+    assert [json.loads(line)["type"] for line in lines] == [
+        "text_delta",
+        "text_delta",
+        "summary",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ends_with_an_error_record_when_generation_fails():
+    """Reports a failure after the stream started as a final error record."""
+
+    async def failing():
+        yield text_output("Hel")
+        raise RuntimeError("upstream went away")
+
+    lines = [
+        line async for line in stream_generation_records(failing(), OutputFormat.FULL)
+    ]
+
+    assert json.loads(lines[-1]) == {
+        "type": "error",
+        "error": "RuntimeError: upstream went away",
+    }
+
+
+@pytest.mark.asyncio
+async def test_closes_the_outputs_when_closed():
+    """Closes the upstream output stream when the caller stops reading."""
+    closed = []
+
+    async def endless():
+        try:
+            while True:
+                yield text_output("Hi")
+        finally:
+            closed.append(True)
+
+    lines = stream_generation_records(endless(), OutputFormat.FULL)
+    await anext(lines)
+    await lines.aclose()
+
+    assert closed == [True]
@@ -0,0 +1,78 @@
+import pytest
+
+from electric_text.web.functions.stream_response_events import (
+    stream_response_events,
+)
+from tests.fixtures import data_output, text_output, tool_call_output
+
+
+async def updates(*outputs):
+    for output in outputs:
+        yield output
+
+
+@pytest.mark.asyncio
+async def test_streams_text_as_response_events():
+    """Sends each update's new text as one response event."""
+    outputs = updates(text_output("Hel"), text_output("Hello"))
+
+    events = [event async for event in stream_response_events(outputs)]
+
+    assert events == [
+        ["event: response\ndata: Hel\n\n"],
+        ["event: response\ndata: lo\n\n"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reads_no_update_ahead():
+    """Pulls the next update only after the previous events were consumed."""
+    pulled: list[str] = []
+
+    async def tracked():
+        for content in ("a", "ab", "abc"):
+            pulled.append(content)
+            yield text_output(content)
+
+    events = stream_response_events(tracked())
+    await anext(events)
+
+    assert pulled == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_yields_one_updates_events_together():
+    """Yields all events for one update at once."""
+    outputs = updates(tool_call_output("search", "{}"))
+
+    chunks = [chunk async for chunk in stream_response_events(outputs)]
+
+    assert chunks == [
+        [
+            "event: response\ndata: <div class='tool-call'>search</div>\n\n",
+            "event: response\ndata: {}\n\n",
+        ]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_skips_updates_that_change_nothing_shown():
+    """Sends nothing for an update that adds no text."""
+    outputs = updates(text_output("Hi"), text_output("Hi"))
+
+    chunks = [chunk async for chunk in stream_response_events(outputs)]
+
+    assert chunks == [["event: response\ndata: Hi\n\n"]]
+
+
+@pytest.mark.asyncio
+async def test_streams_structured_fields_including_the_last():
+    """Sends each data field as it completes, and the last once outputs end."""
+    outputs = updates(data_output({"a": 1}), data_output({"a": 1, "b": 2}))
+
+    chunks = [chunk async for chunk in stream_response_events(outputs)]
+
+    assert chunks == [
+        ["event: response\ndata: <div class='data-field'><b>a</b>: 1</div>\n\n"],
+        ["event: response\ndata: <div class='data-field'><b>b</b>: 2</div>\n\n"],
+    ]
@@ -0,0 +1,21 @@
+import asyncio
+import os
+
+import pytest
+
+from electric_text.web.functions.sweep_connections import sweep_connections
+
+
+@pytest.mark.asyncio
+async def test_closes_streams_nobody_reconnected_to(connection_manager):
+    """Closes a detached stream once resume_timeout_s has passed."""
+    os.environ["ELECTRIC_TEXT_WEB_HEARTBEAT_S"] = "0.01"
+    os.environ["ELECTRIC_TEXT_WEB_RESUME_TIMEOUT_S"] = "0"
+    manager = connection_manager()
+    state = manager.open("cid")
+
+    sweeper = asyncio.create_task(sweep_connections(manager))
+    await asyncio.sleep(0.05)
+    sweeper.cancel()
+
+    assert (state.is_closed, manager.connections) == (True, {})
@@ -0,0 +1,174 @@
+import asyncio
+
+import pytest
+
+from electric_text.web.admission_controller import AdmissionController
+from electric_text.web.data import ConnectionSettings, Priority
+
+
+def create_controller(**settings):
+    return AdmissionController(ConnectionSettings(**settings))
+
+
+async def start_waiting(controller, provider_name, priority=Priority.NORMAL):
+    """Start an admit call and let it join the wait queue."""
+    task = asyncio.create_task(controller.admit(provider_name, priority))
+    await asyncio.sleep(0)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_admits_up_to_the_provider_limit_at_once():
+    """Admits max_provider_generations right away, then makes the next wait."""
+    controller = create_controller(max_provider_generations=2)
+
+    first = await controller.admit("ollama", Priority.NORMAL)
+    second = await controller.admit("ollama", Priority.NORMAL)
+    third = await start_waiting(controller, "ollama")
+
+    assert (first is not None, second is not None, third.done()) == (
+        True,
+        True,
+        False,
+    )
+    third.cancel()
+
+
+@pytest.mark.asyncio
+async def test_limits_each_provider_separately():
+    """Applies provider_limits overrides, and admits other providers freely."""
+    controller = create_controller(
+        max_provider_generations=2, provider_limits={"ollama": 1}
+    )
+    await controller.admit("ollama", Priority.NORMAL)
+
+    waiting = await start_waiting(controller, "ollama")
+    other = await controller.admit("anthropic", Priority.NORMAL)
+
+    assert (waiting.done(), other is not None) == (False, True)
+    waiting.cancel()
+
+
+@pytest.mark.asyncio
+async def test_releasing_admits_the_next_waiter():
+    """Hands a released slot to a waiting generation."""
+    controller = create_controller(max_provider_generations=1)
+    admission = await controller.admit("ollama", Priority.NORMAL)
+    waiting = await start_waiting(controller, "ollama")
+
+    controller.release(admission)
+    admitted = await waiting
+
+    assert (admitted.provider_name, controller.running) == ("ollama", {"ollama": 1})
+
+
+@pytest.mark.asyncio
+async def test_releasing_twice_frees_one_slot():
+    """Ignores a second release of the same admission."""
+    controller = create_controller(max_provider_generations=1)
+    admission = await controller.admit("ollama", Priority.NORMAL)
+
+    controller.release(admission)
+    controller.release(admission)
+
+    assert controller.running == {"ollama": 0}
+
+
+@pytest.mark.asyncio
+async def test_admits_higher_priorities_first():
+    """Starts a waiting HIGH generation before older NORMAL ones."""
+    controller = create_controller(max_provider_generations=1)
+    admission = await controller.admit("ollama", Priority.NORMAL)
+    normal = await start_waiting(controller, "ollama", Priority.NORMAL)
+    high = await start_waiting(controller, "ollama", Priority.HIGH)
+
+    controller.release(admission)
+    await asyncio.sleep(0)
+
+    assert (high.done(), normal.done()) == (True, False)
+    normal.cancel()
+
+
+@pytest.mark.asyncio
+async def test_refuses_generations_that_wait_too_long():
+    """Refuses a generation not admitted within admission_timeout_s."""
+    controller = create_controller(max_provider_generations=1, admission_timeout_s=0.01)
+    await controller.admit("ollama", Priority.NORMAL)
+
+    refused = await controller.admit("ollama", Priority.NORMAL)
+
+    assert (refused, controller.timed_out, controller.waiting) == (
+        None,
+        1,
+        {"ollama": []},
+    )
+
+
+@pytest.mark.asyncio
+async def test_refuses_generations_beyond_the_queue_bound():
+    """Refuses a generation at once when the queue is full of equal priorities."""
+    controller = create_controller(max_provider_generations=1, admission_queue_size=1)
+    await controller.admit("ollama", Priority.NORMAL)
+    waiting = await start_waiting(controller, "ollama")
+
+    refused = await controller.admit("ollama", Priority.NORMAL)
+
+    assert (refused, controller.rejected) == (None, 1)
+    waiting.cancel()
+
+
+@pytest.mark.asyncio
+async def test_sheds_lower_priority_waiters_when_full():
+    """Refuses the lowest waiting generation to queue a higher priority one."""
+    controller = create_controller(max_provider_generations=1, admission_queue_size=1)
+    admission = await controller.admit("ollama", Priority.NORMAL)
+    low = await start_waiting(controller, "ollama", Priority.LOW)
+    high = await start_waiting(controller, "ollama", Priority.HIGH)
+
+    controller.release(admission)
+
+    assert (await low, (await high).priority, controller.shed) == (
+        None,
+        Priority.HIGH,
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_leave_the_queue():
+    """Removes a waiting generation whose task is cancelled."""
+    controller = create_controller(max_provider_generations=1)
+    await controller.admit("ollama", Priority.NORMAL)
+    waiting = await start_waiting(controller, "ollama")
+
+    waiting.cancel()
+    await asyncio.wait([waiting])
+
+    assert controller.waiting == {"ollama": []}
+
+
+@pytest.mark.asyncio
+async def test_passes_on_slots_granted_to_cancelled_waiters():
+    """Hands a slot on when its waiter is cancelled before it could take it."""
+    controller = create_controller(max_provider_generations=1)
+    admission = await controller.admit("ollama", Priority.NORMAL)
+    first = await start_waiting(controller, "ollama")
+    second = await start_waiting(controller, "ollama")
+
+    controller.release(admission)
+    first.cancel()
+    admitted = await second
+
+    assert (admitted is not None, controller.running) == (True, {"ollama": 1})
+
+
+def test_reports_gauges():
+    """Reports running and waiting generations with refusal totals."""
+    assert create_controller().get_gauges() == {
+        "running_generations": 0,
+        "waiting_generations": 0,
+        "admitted_generations": 0,
+        "timed_out_generations": 0,
+        "shed_generations": 0,
+        "rejected_generations": 0,
+    }
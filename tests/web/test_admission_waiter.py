@@ -0,0 +1,18 @@
+import pytest
+
+from electric_text.web.admission_waiter import AdmissionWaiter
+from electric_text.web.data import Priority
+
+
+@pytest.mark.asyncio
+async def test_ranks_by_priority_then_age():
+    """Ranks higher priorities first, and older waiters first within one."""
+    waiters = [
+        AdmissionWaiter(Priority.NORMAL, 1),
+        AdmissionWaiter(Priority.HIGH, 3),
+        AdmissionWaiter(Priority.NORMAL, 2),
+    ]
+
+    ranked = sorted(waiters, key=AdmissionWaiter.get_rank, reverse=True)
+
+    assert [waiter.arrival for waiter in ranked] == [3, 1, 2]
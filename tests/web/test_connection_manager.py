@@ -0,0 +1,273 @@
+import asyncio
+
+import pytest
+
+from electric_text.web.connection_manager import ConnectionManager
+from electric_text.web.data import ConnectionSettings, PromptOutcome
+from tests.fixtures import ManualClock
+
+
+def create_manager(**settings):
+    clock = ManualClock()
+    return ConnectionManager(ConnectionSettings(**settings), clock), clock
+
+
+def test_opens_streams_up_to_the_limit():
+    """Refuses a new stream once max_connections are open."""
+    manager, _ = create_manager(max_connections=1)
+    manager.open("a")
+
+    assert (manager.open("b"), manager.rejected_connections) == (None, 1)
+
+
+def test_reopening_replaces_a_stream():
+    """Closes the earlier stream when a connection id reconnects."""
+    manager, _ = create_manager(max_connections=1)
+    first = manager.open("a")
+
+    second = manager.open("a")
+
+    assert (first.is_closed, manager.connections) == (True, {"a": second})
+
+
+def test_evicts_idle_streams_to_make_room():
+    """Closes streams idle past idle_timeout_s before refusing a new one."""
+    manager, clock = create_manager(max_connections=1, idle_timeout_s=10)
+    idle = manager.open("a")
+    clock.now = 11
+
+    manager.open("b")
+
+    assert (idle.is_closed, list(manager.connections), manager.evicted) == (
+        True,
+        ["b"],
+        1,
+    )
+
+
+def test_activity_keeps_streams_open():
+    """Does not evict a stream that was used within idle_timeout_s."""
+    manager, clock = create_manager(idle_timeout_s=10)
+    manager.open("a")
+    clock.now = 8
+    manager.get("a")
+    clock.now = 16
+
+    assert manager.evict_idle() == 0
+
+
+@pytest.mark.asyncio
+async def test_never_evicts_streams_with_a_running_prompt():
+    """Keeps an attached stream open while its prompt is still streaming."""
+    manager, clock = create_manager(idle_timeout_s=10)
+    state = manager.open("a")
+    manager.attach(state)
+    state.task = asyncio.create_task(asyncio.sleep(10))
+    clock.now = 60
+
+    assert manager.is_expired(state) is False
+    state.task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_closes_detached_streams_after_resume_timeout():
+    """Expires a stream nobody reconnected to, even with a prompt running."""
+    manager, clock = create_manager(resume_timeout_s=5)
+    state = manager.open("a")
+    manager.detach(state, manager.attach(state))
+    state.task = asyncio.create_task(asyncio.sleep(10))
+    clock.now = 6
+
+    assert manager.is_expired(state) is True
+    state.task.cancel()
+
+
+def test_detaching_a_replaced_event_stream_keeps_the_stream_attached():
+    """Ignores the detach of an event stream that a reconnect replaced."""
+    manager, _ = create_manager()
+    state = manager.open("a")
+    first = manager.attach(state)
+    manager.attach(state)
+
+    manager.detach(state, first)
+
+    assert state.is_attached is True
+
+
+def test_resumes_streams_that_kept_the_missed_events():
+    """Returns the open stream when it still holds every event after the id."""
+    manager, _ = create_manager()
+    state = manager.open("a")
+    state.replay.publish_nowait(["one", "two"])
+
+    assert (manager.resume("a", 1), manager.resumed_streams) == (state, 1)
+
+
+def test_refuses_to_resume_past_the_replay_buffer():
+    """Returns None when events after the id were already dropped."""
+    manager, _ = create_manager(replay_events=2)
+    state = manager.open("a")
+    state.replay.publish_nowait(["one", "two", "three"])
+
+    assert manager.resume("a", 0) is None
+
+
+def test_refuses_to_resume_unknown_streams():
+    """Returns None for a connection id with no open stream."""
+    manager, _ = create_manager()
+
+    assert manager.resume("a", 0) is None
+
+
+def test_refuses_watchers_beyond_the_limit():
+    """Refuses a watcher once max_watchers follow the stream."""
+    manager, _ = create_manager(max_watchers=1)
+    state = manager.open("a")
+
+    added = [manager.watch(state), manager.watch(state)]
+
+    assert (added, state.watchers, manager.rejected_watchers) == ([True, False], 1, 1)
+
+
+def test_counts_watchers_dropped_for_falling_behind():
+    """Counts a watcher removed because it fell behind the replay buffer."""
+    manager, _ = create_manager()
+    state = manager.open("a")
+    manager.watch(state)
+
+    manager.unwatch(state, is_dropped=True)
+
+    assert (state.watchers, manager.dropped_watchers) == (0, 1)
+
+
+def test_refuses_prompts_beyond_the_queue_bound():
+    """Refuses a prompt once prompt_queue_size prompts are waiting."""
+    manager, _ = create_manager(prompt_queue_size=1)
+    state = manager.open("a")
+
+    outcomes = [manager.submit(state, "one"), manager.submit(state, "two")]
+
+    assert (outcomes, manager.rejected_prompts) == (
+        [PromptOutcome.QUEUED, PromptOutcome.REJECTED],
+        1,
+    )
+
+
+def test_reuses_response_for_trivial_extensions():
+    """Answers a prompt that only adds trailing punctuation with the latest response."""
+    manager, _ = create_manager()
+    state = manager.open("a")
+    manager.submit(state, "Tell me a joke")
+
+    outcome = manager.submit(state, "Tell me a joke?")
+
+    assert (outcome, state.queue.qsize(), manager.reused_prompts) == (
+        PromptOutcome.REUSED,
+        1,
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_supersedes_the_running_generation():
+    """Cancels the running generation when a different prompt arrives."""
+    manager, _ = create_manager()
+    state = manager.open("a")
+    manager.submit(state, "Tell me a joke")
+    task = asyncio.create_task(asyncio.sleep(10))
+    state.task = task
+
+    outcome = manager.submit(state, "Tell me a story")
+    await asyncio.wait([task])
+
+    assert (outcome, task.cancelled(), state.is_superseded, state.latest_prompt) == (
+        PromptOutcome.QUEUED,
+        True,
+        True,
+        "Tell me a story",
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancel_drops_generation_and_waiting_prompts():
+    """Cancels the running generation, drops waiting prompts, and forgets the latest."""
+    manager, _ = create_manager()
+    state = manager.open("a")
+    manager.submit(state, "Tell me a joke")
+    task = asyncio.create_task(asyncio.sleep(10))
+    state.task = task
+
+    cancelled = manager.cancel(state)
+    await asyncio.wait([task])
+
+    assert (cancelled, task.cancelled(), state.queue.qsize(), state.latest_prompt) == (
+        True,
+        True,
+        0,
+        None,
+    )
+
+
+def test_cancel_reports_nothing_running():
+    """Returns False when no generation is running."""
+    manager, _ = create_manager()
+
+    assert manager.cancel(manager.open("a")) is False
+
+
+def test_spaces_generation_starts():
+    """Makes a stream wait out restart_interval_s after starting a generation."""
+    manager, clock = create_manager(restart_interval_s=1.0)
+    state = manager.open("a")
+    first_delay = manager.get_restart_delay(state)
+    manager.start(state)
+    clock.now = 0.25
+
+    assert (first_delay, manager.get_restart_delay(state)) == (0.0, 0.75)
+
+
+@pytest.mark.asyncio
+async def test_closing_cancels_the_running_prompt():
+    """Cancels the prompt task of a closed stream and forgets the stream."""
+    manager, _ = create_manager()
+    state = manager.open("a")
+    task = asyncio.create_task(asyncio.sleep(10))
+    state.task = task
+
+    manager.close("a", state)
+    await asyncio.wait([task])
+
+    assert (task.cancelled(), manager.connections) == (True, {})
+
+
+def test_reports_gauges():
+    """Reports open, streaming and queued counts with rejection totals."""
+    manager, _ = create_manager(max_connections=2, prompt_queue_size=1)
+    state = manager.open("a")
+    manager.submit(state, "one")
+    manager.submit(state, "two")
+    manager.open("b")
+    manager.open("c")
+
+    assert manager.get_gauges() == {
+        "connections": 2,
+        "max_connections": 2,
+        "streaming": 0,
+        "detached": 2,
+        "watchers": 0,
+        "queued_prompts": 1,
+        "evicted": 0,
+        "rejected_connections": 1,
+        "rejected_prompts": 1,
+        "reused_prompts": 0,
+        "superseded_prompts": 0,
+        "resumed_streams": 0,
+        "rejected_watchers": 0,
+        "dropped_watchers": 0,
+        "running_generations": 0,
+        "waiting_generations": 0,
+        "admitted_generations": 0,
+        "timed_out_generations": 0,
+        "shed_generations": 0,
+        "rejected_generations": 0,
+    }
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from electric_text.web.replay_buffer import ReplayBuffer
+
+
+def test_numbers_events_from_one():
+    """Gives published events consecutive ids starting at 1."""
+    replay = ReplayBuffer(size=8)
+
+    replay.publish_nowait(["a", "b"])
+
+    assert replay.get_after(0) == [(1, "a"), (2, "b")]
+
+
+def test_gets_only_newer_events():
+    """Returns the events after an id, oldest first."""
+    replay = ReplayBuffer(size=8)
+    replay.publish_nowait(["a", "b", "c"])
+
+    assert replay.get_after(1) == [(2, "b"), (3, "c")]
+
+
+def test_keeps_only_the_newest_events():
+    """Drops the oldest events beyond size."""
+    replay = ReplayBuffer(size=2)
+
+    replay.publish_nowait(["a", "b", "c"])
+
+    assert replay.get_after(0) == [(2, "b"), (3, "c")]
+
+
+def test_can_resume_while_missed_events_are_kept():
+    """Allows resuming from any id whose following events are all kept."""
+    replay = ReplayBuffer(size=2)
+    replay.publish_nowait(["a", "b", "c"])
+
+    assert [replay.can_resume(event_id) for event_id in range(5)] == [
+        False,
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_can_resume_a_stream_with_no_events():
+    """Allows resuming from 0 before anything was published."""
+    assert ReplayBuffer(size=2).can_resume(0) is True
+
+
+@pytest.mark.asyncio
+async def test_publishing_waits_for_unsent_events():
+    """Holds new events back until every earlier event was sent."""
+    replay = ReplayBuffer(size=8)
+    replay.publish_nowait(["a"])
+    publishing = asyncio.create_task(replay.publish(["b"]))
+    await asyncio.sleep(0)
+    waiting = replay.last_id
+
+    replay.mark_sent(1)
+    await publishing
+
+    assert (waiting, replay.last_id) == (1, 2)
+
+
+def test_discarding_drops_unsent_events_without_reusing_their_ids():
+    """Drops events not yet sent; the next event still gets a new id."""
+    replay = ReplayBuffer(size=8)
+    replay.publish_nowait(["a", "b"])
+    replay.mark_sent(1)
+
+    replay.discard_unsent()
+    replay.publish_nowait(["c"])
+
+    assert replay.get_after(0) == [(1, "a"), (3, "c")]
+
+
+@pytest.mark.asyncio
+async def test_publishing_continues_after_discarding():
+    """Publishes without waiting once unsent events were discarded."""
+    replay = ReplayBuffer(size=8)
+    replay.publish_nowait(["a"])
+
+    replay.discard_unsent()
+    await replay.publish(["b"])
+
+    assert replay.last_id == 2
+
+
+@pytest.mark.asyncio
+async def test_notifies_waiters_of_new_events():
+    """Wakes a waiter on changed when events are published."""
+    replay = ReplayBuffer(size=8)
+    waiting = asyncio.create_task(replay.changed.wait())
+    await asyncio.sleep(0)
+
+    replay.publish_nowait(["a"])
+
+    assert await waiting is True
@@ -0,0 +1,567 @@
+import asyncio
+import json
+import os
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+
+from electric_text.web.data import ConnectionSettings
+from electric_text.web.routes import (
+    HEARTBEAT,
+    event_stream,
+    response_stream,
+    routes,
+    watch_events,
+)
+from electric_text.web.stream_state import StreamState
+from tests.fixtures import start_prompt
+
+
+def web_client():
+    """HTTP client calling the web routes in-process."""
+    transport = httpx.ASGITransport(app=Starlette(routes=routes))
+    return httpx.AsyncClient(transport=transport, base_url="http://web")
+
+
+def new_state():
+    return StreamState(prompt_queue_size=4, replay_size=100, last_active=0.0)
+
+
+def event_type(event):
+    """Name of a server-sent event, ignoring any id field."""
+    return event.split("event: ", 1)[1].split("\n", 1)[0]
+
+
+async def drain_response(state):
+    """Send events the way event_stream does, until the response's final event."""
+    events = []
+    while not events or event_type(events[-1]) in ("reset", "response"):
+        pending = state.replay.get_after(state.replay.sent_id)
+        if not pending:
+            await state.replay.changed.wait()
+            continue
+        state.replay.mark_sent(pending[-1][0])
+        events.extend(event for _, event in pending)
+    return events
+
+
+async def read_until_complete(stream):
+    """Read an event stream's messages up to the one completing the response."""
+    messages = [await anext(stream)]
+    while "event: complete" not in messages[-1]:
+        messages.append(await anext(stream))
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_streams_model_response_then_completes(clean_env):
+    """Streams the configured model's response, then a complete event."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    state = new_state()
+
+    start_prompt("Hi", state)
+    events = await drain_response(state)
+
+    assert (len(events) > 2, event_type(events[-1])) == (True, "complete")
+
+
+@pytest.mark.asyncio
+async def test_sends_token_bursts_as_few_frames(clean_env):
+    """Sends the first token at once and a burst of later tokens as one frame."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    state = new_state()
+
+    start_prompt("Hi", state, ConnectionSettings(flush_interval_s=10.0))
+    events = await drain_response(state)
+
+    assert len(events) == 4  # reset, first token, the rest, complete
+
+
+@pytest.mark.asyncio
+async def test_waits_for_browser_before_reading_more(clean_env):
+    """Holds one unsent event and pauses the model stream until it is sent."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    state = new_state()
+
+    task = start_prompt("Hi", state)
+    await asyncio.sleep(0.05)
+
+    assert (state.replay.last_id - state.replay.sent_id, task.done()) == (1, False)
+    task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_cancelling_replaces_pending_events(clean_env):
+    """Drops undelivered events and reports the cancellation."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    state = new_state()
+    task = start_prompt("Hi", state)
+    await asyncio.sleep(0.05)
+
+    task.cancel()
+    await asyncio.wait([task])
+    events = await drain_response(state)
+
+    assert ([event_type(event) for event in events], state.task) == (
+        ["cancelled"],
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_starts_by_resetting_the_previous_response(clean_env):
+    """Clears the previous prompt's response before streaming a new one."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    state = new_state()
+
+    start_prompt("Hi", state)
+    events = await drain_response(state)
+
+    assert events[0] == "event: reset\ndata: \n\n"
+
+
+@pytest.mark.asyncio
+async def test_superseded_responses_end_quietly(clean_env):
+    """Ends a superseded response without a cancelled event."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    state = new_state()
+    task = start_prompt("Hi", state)
+    await asyncio.sleep(0.05)
+
+    state.is_superseded = task.cancel()
+    await asyncio.wait([task])
+
+    assert (state.replay.get_after(0), state.is_superseded) == ([], False)
+
+
+@pytest.mark.asyncio
+async def test_reports_failures_as_error_events(clean_env):
+    """Sends an error event when the prompt cannot be run."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    os.environ["ELECTRIC_TEXT_WEB_PROMPT_NAME"] = "no-such-prompt"
+    state = new_state()
+
+    start_prompt("Hi", state)
+    events = await drain_response(state)
+
+    assert [event_type(event) for event in events] == ["reset", "error"]
+
+
+@pytest.mark.asyncio
+async def test_reports_refused_admission_as_error_events(clean_env):
+    """Sends a busy error event when the provider has no slot in time."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    state = new_state()
+    state.latest_prompt = "Hi"
+    settings = ConnectionSettings(max_provider_generations=0, admission_timeout_s=0.01)
+
+    start_prompt("Hi", state, settings)
+    events = await drain_response(state)
+
+    busy = events[-1].startswith("event: error\ndata: Server busy")
+    assert ([event_type(event) for event in events], busy, state.latest_prompt) == (
+        ["reset", "error"],
+        True,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_stream_relays_prompts_and_detaches(connection_manager):
+    """Relays a queued prompt's events and keeps the stream when the browser leaves."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    manager = connection_manager()
+    state = manager.open("cid")
+    manager.submit(state, "Hi")
+
+    stream = event_stream("cid", state)
+    messages = await read_until_complete(stream)
+    await stream.aclose()
+    manager.close("cid", state)
+
+    assert (messages[0].split("\n")[0], state.is_attached) == (
+        "event: connected",
+        False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_stream_numbers_every_event(connection_manager):
+    """Gives each relayed event an id, counting from 1."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    manager = connection_manager()
+    state = manager.open("cid")
+    manager.submit(state, "Hi")
+
+    stream = event_stream("cid", state)
+    messages = await read_until_complete(stream)
+    await stream.aclose()
+    manager.close("cid", state)
+
+    assert messages[1] == "id: 1\nevent: reset\ndata: \n\n"
+
+
+@pytest.mark.asyncio
+async def test_reconnecting_resumes_the_running_generation(connection_manager):
+    """Resends only the missed events and finishes the response without rerunning it."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    manager = connection_manager()
+    state = manager.open("cid")
+    manager.submit(state, "Hi")
+    first = event_stream("cid", state)
+    await anext(first)
+    await anext(first)  # The reset event, id 1
+    await first.aclose()
+    task = state.task
+
+    second = event_stream("cid", state, last_event_id=1)
+    messages = await read_until_complete(second)
+    await second.aclose()
+    manager.close("cid", state)
+
+    assert (
+        messages[1].startswith("id: 2\nevent: response"),
+        sum("event: reset" in message for message in messages),
+        task.cancelled(),
+    ) == (True, 0, False)
+
+
+@pytest.mark.asyncio
+async def test_replaced_event_streams_stop_relaying(connection_manager):
+    """Ends an event stream once a reconnect has taken the stream over."""
+    os.environ["ELECTRIC_TEXT_WEB_HEARTBEAT_S"] = "0.01"
+    manager = connection_manager()
+    state = manager.open("cid")
+    first = event_stream("cid", state)
+    await anext(first)
+    second = event_stream("cid", state, last_event_id=0)
+    await anext(second)
+
+    remaining = [message async for message in first]
+    is_attached = state.is_attached
+    await second.aclose()
+    manager.close("cid", state)
+
+    assert (remaining, is_attached) == ([], True)
+
+
+@pytest.mark.asyncio
+async def test_reconnects_with_last_event_id_reattach(connection_manager):
+    """Reattaches a reconnect carrying Last-Event-ID to the open stream."""
+    manager = connection_manager()
+    state = manager.open("cid")
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/response-stream",
+            "query_string": b"connection_id=cid",
+            "headers": [(b"last-event-id", b"0")],
+        }
+    )
+
+    response = await response_stream(request)
+    await response.body_iterator.aclose()
+
+    assert (manager.connections, manager.resumed_streams) == ({"cid": state}, 1)
+
+
+@pytest.mark.asyncio
+async def test_event_stream_runs_only_the_newest_waiting_prompt(connection_manager):
+    """Skips prompts superseded while the stream waited out restart_interval_s."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    os.environ["ELECTRIC_TEXT_WEB_RESTART_INTERVAL_S"] = "0.05"
+    manager = connection_manager()
+    state = manager.open("cid")
+    state.last_started = manager.clock()
+    manager.submit(state, "Tell me a joke")
+    manager.submit(state, "Tell me a story")
+
+    stream = event_stream("cid", state)
+    messages = await read_until_complete(stream)
+    await stream.aclose()
+    manager.close("cid", state)
+
+    assert sum("event: reset" in message for message in messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_submitting_a_trivial_extension_reuses_the_response(connection_manager):
+    """Answers a prompt that only adds trailing whitespace without queuing it."""
+    state = connection_manager().open("cid")
+
+    async with web_client() as client:
+        bodies = [
+            (
+                await client.post(
+                    "/submit-prompt", data={"prompt": prompt, "connection_id": "cid"}
+                )
+            ).text
+            for prompt in ("Hi", "Hi ")
+        ]
+
+    assert (bodies, state.queue.qsize()) == (["OK", "Reused"], 1)
+
+
+@pytest.mark.asyncio
+async def test_event_stream_sends_heartbeats_while_quiet(connection_manager):
+    """Sends a keep-alive comment when no prompt arrives within heartbeat_s."""
+    os.environ["ELECTRIC_TEXT_WEB_HEARTBEAT_S"] = "0.01"
+    manager = connection_manager()
+    state = manager.open("cid")
+
+    stream = event_stream("cid", state)
+    await anext(stream)
+    message = await anext(stream)
+    await stream.aclose()
+    manager.close("cid", state)
+
+    assert message == HEARTBEAT
+
+
+@pytest.mark.asyncio
+async def test_event_stream_closes_idle_streams(connection_manager):
+    """Closes a stream that has been idle past idle_timeout_s."""
+    os.environ["ELECTRIC_TEXT_WEB_HEARTBEAT_S"] = "0.01"
+    os.environ["ELECTRIC_TEXT_WEB_IDLE_TIMEOUT_S"] = "0"
+    manager = connection_manager()
+    state = manager.open("cid")
+
+    messages = [message async for message in event_stream("cid", state)]
+
+    assert (messages[-1].split("\n")[0], manager.connections) == (
+        "event: close",
+        {},
+    )
+
+
+@pytest.mark.asyncio
+async def test_watchers_follow_the_same_generation(connection_manager):
+    """Sends a watcher the same response as the owner, from one generation."""
+    os.environ["ELECTRIC_TEXT_WEB_MODEL"] = "mock:ollama/m"
+    manager = connection_manager()
+    state = manager.open("cid")
+    manager.watch(state)
+    watcher = watch_events("cid", state, 0)
+    await anext(watcher)
+    manager.submit(state, "Hi")
+
+    owner = event_stream("cid", state)
+    owned = await read_until_complete(owner)
+    watched = await read_until_complete(watcher)
+    await owner.aclose()
+    await watcher.aclose()
+    manager.close("cid", state)
+
+    assert ("".join(watched), state.watchers) == ("".join(owned[1:]), 0)
+
+
+@pytest.mark.asyncio
+async def test_drops_watchers_that_fall_behind(connection_manager):
+    """Closes a watcher whose next event already left the replay buffer."""
+    os.environ["ELECTRIC_TEXT_WEB_REPLAY_EVENTS"] = "2"
+    manager = connection_manager()
+    state = manager.open("cid")
+    manager.watch(state)
+    state.replay.publish_nowait(["a", "b", "c"])
+
+    messages = [message async for message in watch_events("cid", state, 0)]
+
+    assert (messages[-1], manager.dropped_watchers) == (
+        "event: close\ndata: Watcher fell behind\n\n",
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_watchers_end_when_the_stream_closes(connection_manager):
+    """Closes a watcher once the stream it follows is closed."""
+    manager = connection_manager()
+    state = manager.open("cid")
+    manager.watch(state)
+    watcher = watch_events("cid", state, 0)
+    await anext(watcher)
+
+    manager.close("cid", state)
+    messages = [message async for message in watcher]
+
+    assert messages == ["event: close\ndata: Stream closed\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_refuses_to_watch_unknown_streams(connection_manager):
+    """Answers 404 for a connection id with no open stream."""
+    connection_manager()
+
+    async with web_client() as client:
+        response = await client.get("/watch-stream", params={"connection_id": "cid"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_refuses_watchers_beyond_the_limit(connection_manager):
+    """Answers 503 once max_watchers follow the stream."""
+    os.environ["ELECTRIC_TEXT_WEB_MAX_WATCHERS"] = "0"
+    connection_manager().open("cid")
+
+    async with web_client() as client:
+        response = await client.get("/watch-stream", params={"connection_id": "cid"})
+
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_refuses_streams_when_full(connection_manager):
+    """Answers 503 once max_connections streams are open."""
+    os.environ["ELECTRIC_TEXT_WEB_MAX_CONNECTIONS"] = "1"
+    connection_manager().open("other")
+
+    async with web_client() as client:
+        response = await client.get("/response-stream", params={"connection_id": "cid"})
+
+    assert (response.status_code, response.headers["Retry-After"]) == (503, "5")
+
+
+@pytest.mark.asyncio
+async def test_refuses_prompts_beyond_the_queue_bound(connection_manager):
+    """Answers 429 when a stream already has prompt_queue_size prompts waiting."""
+    os.environ["ELECTRIC_TEXT_WEB_PROMPT_QUEUE_SIZE"] = "1"
+    connection_manager().open("cid")
+    async with web_client() as client:
+        statuses = [
+            (
+                await client.post(
+                    "/submit-prompt", data={"prompt": prompt, "connection_id": "cid"}
+                )
+            ).status_code
+            for prompt in ("Hi", "Bye")
+        ]
+
+    assert statuses == [200, 429]
+
+
+@pytest.mark.asyncio
+async def test_api_returns_a_whole_response_as_json(connection_manager):
+    """Answers a non-streaming API request with the output as JSON."""
+    connection_manager()
+
+    async with web_client() as client:
+        response = await client.post(
+            "/api/generate", json={"prompt": "Hi", "model": "mock:ollama/m"}
+        )
+
+    assert (response.status_code, response.json()["response_type"]) == (200, "TEXT")
+
+
+@pytest.mark.asyncio
+async def test_api_streams_ndjson_records(connection_manager):
+    """Streams delta records ending in a summary as NDJSON."""
+    connection_manager()
+
+    async with web_client() as client:
+        response = await client.post(
+            "/api/generate",
+            json={
+                "prompt": "Hi",
+                "model": "mock:ollama/m",
+                "stream": True,
+                "format": "delta",
+            },
+        )
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert (response.headers["content-type"], records[-1]["type"]) == (
+        "application/x-ndjson",
+        "summary",
+    )
+
+
+@pytest.mark.asyncio
+async def test_api_releases_admissions_when_done(connection_manager):
+    """Frees the provider slot after whole and streamed responses."""
+    manager = connection_manager()
+
+    async with web_client() as client:
+        for stream in (False, True):
+            await client.post(
+                "/api/generate",
+                json={"prompt": "Hi", "model": "mock:ollama/m", "stream": stream},
+            )
+
+    assert (manager.admission.admitted, sum(manager.admission.running.values())) == (
+        2,
+        0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_api_refuses_requests_while_the_provider_is_busy(connection_manager):
+    """Answers 503 when no provider slot is free and the queue is full."""
+    os.environ["ELECTRIC_TEXT_WEB_MAX_PROVIDER_GENERATIONS"] = "0"
+    os.environ["ELECTRIC_TEXT_WEB_ADMISSION_QUEUE_SIZE"] = "0"
+    connection_manager()
+
+    async with web_client() as client:
+        response = await client.post(
+            "/api/generate", json={"prompt": "Hi", "model": "mock:ollama/m"}
+        )
+
+    assert (response.status_code, response.headers["retry-after"]) == (503, "1")
+
+
+@pytest.mark.asyncio
+async def test_api_refuses_oversized_bodies(connection_manager):
+    """Answers 413 for a body larger than max_request_bytes."""
+    os.environ["ELECTRIC_TEXT_WEB_MAX_REQUEST_BYTES"] = "16"
+    connection_manager()
+
+    async with web_client() as client:
+        response = await client.post(
+            "/api/generate", json={"prompt": "A prompt well over the limit"}
+        )
+
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_api_refuses_malformed_requests(connection_manager):
+    """Answers 400 with an error message for a body that is not a request."""
+    connection_manager()
+
+    async with web_client() as client:
+        responses = [
+            await client.post("/api/generate", content=content)
+            for content in (b"not json", b'{"prompt": 3}')
+        ]
+
+    assert [
+        (response.status_code, "error" in response.json()) for response in responses
+    ] == [(400, True), (400, True)]
+
+
+@pytest.mark.asyncio
+async def test_api_reports_unknown_prompts_as_bad_requests(connection_manager):
+    """Answers 400 when the named prompt cannot be loaded."""
+    connection_manager()
+
+    async with web_client() as client:
+        response = await client.post(
+            "/api/generate",
+            json={"prompt": "Hi", "model": "mock:ollama/m", "prompt_name": "nope"},
+        )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_reports_connection_gauges(connection_manager):
+    """Serves the connection manager's gauges as JSON."""
+    connection_manager().open("cid")
+
+    async with web_client() as client:
+        response = await client.get("/connection-stats")
+
+    assert response.json()["connections"] == 1
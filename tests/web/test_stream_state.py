@@ -0,0 +1,8 @@
+from electric_text.web.stream_state import StreamState
+
+
+def test_bounds_prompt_queue_and_replay_buffer():
+    """Holds at most prompt_queue_size prompts and replay_size events."""
+    state = StreamState(prompt_queue_size=2, replay_size=8, last_active=0.0)
+
+    assert (state.queue.maxsize, state.replay.events.maxlen) == (2, 8)